@@ -35,9 +35,11 @@ private const val DATALORE_PREFERRED_WIDTH = "letsPlotPreferredWidth"
 fun buildPlotFromRawSpecs(plotSpecJs: dynamic, width: Double, height: Double, parentElement: HTMLElement) {
     try {
         val plotSpec = dynamicObjectToMap(plotSpecJs)
-        PlotConfig.assertFigSpecOrErrorMessage(plotSpec)
-        val processedSpec = MonolithicCommon.processRawSpecs(plotSpec, frontendOnly = false)
-        buildPlotFromProcessedSpecsIntern(processedSpec, width, height, parentElement)
+        withDecodedData(plotSpec, parentElement) {
+            PlotConfig.assertFigSpecOrErrorMessage(plotSpec)
+            val processedSpec = MonolithicCommon.processRawSpecs(plotSpec, frontendOnly = false)
+            buildPlotFromProcessedSpecsIntern(processedSpec, width, height, parentElement)
+        }
     } catch (e: RuntimeException) {
         handleException(e, parentElement)
     }
@@ -54,16 +56,38 @@ fun buildPlotFromRawSpecs(plotSpecJs: dynamic, width: Double, height: Double, pa
 fun buildPlotFromProcessedSpecs(plotSpecJs: dynamic, width: Double, height: Double, parentElement: HTMLElement) {
     try {
         val plotSpec = dynamicObjectToMap(plotSpecJs)
-        // Though the "plotSpec" might contain already "processed" specs,
-        // we apply "frontend" transforms anyway, just to be sure that
-        // we are going to use a truly processed specs.
-        val processedSpec = MonolithicCommon.processRawSpecs(plotSpec, frontendOnly = true)
-        buildPlotFromProcessedSpecsIntern(processedSpec, width, height, parentElement)
+        withDecodedData(plotSpec, parentElement) {
+            // Though the "plotSpec" might contain already "processed" specs,
+            // we apply "frontend" transforms anyway, just to be sure that
+            // we are going to use a truly processed specs.
+            val processedSpec = MonolithicCommon.processRawSpecs(plotSpec, frontendOnly = true)
+            buildPlotFromProcessedSpecsIntern(processedSpec, width, height, parentElement)
+        }
     } catch (e: RuntimeException) {
         handleException(e, parentElement)
     }
 }
 
+/**
+ * Decodes data columns embedded as typed arrays (see `TypedArrayEncoding`), then runs `build`.
+ * Compressed columns are decoded asynchronously.
+ */
+private fun withDecodedData(plotSpec: MutableMap<String, Any>, parentElement: HTMLElement, build: () -> Unit) {
+    TypedArrayDecoding.decode(
+        plotSpec,
+        onDecoded = {
+            try {
+                build()
+            } catch (e: RuntimeException) {
+                handleException(e, parentElement)
+            }
+        },
+        onError = { e ->
+            handleException(e as? RuntimeException ?: RuntimeException(e.message, e), parentElement)
+        }
+    )
+}
+
 private fun buildPlotFromProcessedSpecsIntern(
     plotSpec: MutableMap<String, Any>,
     width: Double,
@@ -0,0 +1,119 @@
+/*
+ * Copyright (c) 2023. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+/* root package */
+
+import kotlinx.browser.window
+import org.jetbrains.letsPlot.core.spec.Option.Meta.SharedData
+import org.jetbrains.letsPlot.core.spec.Option.PlotBase
+import org.jetbrains.letsPlot.core.util.TypedArrayEncoding
+import org.khronos.webgl.ArrayBuffer
+import org.khronos.webgl.Float32Array
+import org.khronos.webgl.Float64Array
+import org.khronos.webgl.Uint8Array
+import org.khronos.webgl.get
+import org.khronos.webgl.set
+import kotlin.js.Promise
+
+/**
+ * Decodes data columns encoded by `TypedArrayEncoding` back to lists of numbers.
+ *
+ * Uncompressed columns are decoded synchronously.
+ * Deflate-compressed columns are inflated with the browser's `DecompressionStream`,
+ * in that case the plot is built when all the columns are decoded.
+ */
+internal object TypedArrayDecoding {
+
+    private class EncodedColumn(
+        val data: MutableMap<String, Any>,
+        val name: String,
+        val spec: Map<*, *>
+    ) {
+        val float32: Boolean get() = spec[TypedArrayEncoding.TYPED_ARRAY] == TypedArrayEncoding.FLOAT32
+        val compressed: Boolean get() = spec[TypedArrayEncoding.COMPRESSION] == TypedArrayEncoding.DEFLATE
+        val length: Int get() = (spec[TypedArrayEncoding.LENGTH] as Number).toInt()
+        val base64: String get() = spec[TypedArrayEncoding.DATA] as String
+    }
+
+    fun decode(plotSpec: MutableMap<String, Any>, onDecoded: () -> Unit, onError: (Throwable) -> Unit) {
+        val columns = ArrayList<EncodedColumn>()
+        collectEncodedColumns(plotSpec, columns)
+
+        if (columns.none { it.compressed }) {
+            columns.forEach { it.data[it.name] = toValues(base64ToBytes(it.base64).buffer, it) }
+            onDecoded()
+            return
+        }
+
+        val buffers = columns.map {
+            val bytes = base64ToBytes(it.base64)
+            if (it.compressed) inflate(bytes) else Promise.resolve(bytes.buffer)
+        }
+
+        Promise.all(buffers.toTypedArray())
+            .then { decoded ->
+                columns.forEachIndexed { i, column -> column.data[column.name] = toValues(decoded[i], column) }
+                onDecoded()
+            }
+            .catch(onError)
+    }
+
+    private fun collectEncodedColumns(value: Any?, result: MutableList<EncodedColumn>) {
+        when (value) {
+            is Map<*, *> -> for ((key, v) in value) {
+                if (key == PlotBase.DATA && v is MutableMap<*, *>) {
+                    collectEncodedColumnsInData(v, result)
+                } else if (key == SharedData.TABLE && v is Map<*, *>) {
+                    v.values.filterIsInstance<MutableMap<*, *>>().forEach { collectEncodedColumnsInData(it, result) }
+                } else {
+                    collectEncodedColumns(v, result)
+                }
+            }
+
+            is List<*> -> value.forEach { collectEncodedColumns(it, result) }
+        }
+    }
+
+    private fun collectEncodedColumnsInData(data: MutableMap<*, *>, result: MutableList<EncodedColumn>) {
+        @Suppress("UNCHECKED_CAST")
+        data as MutableMap<String, Any>
+        data.filterValues(TypedArrayEncoding::isEncodedColumn).forEach { (name, column) ->
+            result.add(EncodedColumn(data, name, column as Map<*, *>))
+        }
+    }
+
+    private fun base64ToBytes(base64: String): Uint8Array {
+        val binary = window.atob(base64)
+        val bytes = Uint8Array(binary.length)
+        for (i in binary.indices) {
+            bytes[i] = binary[i].code.toByte()
+        }
+        return bytes
+    }
+
+    private fun inflate(bytes: Uint8Array): Promise<ArrayBuffer> {
+        @Suppress("UNUSED_VARIABLE")
+        val stream = js("new Blob([bytes]).stream().pipeThrough(new DecompressionStream('deflate'))")
+        return js("new Response(stream).arrayBuffer()").unsafeCast<Promise<ArrayBuffer>>()
+    }
+
+    // Typed arrays use the platform byte order which is little-endian in all browsers.
+    private fun toValues(buffer: ArrayBuffer, column: EncodedColumn): List<Double?> {
+        val length = column.length
+        val values: DoubleArray = if (column.float32) {
+            val floats = Float32Array(buffer, 0, length)
+            DoubleArray(length) { floats[it].toDouble() }
+        } else {
+            // DoubleArray is Float64Array in Kotlin/JS: no copying.
+            Float64Array(buffer, 0, length).unsafeCast<DoubleArray>()
+        }
+
+        return if (values.any(Double::isNaN)) {
+            values.map { if (it.isNaN()) null else it }
+        } else {
+            values.asList()
+        }
+    }
+}
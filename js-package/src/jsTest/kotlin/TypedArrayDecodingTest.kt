@@ -0,0 +1,76 @@
+/*
+ * Copyright (c) 2023. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+/* root package */
+
+import org.jetbrains.letsPlot.core.util.TypedArrayEncoding
+import kotlin.js.Promise
+import kotlin.test.Test
+import kotlin.test.assertEquals
+import kotlin.test.assertTrue
+
+class TypedArrayDecodingTest {
+
+    private val values = List(200) { if (it == 3) null else it * 0.5 }
+    private val labels = List(200) { "a" }
+
+    private fun plotSpec(): MutableMap<String, Any> = mutableMapOf(
+        "kind" to "plot",
+        "data" to mapOf("x" to values, "label" to labels),
+        "layers" to listOf(mapOf("geom" to "point", "data" to mapOf("y" to values))),
+        "shared_data" to mapOf("0" to mapOf("z" to values))
+    )
+
+    @Test
+    fun uncompressedColumnsAreDecodedSynchronously() {
+        for (float32 in listOf(false, true)) {
+            val spec = TypedArrayEncoding(float32).encode(plotSpec())
+            var decoded = false
+            TypedArrayDecoding.decode(spec, onDecoded = { decoded = true }, onError = { throw it })
+            assertTrue(decoded, "float32: $float32")
+            assertDecoded(spec)
+        }
+    }
+
+    @Test
+    fun compressedColumnsAreDecodedAsynchronously(): Promise<Unit> {
+        val spec = TypedArrayEncoding(float32 = false, deflate = ::storedDeflate).encode(plotSpec())
+        val decoded = Promise { resolve, reject ->
+            TypedArrayDecoding.decode(spec, onDecoded = { resolve(Unit) }, onError = reject)
+        }
+        assertTrue(TypedArrayEncoding.isEncodedColumn(data(spec)["x"]))
+        return decoded.then { assertDecoded(spec) }
+    }
+
+    private fun assertDecoded(spec: Map<String, Any>) {
+        assertEquals(values, data(spec)["x"])
+        assertEquals(labels, data(spec)["label"])
+        assertEquals(values, data((spec["layers"] as List<*>)[0] as Map<*, *>)["y"])
+        assertEquals(values, ((spec["shared_data"] as Map<*, *>)["0"] as Map<*, *>)["z"])
+    }
+
+    companion object {
+        private fun data(spec: Map<*, *>): Map<*, *> = spec["data"] as Map<*, *>
+
+        // The zlib stream of a single stored (not compressed) deflate block.
+        private fun storedDeflate(bytes: ByteArray): ByteArray {
+            val len = bytes.size
+            check(len <= 0xFFFF)
+
+            var a = 1
+            var b = 0
+            for (byte in bytes) {
+                a = (a + (byte.toInt() and 0xFF)) % 65521
+                b = (b + a) % 65521
+            }
+            val adler32 = (b shl 16) or a
+
+            val header = byteArrayOf(0x78, 0x01, 0x01)
+            val blockLength = byteArrayOf(len.toByte(), (len shr 8).toByte(), len.inv().toByte(), (len.inv() shr 8).toByte())
+            val checksum = byteArrayOf((adler32 ushr 24).toByte(), (adler32 shr 16).toByte(), (adler32 shr 8).toByte(), adler32.toByte())
+            return header + blockLength + bytes + checksum
+        }
+    }
+}
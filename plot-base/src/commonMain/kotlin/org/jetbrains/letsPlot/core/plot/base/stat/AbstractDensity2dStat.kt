@@ -8,6 +8,8 @@ package org.jetbrains.letsPlot.core.plot.base.stat
 import org.jetbrains.letsPlot.core.plot.base.Aes
 import org.jetbrains.letsPlot.core.plot.base.DataFrame
 import org.jetbrains.letsPlot.core.plot.base.StatContext
+import org.jetbrains.letsPlot.core.plot.base.stat.math3.BlockRealMatrix
+import org.jetbrains.letsPlot.core.commons.data.SeriesUtil
 
 abstract class AbstractDensity2dStat(
     private val bandWidthX: Double?,
@@ -15,6 +17,7 @@ abstract class AbstractDensity2dStat(
     private val bandWidthMethod: DensityStat.BandWidthMethod,  // Used is `bandWidth` is not set.
     protected val adjust: Double,
     private val kernel: DensityStat.Kernel,
+    private val method: DensityStat.Method,
     protected val nX: Int,
     protected val nY: Int,
     protected val isContour: Boolean,
@@ -73,6 +76,42 @@ abstract class AbstractDensity2dStat(
         )
     }
 
+    /**
+     * Density at the nodes of the `stepsX` x `stepsY` grid, row by row (size: nY * nX).
+     */
+    protected fun densityGrid(
+        xs: List<Double?>,
+        ys: List<Double?>,
+        weights: List<Double?>,
+        stepsX: List<Double>,
+        stepsY: List<Double>,
+        bandWidthX: Double,
+        bandWidthY: Double
+    ): List<Double> {
+        val weightsSum = SeriesUtil.sum(weights)
+        // Otherwise (e.g. the grid would be too coarse for the bandwidth): the direct computation.
+        val useFft = method == DensityStat.Method.FFT &&
+                DensityStatUtil.isFft2dApplicable(stepsX, stepsY, bandWidthX * adjust, bandWidthY * adjust)
+        if (useFft) {
+            val density = DensityStatUtil.density2dFft(
+                xs, ys, weights, stepsX, stepsY, kernelFun, bandWidthX, bandWidthY, adjust
+            )
+            return density.flatMap { row -> row.map { it / weightsSum } }
+        }
+
+        val matrixX = BlockRealMatrix(
+            DensityStatUtil.createRawMatrix(xs, stepsX, kernelFun, bandWidthX, adjust, weights)
+        )
+        val matrixY = BlockRealMatrix(
+            DensityStatUtil.createRawMatrix(ys, stepsY, kernelFun, bandWidthY, adjust, weights)
+        )
+        // size: nY * nX
+        val matrixFinal = matrixY.multiply(matrixX.transpose())
+        return (0 until nY).flatMap { row ->
+            (0 until nX).map { col -> matrixFinal.getEntry(row, col) / weightsSum }
+        }
+    }
+
 //    fun setBinCount(bin: Int) {
 //        myBinCount = bin
 //    }
@@ -108,6 +147,7 @@ abstract class AbstractDensity2dStat(
     companion object {
         //        const val DEF_KERNEL = "gaussian"
         val DEF_KERNEL = DensityStat.Kernel.GAUSSIAN
+        val DEF_METHOD = DensityStat.Method.AUTO
         const val DEF_ADJUST = 1.0
         const val DEF_N = 100
 
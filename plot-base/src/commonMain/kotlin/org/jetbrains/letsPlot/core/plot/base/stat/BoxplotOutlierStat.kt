@@ -10,9 +10,12 @@ import org.jetbrains.letsPlot.core.plot.base.DataFrame
 import org.jetbrains.letsPlot.core.plot.base.StatContext
 import org.jetbrains.letsPlot.core.plot.base.data.TransformVar
 import org.jetbrains.letsPlot.core.commons.data.SeriesUtil
+import kotlin.random.Random
 
 class BoxplotOutlierStat(
-    private val whiskerIQRRatio: Double    // ggplot: 'coef'
+    private val whiskerIQRRatio: Double,    // ggplot: 'coef'
+    private val quantileMethod: BoxplotStat.QuantileMethod,
+    private val maxOutliers: Int?           // null - all outliers
 ) : BaseStat(DEF_MAPPING) {
 
     override fun consumes(): List<Aes<*>> {
@@ -31,7 +34,7 @@ class BoxplotOutlierStat(
             List(ys.size) { 0.0 }
         }
 
-        val statData = buildStat(xs, ys, whiskerIQRRatio)
+        val statData = buildStat(xs, ys, whiskerIQRRatio, quantileMethod, maxOutliers)
 
         val builder = DataFrame.Builder()
         for ((variable, series) in statData) {
@@ -41,6 +44,8 @@ class BoxplotOutlierStat(
     }
 
     companion object {
+        private const val OUTLIER_SAMPLING_SEED = 42
+
         private val DEF_MAPPING: Map<Aes<*>, DataFrame.Variable> = mapOf(
             Aes.X to Stats.X,
             Aes.Y to Stats.Y,
@@ -54,7 +59,9 @@ class BoxplotOutlierStat(
         private fun buildStat(
             xs: List<Double?>,
             ys: List<Double?>,
-            whiskerIQRRatio: Double
+            whiskerIQRRatio: Double,
+            quantileMethod: BoxplotStat.QuantileMethod,
+            maxOutliers: Int?
         ): MutableMap<DataFrame.Variable, List<Double>> {
             val xyPairs = SeriesUtil.filterFinite(xs, ys)
                 .let { (xs, ys) -> xs zip ys }
@@ -77,7 +84,7 @@ class BoxplotOutlierStat(
             val statMax = ArrayList<Double>()
 
             for ((x, bin) in binnedData) {
-                val summary = FiveNumberSummary(bin)
+                val summary = FiveNumberSummary(bin, approximate = quantileMethod == BoxplotStat.QuantileMethod.APPROX)
                 val middle = summary.median
                 val lowerHinge = summary.firstQuartile
                 val upperHinge = summary.thirdQuartile
@@ -96,7 +103,9 @@ class BoxplotOutlierStat(
                     }
                 }
 
-                val outliers = bin.filter { y -> y < lowerFence || y > upperFence }
+                val outliers = bin.filter { y -> y < lowerFence || y > upperFence }.let {
+                    if (maxOutliers != null && it.size > maxOutliers) sampleOutliers(it, maxOutliers) else it
+                }
                 val binOutliers = if (outliers.isEmpty() && bin.size > 0) {
                     // If there are no outliers, add a fake one to correct splitting for additional grouping
                     listOf(Double.NaN)
@@ -126,5 +135,19 @@ class BoxplotOutlierStat(
                 Stats.Y_MAX to statMax,
             )
         }
+
+        /**
+         * Random sample of `count` outliers (in the original order) always including the smallest and the largest one.
+         */
+        private fun sampleOutliers(outliers: List<Double>, count: Int): List<Double> {
+            val extremes = listOfNotNull(
+                outliers.indices.minByOrNull { outliers[it] },
+                outliers.indices.maxByOrNull { outliers[it] }
+            ).distinct().take(count)
+            val others = outliers.indices.filter { it !in extremes }
+                .shuffled(Random(OUTLIER_SAMPLING_SEED))
+                .take(count - extremes.size)
+            return (extremes + others).sorted().map { outliers[it] }
+        }
     }
-}
\ No newline at end of file
+}
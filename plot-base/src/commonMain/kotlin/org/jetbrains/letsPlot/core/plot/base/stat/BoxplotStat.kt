@@ -31,7 +31,8 @@ import kotlin.math.sqrt
  */
 class BoxplotStat(
     private val whiskerIQRRatio: Double,    // ggplot: 'coef'
-    private val computeWidth: Boolean       // ggplot: 'varWidth'
+    private val computeWidth: Boolean,      // ggplot: 'varWidth'
+    private val quantileMethod: QuantileMethod
 ) : BaseStat(DEF_MAPPING) {
 
     override fun hasDefaultMapping(aes: Aes<*>): Boolean {
@@ -63,7 +64,7 @@ class BoxplotStat(
             List(ys.size) { 0.0 }
         }
 
-        val statData = buildStat(xs, ys, whiskerIQRRatio)
+        val statData = buildStat(xs, ys, whiskerIQRRatio, quantileMethod)
 
         val statCount = statData.remove(Stats.COUNT)
         val maxCountPerBin = statCount?.maxOrNull()?.toInt() ?: 0
@@ -84,9 +85,15 @@ class BoxplotStat(
         return builder.build()
     }
 
+    enum class QuantileMethod {
+        EXACT,
+        APPROX  // quartiles of big groups are computed over a random sample, see QuantileUtil.approxQuantiles()
+    }
+
     companion object {
         const val DEF_WHISKER_IQR_RATIO = 1.5
         const val DEF_COMPUTE_WIDTH = false
+        val DEF_QUANTILE_METHOD = QuantileMethod.EXACT
 
         private val DEF_MAPPING: Map<Aes<*>, DataFrame.Variable> = mapOf(
             Aes.X to Stats.X,
@@ -100,7 +107,8 @@ class BoxplotStat(
         private fun buildStat(
             xs: List<Double?>,
             ys: List<Double?>,
-            whiskerIQRRatio: Double
+            whiskerIQRRatio: Double,
+            quantileMethod: QuantileMethod
         ): MutableMap<DataFrame.Variable, List<Double>> {
 
             val xyPairs = SeriesUtil.filterFinite(xs, ys)
@@ -126,7 +134,7 @@ class BoxplotStat(
             for ((x, bin) in binnedData) {
                 val count = bin.size.toDouble()
 
-                val summary = FiveNumberSummary(bin)
+                val summary = FiveNumberSummary(bin, approximate = quantileMethod == QuantileMethod.APPROX)
                 val middle = summary.median
                 val lowerHinge = summary.firstQuartile
                 val upperHinge = summary.thirdQuartile
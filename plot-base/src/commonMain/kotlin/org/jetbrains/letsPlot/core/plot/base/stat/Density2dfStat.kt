@@ -9,7 +9,6 @@ import org.jetbrains.letsPlot.core.plot.base.Aes
 import org.jetbrains.letsPlot.core.plot.base.DataFrame
 import org.jetbrains.letsPlot.core.plot.base.StatContext
 import org.jetbrains.letsPlot.core.plot.base.data.TransformVar
-import org.jetbrains.letsPlot.core.plot.base.stat.math3.BlockRealMatrix
 import org.jetbrains.letsPlot.core.commons.data.SeriesUtil
 
 class Density2dfStat(
@@ -18,6 +17,7 @@ class Density2dfStat(
     bandWidthMethod: DensityStat.BandWidthMethod,  // Used is `bandWidth` is not set.
     adjust: Double,
     kernel: DensityStat.Kernel,
+    method: DensityStat.Method,
     nX: Int,
     nY: Int,
     isContour: Boolean,
@@ -30,6 +30,7 @@ class Density2dfStat(
     bandWidthMethod = bandWidthMethod,
     adjust = adjust,
     kernel = kernel,
+    method = method,
     nX = nX,
     nY = nY,
     isContour = isContour,
@@ -61,22 +62,8 @@ class Density2dfStat(
         val xRange = statCtx.overallXRange()
         val yRange = statCtx.overallYRange()
 
-        val statX = ArrayList<Double>()
-        val statY = ArrayList<Double>()
-        val statDensity = ArrayList<Double>()
-
-        val bandWidth = DoubleArray(2)
-//        bandWidth[0] = if (bandWidths != null) bandWidths!![0] else DensityStatUtil.bandWidth(
-//            bandWidthMethod,
-//            xVector
-//        )
-        bandWidth[0] = getBandWidthX(xVector)
-
-//        bandWidth[1] = if (bandWidths != null) bandWidths!![1] else DensityStatUtil.bandWidth(
-//            bandWidthMethod,
-//            yVector
-//        )
-        bandWidth[1] = getBandWidthY(yVector)
+        val bandWidthX = getBandWidthX(xVector)
+        val bandWidthY = getBandWidthY(yVector)
 
         val stepsX = DensityStatUtil.createStepValues(xRange!!, nX)
         val stepsY = DensityStatUtil.createStepValues(yRange!!, nY)
@@ -84,34 +71,14 @@ class Density2dfStat(
         // weight aesthetics
         val groupWeight = BinStatUtil.weightVector(xVector.size, data)
 
-        val matrixX = BlockRealMatrix(
-            DensityStatUtil.createRawMatrix(
-                xVector,
-                stepsX,
-                kernelFun,
-                bandWidth[0],
-                adjust,
-                groupWeight
-            )
-        )
-        val matrixY = BlockRealMatrix(
-            DensityStatUtil.createRawMatrix(
-                yVector,
-                stepsY,
-                kernelFun,
-                bandWidth[1],
-                adjust,
-                groupWeight
-            )
-        )
         // size: nY * nX
-        val matrixFinal = matrixY.multiply(matrixX.transpose())
-
+        val statDensity = densityGrid(xVector, yVector, groupWeight, stepsX, stepsY, bandWidthX, bandWidthY)
+        val statX = ArrayList<Double>()
+        val statY = ArrayList<Double>()
         for (row in 0 until nY) {
             for (col in 0 until nX) {
                 statX.add(stepsX[col])
                 statY.add(stepsY[row])
-                statDensity.add(matrixFinal.getEntry(row, col) / SeriesUtil.sum(groupWeight))
             }
         }
 
@@ -19,6 +19,7 @@ class DensityRidgesStat(
     private val adjust: Double,
     private val kernel: DensityStat.Kernel,
     private val n: Int,
+    private val method: DensityStat.Method,
     private val fullScanMax: Int,
     private val quantiles: List<Double>
 ) : BaseStat(DEF_MAPPING) {
@@ -53,7 +54,7 @@ class DensityRidgesStat(
         val overallXRange = statCtx.overallXRange() ?: DoubleSpan(-0.5, 0.5)
         val statData = DensityStatUtil.binnedStat(
             ys, xs, ws,
-            trim, tailsCutoff, bandWidth, bandWidthMethod, adjust, kernel, n, fullScanMax, overallXRange, quantiles,
+            trim, tailsCutoff, bandWidth, bandWidthMethod, adjust, kernel, n, method, fullScanMax, overallXRange, quantiles,
             binVarName = Stats.Y, valueVarName = Stats.X
         )
 
@@ -18,6 +18,9 @@ import org.jetbrains.letsPlot.core.commons.data.SeriesUtil
  *
  * If size of the input series exceeds the 'fullScanMax' value, then the less accurate but more efficient computation replaces
  * highly inefficient 'full scan' computation.
+ *
+ * With the 'FFT' method, the input series is binned onto a fine grid which is then convolved with the kernel:
+ * use it with very large input series.
  */
 class DensityStat(
     private val trim: Boolean,
@@ -26,6 +29,7 @@ class DensityStat(
     private val adjust: Double,
     private val kernel: Kernel,
     private val n: Int,
+    private val method: Method,
     private val fullScanMax: Int,
     private val quantiles: List<Double>
 ) : BaseStat(DEF_MAPPING) {
@@ -81,7 +85,7 @@ class DensityStat(
         val statScaled = ArrayList<Double>()
         val densityFunction = DensityStatUtil.densityFunction(
             xs, weights,
-            bandWidth, bandWidthMethod, adjust, kernel, fullScanMax
+            bandWidth, bandWidthMethod, adjust, kernel, method, fullScanMax
         )
 
         val nTotal = weights.sum()
@@ -123,6 +127,11 @@ class DensityStat(
         COSINE
     }
 
+    enum class Method {
+        AUTO,  // 'full scan' or, for input series bigger than 'fullScanMax', the less accurate computation
+        FFT
+    }
+
     enum class BandWidthMethod {
         NRD0,
         NRD
@@ -133,6 +142,7 @@ class DensityStat(
         val DEF_KERNEL = Kernel.GAUSSIAN
         const val DEF_ADJUST = 1.0
         const val DEF_N = 512
+        val DEF_METHOD = Method.AUTO
         val DEF_BW = NRD0
         const val DEF_FULL_SCAN_MAX = 5000
         val DEF_QUANTILES = listOf(0.25, 0.5, 0.75)
@@ -14,6 +14,14 @@ object DensityStatUtil {
 
     private const val DEF_STEP_SIZE = 0.5
 
+    // Grid of the 'fft' method: the number of grid points per bandwidth and the max grid size.
+    private const val FFT_GRID_POINTS_PER_BW = 20
+    private const val FFT_MAX_GRID_SIZE = 65536
+
+    // The same for the 2d density (per axis).
+    private const val FFT_2D_GRID_POINTS_PER_BW = 8
+    private const val FFT_2D_MAX_GRID_SIZE = 2048
+
     private fun stdDev(data: List<Double>): Double {
         var sum = 0.0
         var counter = 0.0
@@ -39,6 +47,7 @@ object DensityStatUtil {
         adjust: Double,
         kernel: DensityStat.Kernel,
         n: Int,
+        method: DensityStat.Method,
         fullScanMax: Int,
         overallValuesRange: DoubleSpan,
         quantiles: List<Double> = emptyList(),
@@ -67,7 +76,7 @@ object DensityStatUtil {
             val binStatValue = createStepValues(valueRange, n)
             val densityFunction = densityFunction(
                 binValue, binWeight,
-                bandWidth, bandWidthMethod, adjust, kernel, fullScanMax
+                bandWidth, bandWidthMethod, adjust, kernel, method, fullScanMax
             )
             val binStatCount = binStatValue.map { densityFunction(it) }
             val widthsSum = binWeight.sum()
@@ -241,14 +250,16 @@ object DensityStatUtil {
         bwMethod: DensityStat.BandWidthMethod,
         ad: Double,
         ker: DensityStat.Kernel,
+        method: DensityStat.Method,
         fullScanMax: Int
     ): (Double) -> Double {
         val bandWidth = bw ?: bandWidth(bwMethod, values)
         val kernelFun: (Double) -> Double = kernel(ker)
 
-        return when (values.size <= fullScanMax) {
-            true -> densityFunctionFullScan(values, weights, kernelFun, bandWidth, ad)
-            false -> densityFunctionFast(values, weights, kernelFun, bandWidth, ad)
+        return when {
+            method == DensityStat.Method.FFT -> densityFunctionFft(values, weights, kernelFun, bandWidth, ad)
+            values.size <= fullScanMax -> densityFunctionFullScan(values, weights, kernelFun, bandWidth, ad)
+            else -> densityFunctionFast(values, weights, kernelFun, bandWidth, ad)
         }
     }
 
@@ -297,6 +308,184 @@ object DensityStatUtil {
         }
     }
 
+    /**
+     * Binned approximation: the values are linearly binned onto a regular grid
+     * and the bin weights are convolved with the kernel (via FFT).
+     * The density between the grid points is linearly interpolated.
+     *
+     * Like in `densityFunctionFast`, the kernel is truncated at 5 bandwidths.
+     * When the range of the values is too wide for FFT_GRID_POINTS_PER_BW points per bandwidth
+     * within FFT_MAX_GRID_SIZE (e.g. due to outliers), falls back to `densityFunctionFast`.
+     */
+    internal fun densityFunctionFft(
+        xs: List<Double>,  // must be ordered!
+        weights: List<Double>,
+        ker: (Double) -> Double,
+        bw: Double,
+        ad: Double
+    ): (Double) -> Double {
+        val h = bw * ad
+        if (!(h > 0.0 && h.isFinite())) {
+            return densityFunctionFullScan(xs, weights, ker, bw, ad)
+        }
+        val cutoff = h * 5
+
+        val gridStart = xs.minOrNull()!! - cutoff
+        val gridEnd = xs.maxOrNull()!! + cutoff
+        val requiredGridSize = ceil((gridEnd - gridStart) / h * FFT_GRID_POINTS_PER_BW) + 1
+        if (requiredGridSize > FFT_MAX_GRID_SIZE) {
+            return densityFunctionFast(xs, weights, ker, bw, ad)
+        }
+        val gridSize = requiredGridSize.toInt()
+        val step = (gridEnd - gridStart) / (gridSize - 1)
+
+        val binWeights = DoubleArray(gridSize)
+        for (i in xs.indices) {
+            val pos = (xs[i] - gridStart) / step
+            val bin = min(floor(pos).toInt(), gridSize - 2)
+            val frac = pos - bin
+            binWeights[bin] += weights[i] * (1 - frac)
+            binWeights[bin + 1] += weights[i] * frac
+        }
+
+        val kernelValues = wrappedKernel(ker, h, step, gridSize)
+        val density = FftUtil.convolve(binWeights.copyOf(kernelValues.size), kernelValues)
+        return { x ->
+            val pos = (x - gridStart) / step
+            if (pos < 0 || pos > gridSize - 1) {
+                0.0
+            } else {
+                val i = min(floor(pos).toInt(), gridSize - 2)
+                val frac = pos - i
+                density[i] * (1 - frac) + density[i + 1] * frac
+            }
+        }
+    }
+
+    /**
+     * Binned approximation of the 2d density at the nodes of the `stepsX` x `stepsY` grid (size: nY * nX).
+     * The values are bilinearly binned onto a grid which refines the (evenly spaced) steps,
+     * then the bin weights are convolved with the kernel along x and along y (via FFT).
+     *
+     * The values are expected to lie within the range of the steps.
+     * See `isFft2dApplicable`.
+     */
+    internal fun density2dFft(
+        xs: List<Double?>,
+        ys: List<Double?>,
+        weights: List<Double?>,
+        stepsX: List<Double>,
+        stepsY: List<Double>,
+        ker: (Double) -> Double,
+        bwX: Double,
+        bwY: Double,
+        ad: Double
+    ): Array<DoubleArray> {
+        val gridX = FftGrid(stepsX, bwX * ad)
+        val gridY = FftGrid(stepsY, bwY * ad)
+
+        val binWeights = Array(gridY.size) { DoubleArray(gridX.size) }
+        for (i in xs.indices) {
+            val posX = gridX.position(xs[i]!!)
+            val posY = gridY.position(ys[i]!!)
+            val col = min(floor(posX).toInt(), gridX.size - 2)
+            val row = min(floor(posY).toInt(), gridY.size - 2)
+            val fracX = posX - col
+            val fracY = posY - row
+            val w = weights[i]!!
+            binWeights[row][col] += w * (1 - fracX) * (1 - fracY)
+            binWeights[row][col + 1] += w * fracX * (1 - fracY)
+            binWeights[row + 1][col] += w * (1 - fracX) * fracY
+            binWeights[row + 1][col + 1] += w * fracX * fracY
+        }
+
+        // Along x: keep only the columns of the steps.
+        val kernelX = wrappedKernel(ker, gridX.h, gridX.step, gridX.size)
+        val convolveX = FftUtil.convolver(kernelX)
+        val convolvedRows = binWeights.map { binRow ->
+            val convolved = convolveX(binRow.copyOf(kernelX.size))
+            DoubleArray(stepsX.size) { convolved[it * gridX.refinement] }
+        }
+
+        // Along y: keep only the rows of the steps.
+        val kernelY = wrappedKernel(ker, gridY.h, gridY.step, gridY.size)
+        val convolveY = FftUtil.convolver(kernelY)
+        val result = Array(stepsY.size) { DoubleArray(stepsX.size) }
+        for (col in stepsX.indices) {
+            val column = DoubleArray(kernelY.size)
+            for (row in convolvedRows.indices) {
+                column[row] = convolvedRows[row][col]
+            }
+            val convolved = convolveY(column)
+            for (row in stepsY.indices) {
+                result[row][col] = convolved[row * gridY.refinement]
+            }
+        }
+        return result
+    }
+
+    /**
+     * Whether the grids of `density2dFft` have FFT_2D_GRID_POINTS_PER_BW points per bandwidth
+     * within FFT_2D_MAX_GRID_SIZE: too wide steps (e.g. due to outliers) would under-sample the kernel.
+     */
+    internal fun isFft2dApplicable(stepsX: List<Double>, stepsY: List<Double>, hX: Double, hY: Double): Boolean {
+        return hX > 0.0 && hY > 0.0 &&
+                stepsX.size > 1 && stepsY.size > 1 &&
+                FftGrid.isFineEnough(stepsX, hX) && FftGrid.isFineEnough(stepsY, hY)
+    }
+
+    /**
+     * Kernel values at the grid steps for the convolution with a grid of size `gridSize`:
+     * k(0), k(step), ..., k(-step) ('wrapped around', zero-padded to a power of two).
+     * The kernel is truncated at 5 bandwidths.
+     */
+    private fun wrappedKernel(ker: (Double) -> Double, h: Double, step: Double, gridSize: Int): DoubleArray {
+        val halfSize = min((gridSize - 1).toDouble(), floor(h * 5 / step)).toInt()
+        val fftSize = FftUtil.nextPowerOfTwo(gridSize + halfSize)
+        val kernelValues = DoubleArray(fftSize)
+        for (i in 0..halfSize) {
+            val k = ker(i * step / h) / h
+            kernelValues[i] = k
+            if (i > 0) {
+                kernelValues[fftSize - i] = k
+            }
+        }
+        return kernelValues
+    }
+
+    /**
+     * Evenly spaced steps refined so that the grid has about FFT_2D_GRID_POINTS_PER_BW points per bandwidth.
+     */
+    private class FftGrid(steps: List<Double>, val h: Double) {
+        private val start = steps.first()
+        val refinement: Int
+        val step: Double
+        val size: Int
+
+        init {
+            require(steps.size > 1) { "At least two steps expected but was ${steps.size}" }
+            val outerStep = outerStep(steps)
+            refinement = min(maxRefinement(steps).toDouble(), ceil(outerStep / h * FFT_2D_GRID_POINTS_PER_BW)).toInt()
+                .coerceAtLeast(1)
+            step = outerStep / refinement
+            size = (steps.size - 1) * refinement + 1
+        }
+
+        fun position(value: Double): Double {
+            return ((value - start) / step).coerceIn(0.0, (size - 1).toDouble())
+        }
+
+        companion object {
+            private fun outerStep(steps: List<Double>) = (steps.last() - steps.first()) / (steps.size - 1)
+
+            private fun maxRefinement(steps: List<Double>) = max(1, (FFT_2D_MAX_GRID_SIZE - 1) / (steps.size - 1))
+
+            fun isFineEnough(steps: List<Double>, h: Double): Boolean {
+                return outerStep(steps) / maxRefinement(steps) <= h / FFT_2D_GRID_POINTS_PER_BW
+            }
+        }
+    }
+
     fun createStepValues(range: DoubleSpan, n: Int): List<Double> {
         val x = ArrayList<Double>()
         var min = range.lowerEnd
@@ -330,6 +519,17 @@ object DensityStatUtil {
         }
     }
 
+    fun toMethod(method: String): DensityStat.Method {
+        return when (method) {
+            "auto" -> DensityStat.Method.AUTO
+            "fft" -> DensityStat.Method.FFT
+            else -> throw IllegalArgumentException(
+                "Unsupported density estimation method: '$method'.\n" +
+                        "Use one of: auto, fft."
+            )
+        }
+    }
+
     fun toBandWidthMethod(bw: String): DensityStat.BandWidthMethod {
         return when (bw) {
             "nrd0" -> DensityStat.BandWidthMethod.NRD0
@@ -0,0 +1,107 @@
+/*
+ * Copyright (c) 2023. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.plot.base.stat
+
+import kotlin.math.PI
+import kotlin.math.cos
+import kotlin.math.sin
+
+internal object FftUtil {
+
+    fun nextPowerOfTwo(n: Int): Int {
+        var size = 1
+        while (size < n) {
+            size = size shl 1
+        }
+        return size
+    }
+
+    /**
+     * Circular convolution of two real sequences of the same size (a power of two).
+     */
+    fun convolve(a: DoubleArray, b: DoubleArray): DoubleArray {
+        require(a.size == b.size) { "Sequences must have equal size: ${a.size} != ${b.size}" }
+        return convolver(b)(a)
+    }
+
+    /**
+     * Returns a function computing circular convolution of a real sequence with the `kernel`.
+     * The kernel is transformed once: use it to convolve many sequences with the same kernel.
+     */
+    fun convolver(kernel: DoubleArray): (DoubleArray) -> DoubleArray {
+        val size = kernel.size
+        require(size > 0 && size and (size - 1) == 0) { "Size must be a power of two: $size" }
+
+        val kRe = kernel.copyOf()
+        val kIm = DoubleArray(size)
+        transform(kRe, kIm, inverse = false)
+
+        return { a ->
+            require(a.size == size) { "Sequence size must be $size but was ${a.size}" }
+            val re = a.copyOf()
+            val im = DoubleArray(size)
+            transform(re, im, inverse = false)
+
+            for (i in 0 until size) {
+                val r = re[i] * kRe[i] - im[i] * kIm[i]
+                im[i] = re[i] * kIm[i] + im[i] * kRe[i]
+                re[i] = r
+            }
+
+            transform(re, im, inverse = true)
+            for (i in 0 until size) {
+                re[i] /= size
+            }
+            re
+        }
+    }
+
+    /**
+     * In-place iterative radix-2 FFT (unnormalized in both directions).
+     */
+    private fun transform(re: DoubleArray, im: DoubleArray, inverse: Boolean) {
+        val size = re.size
+
+        // Bit-reversal permutation.
+        var j = 0
+        for (i in 1 until size) {
+            var bit = size shr 1
+            while (j and bit != 0) {
+                j = j xor bit
+                bit = bit shr 1
+            }
+            j = j xor bit
+            if (i < j) {
+                var t = re[i]; re[i] = re[j]; re[j] = t
+                t = im[i]; im[i] = im[j]; im[j] = t
+            }
+        }
+
+        val sign = if (inverse) 1.0 else -1.0
+        var len = 2
+        while (len <= size) {
+            val angle = sign * 2 * PI / len
+            val half = len / 2
+            for (k in 0 until half) {
+                val wRe = cos(angle * k)
+                val wIm = sin(angle * k)
+                var start = 0
+                while (start < size) {
+                    val u = start + k
+                    val v = u + half
+                    val tRe = re[v] * wRe - im[v] * wIm
+                    val tIm = re[v] * wIm + im[v] * wRe
+                    re[v] = re[u] - tRe
+                    im[v] = im[u] - tIm
+                    re[u] += tRe
+                    im[u] += tIm
+                    start += len
+                }
+            }
+            len = len shl 1
+        }
+    }
+}
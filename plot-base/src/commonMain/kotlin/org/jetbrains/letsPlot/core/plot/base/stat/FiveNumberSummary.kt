@@ -20,13 +20,28 @@ internal class FiveNumberSummary {
     // 25 %
     val thirdQuartile: Double    // 75 %
 
-    constructor(data: List<Double>) {
-        val sorted = Ordering.natural<Double>().sortedCopy(data)
-        min = AggregateFunctions.min(sorted)
-        max = AggregateFunctions.max(sorted)
-        median = AggregateFunctions.median(sorted)
-        firstQuartile = AggregateFunctions.quantile(sorted, 0.25)
-        thirdQuartile = AggregateFunctions.quantile(sorted, 0.75)
+    /**
+     * With `approximate` the quartiles of a big data are computed over a random sample
+     * (see QuantileUtil.approxQuantiles()), min and max are always exact.
+     */
+    constructor(data: List<Double>, approximate: Boolean = false) {
+        if (data.any { it.isNaN() }) {
+            val sorted = Ordering.natural<Double>().sortedCopy(data)
+            min = AggregateFunctions.min(sorted)
+            max = AggregateFunctions.max(sorted)
+        } else {
+            min = data.minOrNull() ?: Double.NaN
+            max = data.maxOrNull() ?: Double.NaN
+        }
+
+        val quantiles = if (approximate) {
+            QuantileUtil.approxQuantiles(data, QUANTILES)
+        } else {
+            QuantileUtil.quantiles(data, QUANTILES)
+        }
+        firstQuartile = quantiles[0]
+        median = quantiles[1]
+        thirdQuartile = quantiles[2]
     }
 
     constructor(min: Double, max: Double, median: Double, firstQuartile: Double, thirdQuartile: Double) {
@@ -51,4 +66,8 @@ internal class FiveNumberSummary {
     override fun hashCode(): Int {
         return arrayOf(min, max, median, firstQuartile, thirdQuartile).hashCode()
     }
+
+    companion object {
+        private val QUANTILES = listOf(0.25, 0.5, 0.75)
+    }
 }
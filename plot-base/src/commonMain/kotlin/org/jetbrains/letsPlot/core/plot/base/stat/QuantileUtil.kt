@@ -0,0 +1,117 @@
+/*
+ * Copyright (c) 2023. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.plot.base.stat
+
+import kotlin.math.ceil
+import kotlin.math.floor
+import kotlin.random.Random
+
+internal object QuantileUtil {
+    // Approximate quantiles are computed over a random sample of this size.
+    const val APPROX_SAMPLE_SIZE = 100_000
+    private const val APPROX_SEED = 42
+
+    /**
+     * Same as `AggregateFunctions.quantile()` of the sorted values but computed by selection (no full sort).
+     */
+    fun quantiles(values: List<Double>, probabilities: List<Double>): List<Double> {
+        if (values.isEmpty()) {
+            return probabilities.map { Double.NaN }
+        }
+        if (values.any { it.isNaN() }) {
+            // NaN is the greatest value in the natural ordering, selection doesn't support it.
+            val sorted = values.sorted()
+            return probabilities.map { p -> AggregateFunctions.quantile(sorted, p) }
+        }
+        return selectQuantiles(values.toDoubleArray(), probabilities)
+    }
+
+    /**
+     * Quantiles of a random sample of APPROX_SAMPLE_SIZE values (exact for smaller data).
+     */
+    fun approxQuantiles(values: List<Double>, probabilities: List<Double>): List<Double> {
+        if (values.size <= APPROX_SAMPLE_SIZE) {
+            return quantiles(values, probabilities)
+        }
+        val random = Random(APPROX_SEED)
+        val sample = List(APPROX_SAMPLE_SIZE) { values[random.nextInt(values.size)] }
+        return quantiles(sample, probabilities)
+    }
+
+    private fun selectQuantiles(values: DoubleArray, probabilities: List<Double>): List<Double> {
+        val places = probabilities.map { p -> p * (values.size - 1) }
+        val positions = places.flatMap { listOf(floor(it).toInt(), ceil(it).toInt()) }.distinct().sorted()
+
+        // Values right of a selected position are not less than it: select the next position among them.
+        val valueAt = HashMap<Int, Double>()
+        var from = 0
+        for (k in positions) {
+            select(values, k, from, values.size - 1)
+            valueAt[k] = values[k]
+            from = k
+        }
+
+        return places.map { place ->
+            val lower = valueAt.getValue(floor(place).toInt())
+            val upper = valueAt.getValue(ceil(place).toInt())
+            if (floor(place) == place) lower else (upper + lower) / 2.0
+        }
+    }
+
+    /**
+     * Introselect: moves the k-th smallest value of a[from..to] to the index k,
+     * with not greater values before it and not less values after it.
+     * Falls back to sorting if the partitioning doesn't converge.
+     */
+    internal fun select(a: DoubleArray, k: Int, from: Int, to: Int) {
+        var lo = from
+        var hi = to
+        var depthLimit = 0
+        var size = hi - lo + 1
+        while (size > 0) {
+            depthLimit += 2
+            size = size shr 1
+        }
+        while (hi > lo) {
+            if (depthLimit-- == 0) {
+                a.sort(lo, hi + 1)
+                return
+            }
+
+            // Median of three.
+            val mid = (lo + hi) ushr 1
+            if (a[mid] < a[lo]) swap(a, mid, lo)
+            if (a[hi] < a[lo]) swap(a, hi, lo)
+            if (a[hi] < a[mid]) swap(a, hi, mid)
+            val pivot = a[mid]
+
+            var i = lo
+            var j = hi
+            while (i <= j) {
+                while (a[i] < pivot) i++
+                while (a[j] > pivot) j--
+                if (i <= j) {
+                    swap(a, i, j)
+                    i++
+                    j--
+                }
+            }
+
+            // a[lo..j] <= pivot, a[j+1..i-1] == pivot, a[i..hi] >= pivot
+            when {
+                k <= j -> hi = j
+                k >= i -> lo = i
+                else -> return
+            }
+        }
+    }
+
+    private fun swap(a: DoubleArray, i: Int, j: Int) {
+        val t = a[i]
+        a[i] = a[j]
+        a[j] = t
+    }
+}
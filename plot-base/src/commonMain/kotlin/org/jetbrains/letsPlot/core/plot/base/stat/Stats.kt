@@ -237,15 +237,18 @@ object Stats {
 
     fun boxplot(
         whiskerIQRRatio: Double = BoxplotStat.DEF_WHISKER_IQR_RATIO,
-        computeWidth: Boolean = BoxplotStat.DEF_COMPUTE_WIDTH
+        computeWidth: Boolean = BoxplotStat.DEF_COMPUTE_WIDTH,
+        quantileMethod: BoxplotStat.QuantileMethod = BoxplotStat.DEF_QUANTILE_METHOD
     ): BoxplotStat {
-        return BoxplotStat(whiskerIQRRatio, computeWidth)
+        return BoxplotStat(whiskerIQRRatio, computeWidth, quantileMethod)
     }
 
     fun boxplotOutlier(
-        whiskerIQRRatio: Double = BoxplotStat.DEF_WHISKER_IQR_RATIO
+        whiskerIQRRatio: Double = BoxplotStat.DEF_WHISKER_IQR_RATIO,
+        quantileMethod: BoxplotStat.QuantileMethod = BoxplotStat.DEF_QUANTILE_METHOD,
+        maxOutliers: Int? = null
     ): BoxplotOutlierStat {
-        return BoxplotOutlierStat(whiskerIQRRatio)
+        return BoxplotOutlierStat(whiskerIQRRatio, quantileMethod, maxOutliers)
     }
 
     fun density(
@@ -255,6 +258,7 @@ object Stats {
         adjust: Double = DensityStat.DEF_ADJUST,
         kernel: DensityStat.Kernel = DensityStat.DEF_KERNEL,
         n: Int = DensityStat.DEF_N,
+        method: DensityStat.Method = DensityStat.DEF_METHOD,
         fullScanMax: Int = DensityStat.DEF_FULL_SCAN_MAX,
         quantiles: List<Double> = DensityStat.DEF_QUANTILES
     ): DensityStat {
@@ -265,6 +269,7 @@ object Stats {
             adjust = adjust,
             kernel = kernel,
             n = n,
+            method = method,
             fullScanMax = fullScanMax,
             quantiles = quantiles
         )
@@ -276,6 +281,7 @@ object Stats {
         bandWidthMethod: DensityStat.BandWidthMethod = AbstractDensity2dStat.DEF_BW,  // Used is `bandWidth` is not set.
         adjust: Double = AbstractDensity2dStat.DEF_ADJUST,
         kernel: DensityStat.Kernel = AbstractDensity2dStat.DEF_KERNEL,
+        method: DensityStat.Method = AbstractDensity2dStat.DEF_METHOD,
         nX: Int = AbstractDensity2dStat.DEF_N,
         nY: Int = AbstractDensity2dStat.DEF_N,
         isContour: Boolean = AbstractDensity2dStat.DEF_CONTOUR,
@@ -288,6 +294,7 @@ object Stats {
             bandWidthMethod = bandWidthMethod,
             adjust = adjust,
             kernel = kernel,
+            method = method,
             nX = nX,
             nY = nY,
             isContour = isContour,
@@ -302,6 +309,7 @@ object Stats {
         bandWidthMethod: DensityStat.BandWidthMethod,  // Used is `bandWidth` is not set.
         adjust: Double = AbstractDensity2dStat.DEF_ADJUST,
         kernel: DensityStat.Kernel = AbstractDensity2dStat.DEF_KERNEL,
+        method: DensityStat.Method = AbstractDensity2dStat.DEF_METHOD,
         nX: Int = AbstractDensity2dStat.DEF_N,
         nY: Int = AbstractDensity2dStat.DEF_N,
         isContour: Boolean = AbstractDensity2dStat.DEF_CONTOUR,
@@ -314,6 +322,7 @@ object Stats {
             bandWidthMethod = bandWidthMethod,
             adjust = adjust,
             kernel = kernel,
+            method = method,
             nX = nX,
             nY = nY,
             isContour = isContour,
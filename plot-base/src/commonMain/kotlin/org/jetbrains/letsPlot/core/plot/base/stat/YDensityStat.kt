@@ -20,6 +20,7 @@ class YDensityStat(
     private val adjust: Double,
     private val kernel: DensityStat.Kernel,
     private val n: Int,
+    private val method: DensityStat.Method,
     private val fullScanMax: Int,
     private val quantiles: List<Double>
 ) : BaseStat(DEF_MAPPING) {
@@ -52,7 +53,7 @@ class YDensityStat(
         }
 
         val overallYRange = statCtx.overallYRange() ?: DoubleSpan(-0.5, 0.5)
-        val statData = DensityStatUtil.binnedStat(xs, ys, ws, trim, tailsCutoff, bandWidth, bandWidthMethod, adjust, kernel, n, fullScanMax, overallYRange, quantiles)
+        val statData = DensityStatUtil.binnedStat(xs, ys, ws, trim, tailsCutoff, bandWidth, bandWidthMethod, adjust, kernel, n, method, fullScanMax, overallYRange, quantiles)
 
         val builder = DataFrame.Builder()
         for ((variable, series) in statData) {
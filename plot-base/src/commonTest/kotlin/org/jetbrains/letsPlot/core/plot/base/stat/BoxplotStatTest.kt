@@ -107,4 +107,41 @@ class BoxplotStatTest {
         assertEquals(2.0, statDf[Stats.MIDDLE][0])
     }
 
-}
\ No newline at end of file
+    @Test
+    fun maxOutliers() {
+        // IQR = 0: all non-zero values are outliers.
+        val ys = List(200) { 0.0 } + List(50) { 10.0 + it } + listOf(-100.0)
+        val df = df(
+            mapOf(
+                TransformVar.Y to ys
+            )
+        )
+
+        val all = Stats.boxplotOutlier().apply(df, statContext(df))[Stats.Y]
+        assertEquals(51, all.size)
+
+        val sampled = Stats.boxplotOutlier(maxOutliers = 10).apply(df, statContext(df))[Stats.Y]
+        assertEquals(10, sampled.size)
+        assertTrue(-100.0 in sampled && 59.0 in sampled)
+        assertTrue(all.containsAll(sampled))
+
+        val none = Stats.boxplotOutlier(maxOutliers = 0).apply(df, statContext(df))[Stats.Y]
+        assertEquals(1, none.size)
+        assertTrue((none[0] as Double).isNaN())
+    }
+
+    @Test
+    fun approxQuantileMethodOfSmallData() {
+        val df = df(
+            mapOf(
+                TransformVar.Y to List(1000) { (it * 7 % 1000).toDouble() }
+            )
+        )
+
+        val exact = Stats.boxplot().apply(df, statContext(df))
+        val approx = Stats.boxplot(quantileMethod = BoxplotStat.QuantileMethod.APPROX).apply(df, statContext(df))
+        for (variable in listOf(Stats.LOWER, Stats.MIDDLE, Stats.UPPER, Stats.Y_MIN, Stats.Y_MAX)) {
+            assertEquals(exact[variable], approx[variable])
+        }
+    }
+}
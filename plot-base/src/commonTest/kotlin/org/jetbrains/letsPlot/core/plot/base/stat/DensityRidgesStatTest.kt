@@ -20,6 +20,7 @@ class DensityRidgesStatTest : BaseStatTest() {
             adjust = DensityStat.DEF_ADJUST,
             kernel = DensityStat.DEF_KERNEL,
             n = DensityStat.DEF_N,
+            method = DensityStat.DEF_METHOD,
             fullScanMax = DensityStat.DEF_FULL_SCAN_MAX,
             quantiles = quantiles ?: DensityRidgesStat.DEF_QUANTILES
         )
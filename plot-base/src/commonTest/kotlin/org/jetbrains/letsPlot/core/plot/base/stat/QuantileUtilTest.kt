@@ -0,0 +1,58 @@
+/*
+ * Copyright (c) 2023. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.plot.base.stat
+
+import kotlin.math.abs
+import kotlin.random.Random
+import kotlin.test.Test
+import kotlin.test.assertEquals
+import kotlin.test.assertTrue
+
+class QuantileUtilTest {
+    private val probabilities = listOf(0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0)
+
+    @Test
+    fun selectionEqualsSortedQuantiles() {
+        val random = Random(42)
+        repeat(500) {
+            val size = 1 + random.nextInt(200)
+            // Few distinct values in every other data set: many duplicates.
+            val values = List(size) { if (it % 2 == 0) random.nextDouble() else random.nextInt(5).toDouble() }
+            val sorted = values.sorted()
+            assertEquals(
+                probabilities.map { AggregateFunctions.quantile(sorted, it) },
+                QuantileUtil.quantiles(values, probabilities)
+            )
+        }
+    }
+
+    @Test
+    fun sortedAndReversedData() {
+        val values = List(1001) { it.toDouble() }
+        val expected = probabilities.map { AggregateFunctions.quantile(values, it) }
+        assertEquals(expected, QuantileUtil.quantiles(values, probabilities))
+        assertEquals(expected, QuantileUtil.quantiles(values.reversed(), probabilities))
+    }
+
+    @Test
+    fun emptyData() {
+        assertTrue(QuantileUtil.quantiles(emptyList(), probabilities).all { it.isNaN() })
+    }
+
+    @Test
+    fun approxQuantiles() {
+        val random = Random(42)
+        val values = List(1_000_000) { random.nextDouble() }
+        val sorted = values.sorted()
+        val approx = QuantileUtil.approxQuantiles(values, probabilities)
+        for ((p, q) in probabilities.zip(approx)) {
+            assertTrue(abs(q - AggregateFunctions.quantile(sorted, p)) < 0.01, "p=$p: $q")
+        }
+
+        val small = values.take(QuantileUtil.APPROX_SAMPLE_SIZE)
+        assertEquals(QuantileUtil.quantiles(small, probabilities), QuantileUtil.approxQuantiles(small, probabilities))
+    }
+}
@@ -22,6 +22,7 @@ class YDensityStatTest : BaseStatTest() {
             adjust = DensityStat.DEF_ADJUST,
             kernel = DensityStat.DEF_KERNEL,
             n = DensityStat.DEF_N,
+            method = DensityStat.DEF_METHOD,
             fullScanMax = DensityStat.DEF_FULL_SCAN_MAX,
             quantiles = YDensityStat.DEF_QUANTILES
         )
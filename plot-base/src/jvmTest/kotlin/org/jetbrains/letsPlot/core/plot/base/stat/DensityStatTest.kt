@@ -6,6 +6,7 @@
 package org.jetbrains.letsPlot.core.plot.base.stat
 
 import demoAndTestShared.assertEquals
+import org.jetbrains.letsPlot.commons.interval.DoubleSpan
 import org.jetbrains.letsPlot.commons.intern.random.RandomGaussian.Companion.normal
 import org.jetbrains.letsPlot.core.commons.data.SeriesUtil
 import org.jetbrains.letsPlot.core.plot.base.DataFrame
@@ -15,6 +16,7 @@ import org.jetbrains.letsPlot.core.plot.base.data.TransformVar
 import org.jetbrains.letsPlot.core.plot.base.stat.DensityStat
 import org.jetbrains.letsPlot.core.plot.base.stat.SimpleStatContext
 import org.jetbrains.letsPlot.core.plot.base.stat.Stats
+import kotlin.math.abs
 import kotlin.test.Test
 import kotlin.test.assertEquals
 import kotlin.test.assertTrue
@@ -60,29 +62,69 @@ class DensityStatTest {
         val binWidth = (SeriesUtil.range(test)!!).length / (n - 1)
 
         for (kernel in DensityStat.Kernel.values()) { //test for different kernels
-            val stat = Stats.density(n = n, kernel = kernel, quantiles = emptyList())
-
-            val statDf = stat.apply(df, statContext(df))
-            assertTrue(statDf.has(Stats.X))
-            assertTrue(statDf.has(Stats.DENSITY))
-            assertTrue(statDf.has(Stats.COUNT))
-            assertTrue(statDf.has(Stats.SCALED))
-
-            assertEquals(n, statDf[Stats.X].size)
-            assertEquals(n, statDf[Stats.DENSITY].size)
-            assertEquals(n, statDf[Stats.COUNT].size)
-            assertEquals(n, statDf[Stats.SCALED].size)
-
-            assertEquals(1.0, SeriesUtil.sum(statDf.getNumeric(Stats.DENSITY)) * binWidth, .01) //integral is one
-            assertEquals(
-                length.toDouble(),
-                SeriesUtil.sum(statDf.getNumeric(Stats.COUNT)) * binWidth,
-                length / 100.0
-            ) //integral is the number of data points
-            assertEquals(1.0, statDf.getNumeric(Stats.SCALED).maxByOrNull { v -> v!! }, 0.0) //maximum is one
+            for (method in DensityStat.Method.values()) {
+                val stat = Stats.density(n = n, kernel = kernel, method = method, quantiles = emptyList())
+
+                val statDf = stat.apply(df, statContext(df))
+                assertTrue(statDf.has(Stats.X))
+                assertTrue(statDf.has(Stats.DENSITY))
+                assertTrue(statDf.has(Stats.COUNT))
+                assertTrue(statDf.has(Stats.SCALED))
+
+                assertEquals(n, statDf[Stats.X].size)
+                assertEquals(n, statDf[Stats.DENSITY].size)
+                assertEquals(n, statDf[Stats.COUNT].size)
+                assertEquals(n, statDf[Stats.SCALED].size)
+
+                assertEquals(1.0, SeriesUtil.sum(statDf.getNumeric(Stats.DENSITY)) * binWidth, .01) //integral is one
+                assertEquals(
+                    length.toDouble(),
+                    SeriesUtil.sum(statDf.getNumeric(Stats.COUNT)) * binWidth,
+                    length / 100.0
+                ) //integral is the number of data points
+                assertEquals(1.0, statDf.getNumeric(Stats.SCALED).maxByOrNull { v -> v!! }, 0.0) //maximum is one
+            }
         }
     }
 
+    @Test
+    fun testFftMethodMatchesFullScan() {
+        val xs = (normal(3000, 0.0, 1.0, seed = 42) + normal(1000, 5.0, 0.3, seed = 43))
+            .sorted()
+        val weights = List(xs.size) { 1.0 }
+        val bw = DensityStatUtil.bandWidth(DensityStat.DEF_BW, xs)
+        val statX = DensityStatUtil.createStepValues(SeriesUtil.range(xs)!!, DensityStat.DEF_N)
+
+        for (kernel in DensityStat.Kernel.values()) {
+            val ker = DensityStatUtil.kernel(kernel)
+            val fullScan = DensityStatUtil.densityFunctionFullScan(xs, weights, ker, bw, DensityStat.DEF_ADJUST)
+            val fft = DensityStatUtil.densityFunctionFft(xs, weights, ker, bw, DensityStat.DEF_ADJUST)
+
+            val expected = statX.map(fullScan)
+            val maxError = statX.map(fft).zip(expected).maxOf { (actual, exp) -> abs(actual - exp) }
+            // The rectangular kernel is discontinuous: the binning error is bigger at the steps.
+            val tolerance = if (kernel == DensityStat.Kernel.RECTANGULAR) 0.05 else 0.005
+            assertTrue(maxError < tolerance * expected.maxOf { it }, "$kernel: max error $maxError")
+        }
+    }
+
+    @Test
+    fun testFftMethodWithOutlier() {
+        // The grid would be too coarse for the bandwidth: falls back to the direct computation.
+        val xs = (normal(20000, 0.0, 1.0, seed = 42) + listOf(1e5)).sorted()
+        val weights = List(xs.size) { 1.0 }
+        val bw = DensityStatUtil.bandWidth(DensityStat.DEF_BW, xs)
+        val ker = DensityStatUtil.kernel(DensityStat.Kernel.GAUSSIAN)
+        val fft = DensityStatUtil.densityFunctionFft(xs, weights, ker, bw, DensityStat.DEF_ADJUST)
+        val fast = DensityStatUtil.densityFunctionFast(xs, weights, ker, bw, DensityStat.DEF_ADJUST)
+
+        val statX = DensityStatUtil.createStepValues(DoubleSpan(-5.0, 5.0), DensityStat.DEF_N)
+        assertEquals(statX.map(fast), statX.map(fft))
+        // The density integrates to the number of values (all of them but the outlier are within the steps).
+        val integral = statX.map(fft).sum() * (statX[1] - statX[0])
+        assertEquals(xs.size - 1.0, integral, 0.01 * xs.size)
+    }
+
     @Test
     fun testDensity2dStat() {
         val length = 250
@@ -117,4 +159,52 @@ class DensityStatTest {
 
         assertEquals(1.0, SeriesUtil.sum(statDf.getNumeric(Stats.DENSITY)) * binArea, .01) //integral is one
     }
-}
\ No newline at end of file
+
+    @Test
+    fun testDensity2dFftMethodMatchesMatrixComputation() {
+        val df = DataFrameUtil.fromMap(
+            mapOf(
+                TransformVar.X.name to normal(1500, 0.0, 1.0, seed = 42) + normal(500, 4.0, 0.5, seed = 43),
+                TransformVar.Y.name to normal(1500, 0.0, 1.0, seed = 44) + normal(500, 2.0, 0.3, seed = 45)
+            )
+        )
+
+        for (kernel in DensityStat.Kernel.values()) {
+            val expected = Stats.density2d(kernel = kernel, isContour = false)
+                .apply(df, statContext(df))
+                .getNumeric(Stats.DENSITY).map { it!! }
+            val actual = Stats.density2d(kernel = kernel, method = DensityStat.Method.FFT, isContour = false)
+                .apply(df, statContext(df))
+                .getNumeric(Stats.DENSITY).map { it!! }
+
+            assertEquals(expected.size, actual.size)
+            val errors = actual.zip(expected).map { (a, e) -> abs(a - e) }
+            val maxDensity = expected.maxOf { it }
+            if (kernel == DensityStat.Kernel.RECTANGULAR) {
+                // The kernel is discontinuous: only the mean error is small.
+                assertTrue(errors.average() < 0.02 * maxDensity, "$kernel: mean error ${errors.average()}")
+            } else {
+                assertTrue(errors.maxOf { it } < 0.02 * maxDensity, "$kernel: max error ${errors.maxOf { it }}")
+            }
+        }
+    }
+
+    @Test
+    fun testDensity2dFftMethodWithOutlier() {
+        // The grid would be too coarse for the bandwidth: falls back to the matrix computation.
+        val df = DataFrameUtil.fromMap(
+            mapOf(
+                TransformVar.X.name to normal(2000, 0.0, 1.0, seed = 42) + listOf(1e4),
+                TransformVar.Y.name to normal(2000, 0.0, 1.0, seed = 44) + listOf(0.0)
+            )
+        )
+
+        val expected = Stats.density2d(isContour = false)
+            .apply(df, statContext(df))
+            .getNumeric(Stats.DENSITY)
+        val actual = Stats.density2d(method = DensityStat.Method.FFT, isContour = false)
+            .apply(df, statContext(df))
+            .getNumeric(Stats.DENSITY)
+        assertEquals(expected, actual)
+    }
+}
@@ -5,6 +5,7 @@
 
 package org.jetbrains.letsPlot.core.plot.builder.assemble.geom
 
+import org.jetbrains.letsPlot.core.plot.builder.sampling.Samplings.m4
 import org.jetbrains.letsPlot.core.plot.builder.sampling.Samplings.random
 import org.jetbrains.letsPlot.core.plot.builder.sampling.Samplings.systematic
 import org.jetbrains.letsPlot.core.plot.builder.sampling.Samplings.systematicGroup
@@ -23,7 +24,7 @@ object DefaultSampling {
 
     // basis
     val POINT = random(100_000, SEED)   // optimized
-    val LINE = systematic(50_000)
+    val LINE = m4(50_000)   // keeps the shape of lines
     val PATH = vertexDp(50_000)  // ToDo: vertex sampling has issues.
     val SEGMENT = random(10_000, SEED)
 
@@ -45,7 +46,7 @@ object DefaultSampling {
 
     // lines
     val Q_Q_LINE = LINE
-    val RIBBON = LINE
+    val RIBBON = systematic(50_000)  // no single y
     val AREA = LINE
     val DENSITY = LINE
     val FREQPOLY = LINE
@@ -5,6 +5,7 @@
 
 package org.jetbrains.letsPlot.core.plot.builder.sampling
 
+import org.jetbrains.letsPlot.commons.interval.DoubleSpan
 import org.jetbrains.letsPlot.core.plot.base.DataFrame
 import org.jetbrains.letsPlot.core.plot.builder.sampling.method.*
 import org.jetbrains.letsPlot.core.plot.builder.sampling.method.VertexSampling.VertexDpSampling
@@ -19,6 +20,9 @@ object Samplings {
     const val RANDOM_STRATIFIED = RandomStratifiedSampling.ALIAS
     const val VERTEX_VW = VertexVwSampling.ALIAS
     const val VERTEX_DP = VertexDpSampling.ALIAS
+    const val LTTB = LttbSampling.ALIAS
+    const val M4 = M4Sampling.ALIAS
+    const val QUADTREE = QuadtreeSampling.ALIAS
 
     val NONE: PointSampling =
         NoneSampling()
@@ -39,6 +43,30 @@ object Samplings {
         return VertexVwSampling(sampleSize)
     }
 
+    fun lttb(sampleSize: Int): Sampling {
+        return LttbSampling(sampleSize)
+    }
+
+    fun m4(sampleSize: Int): Sampling {
+        return M4Sampling(sampleSize)
+    }
+
+    fun quadtree(sampleSize: Int, depth: Int?): PointSampling {
+        return QuadtreeSampling(sampleSize, depth ?: QuadtreeSampling.DEF_DEPTH)
+    }
+
+    /**
+     * Level-of-detail samplings (quadtree) pick points for the viewport: the visible x/y-ranges.
+     */
+    fun withViewport(samplings: List<Sampling>, xLim: DoubleSpan?, yLim: DoubleSpan?): List<Sampling> {
+        return samplings.map {
+            when (it) {
+                is QuadtreeSampling -> it.withViewport(xLim, yLim)
+                else -> it
+            }
+        }
+    }
+
     fun systematic(sampleSize: Int): Sampling {
         return SystematicSampling(sampleSize)
     }
@@ -0,0 +1,90 @@
+/*
+ * Copyright (c) 2023. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.plot.builder.sampling.method
+
+import org.jetbrains.letsPlot.core.commons.data.SeriesUtil
+import org.jetbrains.letsPlot.core.plot.base.DataFrame
+import org.jetbrains.letsPlot.core.plot.base.data.TransformVar
+import org.jetbrains.letsPlot.core.plot.base.stat.Stats
+import org.jetbrains.letsPlot.core.plot.builder.data.GroupUtil
+import org.jetbrains.letsPlot.core.plot.builder.sampling.GroupAwareSampling
+import org.jetbrains.letsPlot.core.plot.builder.sampling.method.SamplingUtil.xVar
+import org.jetbrains.letsPlot.core.plot.builder.sampling.method.SamplingUtil.yVar
+import kotlin.math.max
+import kotlin.math.round
+
+/**
+ * Downsampling of lines which keeps their shape: each group (line) is sampled separately,
+ * the sample size is distributed between groups proportionally to their size.
+ * Only points with finite x and y are sampled: a run of non-finite points (a gap in the line)
+ * is kept as its first point, the break marker. The picked rows keep their order.
+ * Not applicable to data without x and y (e.g. ribbons) and to data with not more than `sampleSize` finite points.
+ */
+internal abstract class LineSamplingBase(sampleSize: Int) : SamplingBase(sampleSize),
+    GroupAwareSampling {
+
+    protected abstract val minGroupSampleSize: Int
+
+    override fun isApplicable(population: DataFrame, groupMapper: (Int) -> Int): Boolean {
+        if (population.rowCount() <= sampleSize ||
+            xVar(population.variables()) == null ||
+            !(population.has(Stats.Y) || population.has(TransformVar.Y))
+        ) {
+            return false
+        }
+        // Otherwise the sampling would only drop the break markers.
+        val xs = population.getNumeric(xVar(population))
+        val ys = population.getNumeric(yVar(population))
+        return (0 until population.rowCount()).count { SeriesUtil.allFinite(xs[it], ys[it]) } > sampleSize
+    }
+
+    override fun apply(population: DataFrame, groupMapper: (Int) -> Int): DataFrame {
+        require(isApplicable(population, groupMapper))
+        val xs = population.getNumeric(xVar(population))
+        val ys = population.getNumeric(yVar(population))
+        val isFinite = { i: Int -> SeriesUtil.allFinite(xs[i], ys[i]) }
+
+        val allIndicesByGroup = GroupUtil.indicesByGroup(population.rowCount(), groupMapper)
+        val indicesByGroup = allIndicesByGroup.mapValues { (_, indices) -> indices.filter(isFinite) }
+        val popSize = indicesByGroup.values.sumOf { it.size }
+
+        val pickedIndices = ArrayList<Int>()
+        for (groupIndices in allIndicesByGroup.values) {
+            // The first point of each run of non-finite points breaks the line.
+            groupIndices.filterIndexedTo(pickedIndices) { i, index ->
+                !isFinite(index) && (i == 0 || isFinite(groupIndices[i - 1]))
+            }
+        }
+        for (groupIndices in indicesByGroup.values) {
+            // proportionate allocation
+            val groupSampleSize = max(
+                round(sampleSize * groupIndices.size.toDouble() / popSize).toInt(),
+                minGroupSampleSize
+            )
+
+            if (groupIndices.size <= groupSampleSize) {
+                pickedIndices.addAll(groupIndices)
+            } else {
+                pickedIndices.addAll(
+                    sample(
+                        groupIndices,
+                        DoubleArray(groupIndices.size) { xs[groupIndices[it]]!! },
+                        DoubleArray(groupIndices.size) { ys[groupIndices[it]]!! },
+                        groupSampleSize
+                    )
+                )
+            }
+        }
+
+        return population.selectIndices(pickedIndices.sorted())
+    }
+
+    /**
+     * Picks (about) `sampleSize` of the `indices`.
+     * `xs` and `ys` are the (finite) values at these indices.
+     */
+    protected abstract fun sample(indices: List<Int>, xs: DoubleArray, ys: DoubleArray, sampleSize: Int): List<Int>
+}
@@ -0,0 +1,77 @@
+/*
+ * Copyright (c) 2023. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.plot.builder.sampling.method
+
+import kotlin.math.abs
+import kotlin.math.min
+
+/**
+ * Largest-Triangle-Three-Buckets: the points sorted by x are split into `sampleSize - 2` buckets
+ * of (about) the same size. In each bucket the point forming the largest triangle with the point picked
+ * in the previous bucket and the average point of the next bucket is picked. The first and the last points are kept.
+ */
+internal class LttbSampling(sampleSize: Int) : LineSamplingBase(sampleSize) {
+
+    override val expressionText: String
+        get() = "sampling_" + ALIAS + "(" +
+                "n=" + sampleSize +
+                ")"
+
+    override val minGroupSampleSize: Int = MIN_SAMPLE_SIZE
+
+    init {
+        check(sampleSize >= MIN_SAMPLE_SIZE) { "Sample size must be at least $MIN_SAMPLE_SIZE, but was: $sampleSize" }
+    }
+
+    override fun sample(indices: List<Int>, xs: DoubleArray, ys: DoubleArray, sampleSize: Int): List<Int> {
+        val order = xs.indices.sortedBy { xs[it] }
+        val x = DoubleArray(order.size) { xs[order[it]] }
+        val y = DoubleArray(order.size) { ys[order[it]] }
+        val last = order.size - 1
+
+        val bucketSize = (order.size - 2).toDouble() / (sampleSize - 2)
+        fun bucketStart(bucket: Int) = min((bucket * bucketSize).toInt() + 1, last + 1)
+
+        val picked = ArrayList<Int>(sampleSize)
+        picked.add(0)
+        var a = 0
+        for (bucket in 0 until sampleSize - 2) {
+            val start = bucketStart(bucket)
+            val end = bucketStart(bucket + 1)
+            val nextEnd = bucketStart(bucket + 2)
+
+            // The average point of the next bucket (the last point after the last bucket).
+            var avgX = 0.0
+            var avgY = 0.0
+            for (i in end until nextEnd) {
+                avgX += x[i]
+                avgY += y[i]
+            }
+            avgX /= nextEnd - end
+            avgY /= nextEnd - end
+
+            var maxArea = -1.0
+            var next = start
+            for (i in start until end) {
+                val area = abs((x[a] - avgX) * (y[i] - y[a]) - (x[a] - x[i]) * (avgY - y[a]))
+                if (area > maxArea) {
+                    maxArea = area
+                    next = i
+                }
+            }
+            picked.add(next)
+            a = next
+        }
+        picked.add(last)
+
+        return picked.map { indices[order[it]] }
+    }
+
+    companion object {
+        const val ALIAS = "lttb"
+        private const val MIN_SAMPLE_SIZE = 3
+    }
+}
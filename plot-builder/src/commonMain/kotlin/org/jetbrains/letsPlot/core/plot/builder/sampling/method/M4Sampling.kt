@@ -0,0 +1,60 @@
+/*
+ * Copyright (c) 2023. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.plot.builder.sampling.method
+
+import kotlin.math.max
+import kotlin.math.min
+
+/**
+ * M4: the x-range is split into `sampleSize / 4` buckets of the same width (think of pixel columns).
+ * In each bucket the points with the min and max x and the min and max y are picked
+ * (the first one of equal values).
+ */
+internal class M4Sampling(sampleSize: Int) : LineSamplingBase(sampleSize) {
+
+    override val expressionText: String
+        get() = "sampling_" + ALIAS + "(" +
+                "n=" + sampleSize +
+                ")"
+
+    override val minGroupSampleSize: Int = POINTS_PER_BUCKET
+
+    override fun sample(indices: List<Int>, xs: DoubleArray, ys: DoubleArray, sampleSize: Int): List<Int> {
+        val bucketCount = max(sampleSize / POINTS_PER_BUCKET, 1)
+        val xMin = xs.minOrNull()!!
+        val span = xs.maxOrNull()!! - xMin
+
+        val first = IntArray(bucketCount) { -1 }
+        val last = IntArray(bucketCount)
+        val bottom = IntArray(bucketCount)
+        val top = IntArray(bucketCount)
+        for (i in xs.indices) {
+            val bucket = if (span > 0) min(((xs[i] - xMin) / span * bucketCount).toInt(), bucketCount - 1) else 0
+            if (first[bucket] < 0) {
+                first[bucket] = i
+                last[bucket] = i
+                bottom[bucket] = i
+                top[bucket] = i
+            } else {
+                if (xs[i] < xs[first[bucket]]) first[bucket] = i
+                if (xs[i] > xs[last[bucket]]) last[bucket] = i
+                if (ys[i] < ys[bottom[bucket]]) bottom[bucket] = i
+                if (ys[i] > ys[top[bucket]]) top[bucket] = i
+            }
+        }
+
+        return (0 until bucketCount)
+            .filter { first[it] >= 0 }
+            .flatMap { listOf(first[it], last[it], bottom[it], top[it]) }
+            .distinct()
+            .map { indices[it] }
+    }
+
+    companion object {
+        const val ALIAS = "m4"
+        private const val POINTS_PER_BUCKET = 4
+    }
+}
@@ -0,0 +1,138 @@
+/*
+ * Copyright (c) 2023. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.plot.builder.sampling.method
+
+import org.jetbrains.letsPlot.commons.interval.DoubleSpan
+import org.jetbrains.letsPlot.core.commons.data.SeriesUtil
+import org.jetbrains.letsPlot.core.plot.base.DataFrame
+import org.jetbrains.letsPlot.core.plot.base.data.TransformVar
+import org.jetbrains.letsPlot.core.plot.base.stat.Stats
+import org.jetbrains.letsPlot.core.plot.builder.sampling.PointSampling
+import org.jetbrains.letsPlot.core.plot.builder.sampling.method.SamplingUtil.xVar
+import org.jetbrains.letsPlot.core.plot.builder.sampling.method.SamplingUtil.yVar
+import kotlin.math.ln
+import kotlin.math.max
+import kotlin.math.min
+
+/**
+ * Level-of-detail sampling over a quadtree (pyramid) of the x/y-range of the data.
+ *
+ * At the level `d` the data range is split into 2^d x 2^d cells and each cell keeps
+ * (at most) `sampleSize` rows with the smallest priority (a fixed pseudo-random order of rows).
+ * Thus the rows of a level are a subset of the rows of the next level.
+ *
+ * The level is chosen by the viewport (the coordinate limits): when the viewport
+ * covers 1/4^d of the data area, the rows of the level `d` inside the viewport are picked,
+ * i.e. about `sampleSize` points are visible at any zoom.
+ * Deeper than `depth` levels all the rows inside the viewport are picked.
+ * Points with non-finite x or y are dropped.
+ */
+internal class QuadtreeSampling(
+    sampleSize: Int,
+    val depth: Int,
+    private val xLim: DoubleSpan? = null,
+    private val yLim: DoubleSpan? = null
+) : SamplingBase(sampleSize), PointSampling {
+
+    init {
+        check(depth in 0..MAX_DEPTH) { "Depth must be in range [0, $MAX_DEPTH], but was: $depth" }
+    }
+
+    override val expressionText: String
+        get() = "sampling_" + ALIAS + "(" +
+                "n=" + sampleSize +
+                ", depth=" + depth +
+                ")"
+
+    fun withViewport(xLim: DoubleSpan?, yLim: DoubleSpan?): QuadtreeSampling {
+        return QuadtreeSampling(sampleSize, depth, xLim, yLim)
+    }
+
+    override fun isApplicable(population: DataFrame): Boolean {
+        return super.isApplicable(population) &&
+                xVar(population.variables()) != null &&
+                (population.has(Stats.Y) || population.has(TransformVar.Y))
+    }
+
+    override fun apply(population: DataFrame): DataFrame {
+        require(isApplicable(population))
+        val xs = population.getNumeric(xVar(population))
+        val ys = population.getNumeric(yVar(population))
+        val indices = (0 until population.rowCount()).filter { SeriesUtil.allFinite(xs[it], ys[it]) }
+        if (indices.isEmpty()) {
+            return population.selectIndices(indices)
+        }
+
+        val xRange = DoubleSpan.encloseAll(indices.map { xs[it] })
+        val yRange = DoubleSpan.encloseAll(indices.map { ys[it] })
+        val level = level(visibleShare(xRange, xLim) * visibleShare(yRange, yLim))
+
+        val picked = if (level > depth) {
+            indices
+        } else {
+            val cellCount = 1 shl level
+            indices
+                .groupBy { cell(xs[it]!!, xRange, cellCount) * cellCount + cell(ys[it]!!, yRange, cellCount) }
+                .values
+                .flatMap { cellIndices -> cellIndices.sortedBy(::priority).take(sampleSize) }
+        }
+
+        val xView = xLim?.let(::withMargin)
+        val yView = yLim?.let(::withMargin)
+        return population.selectIndices(
+            picked
+                .filter { (xView == null || xs[it]!! in xView) && (yView == null || ys[it]!! in yView) }
+                .sorted()
+        )
+    }
+
+    companion object {
+        const val ALIAS = "quadtree"
+        const val DEF_DEPTH = 8
+        const val MAX_DEPTH = 15
+
+        // Points slightly outside the viewport are kept for shapes partially visible at its edges.
+        private const val VIEWPORT_MARGIN = 0.1
+
+        // Knuth's multiplicative hash: the priority is a fixed permutation of row indices.
+        private const val PRIORITY_MULTIPLIER = 0x9E3779B1L
+
+        private fun priority(index: Int): Long {
+            return (index.toLong() * PRIORITY_MULTIPLIER) and 0xFFFFFFFFL
+        }
+
+        private fun cell(v: Double, range: DoubleSpan, cellCount: Int): Int {
+            if (range.length == 0.0) {
+                return 0
+            }
+            return min(((v - range.lowerEnd) / range.length * cellCount).toInt(), cellCount - 1)
+        }
+
+        private fun visibleShare(range: DoubleSpan, lim: DoubleSpan?): Double {
+            if (lim == null) {
+                return 1.0
+            }
+            if (range.length == 0.0) {
+                return if (range.lowerEnd in lim) 1.0 else 0.0
+            }
+            val overlap = min(range.upperEnd, lim.upperEnd) - max(range.lowerEnd, lim.lowerEnd)
+            return max(overlap, 0.0) / range.length
+        }
+
+        private fun level(visibleShare: Double): Int {
+            if (visibleShare <= 0.0) {
+                return Int.MAX_VALUE
+            }
+            // The viewport covers 1/4^level of the data area.
+            return max((ln(1 / visibleShare) / ln(4.0)).toInt(), 0)
+        }
+
+        private fun withMargin(lim: DoubleSpan): DoubleSpan {
+            val margin = lim.length * VIEWPORT_MARGIN
+            return DoubleSpan(lim.lowerEnd - margin, lim.upperEnd + margin)
+        }
+    }
+}
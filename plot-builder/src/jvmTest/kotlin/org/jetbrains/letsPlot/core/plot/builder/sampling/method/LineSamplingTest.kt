@@ -0,0 +1,97 @@
+/*
+ * Copyright (c) 2023. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.plot.builder.sampling.method
+
+import org.jetbrains.letsPlot.core.plot.base.DataFrame
+import org.jetbrains.letsPlot.core.plot.base.DataFrame.Builder
+import org.jetbrains.letsPlot.core.plot.base.data.TransformVar
+import kotlin.test.*
+
+class LineSamplingTest {
+
+    private fun toDF(ys: List<Double>): DataFrame {
+        return Builder()
+            .put(TransformVar.X, ys.indices.map(Int::toDouble))
+            .put(TransformVar.Y, ys)
+            .build()
+    }
+
+    // Flat line with a spike.
+    private val myData = toDF(List(N) { if (it == SPIKE) 100.0 else 0.0 })
+
+    private fun sampledXs(sampling: LineSamplingBase, data: DataFrame, groupMapper: (Int) -> Int): List<Double> {
+        assertTrue(sampling.isApplicable(data, groupMapper))
+        return sampling.apply(data, groupMapper).getNumeric(TransformVar.X).map { it!! }
+    }
+
+    @Test
+    fun notApplicable() {
+        assertFalse(LttbSampling(N).isApplicable(myData) { 0 })
+        assertFalse(M4Sampling(N).isApplicable(myData) { 0 })
+
+        val noY = Builder().put(TransformVar.X, List(N) { it.toDouble() }).build()
+        assertFalse(M4Sampling(10).isApplicable(noY) { 0 })
+
+        assertFailsWith(IllegalStateException::class) {
+            LttbSampling(2)
+        }
+    }
+
+    @Test
+    fun lttbKeepsSpike() {
+        val xs = sampledXs(LttbSampling(20), myData) { 0 }
+        assertEquals(20, xs.size)
+        assertEquals(xs.sorted(), xs)
+        assertEquals(0.0, xs.first())
+        assertEquals(N - 1.0, xs.last())
+        assertTrue(SPIKE.toDouble() in xs)
+    }
+
+    @Test
+    fun m4KeepsSpike() {
+        val xs = sampledXs(M4Sampling(20), myData) { 0 }
+        assertTrue(xs.size <= 20)
+        assertEquals(xs.sorted(), xs)
+        assertEquals(0.0, xs.first())
+        assertEquals(N - 1.0, xs.last())
+        assertTrue(SPIKE.toDouble() in xs)
+    }
+
+    @Test
+    fun groupsAreSampledSeparately() {
+        // two interleaved lines
+        val groupMapper = { i: Int -> i % 2 }
+        for (sampling in listOf(LttbSampling(20), M4Sampling(20))) {
+            val xs = sampledXs(sampling, myData, groupMapper)
+            assertTrue(xs.size <= 20)
+            assertTrue(listOf(0.0, 1.0, N - 2.0, N - 1.0).all { it in xs })
+            assertTrue(SPIKE.toDouble() in xs)
+        }
+    }
+
+    @Test
+    fun gapsAreKept() {
+        // A gap of NaN-s in the middle of the line.
+        val data = toDF(List(N) { if (it in 400 until 600) Double.NaN else it.toDouble() })
+        for (sampling in listOf(LttbSampling(20), M4Sampling(20))) {
+            val sample = sampling.apply(data) { 0 }
+            val xs = sample.getNumeric(TransformVar.X)
+            val ys = sample.getNumeric(TransformVar.Y)
+            // The first point of the gap breaks the line.
+            assertEquals(listOf(400.0), xs.indices.filter { ys[it]?.isFinite() != true }.map { xs[it] })
+            assertTrue(ys.count { it?.isFinite() == true } <= 20)
+        }
+
+        // The sampling would only drop the gap.
+        assertFalse(M4Sampling(N - 200).isApplicable(data) { 0 })
+        assertTrue(M4Sampling(N - 201).isApplicable(data) { 0 })
+    }
+
+    companion object {
+        private const val N = 1000
+        private const val SPIKE = 500
+    }
+}
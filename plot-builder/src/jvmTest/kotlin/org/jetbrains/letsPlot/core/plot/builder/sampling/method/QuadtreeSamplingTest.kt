@@ -0,0 +1,78 @@
+/*
+ * Copyright (c) 2023. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.plot.builder.sampling.method
+
+import org.jetbrains.letsPlot.commons.interval.DoubleSpan
+import org.jetbrains.letsPlot.core.plot.base.DataFrame
+import org.jetbrains.letsPlot.core.plot.base.DataFrame.Builder
+import org.jetbrains.letsPlot.core.plot.base.data.TransformVar
+import kotlin.test.*
+
+class QuadtreeSamplingTest {
+
+    // Grid of SIDE x SIDE points.
+    private val myData = Builder()
+        .put(TransformVar.X, List(SIDE * SIDE) { (it % SIDE).toDouble() })
+        .put(TransformVar.Y, List(SIDE * SIDE) { (it / SIDE).toDouble() })
+        .build()
+
+    private fun sampledPoints(sampling: QuadtreeSampling): List<Pair<Double, Double>> {
+        assertTrue(sampling.isApplicable(myData))
+        val sample = sampling.apply(myData)
+        return sample.getNumeric(TransformVar.X).zip(sample.getNumeric(TransformVar.Y)) { x, y -> Pair(x!!, y!!) }
+    }
+
+    private fun countIn(points: List<Pair<Double, Double>>, lim: DoubleSpan): Int {
+        return points.count { (x, y) -> x in lim && y in lim }
+    }
+
+    @Test
+    fun notApplicable() {
+        assertFalse(QuadtreeSampling(SIDE * SIDE, 8).isApplicable(myData))
+
+        val noY = Builder().put(TransformVar.X, List(1000) { it.toDouble() }).build()
+        assertFalse(QuadtreeSampling(10, 8).isApplicable(noY))
+
+        assertFailsWith(IllegalStateException::class) {
+            QuadtreeSampling(10, QuadtreeSampling.MAX_DEPTH + 1)
+        }
+    }
+
+    @Test
+    fun withoutViewport() {
+        val points = sampledPoints(QuadtreeSampling(100, 8))
+        assertEquals(100, points.size)
+        assertEquals(100, points.distinct().size)
+    }
+
+    @Test
+    fun zoomedViewport() {
+        // The viewport covers 1/16 of the data area: the quadtree cell of the level 2.
+        val lim = DoubleSpan(0.0, (SIDE - 1) / 4.0)
+        val sampling = QuadtreeSampling(100, 8).withViewport(lim, lim)
+        val points = sampledPoints(sampling)
+
+        assertEquals(100, countIn(points, lim))
+        // Points near the viewport are kept.
+        assertTrue(points.all { (x, y) -> x <= 30.0 && y <= 30.0 })
+
+        // Points of a level are kept at the next levels.
+        assertTrue(sampledPoints(QuadtreeSampling(100, 8)).filter { (x, y) -> x in lim && y in lim }
+            .all { it in points })
+    }
+
+    @Test
+    fun zoomedDeeperThanDepth() {
+        val lim = DoubleSpan(0.0, 9.0)
+        val points = sampledPoints(QuadtreeSampling(10, 1).withViewport(lim, lim))
+        assertEquals(100, points.size)
+        assertEquals(100, countIn(points, lim))
+    }
+
+    companion object {
+        private const val SIDE = 100
+    }
+}
@@ -23,6 +23,11 @@ object Option {
             const val GG_BUNCH = "ggbunch"
         }
 
+        object SharedData {
+            const val TABLE = "shared_data" // top-level: data id -> data
+            const val REF = "data_ref"      // used instead of "data" in plots and layers
+        }
+
         object PubSub {
             const val TAG = "pubsub"
             const val CHANNEL_ID = "channel_id"
@@ -350,6 +355,8 @@ object Option {
         object Boxplot {
             const val COEF = "coef"
             const val VARWIDTH = "varwidth"
+            const val QUANTILE_METHOD = "quantile_method"
+            const val MAX_OUTLIERS = "max_outliers"
         }
 
         object Bin {
@@ -394,6 +401,7 @@ object Option {
             const val KERNEL = "kernel"
             const val BAND_WIDTH = "bw"     // number or string (method name)
             const val ADJUST = "adjust"
+            const val METHOD = "method"
             const val FULL_SCAN_MAX = "fs_max"  // use 'full scan' when the input size is < 'fs_max'
             const val TRIM = "trim"
             const val QUANTILES = "quantiles"
@@ -404,6 +412,7 @@ object Option {
             const val KERNEL = "kernel"
             const val BAND_WIDTH = "bw"     // list of two numbers, one number or string (method name)
             const val ADJUST = "adjust"
+            const val METHOD = "method"
             const val IS_CONTOUR = "contour"
             const val BINS = "bins"
             const val BINWIDTH = "binwidth"
@@ -654,6 +663,7 @@ object Option {
         const val N = "n"
         const val SEED = "seed"
         const val MIN_SUB_SAMPLE = "min_subsample"
+        const val DEPTH = "depth"
     }
 
     object Theme {
@@ -0,0 +1,153 @@
+/*
+ * Copyright (c) 2023. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.spec
+
+import org.jetbrains.letsPlot.core.spec.Option.Meta.SharedData
+import org.jetbrains.letsPlot.core.spec.Option.PlotBase
+
+/**
+ * Data used by several plots, layers, subplots or GGBunch items can be sent once:
+ * in the "shared_data" table at the top level of the figure spec,
+ * referenced by "data_ref" in place of "data".
+ */
+object SharedDataUtil {
+
+    /**
+     * Replaces data references with the data from the shared data table.
+     * Every place referring to the data gets its own copy of the data map (the columns are not copied):
+     * the data maps of plots and layers are modified in place later on.
+     */
+    fun resolve(figSpec: MutableMap<String, Any>): MutableMap<String, Any> {
+        val table = figSpec[SharedData.TABLE] as? Map<*, *> ?: return figSpec
+
+        @Suppress("UNCHECKED_CAST")
+        val resolved = resolveRefs(figSpec, table) as MutableMap<String, Any>
+        resolved.remove(SharedData.TABLE)
+        return resolved
+    }
+
+    /**
+     * Moves the data found in more than one place to the shared data table.
+     * Data objects are compared by identity, then by value: only the ones with the same columns of the same sizes.
+     */
+    fun share(figSpec: MutableMap<String, Any>): MutableMap<String, Any> {
+        val dataList = ArrayList<Map<*, *>>()
+        collectData(figSpec, dataList)
+        if (dataList.size < 2) {
+            return figSpec
+        }
+
+        // For each data: the index of the first equal data.
+        val firstEqual = IntArray(dataList.size) { it }
+        for (indices in dataList.indices.groupBy { signature(dataList[it]) }.values) {
+            val distinct = ArrayList<Int>()
+            for (i in indices) {
+                val equal = distinct.firstOrNull { sameData(dataList[it], dataList[i]) }
+                if (equal != null) {
+                    firstEqual[i] = equal
+                } else {
+                    distinct.add(i)
+                }
+            }
+        }
+
+        val useCounts = IntArray(dataList.size)
+        firstEqual.forEach { useCounts[it]++ }
+        val sharedIndices = dataList.indices.filter { useCounts[it] > 1 }
+        if (sharedIndices.isEmpty()) {
+            return figSpec
+        }
+
+        // Data references in the order of collectData().
+        val refs = firstEqual.map { sharedIndices.indexOf(it) }.iterator()
+
+        @Suppress("UNCHECKED_CAST")
+        val result = shareRefs(figSpec, refs) as MutableMap<String, Any>
+        result[SharedData.TABLE] = sharedIndices.withIndex().associate { (i, dataIndex) ->
+            i.toString() to dataList[dataIndex]
+        }
+        return result
+    }
+
+    private fun resolveRefs(spec: Any?, table: Map<*, *>): Any? {
+        return when (spec) {
+            is Map<*, *> -> {
+                val result = LinkedHashMap<String, Any?>()
+                for ((key, value) in spec) {
+                    when (key) {
+                        SharedData.REF -> {
+                            val data = table[value] as? Map<*, *>
+                                ?: throw IllegalArgumentException("Undefined shared data: '$value'")
+                            result[PlotBase.DATA] = LinkedHashMap(data)
+                        }
+
+                        PlotBase.DATA -> result[key] = value
+                        else -> result[key as String] = resolveRefs(value, table)
+                    }
+                }
+                result
+            }
+
+            is List<*> -> spec.map { resolveRefs(it, table) }
+            else -> spec
+        }
+    }
+
+    private fun collectData(spec: Any?, result: MutableList<Map<*, *>>) {
+        when (spec) {
+            is Map<*, *> -> for ((key, value) in spec) {
+                if (key == PlotBase.DATA) {
+                    if (value is Map<*, *> && value.isNotEmpty()) {
+                        result.add(value)
+                    }
+                } else {
+                    collectData(value, result)
+                }
+            }
+
+            is List<*> -> spec.forEach { collectData(it, result) }
+        }
+    }
+
+    /**
+     * `refs`: indices in the shared data table (or -1) of the data found by collectData(), in the same order.
+     */
+    private fun shareRefs(spec: Any?, refs: Iterator<Int>): Any? {
+        return when (spec) {
+            is Map<*, *> -> {
+                val result = LinkedHashMap<String, Any?>()
+                for ((key, value) in spec) {
+                    if (key == PlotBase.DATA) {
+                        val i = if (value is Map<*, *> && value.isNotEmpty()) refs.next() else -1
+                        if (i >= 0) {
+                            result[SharedData.REF] = i.toString()
+                        } else {
+                            result[key] = value
+                        }
+                    } else {
+                        result[key as String] = shareRefs(value, refs)
+                    }
+                }
+                result
+            }
+
+            is List<*> -> spec.map { shareRefs(it, refs) }
+            else -> spec
+        }
+    }
+
+    /**
+     * Cheap to compare: the columns and their sizes.
+     */
+    private fun signature(data: Map<*, *>): Map<*, Int?> {
+        return data.mapValues { (_, v) -> (v as? List<*>)?.size }
+    }
+
+    private fun sameData(data: Map<*, *>, other: Map<*, *>): Boolean {
+        // Data of the same signature: comparing values of big columns is costly.
+        return data === other || data == other
+    }
+}
@@ -88,13 +88,18 @@ object StatProto {
             StatKind.BOXPLOT -> {
                 return Stats.boxplot(
                     whiskerIQRRatio = options.getDouble(Boxplot.COEF) ?: BoxplotStat.DEF_WHISKER_IQR_RATIO,
-                    computeWidth = options.getBoolean(Boxplot.VARWIDTH, BoxplotStat.DEF_COMPUTE_WIDTH)
+                    computeWidth = options.getBoolean(Boxplot.VARWIDTH, BoxplotStat.DEF_COMPUTE_WIDTH),
+                    quantileMethod = getBoxplotQuantileMethod(options)
                 )
             }
 
             StatKind.BOXPLOT_OUTLIER -> {
                 return Stats.boxplotOutlier(
-                    whiskerIQRRatio = options.getDouble(Boxplot.COEF) ?: BoxplotStat.DEF_WHISKER_IQR_RATIO
+                    whiskerIQRRatio = options.getDouble(Boxplot.COEF) ?: BoxplotStat.DEF_WHISKER_IQR_RATIO,
+                    quantileMethod = getBoxplotQuantileMethod(options),
+                    maxOutliers = options.getInteger(Boxplot.MAX_OUTLIERS)?.also {
+                        require(it >= 0) { "'${Boxplot.MAX_OUTLIERS}' must be non-negative: $it" }
+                    }
                 )
             }
 
@@ -133,6 +138,19 @@ object StatProto {
         }
     }
 
+    private fun getBoxplotQuantileMethod(options: OptionsAccessor): BoxplotStat.QuantileMethod {
+        return options.getString(Boxplot.QUANTILE_METHOD)?.let {
+            when (it.lowercase()) {
+                "exact" -> BoxplotStat.QuantileMethod.EXACT
+                "approx" -> BoxplotStat.QuantileMethod.APPROX
+                else -> throw IllegalArgumentException(
+                    "Unsupported quantile method: '$it'\n" +
+                            "Use one of: exact, approx."
+                )
+            }
+        } ?: BoxplotStat.DEF_QUANTILE_METHOD
+    }
+
     private fun configureDotplotStat(options: OptionsAccessor): DotplotStat {
 
         val method = options.getString(Bin.METHOD)?.let {
@@ -202,6 +220,10 @@ object StatProto {
             DensityStatUtil.toKernel(it)
         }
 
+        val method = options.getString(Density.METHOD)?.let {
+            DensityStatUtil.toMethod(it)
+        }
+
         val quantiles = if (options.hasOwn(DensityRidges.QUANTILES)) {
             options.getBoundedDoubleList(DensityRidges.QUANTILES, 0.0, 1.0)
         } else DensityRidgesStat.DEF_QUANTILES
@@ -214,6 +236,7 @@ object StatProto {
             adjust = options.getDoubleDef(Density.ADJUST, DensityStat.DEF_ADJUST),
             kernel = kernel ?: DensityStat.DEF_KERNEL,
             n = options.getIntegerDef(Density.N, DensityStat.DEF_N),
+            method = method ?: DensityStat.DEF_METHOD,
             fullScanMax = options.getIntegerDef(Density.FULL_SCAN_MAX, DensityStat.DEF_FULL_SCAN_MAX),
             quantiles = quantiles
         )
@@ -246,6 +269,10 @@ object StatProto {
             DensityStatUtil.toKernel(it)
         }
 
+        val method = options.getString(Density.METHOD)?.let {
+            DensityStatUtil.toMethod(it)
+        }
+
         val quantiles = if (options.hasOwn(YDensity.QUANTILES)) {
             options.getBoundedDoubleList(YDensity.QUANTILES, 0.0, 1.0)
         } else {
@@ -261,6 +288,7 @@ object StatProto {
             adjust = options.getDoubleDef(Density.ADJUST, DensityStat.DEF_ADJUST),
             kernel = kernel ?: DensityStat.DEF_KERNEL,
             n = options.getIntegerDef(Density.N, DensityStat.DEF_N),
+            method = method ?: DensityStat.DEF_METHOD,
             fullScanMax = options.getIntegerDef(Density.FULL_SCAN_MAX, DensityStat.DEF_FULL_SCAN_MAX),
             quantiles = quantiles
         )
@@ -296,6 +324,10 @@ object StatProto {
             DensityStatUtil.toKernel(it)
         }
 
+        val method = options.getString(Density.METHOD)?.let {
+            DensityStatUtil.toMethod(it)
+        }
+
         val quantiles = if (options.hasOwn(Density.QUANTILES)) {
             options.getBoundedDoubleList(Density.QUANTILES, 0.0, 1.0)
         } else DensityStat.DEF_QUANTILES
@@ -307,6 +339,7 @@ object StatProto {
             adjust = options.getDoubleDef(Density.ADJUST, DensityStat.DEF_ADJUST),
             kernel = kernel ?: DensityStat.DEF_KERNEL,
             n = options.getIntegerDef(Density.N, DensityStat.DEF_N),
+            method = method ?: DensityStat.DEF_METHOD,
             fullScanMax = options.getIntegerDef(Density.FULL_SCAN_MAX, DensityStat.DEF_FULL_SCAN_MAX),
             quantiles = quantiles
         )
@@ -337,6 +370,10 @@ object StatProto {
             DensityStatUtil.toKernel(it)
         }
 
+        val method = options.getString(Density2d.METHOD)?.let {
+            DensityStatUtil.toMethod(it)
+        }
+
         var nX: Int? = null
         var nY: Int? = null
         options[Density2d.N]?.run {
@@ -361,6 +398,7 @@ object StatProto {
                 bandWidthMethod = bwMethod ?: AbstractDensity2dStat.DEF_BW,
                 adjust = options.getDoubleDef(Density2d.ADJUST, AbstractDensity2dStat.DEF_ADJUST),
                 kernel = kernel ?: AbstractDensity2dStat.DEF_KERNEL,
+                method = method ?: AbstractDensity2dStat.DEF_METHOD,
                 nX = nX ?: AbstractDensity2dStat.DEF_N,
                 nY = nY ?: AbstractDensity2dStat.DEF_N,
                 isContour = options.getBoolean(Density2d.IS_CONTOUR, AbstractDensity2dStat.DEF_CONTOUR),
@@ -374,6 +412,7 @@ object StatProto {
                 bandWidthMethod = bwMethod ?: AbstractDensity2dStat.DEF_BW,
                 adjust = options.getDoubleDef(Density2d.ADJUST, AbstractDensity2dStat.DEF_ADJUST),
                 kernel = kernel ?: AbstractDensity2dStat.DEF_KERNEL,
+                method = method ?: AbstractDensity2dStat.DEF_METHOD,
                 nX = nX ?: AbstractDensity2dStat.DEF_N,
                 nY = nY ?: AbstractDensity2dStat.DEF_N,
                 isContour = options.getBoolean(Density2d.IS_CONTOUR, AbstractDensity2dStat.DEF_CONTOUR),
@@ -5,6 +5,7 @@
 
 package org.jetbrains.letsPlot.core.spec.back
 
+import org.jetbrains.letsPlot.commons.interval.DoubleSpan
 import org.jetbrains.letsPlot.core.plot.base.*
 import org.jetbrains.letsPlot.core.plot.base.DataFrame.Variable
 import org.jetbrains.letsPlot.core.plot.base.data.DataFrameUtil
@@ -15,14 +16,17 @@ import org.jetbrains.letsPlot.core.plot.builder.data.DataProcessing
 import org.jetbrains.letsPlot.core.plot.builder.data.OrderOptionUtil.OrderOption
 import org.jetbrains.letsPlot.core.plot.builder.data.YOrientationUtil
 import org.jetbrains.letsPlot.core.plot.builder.presentation.DefaultFontFamilyRegistry
+import org.jetbrains.letsPlot.core.plot.builder.sampling.Samplings
 import org.jetbrains.letsPlot.core.plot.builder.tooltip.data.DataFrameField
 import org.jetbrains.letsPlot.core.spec.Option.Meta.DATA_META
 import org.jetbrains.letsPlot.core.spec.Option.Meta.GeoDataFrame.GDF
 import org.jetbrains.letsPlot.core.spec.Option.Meta.GeoDataFrame.GEOMETRY
+import org.jetbrains.letsPlot.core.spec.Option.Plot.COORD
 import org.jetbrains.letsPlot.core.spec.Option.Plot.THEME
 import org.jetbrains.letsPlot.core.spec.PlotConfigUtil
 import org.jetbrains.letsPlot.core.spec.back.data.BackendDataProcUtil
 import org.jetbrains.letsPlot.core.spec.back.data.PlotSampling
+import org.jetbrains.letsPlot.core.spec.config.CoordConfig
 import org.jetbrains.letsPlot.core.spec.config.DataMetaUtil
 import org.jetbrains.letsPlot.core.spec.config.LayerConfig
 import org.jetbrains.letsPlot.core.spec.config.PlotConfig
@@ -37,6 +41,15 @@ open class PlotConfigBackend(
 ) {
     val theme = ThemeConfig(getMap(THEME), DefaultFontFamilyRegistry()).theme
 
+    // The coordinate limits: the viewport of level-of-detail samplings.
+    private val samplingViewport: Pair<DoubleSpan?, DoubleSpan?> by lazy {
+        CoordConfig.cartesianLimits(
+            get(COORD),
+            transformByAes.getValue(Aes.X),
+            transformByAes.getValue(Aes.Y)
+        ) ?: Pair(null, null)
+    }
+
     /**
      * WARN! Side effects - performs modifications deep in specs tree
      */
@@ -184,7 +197,7 @@ open class PlotConfigBackend(
             // Apply sampling to layer tile data if necessary
             PlotSampling.apply(
                 tileDataAfterStat,
-                layerConfig.samplings,
+                Samplings.withViewport(layerConfig.samplings, samplingViewport.first, samplingViewport.second),
                 groupMapperAfterStat
             ) { message -> messageHandler(BackendDataProcUtil.createSamplingMessage(message, layerConfig)) }
         }
@@ -10,6 +10,7 @@ import org.jetbrains.letsPlot.core.spec.FailureHandler
 import org.jetbrains.letsPlot.core.spec.FigKind
 import org.jetbrains.letsPlot.core.spec.Option
 import org.jetbrains.letsPlot.core.spec.Option.SubPlots.Figure.BLANK
+import org.jetbrains.letsPlot.core.spec.SharedDataUtil
 import org.jetbrains.letsPlot.core.spec.back.transform.PlotConfigBackendTransforms
 import org.jetbrains.letsPlot.core.spec.config.PlotConfig
 
@@ -20,6 +21,8 @@ object SpecTransformBackendUtil {
 
     fun processTransform(plotSpecRaw: MutableMap<String, Any>): MutableMap<String, Any> {
         return try {
+            @Suppress("NAME_SHADOWING")
+            val plotSpecRaw = SharedDataUtil.resolve(plotSpecRaw)
             when (PlotConfig.figSpecKind(plotSpecRaw)) {
                 FigKind.PLOT_SPEC -> processTransformIntern(plotSpecRaw)
                 FigKind.SUBPLOTS_SPEC -> processTransformInSubPlots(plotSpecRaw)
@@ -53,6 +53,28 @@ class CoordConfig private constructor(
             }
         }
 
+        /**
+         * The "transformed" x/y-limits of not flipped cartesian (or fixed) coordinates, else null.
+         */
+        fun cartesianLimits(
+            coordOpts: Any?,
+            transformX: Transform,
+            transformY: Transform
+        ): Pair<DoubleSpan?, DoubleSpan?>? {
+            if (coordOpts !is Map<*, *>) return null
+            if (ConfigUtil.featureName(coordOpts) !in listOf(Option.CoordName.CARTESIAN, Option.CoordName.FIXED)) {
+                return null
+            }
+
+            @Suppress("UNCHECKED_CAST")
+            val accessor = over(coordOpts as Map<String, Any>)
+            if (accessor.getBoolean(Option.Coord.FLIPPED)) return null
+
+            val xLim = accessor.getRangeOrNull(Option.Coord.X_LIM)?.let { validateRange(it, transformX) }
+            val yLim = accessor.getRangeOrNull(Option.Coord.Y_LIM)?.let { validateRange(it, transformY) }
+            return Pair(xLim, yLim)
+        }
+
         private fun validateRange(r: DoubleSpan, t: Transform): DoubleSpan {
             return when (t) {
                 is ContinuousTransform -> {
@@ -7,7 +7,10 @@ package org.jetbrains.letsPlot.core.spec.config
 
 import org.jetbrains.letsPlot.core.plot.builder.sampling.Sampling
 import org.jetbrains.letsPlot.core.plot.builder.sampling.Samplings
+import org.jetbrains.letsPlot.core.plot.builder.sampling.Samplings.LTTB
+import org.jetbrains.letsPlot.core.plot.builder.sampling.Samplings.M4
 import org.jetbrains.letsPlot.core.plot.builder.sampling.Samplings.PICK
+import org.jetbrains.letsPlot.core.plot.builder.sampling.Samplings.QUADTREE
 import org.jetbrains.letsPlot.core.plot.builder.sampling.Samplings.RANDOM
 import org.jetbrains.letsPlot.core.plot.builder.sampling.Samplings.RANDOM_GROUP
 import org.jetbrains.letsPlot.core.plot.builder.sampling.Samplings.RANDOM_STRATIFIED
@@ -16,6 +19,7 @@ import org.jetbrains.letsPlot.core.plot.builder.sampling.Samplings.SYSTEMATIC_GR
 import org.jetbrains.letsPlot.core.plot.builder.sampling.Samplings.VERTEX_DP
 import org.jetbrains.letsPlot.core.plot.builder.sampling.Samplings.VERTEX_VW
 import org.jetbrains.letsPlot.core.spec.Option
+import org.jetbrains.letsPlot.core.spec.Option.Sampling.DEPTH
 import org.jetbrains.letsPlot.core.spec.Option.Sampling.MIN_SUB_SAMPLE
 import org.jetbrains.letsPlot.core.spec.Option.Sampling.N
 import org.jetbrains.letsPlot.core.spec.Option.Sampling.SEED
@@ -38,6 +42,9 @@ internal object SamplingProto {
             )
             VERTEX_VW -> Samplings.vertexVw(opts.getInteger(N)!!)
             VERTEX_DP -> Samplings.vertexDp(opts.getInteger(N)!!)
+            LTTB -> Samplings.lttb(opts.getInteger(N)!!)
+            M4 -> Samplings.m4(opts.getInteger(N)!!)
+            QUADTREE -> Samplings.quadtree(opts.getInteger(N)!!, opts.getInteger(DEPTH))
 
             else -> throw IllegalArgumentException("Unknown sampling method: '$name'")
         }
@@ -11,6 +11,7 @@ import org.jetbrains.letsPlot.core.plot.builder.FigureBuildInfo
 import org.jetbrains.letsPlot.core.plot.builder.assemble.PlotAssembler
 import org.jetbrains.letsPlot.core.plot.builder.presentation.Defaults
 import org.jetbrains.letsPlot.core.spec.FigKind
+import org.jetbrains.letsPlot.core.spec.SharedDataUtil
 import org.jetbrains.letsPlot.core.spec.back.SpecTransformBackendUtil
 import org.jetbrains.letsPlot.core.spec.config.BunchConfig
 import org.jetbrains.letsPlot.core.spec.config.CompositeFigureConfig
@@ -294,9 +295,12 @@ object MonolithicCommon {
             return plotSpec
         }
 
-        // "Backend" transforms.
+        // Put the shared data in place of references to it.
         @Suppress("NAME_SHADOWING")
-        val plotSpec = if (frontendOnly) {
+        var plotSpec = SharedDataUtil.resolve(plotSpec)
+
+        // "Backend" transforms.
+        plotSpec = if (frontendOnly) {
             plotSpec
         } else {
             SpecTransformBackendUtil.processTransform(plotSpec)
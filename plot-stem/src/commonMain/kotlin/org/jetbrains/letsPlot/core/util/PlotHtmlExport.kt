@@ -17,13 +17,15 @@ object PlotHtmlExport {
      * @param scriptUrl A URL to load the Lets-plot JS library from.
      * @param iFrame Whether to wrap HTML in IFrame
      * @param plotSize Desired plot size. Has no effect on GGBunch.
+     * @param dataEncoding When specified, numeric data columns are embedded as typed arrays instead of JSON lists.
      */
     @Suppress("MemberVisibilityCanBePrivate")
     fun buildHtmlFromRawSpecs(
         plotSpec: MutableMap<String, Any>,
         scriptUrl: String,
         iFrame: Boolean = false,
-        plotSize: DoubleVector? = null
+        plotSize: DoubleVector? = null,
+        dataEncoding: TypedArrayEncoding? = null
     ): String {
 
         val configureHtml = PlotHtmlHelper.getStaticConfigureHtml(scriptUrl)
@@ -31,7 +33,8 @@ object PlotHtmlExport {
             plotSpec,
             plotSize,
             removeComputationMessages = true,
-            logComputationMessages = true
+            logComputationMessages = true,
+            dataEncoding = dataEncoding
         )
 
         val style = if (iFrame) {
@@ -10,6 +10,7 @@ import org.jetbrains.letsPlot.core.commons.jsObject.JsObjectSupportCommon
 import org.jetbrains.letsPlot.commons.logging.PortableLogging
 import org.jetbrains.letsPlot.commons.intern.random.RandomString.randomString
 import org.jetbrains.letsPlot.core.spec.PlotConfigUtil
+import org.jetbrains.letsPlot.core.spec.SharedDataUtil
 import org.jetbrains.letsPlot.core.spec.back.SpecTransformBackendUtil
 
 object PlotHtmlHelper {
@@ -91,10 +92,21 @@ object PlotHtmlHelper {
         """.trimMargin()
     }
 
-    fun getDynamicDisplayHtmlForRawSpec(plotSpec: MutableMap<String, Any>, size: DoubleVector? = null): String {
+    /**
+     * @param dataEncoding When specified, numeric data columns are embedded as typed arrays instead of JSON lists.
+     */
+    fun getDynamicDisplayHtmlForRawSpec(
+        plotSpec: MutableMap<String, Any>,
+        size: DoubleVector? = null,
+        dataEncoding: TypedArrayEncoding? = null
+    ): String {
         // server-side transforms: statistics, sampling, etc.
         @Suppress("NAME_SHADOWING")
-        val plotSpec = SpecTransformBackendUtil.processTransform(plotSpec)
+        var plotSpec = SpecTransformBackendUtil.processTransform(plotSpec)
+        plotSpec = SharedDataUtil.share(plotSpec)
+        if (dataEncoding != null) {
+            plotSpec = dataEncoding.encode(plotSpec)
+        }
         val plotSpecJs = JsObjectSupportCommon.mapToJsObjectInitializer(plotSpec)
         return getDynamicDisplayHtml(plotSpecJs, size)
     }
@@ -120,10 +132,16 @@ object PlotHtmlHelper {
         return "<script type=\"text/javascript\" $ATT_SCRIPT_KIND=\"$SCRIPT_KIND_LIB_LOADING\" src=\"$scriptUrl\"></script>"
     }
 
-    fun getStaticDisplayHtmlForRawSpec(plotSpec: MutableMap<String, Any>, size: DoubleVector? = null, removeComputationMessages: Boolean = false, logComputationMessages: Boolean = false): String {
+    fun getStaticDisplayHtmlForRawSpec(
+        plotSpec: MutableMap<String, Any>,
+        size: DoubleVector? = null,
+        removeComputationMessages: Boolean = false,
+        logComputationMessages: Boolean = false,
+        dataEncoding: TypedArrayEncoding? = null
+    ): String {
         // server-side transforms: statistics, sampling, etc.
         @Suppress("NAME_SHADOWING")
-        val plotSpec = SpecTransformBackendUtil.processTransform(plotSpec)
+        var plotSpec = SpecTransformBackendUtil.processTransform(plotSpec)
 
         if (logComputationMessages) {
             PlotConfigUtil.findComputationMessages(plotSpec).forEach { LOG.info { "[when HTML generating] $it" } }
@@ -134,6 +152,13 @@ object PlotHtmlHelper {
             PlotConfigUtil.removeComputationMessages(plotSpec)
         }
 
+        // Data of subplots or layers processed to the same values is embedded once.
+        plotSpec = SharedDataUtil.share(plotSpec)
+
+        if (dataEncoding != null) {
+            plotSpec = dataEncoding.encode(plotSpec)
+        }
+
         val plotSpecJs = JsObjectSupportCommon.mapToJsObjectInitializer(plotSpec)
         return getStaticDisplayHtml(plotSpecJs, size)
     }
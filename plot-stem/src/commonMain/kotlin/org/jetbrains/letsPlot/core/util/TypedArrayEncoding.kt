@@ -0,0 +1,152 @@
+/*
+ * Copyright (c) 2023. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.util
+
+import org.jetbrains.letsPlot.core.spec.Option.Meta
+import org.jetbrains.letsPlot.core.spec.Option.Meta.SeriesAnnotation
+import org.jetbrains.letsPlot.core.spec.Option.Meta.SharedData
+import org.jetbrains.letsPlot.core.spec.Option.PlotBase
+import kotlin.io.encoding.Base64
+import kotlin.io.encoding.ExperimentalEncodingApi
+
+/**
+ * Replaces numeric data columns in a (processed) plot spec with base64-encoded little-endian
+ * Float64 or Float32 buffers, optionally deflate-compressed.
+ *
+ * Embedding data as typed arrays makes the HTML several times smaller than JSON number arrays
+ * and much faster to parse by the browser.
+ * The frontend decodes the encoded columns back before building the plot (see `TypedArrayDecoding` in js-package).
+ *
+ * Encoded column:
+ *  {
+ *      "typed_array": "float64" | "float32",
+ *      "compression": "deflate",   // optional
+ *      "length": <number of values>,
+ *      "data": "<base64>"
+ *  }
+ *  Null values are encoded as NaN.
+ *
+ *  Datetime columns (see `series_annotations`) are always encoded as Float64:
+ *  epoch milliseconds are too big for Float32 (one step is about 2 minutes).
+ */
+class TypedArrayEncoding(
+    private val float32: Boolean,
+    private val deflate: ((ByteArray) -> ByteArray)? = null,
+    private val minLength: Int = MIN_LENGTH
+) {
+
+    fun encode(plotSpec: MutableMap<String, Any>): MutableMap<String, Any> {
+        val datetimeColumns = HashSet<String>()
+        if (float32) {
+            collectDatetimeColumns(plotSpec, datetimeColumns)
+        }
+
+        @Suppress("UNCHECKED_CAST")
+        return encodeValue(plotSpec, datetimeColumns) as MutableMap<String, Any>
+    }
+
+    private fun encodeValue(value: Any?, datetimeColumns: Set<String>): Any? {
+        return when (value) {
+            is Map<*, *> -> value.mapValuesTo(LinkedHashMap()) { (key, v) ->
+                if (key == PlotBase.DATA && v is Map<*, *>) {
+                    encodeData(v, datetimeColumns)
+                } else if (key == SharedData.TABLE && v is Map<*, *>) {
+                    v.mapValues { (_, data) -> encodeData(data as Map<*, *>, datetimeColumns) }
+                } else {
+                    encodeValue(v, datetimeColumns)
+                }
+            }
+
+            is List<*> -> value.map { encodeValue(it, datetimeColumns) }
+            else -> value
+        }
+    }
+
+    private fun encodeData(data: Map<*, *>, datetimeColumns: Set<String>): Map<*, *> {
+        return data.mapValuesTo(LinkedHashMap()) { (name, column) ->
+            if (column is List<*> && isNumeric(column)) {
+                encodeColumn(column, asFloat32 = float32 && name !in datetimeColumns)
+            } else {
+                column
+            }
+        }
+    }
+
+    private fun isNumeric(column: List<*>): Boolean {
+        return column.size >= minLength && column.all { it == null || it is Double || it is Float || it is Int || it is Long }
+    }
+
+    @OptIn(ExperimentalEncodingApi::class)
+    private fun encodeColumn(column: List<*>, asFloat32: Boolean): Map<String, Any> {
+        var bytes = if (asFloat32) float32Bytes(column) else float64Bytes(column)
+        val encoded = LinkedHashMap<String, Any>()
+        encoded[TYPED_ARRAY] = if (asFloat32) FLOAT32 else FLOAT64
+        if (deflate != null) {
+            bytes = deflate.invoke(bytes)
+            encoded[COMPRESSION] = DEFLATE
+        }
+        encoded[LENGTH] = column.size
+        encoded[DATA] = Base64.encode(bytes)
+        return encoded
+    }
+
+    companion object {
+        const val TYPED_ARRAY = "typed_array"
+        const val COMPRESSION = "compression"
+        const val LENGTH = "length"
+        const val DATA = "data"
+
+        const val FLOAT64 = "float64"
+        const val FLOAT32 = "float32"
+        const val DEFLATE = "deflate"
+
+        // Short columns are cheaper to keep as JSON.
+        private const val MIN_LENGTH = 100
+
+        fun isEncodedColumn(column: Any?): Boolean {
+            return column is Map<*, *> && column.containsKey(TYPED_ARRAY)
+        }
+
+        // Names of the columns annotated as datetime in the plot, its layers and subplots.
+        private fun collectDatetimeColumns(value: Any?, result: MutableSet<String>) {
+            when (value) {
+                is Map<*, *> -> for ((key, v) in value) {
+                    if (key == Meta.DATA_META && v is Map<*, *>) {
+                        (v[SeriesAnnotation.TAG] as? List<*>)?.filterIsInstance<Map<*, *>>()
+                            ?.filter { it[SeriesAnnotation.TYPE] == SeriesAnnotation.DateTime.DATE_TIME }
+                            ?.mapNotNullTo(result) { it[SeriesAnnotation.COLUMN] as? String }
+                    } else if (key != PlotBase.DATA && key != SharedData.TABLE) {
+                        collectDatetimeColumns(v, result)
+                    }
+                }
+
+                is List<*> -> value.forEach { collectDatetimeColumns(it, result) }
+            }
+        }
+
+        private fun float64Bytes(column: List<*>): ByteArray {
+            val bytes = ByteArray(column.size * 8)
+            column.forEachIndexed { i, v ->
+                val bits = ((v as? Number)?.toDouble() ?: Double.NaN).toRawBits()
+                for (b in 0 until 8) {
+                    bytes[i * 8 + b] = (bits ushr (8 * b)).toByte()
+                }
+            }
+            return bytes
+        }
+
+        private fun float32Bytes(column: List<*>): ByteArray {
+            val bytes = ByteArray(column.size * 4)
+            column.forEachIndexed { i, v ->
+                val bits = ((v as? Number)?.toFloat() ?: Float.NaN).toRawBits()
+                for (b in 0 until 4) {
+                    bytes[i * 4 + b] = (bits ushr (8 * b)).toByte()
+                }
+            }
+            return bytes
+        }
+    }
+}
@@ -0,0 +1,84 @@
+/*
+ * Copyright (c) 2023. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.spec
+
+import org.assertj.core.api.Assertions.assertThat
+import org.junit.Test
+
+class SharedDataUtilTest {
+
+    @Test
+    fun `repeated data is shared and resolved back`() {
+        val data = mapOf("x" to listOf(1.0, 2.0), "y" to listOf(3.0, 4.0))
+        val spec = mutableMapOf<String, Any>(
+            "kind" to "subplots",
+            "figures" to listOf(
+                mapOf("kind" to "plot", "data" to data),
+                mapOf("kind" to "plot", "data" to data.toMap()),
+                mapOf("kind" to "plot", "data" to mapOf("x" to listOf(5.0)))
+            )
+        )
+
+        val shared = SharedDataUtil.share(spec)
+        assertThat(shared["shared_data"]).isEqualTo(mapOf("0" to data))
+
+        @Suppress("UNCHECKED_CAST")
+        val figures = shared["figures"] as List<Map<String, Any>>
+        assertThat(figures.map { it["data_ref"] }).isEqualTo(listOf("0", "0", null))
+        assertThat(figures[2]["data"]).isEqualTo(mapOf("x" to listOf(5.0)))
+
+        assertThat(SharedDataUtil.resolve(shared)).isEqualTo(spec)
+    }
+
+    @Test
+    fun `data used once is not shared`() {
+        val spec = mutableMapOf<String, Any>(
+            "kind" to "plot",
+            "data" to mapOf("x" to listOf(1.0)),
+            "layers" to listOf(mapOf("geom" to "point", "data" to mapOf("x" to listOf(2.0))))
+        )
+        assertThat(SharedDataUtil.share(spec)).isSameAs(spec)
+    }
+
+    @Test
+    fun `each place gets its own copy of resolved data`() {
+        val spec = mutableMapOf<String, Any>(
+            "kind" to "plot",
+            "layers" to listOf(mapOf("data_ref" to "0"), mapOf("data_ref" to "0")),
+            "shared_data" to mapOf("0" to mapOf("x" to listOf(1.0)))
+        )
+
+        @Suppress("UNCHECKED_CAST")
+        val layers = SharedDataUtil.resolve(spec)["layers"] as List<Map<String, Any>>
+        @Suppress("UNCHECKED_CAST")
+        (layers[0]["data"] as MutableMap<String, Any>)["y"] = listOf(2.0)
+        assertThat(layers[1]["data"]).isEqualTo(mapOf("x" to listOf(1.0)))
+    }
+
+    @Test
+    fun `data of the same columns and sizes is compared by value`() {
+        val spec = mutableMapOf<String, Any>(
+            "kind" to "plot",
+            "data" to mapOf("x" to listOf(1.0, 2.0)),
+            "layers" to listOf(
+                mapOf("geom" to "point", "data" to mapOf("x" to listOf(1.0, 3.0))),
+                mapOf("geom" to "point", "data" to mapOf("x" to listOf(1.0))),
+                mapOf("geom" to "point", "data" to mapOf("x" to listOf(1.0, 3.0))),
+                mapOf("geom" to "point", "data" to emptyMap<String, Any>())
+            )
+        )
+
+        val shared = SharedDataUtil.share(spec)
+        assertThat(shared["shared_data"]).isEqualTo(mapOf("0" to mapOf("x" to listOf(1.0, 3.0))))
+        assertThat(shared["data"]).isEqualTo(mapOf("x" to listOf(1.0, 2.0)))
+        @Suppress("UNCHECKED_CAST")
+        val layers = shared["layers"] as List<Map<String, Any>>
+        assertThat(layers.map { it["data_ref"] }).isEqualTo(listOf("0", null, "0", null))
+        assertThat(layers[3]["data"]).isEqualTo(emptyMap<String, Any>())
+
+        assertThat(SharedDataUtil.resolve(shared)).isEqualTo(spec)
+    }
+}
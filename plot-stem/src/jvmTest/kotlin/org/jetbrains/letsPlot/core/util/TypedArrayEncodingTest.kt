@@ -0,0 +1,63 @@
+/*
+ * Copyright (c) 2023. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.util
+
+import org.assertj.core.api.Assertions.assertThat
+import org.junit.Test
+import java.nio.ByteBuffer
+import java.nio.ByteOrder
+import java.util.Base64
+
+class TypedArrayEncodingTest {
+
+    @Test
+    fun `numeric columns of plot and layer data are encoded`() {
+        val values = List(200) { if (it == 3) null else it * 0.5 }
+        val spec = mutableMapOf<String, Any>(
+            "kind" to "plot",
+            "data" to mapOf("x" to values, "label" to List(200) { "a" }),
+            "layers" to listOf(mapOf("geom" to "point", "data" to mapOf("y" to values)))
+        )
+
+        val encoded = TypedArrayEncoding(float32 = false).encode(spec)
+
+        val plotData = encoded["data"] as Map<*, *>
+        assertThat(plotData["label"]).isEqualTo(List(200) { "a" })
+        assertThat(decodeFloat64(plotData["x"] as Map<*, *>)).isEqualTo(values)
+
+        @Suppress("UNCHECKED_CAST")
+        val layerData = (encoded["layers"] as List<Map<*, *>>)[0]["data"] as Map<*, *>
+        assertThat(decodeFloat64(layerData["y"] as Map<*, *>)).isEqualTo(values)
+    }
+
+    @Test
+    fun `short columns are kept as JSON`() {
+        val spec = mutableMapOf<String, Any>("data" to mapOf("x" to listOf(1.0, 2.0)))
+        val encoded = TypedArrayEncoding(float32 = true).encode(spec)
+        assertThat(encoded["data"]).isEqualTo(mapOf("x" to listOf(1.0, 2.0)))
+    }
+
+    @Test
+    fun `datetime columns are not narrowed to float32`() {
+        val millis = List(200) { 1.7e12 + it * 1000.0 + 1.0 }
+        val spec = mutableMapOf<String, Any>(
+            "kind" to "plot",
+            "data" to mapOf("t" to millis, "x" to millis),
+            "data_meta" to mapOf("series_annotations" to listOf(mapOf("column" to "t", "type" to "datetime")))
+        )
+
+        val plotData = TypedArrayEncoding(float32 = true).encode(spec)["data"] as Map<*, *>
+        assertThat(decodeFloat64(plotData["t"] as Map<*, *>)).isEqualTo(millis)
+        assertThat((plotData["x"] as Map<*, *>)[TypedArrayEncoding.TYPED_ARRAY]).isEqualTo(TypedArrayEncoding.FLOAT32)
+    }
+
+    private fun decodeFloat64(column: Map<*, *>): List<Double?> {
+        assertThat(column[TypedArrayEncoding.TYPED_ARRAY]).isEqualTo(TypedArrayEncoding.FLOAT64)
+        val bytes = Base64.getDecoder().decode(column[TypedArrayEncoding.DATA] as String)
+        val buffer = ByteBuffer.wrap(bytes).order(ByteOrder.LITTLE_ENDIAN).asDoubleBuffer()
+        return List(column[TypedArrayEncoding.LENGTH] as Int) { buffer[it].takeUnless(Double::isNaN) }
+    }
+}
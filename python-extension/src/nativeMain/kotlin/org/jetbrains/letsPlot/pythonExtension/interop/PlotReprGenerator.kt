@@ -5,6 +5,8 @@
 
 package org.jetbrains.letsPlot.pythonExtension.interop
 
+import Python.PyEval_RestoreThread
+import Python.PyEval_SaveThread
 import Python.PyObject
 import Python.Py_BuildValue
 import kotlinx.cinterop.ByteVar
@@ -12,16 +14,30 @@ import kotlinx.cinterop.CPointer
 import kotlinx.cinterop.toKString
 import org.jetbrains.letsPlot.core.util.PlotHtmlExport
 import org.jetbrains.letsPlot.core.util.PlotHtmlHelper
+import org.jetbrains.letsPlot.core.util.TypedArrayEncoding
+import org.jetbrains.letsPlot.nat.encoding.png.NativeDeflater
 import org.jetbrains.letsPlot.nat.util.PlotSvgExportNative
 import org.jetbrains.letsPlot.pythonExtension.interop.TypeUtils.pyDictToMap
+import org.jetbrains.letsPlot.pythonExtension.interop.TypeUtils.pyListToDictList
+import org.jetbrains.letsPlot.pythonExtension.interop.TypeUtils.stringListToPyList
 
 object PlotReprGenerator {
-    fun generateDynamicDisplayHtml(plotSpecDict: CPointer<PyObject>?): CPointer<PyObject>? {
+    fun generateDynamicDisplayHtml(
+        plotSpecDict: CPointer<PyObject>?,
+        dataEncodingCStr: CPointer<ByteVar>?,
+        dataCompressionCStr: CPointer<ByteVar>?
+    ): CPointer<PyObject>? {
         return try {
             val plotSpecMap = pyDictToMap(plotSpecDict)
+            val dataEncoding = typedArrayEncoding(dataEncodingCStr, dataCompressionCStr)
 
             @Suppress("UNCHECKED_CAST")
-            val html = PlotHtmlHelper.getDynamicDisplayHtmlForRawSpec(plotSpecMap as MutableMap<String, Any>)
+            val html = withoutGil {
+                PlotHtmlHelper.getDynamicDisplayHtmlForRawSpec(
+                    plotSpecMap as MutableMap<String, Any>,
+                    dataEncoding = dataEncoding
+                )
+            }
             Py_BuildValue("s", html)
         } catch (e: Throwable) {
             Py_BuildValue("s", "generateDynamicDisplayHtml() - Exception: ${e.message}");
@@ -33,40 +49,153 @@ object PlotReprGenerator {
             val plotSpecMap = pyDictToMap(plotSpecDict)
 
             @Suppress("UNCHECKED_CAST")
-            val svg = PlotSvgExportNative.buildSvgImageFromRawSpecs(
-                plotSpec = plotSpecMap as MutableMap<String, Any>,
-                plotSize = null,
-                useCssPixelatedImageRendering = useCssPixelatedImageRendering == 1,
-            )
+            val svg = withoutGil {
+                PlotSvgExportNative.buildSvgImageFromRawSpecs(
+                    plotSpec = plotSpecMap as MutableMap<String, Any>,
+                    plotSize = null,
+                    useCssPixelatedImageRendering = useCssPixelatedImageRendering == 1,
+                )
+            }
             Py_BuildValue("s", svg)
         } catch (e: Throwable) {
-            val svgStr = """
-                <svg style="width:100%;height:100%;" xmlns="http://www.w3.org/2000/svg">
-                    <text x="0" y="20">generateSvg() - Exception: ${e.message}</text>
-                </svg>
-            """.trimIndent()
-            Py_BuildValue("s", svgStr);
+            Py_BuildValue("s", errorSvg("generateSvg", e));
+        }
+    }
+
+    /**
+     * Batch version of generateSvg(): converts all specs, then builds all SVGs with the GIL released.
+     * Returns a Python list of strings in the same order as the specs.
+     */
+    fun generateSvgBatch(plotSpecList: CPointer<PyObject>?, useCssPixelatedImageRendering: Int): CPointer<PyObject>? {
+        return try {
+            val plotSpecMaps = pyListToDictList(plotSpecList)
+
+            val svgList = withoutGil {
+                plotSpecMaps.map { plotSpecMap ->
+                    try {
+                        @Suppress("UNCHECKED_CAST")
+                        PlotSvgExportNative.buildSvgImageFromRawSpecs(
+                            plotSpec = plotSpecMap as MutableMap<String, Any>,
+                            plotSize = null,
+                            useCssPixelatedImageRendering = useCssPixelatedImageRendering == 1,
+                        )
+                    } catch (e: Throwable) {
+                        errorSvg("generateSvgBatch", e)
+                    }
+                }
+            }
+            stringListToPyList(svgList)
+        } catch (e: Throwable) {
+            stringListToPyList(listOf(errorSvg("generateSvgBatch", e)))
         }
     }
 
     fun generateStaticHtmlPage(
         plotSpecDict: CPointer<PyObject>?,
         scriptUrlCStr: CPointer<ByteVar>,
-        iFrame: Int
+        iFrame: Int,
+        dataEncodingCStr: CPointer<ByteVar>?,
+        dataCompressionCStr: CPointer<ByteVar>?
     ): CPointer<PyObject>? {
         return try {
             val plotSpecMap = pyDictToMap(plotSpecDict)
             val scriptUrl = scriptUrlCStr.toKString()
+            val dataEncoding = typedArrayEncoding(dataEncodingCStr, dataCompressionCStr)
 
             @Suppress("UNCHECKED_CAST")
-            val html = PlotHtmlExport.buildHtmlFromRawSpecs(
-                plotSpec = plotSpecMap as MutableMap<String, Any>,
-                scriptUrl = scriptUrl,
-                iFrame = iFrame == 1
-            )
+            val html = withoutGil {
+                PlotHtmlExport.buildHtmlFromRawSpecs(
+                    plotSpec = plotSpecMap as MutableMap<String, Any>,
+                    scriptUrl = scriptUrl,
+                    iFrame = iFrame == 1,
+                    dataEncoding = dataEncoding
+                )
+            }
             Py_BuildValue("s", html)
         } catch (e: Throwable) {
             Py_BuildValue("s", "generateStaticHtmlPage() - Exception: ${e.message}");
         }
     }
-}
\ No newline at end of file
+
+    /**
+     * Batch version of generateStaticHtmlPage(): converts all specs, then builds all HTML pages with the GIL released.
+     * Returns a Python list of strings in the same order as the specs.
+     */
+    fun generateStaticHtmlPageBatch(
+        plotSpecList: CPointer<PyObject>?,
+        scriptUrlCStr: CPointer<ByteVar>,
+        iFrame: Int,
+        dataEncodingCStr: CPointer<ByteVar>?,
+        dataCompressionCStr: CPointer<ByteVar>?
+    ): CPointer<PyObject>? {
+        return try {
+            val plotSpecMaps = pyListToDictList(plotSpecList)
+            val scriptUrl = scriptUrlCStr.toKString()
+            val dataEncoding = typedArrayEncoding(dataEncodingCStr, dataCompressionCStr)
+
+            val htmlList = withoutGil {
+                plotSpecMaps.map { plotSpecMap ->
+                    try {
+                        @Suppress("UNCHECKED_CAST")
+                        PlotHtmlExport.buildHtmlFromRawSpecs(
+                            plotSpec = plotSpecMap as MutableMap<String, Any>,
+                            scriptUrl = scriptUrl,
+                            iFrame = iFrame == 1,
+                            dataEncoding = dataEncoding
+                        )
+                    } catch (e: Throwable) {
+                        "generateStaticHtmlPageBatch() - Exception: ${e.message}"
+                    }
+                }
+            }
+            stringListToPyList(htmlList)
+        } catch (e: Throwable) {
+            stringListToPyList(listOf("generateStaticHtmlPageBatch() - Exception: ${e.message}"))
+        }
+    }
+
+    /**
+     * @param dataEncodingCStr 'json' (or NULL), 'float64' or 'float32'.
+     * @param dataCompressionCStr NULL or 'deflate'.
+     */
+    private fun typedArrayEncoding(
+        dataEncodingCStr: CPointer<ByteVar>?,
+        dataCompressionCStr: CPointer<ByteVar>?
+    ): TypedArrayEncoding? {
+        val deflate: ((ByteArray) -> ByteArray)? = when (val compression = dataCompressionCStr?.toKString()) {
+            null -> null
+            TypedArrayEncoding.DEFLATE -> { bytes -> NativeDeflater().deflateByteArray(bytes) }
+            else -> throw IllegalArgumentException("Unsupported data compression: '$compression'")
+        }
+
+        return when (val encoding = dataEncodingCStr?.toKString()) {
+            null, "json" -> null
+            TypedArrayEncoding.FLOAT64 -> TypedArrayEncoding(float32 = false, deflate = deflate)
+            TypedArrayEncoding.FLOAT32 -> TypedArrayEncoding(float32 = true, deflate = deflate)
+            else -> throw IllegalArgumentException("Unsupported data encoding: '$encoding'")
+        }
+    }
+
+    private fun errorSvg(funName: String, e: Throwable): String {
+        return """
+            <svg style="width:100%;height:100%;" xmlns="http://www.w3.org/2000/svg">
+                <text x="0" y="20">$funName() - Exception: ${e.message}</text>
+            </svg>
+        """.trimIndent()
+    }
+
+    /**
+     * Runs the block with the GIL released so that other Python threads can run
+     * (and render other plots) meanwhile.
+     * The block must not touch any Python objects: the plot spec has to be converted
+     * before and the result has to be built after the call.
+     */
+    private inline fun <T> withoutGil(block: () -> T): T {
+        val threadState = PyEval_SaveThread()
+        try {
+            return block()
+        } finally {
+            PyEval_RestoreThread(threadState)
+        }
+    }
+}
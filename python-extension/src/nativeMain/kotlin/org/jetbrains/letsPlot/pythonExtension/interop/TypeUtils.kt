@@ -6,8 +6,16 @@
 package org.jetbrains.letsPlot.pythonExtension.interop
 
 import Python.*
+import kotlinx.cinterop.ByteVar
 import kotlinx.cinterop.CPointer
 import kotlinx.cinterop.CValuesRef
+import kotlinx.cinterop.DoubleVar
+import kotlinx.cinterop.LongVar
+import kotlinx.cinterop.alloc
+import kotlinx.cinterop.get
+import kotlinx.cinterop.memScoped
+import kotlinx.cinterop.ptr
+import kotlinx.cinterop.reinterpret
 import kotlinx.cinterop.toKString
 import org.jetbrains.letsPlot.pythonExtension.interop.PythonTypes.BOOL
 import org.jetbrains.letsPlot.pythonExtension.interop.PythonTypes.DICT
@@ -39,6 +47,27 @@ internal object TypeUtils {
             .toMutableMap()
     }
 
+    fun pyListToDictList(list: TPyObjPtr?): List<MutableMap<Any?, Any?>> {
+        if (list == null) {
+            return emptyList()
+        }
+
+        require(getPyObjectType(list) == LIST) { "pyListToDictList() - unexpected type: ${getPyObjectType(list)}" }
+
+        return asSequence(list, ::PyList_Size, ::PyList_GetItem)
+            .map(::pyDictToMap)
+            .toList()
+    }
+
+    fun stringListToPyList(strings: List<String>): TPyObjPtr? {
+        val list = PyList_New(strings.size.toLong()) ?: return null
+        strings.forEachIndexed { i, str ->
+            // PyList_SetItem steals the reference to the item.
+            PyList_SetItem(list, i.toLong(), Py_BuildValue("s", str))
+        }
+        return list
+    }
+
     private fun pyObjectToKotlin(obj: TPyObjPtr?): Any? {
         if (obj == null) return null;
 
@@ -53,7 +82,64 @@ internal object TypeUtils {
             LIST -> asSequence(obj, ::PyList_Size, ::PyList_GetItem).map(TypeUtils::pyObjectToKotlin).toMutableList()
             TUPLE -> asSequence(obj, ::PyTuple_Size, ::PyTuple_GetItem).map(TypeUtils::pyObjectToKotlin).toMutableList()
             NONE -> null
-            else -> error("pyObjectToKotlin() - unexpected type: $objType")
+            else -> pyBufferToList(obj) ?: error("pyObjectToKotlin() - unexpected type: $objType")
+        }
+    }
+
+    /**
+     * Reads a numeric column exposed via the Python buffer protocol (i.e. a contiguous numpy array)
+     * without building intermediate Python objects.
+     * Supported item formats: float64 ('d'), int64 ('q', 'l') and bool ('?').
+     * Numbers are copied to a primitive array (see `DoubleColumn`), non-finite values (NaN, +/-Inf) are missing values.
+     *
+     * @return null if the object doesn't support the buffer protocol.
+     */
+    private fun pyBufferToList(obj: TPyObjPtr): List<Any?>? = memScoped {
+        val view = alloc<Py_buffer>()
+        if (PyObject_GetBuffer(obj, view.ptr, PyBUF_C_CONTIGUOUS or PyBUF_FORMAT) != 0) {
+            PyErr_Clear()
+            return null
+        }
+
+        try {
+            val format = view.format?.toKString()
+            val itemSize = view.itemsize
+            val count = (view.len / itemSize).toInt()
+            val buf = requireNotNull(view.buf) { "pyBufferToList() - buffer is null" }
+
+            when {
+                format == "d" && itemSize == 8L -> {
+                    val values = buf.reinterpret<DoubleVar>()
+                    DoubleColumn(DoubleArray(count) { i -> values[i] })
+                }
+
+                (format == "q" || format == "l") && itemSize == 8L -> {
+                    val values = buf.reinterpret<LongVar>()
+                    DoubleColumn(DoubleArray(count) { i -> values[i].toDouble() })
+                }
+
+                format == "?" && itemSize == 1L -> {
+                    val values = buf.reinterpret<ByteVar>()
+                    MutableList<Any?>(count) { i -> values[i] != 0.toByte() }
+                }
+
+                else -> error("pyBufferToList() - unsupported buffer format: $format (item size: $itemSize)")
+            }
+        } finally {
+            PyBuffer_Release(view.ptr)
+        }
+    }
+
+    /**
+     * Read-only column of numbers stored in a primitive array: the values are boxed only when read.
+     * Non-finite values are read as nulls (missing values).
+     */
+    internal class DoubleColumn(private val values: DoubleArray) : AbstractList<Double?>() {
+        override val size: Int
+            get() = values.size
+
+        override fun get(index: Int): Double? {
+            return values[index].takeIf { it.isFinite() }
         }
     }
 
@@ -0,0 +1,36 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Measures detection of datetime columns (`as_annotated_data()`) which runs for every `ggplot()`
+and every layer with `data=`.
+
+    python benchmarks/bench_annotated_data.py
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from lets_plot.plot.util import as_annotated_data
+
+
+def main():
+    n = 10 ** 6
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({
+        'x': rng.normal(size=n),
+        'y': rng.normal(size=n),
+        'n': rng.integers(0, 100, size=n),
+        't': pd.date_range('2020-01-01', periods=n, freq='s'),
+        'label': rng.choice(['a', 'b', 'c'], size=n).astype(object),
+    })
+    for i in range(3):
+        start = time.perf_counter()
+        as_annotated_data(df, None)
+        print("call #{}: {:8.3f}ms".format(i, (time.perf_counter() - start) * 1000))
+
+
+if __name__ == '__main__':
+    main()
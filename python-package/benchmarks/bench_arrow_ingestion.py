@@ -0,0 +1,48 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Compares standardization of a polars data frame read from its Arrow buffers
+with the former path through `DataFrame.to_dict(as_series=False)`.
+
+    python benchmarks/bench_arrow_ingestion.py
+"""
+
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import polars as pl
+
+from lets_plot._type_utils import standardize_dict
+
+
+def _timeit(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    n = 10 ** 6
+    rng = np.random.default_rng(42)
+    x = rng.normal(size=n)
+    x[::10] = np.nan
+    df = pl.DataFrame({
+        'x': x,
+        'n': pl.Series(rng.integers(0, 100, size=n)).set(pl.Series(rng.random(n) < 0.1), None),
+        'c': pl.Series(rng.choice(['a', 'b', 'c'], size=n), dtype=pl.Categorical),
+        't': pl.datetime_range(datetime(2020, 1, 1), datetime(2020, 1, 1) + timedelta(seconds=n - 1), '1s', eager=True),
+    })
+    table = df.to_arrow()
+
+    to_dict = _timeit(lambda: standardize_dict({'data': df.to_dict(as_series=False)}))
+    print("polars, via to_dict():        {:7.3f}s".format(to_dict))
+    print("polars, Arrow buffers:        {:7.3f}s".format(_timeit(lambda: standardize_dict({'data': df}))))
+    print("polars, Arrow, numeric buffers: {:5.3f}s".format(
+        _timeit(lambda: standardize_dict({'data': df}, numeric_buffers=True))))
+    print("pyarrow.Table, Arrow buffers: {:7.3f}s".format(_timeit(lambda: standardize_dict({'data': table}))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Measures `as_dict()` of a plot re-displayed after a small change (e.g. a theme tweak in a notebook cell).
+Dicts of the unchanged layers and scales are reused from the previous call.
+
+    python benchmarks/bench_as_dict.py
+"""
+
+import time
+
+from lets_plot import ggplot, aes, geom_point, geom_line, scale_color_brewer, theme, element_text
+
+
+def _timeit(fn, repeat=200):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    p = ggplot() + scale_color_brewer(palette='Set1')
+    for i in range(30):
+        p += geom_point(aes('x', 'y', color='c'), size=i, alpha=0.5, tooltips='none')
+        p += geom_line(aes('x', 'y', group='c'), linetype=i % 6)
+
+    p.as_dict()
+    for i in range(3):
+        p_tweaked = p + theme(axis_title=element_text(size=10 + i))
+        t = _timeit(p_tweaked.as_dict)
+        print("theme tweak #{}: as_dict() {:8.1f}us".format(i, t * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Measures preparation of `geom_bin2d()` of 10M points for the plotting engine:
+standardization of the raw data vs. binning in Python (`precompute=True`), in one data frame and in 10 chunks.
+
+    python benchmarks/bench_bin2d_precompute.py
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from lets_plot import ggplot, geom_bin2d, aes
+from lets_plot._kbridge import _standardize_plot_spec
+
+
+def _prepare(data, precompute):
+    spec = (ggplot(data, aes('x', 'y')) + geom_bin2d(bins=[100, 100], precompute=precompute)).as_dict()
+    start = time.perf_counter()
+    std_spec = _standardize_plot_spec(spec)
+    elapsed = time.perf_counter() - start
+    return len((std_spec['layers'][0].get('data') or std_spec['data'])['x']), elapsed
+
+
+def main():
+    rng = np.random.default_rng(42)
+    n = 10 ** 7
+    df = pd.DataFrame({'x': rng.normal(size=n), 'y': rng.normal(size=n)})
+    chunks = [df.iloc[i:i + n // 10] for i in range(0, n, n // 10)]
+
+    for name, data, precompute in [('data frame', df, False), ('data frame', df, True), ('10 chunks', chunks, True)]:
+        rows, elapsed = _prepare(data, precompute)
+        print("{:>10}, precompute={!s:>5}: {:8} rows sent, {:7.3f}s".format(name, precompute, rows, elapsed))
+
+
+if __name__ == '__main__':
+    main()
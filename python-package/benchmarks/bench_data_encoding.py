@@ -0,0 +1,80 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Compares HTML output of a scatter plot with numeric data embedded as JSON lists
+and as base64 typed arrays (`LetsPlot.setup_html(data_encoding=..., data_compression=...)`).
+
+Reports the HTML size and the export time for each encoding.
+If `playwright` (with Chromium) is installed, also reports time to first paint:
+the time from navigation start until the plot SVG is attached to the page.
+
+    python benchmarks/bench_data_encoding.py [n_points]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from lets_plot import LetsPlot, ggplot, geom_point, aes, ggsave
+
+ENCODINGS = [
+    ('json', 'none'),
+    ('float64', 'none'),
+    ('float64', 'deflate'),
+    ('float32', 'none'),
+    ('float32', 'deflate'),
+]
+
+
+def _time_to_first_paint(files):
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        return {}
+
+    result = {}
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        for path in files:
+            page = browser.new_page()
+            start = time.perf_counter()
+            page.goto('file://' + path)
+            page.wait_for_selector('svg', state='attached', timeout=600000)
+            result[path] = time.perf_counter() - start
+            page.close()
+        browser.close()
+    return result
+
+
+def main():
+    n_points = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    rng = np.random.default_rng(42)
+    data = {'x': rng.normal(size=n_points), 'y': rng.normal(size=n_points)}
+    p = ggplot(data, aes('x', 'y')) + geom_point(size=1, alpha=0.1, sampling='none')
+
+    out_dir = tempfile.mkdtemp()
+    files = []
+    for encoding, compression in ENCODINGS:
+        LetsPlot.set({'data_encoding': encoding, 'data_compression': compression})
+        name = 'plot-{}-{}.html'.format(encoding, compression)
+        start = time.perf_counter()
+        path = ggsave(p, name, path=out_dir)
+        elapsed = time.perf_counter() - start
+        files.append(path)
+        print("{:>8} {:>8}: {:8.2f} MB  export: {:6.2f}s".format(
+            encoding, compression, os.path.getsize(path) / 2 ** 20, elapsed))
+
+    ttfp = _time_to_first_paint(files)
+    if not ttfp:
+        print("Install playwright to measure time to first paint.")
+    for (encoding, compression), path in zip(ENCODINGS, files):
+        if path in ttfp:
+            print("{:>8} {:>8}: time to first paint {:6.2f}s".format(encoding, compression, ttfp[path]))
+
+
+if __name__ == '__main__':
+    main()
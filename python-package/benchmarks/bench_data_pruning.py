@@ -0,0 +1,36 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Measures standardization of a plot spec with and without pruning of unused data columns
+for a wide data frame of which the plot uses only three columns.
+
+    python benchmarks/bench_data_pruning.py
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from lets_plot import ggplot, geom_point, aes
+from lets_plot._data_pruning import prune_unused_columns
+from lets_plot._type_utils import standardize_dict
+
+
+def main():
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(rng.normal(size=(10 ** 5, 200)), columns=['c{}'.format(i) for i in range(200)])
+    df['label'] = rng.choice(['a', 'b', 'c'], size=len(df))
+    spec = (ggplot(df, aes('c0', 'c1', color='label')) + geom_point()).as_dict()
+
+    for prune in [False, True]:
+        for numeric_buffers in [False, True]:
+            start = time.perf_counter()
+            std_spec = standardize_dict(prune_unused_columns(spec) if prune else spec, numeric_buffers)
+            print("prune={!s:>5} numeric_buffers={!s:>5}: {:3} columns, {:7.3f}s".format(
+                prune, numeric_buffers, len(std_spec['data']), time.perf_counter() - start))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Compares the time of preparing `geom_point()` and `geom_line()` plot specs for the plotting engine (standardization of the data)
+with the default sampling applied in Python and without it (all rows are passed to the engine).
+
+    python benchmarks/bench_data_sampling.py [max power of 10, default: 7]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from lets_plot import ggplot, geom_point, geom_line, aes
+from lets_plot import _kbridge
+from lets_plot._type_utils import standardize_dict
+
+
+def _time(prepare, spec):
+    start = time.perf_counter()
+    prepare(spec)
+    return time.perf_counter() - start
+
+
+def main():
+    max_power = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    rng = np.random.default_rng(42)
+    for power in range(5, max_power + 1):
+        n = 2 * 10 ** power
+        data = pd.DataFrame({'x': np.arange(n), 'y': rng.normal(size=n).cumsum(), 'c': rng.choice(['a', 'b'], n)})
+        for geom in [geom_point, geom_line]:
+            spec = (ggplot(data, aes('x', 'y', color='c')) + geom()).as_dict()
+            sampled = _time(_kbridge._standardize_plot_spec, spec)
+            full = _time(lambda s: standardize_dict(s, numeric_buffers=True), spec)
+            print("{:>10}  rows: {:>10}  all rows: {:8.3f}s  sampled: {:8.3f}s".format(
+                geom.__name__, n, full, sampled
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Compares SVG rendering time of `geom_density()` computed with the default method and with method='fft'.
+The default method is skipped for big data (it takes minutes).
+
+    python benchmarks/bench_density_fft.py [max power of 10, default: 8]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from lets_plot import ggplot, geom_density, aes
+from lets_plot import _kbridge
+
+AUTO_MAX_SIZE = 10 ** 6
+
+
+def _render_time(data, method):
+    spec = (ggplot(data, aes('x')) + geom_density(method=method)).as_dict()
+    start = time.perf_counter()
+    _kbridge._generate_svg(spec)
+    return time.perf_counter() - start
+
+
+def main():
+    max_power = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    rng = np.random.default_rng(42)
+    for power in range(4, max_power + 1):
+        n = 10 ** power
+        data = {'x': np.concatenate([rng.normal(size=n - n // 4), rng.normal(5, 0.3, size=n // 4)])}
+        fft = _render_time(data, 'fft')
+        auto = _render_time(data, 'auto') if n <= AUTO_MAX_SIZE else None
+        print("values: {:>10}  auto: {:>9}  fft: {:8.3f}s".format(
+            n, '-' if auto is None else '{:8.3f}s'.format(auto), fft
+        ))
+
+
+if __name__ == '__main__':
+    main()
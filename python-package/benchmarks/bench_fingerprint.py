@@ -0,0 +1,34 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Compares PlotSpec.fingerprint() with hashing of the JSON-serialized plot spec.
+
+    python benchmarks/bench_fingerprint.py
+"""
+
+import hashlib
+import json
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from lets_plot import ggplot, geom_point, aes
+from lets_plot._type_utils import standardize_dict
+
+
+def main():
+    for n in [10 ** 5, 10 ** 6, 10 ** 7]:
+        rng = np.random.default_rng(42)
+        df = pd.DataFrame({'x': rng.normal(size=n), 'y': rng.normal(size=n), 'c': rng.choice(['a', 'b'], size=n)})
+        p = ggplot(df, aes('x', 'y')) + geom_point(aes(color='c'))
+
+        fingerprint = min(timeit.repeat(p.fingerprint, number=1, repeat=3))
+        json_hash = timeit.timeit(
+            lambda: hashlib.sha256(json.dumps(standardize_dict(p.as_dict())).encode()).hexdigest(), number=1)
+        print("rows: {:>10}  fingerprint: {:7.3f}s  json: {:7.3f}s".format(n, fingerprint, json_hash))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Measures `geom_imshow()` time (normalization, colormap and PNG encoding) across image sizes and compression levels.
+If `pypng` is installed, the time of encoding the same image with it is shown for reference.
+
+    python benchmarks/bench_imshow.py [max image side, default: 4096]
+"""
+
+import io
+import sys
+import time
+
+import numpy as np
+
+from lets_plot import geom_imshow
+
+try:
+    import png
+except ImportError:
+    png = None
+
+COMPRESSION_LEVELS = [0, 1, 6, 9]
+
+
+def _time(f):
+    start = time.perf_counter()
+    f()
+    return time.perf_counter() - start
+
+
+def _pypng_time(image, compression):
+    height, width = image.shape[:2]
+    nchannels = 1 if image.ndim == 2 else image.shape[2]
+    rows = image.reshape(height, width * nchannels)
+    writer = png.Writer(width=width, height=height, greyscale=(nchannels == 1), bitdepth=8, compression=compression)
+    return _time(lambda: writer.write(io.BytesIO(), rows))
+
+
+def main():
+    max_side = int(sys.argv[1]) if len(sys.argv) > 1 else 4096
+    rng = np.random.default_rng(42)
+    side = 512
+    while side <= max_side:
+        images = [
+            ('float', rng.normal(size=(side, side)).cumsum(axis=1), dict(cmap='viridis')),
+            ('uint16', rng.integers(0, 4096, size=(side, side), dtype=np.uint16), dict(cmap='magma')),
+            ('rgb', rng.integers(0, 256, size=(side, side, 3), dtype=np.uint8), dict()),
+        ]
+        for name, image, kwargs in images:
+            for compression in COMPRESSION_LEVELS:
+                imshow = _time(lambda: geom_imshow(image, compression=compression, **kwargs))
+                if png is not None:
+                    pixels = image if image.dtype == np.uint8 else \
+                        ((image - image.min()) / np.ptp(image) * 255).astype(np.uint8)
+                    pypng = '{:8.3f}s'.format(_pypng_time(pixels, compression))
+                else:
+                    pypng = '-'
+                print("image: {:>5} x {:<5} {:>6}  compression: {}  geom_imshow: {:8.3f}s  pypng encoding: {:>9}".format(
+                    side, side, name, compression, imshow, pypng
+                ))
+        side *= 2
+
+
+if __name__ == '__main__':
+    main()
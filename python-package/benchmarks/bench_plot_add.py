@@ -0,0 +1,28 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Measures incremental construction of a plot: `p = p + feature` in a loop.
+Time per added feature should not grow with the number of features.
+
+    python benchmarks/bench_plot_add.py
+"""
+
+import time
+
+from lets_plot import ggplot, geom_point, geom_text, scale_x_continuous
+
+
+def main():
+    features = [geom_point(x=0, y=0), geom_text(x=0, y=0, label='a'), scale_x_continuous()]
+    for n in [10 ** 3, 3 * 10 ** 3, 10 ** 4]:
+        p = ggplot()
+        start = time.perf_counter()
+        for i in range(n):
+            p = p + features[i % len(features)]
+        elapsed = time.perf_counter() - start
+        print("features: {:>6}  total: {:7.3f}s  per feature: {:6.1f}us".format(n, elapsed, elapsed / n * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Measures preparation of a histogram of 10M values in 3 groups for the plotting engine:
+standardization of the raw data vs. binning in Python (`precompute=True`).
+
+    python benchmarks/bench_precompute.py
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from lets_plot import ggplot, geom_histogram, aes
+from lets_plot._kbridge import _standardize_plot_spec
+
+
+def main():
+    rng = np.random.default_rng(42)
+    n = 10 ** 7
+    df = pd.DataFrame({'x': rng.normal(size=n), 'g': pd.Categorical(rng.choice(['a', 'b', 'c'], size=n))})
+
+    for precompute in [False, True]:
+        spec = (ggplot(df, aes('x', fill='g')) + geom_histogram(bins=50, precompute=precompute)).as_dict()
+        start = time.perf_counter()
+        std_spec = _standardize_plot_spec(spec)
+        elapsed = time.perf_counter() - start
+        data = std_spec['layers'][0].get('data') or std_spec['data']
+        print("precompute={!s:>5}: {:8} rows sent, {:7.3f}s".format(precompute, len(data['x']), elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Compares the time of preparing a `geom_point()` plot spec for the plotting engine with rasterized points
+(`rasterize=True`) and with all points passed to the engine (`sampling='none'`).
+
+    python benchmarks/bench_rasterize.py [max power of 10, default: 7]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from lets_plot import ggplot, geom_point, aes
+from lets_plot import _kbridge
+
+
+def _prepare_time(spec):
+    start = time.perf_counter()
+    _kbridge._standardize_plot_spec(spec)
+    return time.perf_counter() - start
+
+
+def main():
+    max_power = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    rng = np.random.default_rng(42)
+    for power in range(5, max_power + 1):
+        n = 10 ** power
+        data = {'x': rng.normal(size=n), 'y': rng.normal(size=n), 'c': rng.choice(['a', 'b', 'c'], n)}
+        p = ggplot(data, aes('x', 'y', color='c'))
+        points = _prepare_time((p + geom_point(sampling='none')).as_dict())
+        raster = _prepare_time((p + geom_point(rasterize=True)).as_dict())
+        print("points: {:>10}  all points: {:8.3f}s  rasterized: {:8.3f}s".format(n, points, raster))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Measures standardization of a 4x4 grid of plots built on one data frame (500k rows)
+with and without sharing of the repeated data, and the size of the resulting JSON.
+
+    python benchmarks/bench_shared_data.py
+"""
+
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from lets_plot import ggplot, geom_point, aes, gggrid
+from lets_plot._shared_data import share_data, SHARED_DATA
+from lets_plot._type_utils import standardize_dict
+
+
+def main():
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({'x': rng.normal(size=500_000), 'y': rng.normal(size=500_000)})
+    spec = gggrid([ggplot(df, aes('x', 'y')) + geom_point() for _ in range(16)], ncol=4).as_dict()
+
+    for share in [False, True]:
+        start = time.perf_counter()
+        std_spec = standardize_dict(share_data(spec) if share else spec)
+        elapsed = time.perf_counter() - start
+        tables = len(std_spec[SHARED_DATA]) if share else len(std_spec['figures'])
+        size = len(json.dumps(std_spec))
+        print("share={!s:>5}: {:2} data tables, {:7.3f}s, JSON {:6.1f} MB".format(share, tables, elapsed, size / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
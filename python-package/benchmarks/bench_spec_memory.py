@@ -0,0 +1,33 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Measures memory allocated per plot layer (including its mapping) and per scale.
+
+    python benchmarks/bench_spec_memory.py
+"""
+
+import tracemalloc
+
+from lets_plot import geom_point, aes, scale_x_continuous
+
+COUNT = 10000
+
+
+def _bytes_per_object(create):
+    tracemalloc.start()
+    start = tracemalloc.take_snapshot()
+    objects = [create() for _ in range(COUNT)]
+    stats = tracemalloc.take_snapshot().compare_to(start, 'filename')
+    tracemalloc.stop()
+    del objects
+    return sum(stat.size_diff for stat in stats) / COUNT
+
+
+def main():
+    print("layer: {:7.0f} bytes".format(_bytes_per_object(lambda: geom_point(aes('x', 'y', color='c'), size=3))))
+    print("scale: {:7.0f} bytes".format(_bytes_per_object(lambda: scale_x_continuous(name='x'))))
+
+
+if __name__ == '__main__':
+    main()
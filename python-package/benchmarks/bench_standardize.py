@@ -0,0 +1,45 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Compares the columnar standardization of data columns with the per-element one.
+
+    python benchmarks/bench_standardize.py
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from lets_plot._type_utils import standardize_dict, _standardize_value
+
+
+def _make_data(n):
+    rng = np.random.default_rng(42)
+    x = rng.normal(size=n)
+    x[::100] = np.nan
+    return pd.DataFrame({
+        'float': x,
+        'int': rng.integers(0, 1000, size=n),
+        'bool': x > 0,
+        'datetime': pd.date_range('2020-01-01', periods=n, freq='s'),
+        'category': pd.Categorical(rng.choice(['a', 'b', 'c'], size=n)),
+    })
+
+
+def _per_element(df):
+    return {name: _standardize_value(df[name].tolist()) for name in df.columns}
+
+
+def main():
+    for n in [10 ** 5, 10 ** 6, 10 ** 7]:
+        df = _make_data(n)
+        columnar = min(timeit.repeat(lambda: standardize_dict(df), number=1, repeat=3))
+        per_element = min(timeit.repeat(lambda: _per_element(df), number=1, repeat=1))
+        print("rows: {:>10}  columnar: {:8.3f}s  per-element: {:8.3f}s  speedup: {:5.1f}x".format(
+            n, columnar, per_element, per_element / columnar))
+
+
+if __name__ == '__main__':
+    main()
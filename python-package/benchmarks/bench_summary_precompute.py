@@ -0,0 +1,45 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Measures `stat_summary_bin()` (median and quartiles) of 10M points in 3 groups computed in Python (`precompute=True`)
+from one data frame and from 20 chunks, and the time the engine would get the raw data.
+
+    python benchmarks/bench_summary_precompute.py
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from lets_plot import ggplot, stat_summary_bin, aes
+from lets_plot._kbridge import _standardize_plot_spec
+
+
+def _prepare(data, precompute):
+    spec = (ggplot(data, aes('x', 'y', color='g')) +
+            stat_summary_bin(fun='median', fun_min='lq', fun_max='uq', precompute=precompute)).as_dict()
+    start = time.perf_counter()
+    std_spec = _standardize_plot_spec(spec)
+    elapsed = time.perf_counter() - start
+    return len((std_spec['layers'][0].get('data') or std_spec['data'])['x']), elapsed
+
+
+def main():
+    rng = np.random.default_rng(42)
+    n = 10 ** 7
+    df = pd.DataFrame({
+        'x': rng.normal(size=n),
+        'y': rng.exponential(size=n),
+        'g': pd.Categorical(rng.choice(['a', 'b', 'c'], size=n)),
+    })
+    chunks = [df.iloc[i:i + n // 20] for i in range(0, n, n // 20)]
+
+    for name, data, precompute in [('data frame', df, False), ('data frame', df, True), ('20 chunks', chunks, True)]:
+        rows, elapsed = _prepare(data, precompute)
+        print("{:>10}, precompute={!s:>5}: {:8} rows sent, {:7.3f}s".format(name, precompute, rows, elapsed))
+
+
+if __name__ == '__main__':
+    main()
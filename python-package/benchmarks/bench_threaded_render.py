@@ -0,0 +1,41 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+"""
+Measures SVG rendering throughput with a growing number of threads.
+The native bridge releases the GIL while building plots, so throughput should scale with the number of threads.
+
+    python benchmarks/bench_threaded_render.py
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from lets_plot import ggplot, geom_point, aes
+from lets_plot import _kbridge
+
+PLOTS_COUNT = 200
+
+
+def _make_plot_specs(n_points):
+    rng = np.random.default_rng(42)
+    data = {'x': rng.normal(size=n_points), 'y': rng.normal(size=n_points)}
+    p = ggplot(data, aes('x', 'y')) + geom_point()
+    return [p.as_dict() for _ in range(PLOTS_COUNT)]
+
+
+def main():
+    for n_points in [1000, 10000]:
+        specs = _make_plot_specs(n_points)
+        for workers in [1, 2, 4, 8]:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                start = time.perf_counter()
+                list(executor.map(_kbridge._generate_svg, specs))
+                elapsed = time.perf_counter() - start
+            print("points: {:>6}  threads: {}  plots/s: {:8.1f}".format(n_points, workers, PLOTS_COUNT / elapsed))
+
+
+if __name__ == '__main__':
+    main()
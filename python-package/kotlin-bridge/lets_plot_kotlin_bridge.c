@@ -18,9 +18,18 @@
 #define TLSVAR __thread
 #endif
 
-static PyObject* generate_html(PyObject* self, PyObject* rawPlotSpecDict) {
+static PyObject* generate_html(PyObject* self, PyObject* args) {
     T_(PlotReprGenerator) reprGen = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator._instance();
-    PyObject* html = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator.generateDynamicDisplayHtml(reprGen, rawPlotSpecDict);
+
+    // parse arguments
+    PyObject *rawPlotSpecDict;
+    const char *dataEncoding = NULL;        // optional: 'json', 'float64', 'float32'
+    const char *dataCompression = NULL;     // optional: 'deflate'
+    if (!PyArg_ParseTuple(args, "O|zz", &rawPlotSpecDict, &dataEncoding, &dataCompression)) {
+        return NULL;
+    }
+
+    PyObject* html = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator.generateDynamicDisplayHtml(reprGen, rawPlotSpecDict, dataEncoding, dataCompression);
     return html;
 }
 
@@ -29,7 +38,9 @@ static PyObject* export_svg(PyObject* self, PyObject* args) {
 
     PyObject *rawPlotSpecDict;
     int useCssPixelatedImageRendering;          // 0 - false, 1 - true
-    PyArg_ParseTuple(args, "Op", &rawPlotSpecDict, &useCssPixelatedImageRendering);
+    if (!PyArg_ParseTuple(args, "Op", &rawPlotSpecDict, &useCssPixelatedImageRendering)) {
+        return NULL;
+    }
 
     PyObject* svg = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator.generateSvg(reprGen, rawPlotSpecDict, useCssPixelatedImageRendering);
     return svg;
@@ -42,16 +53,52 @@ static PyObject* export_html(PyObject* self, PyObject* args) {
     PyObject *rawPlotSpecDict;
     const char *scriptUrl;
     int iframe;          // 0 - false, 1 - true
-    PyArg_ParseTuple(args, "Osp", &rawPlotSpecDict, &scriptUrl, &iframe);
+    const char *dataEncoding = NULL;
+    const char *dataCompression = NULL;
+    if (!PyArg_ParseTuple(args, "Osp|zz", &rawPlotSpecDict, &scriptUrl, &iframe, &dataEncoding, &dataCompression)) {
+        return NULL;
+    }
 
-    PyObject* html = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator.generateStaticHtmlPage(reprGen, rawPlotSpecDict, scriptUrl, iframe);
+    PyObject* html = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator.generateStaticHtmlPage(reprGen, rawPlotSpecDict, scriptUrl, iframe, dataEncoding, dataCompression);
     return html;
 }
 
+static PyObject* export_svg_batch(PyObject* self, PyObject* args) {
+    T_(PlotReprGenerator) reprGen = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator._instance();
+
+    PyObject *rawPlotSpecList;
+    int useCssPixelatedImageRendering;          // 0 - false, 1 - true
+    if (!PyArg_ParseTuple(args, "Op", &rawPlotSpecList, &useCssPixelatedImageRendering)) {
+        return NULL;
+    }
+
+    PyObject* svgList = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator.generateSvgBatch(reprGen, rawPlotSpecList, useCssPixelatedImageRendering);
+    return svgList;
+}
+
+static PyObject* export_html_batch(PyObject* self, PyObject* args) {
+    T_(PlotReprGenerator) reprGen = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator._instance();
+
+    // parse arguments
+    PyObject *rawPlotSpecList;
+    const char *scriptUrl;
+    int iframe;          // 0 - false, 1 - true
+    const char *dataEncoding = NULL;
+    const char *dataCompression = NULL;
+    if (!PyArg_ParseTuple(args, "Osp|zz", &rawPlotSpecList, &scriptUrl, &iframe, &dataEncoding, &dataCompression)) {
+        return NULL;
+    }
+
+    PyObject* htmlList = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator.generateStaticHtmlPageBatch(reprGen, rawPlotSpecList, scriptUrl, iframe, dataEncoding, dataCompression);
+    return htmlList;
+}
+
 static PyMethodDef module_methods[] = {
-   { "generate_html", (PyCFunction)generate_html, METH_O, "Generates HTML and JS sufficient for buidling of interactive plot." },
+   { "generate_html", (PyCFunction)generate_html, METH_VARARGS, "Generates HTML and JS sufficient for buidling of interactive plot." },
    { "export_svg", (PyCFunction)export_svg, METH_VARARGS, "Generates SVG representing plot." },
    { "export_html", (PyCFunction)export_html, METH_VARARGS, "Generates HTML page showing plot." },
+   { "export_svg_batch", (PyCFunction)export_svg_batch, METH_VARARGS, "Generates SVG for each plot in the list." },
+   { "export_html_batch", (PyCFunction)export_html_batch, METH_VARARGS, "Generates HTML page for each plot in the list." },
    { NULL }
 };
 
@@ -11,7 +11,7 @@ __path__ = extend_path(__path__, __name__)
 
 from ._version import __version__
 from ._global_settings import _settings, is_production, get_global_bool, PLOT_THEME
-from ._global_settings import NO_JS, OFFLINE
+from ._global_settings import NO_JS, OFFLINE, DATA_ENCODING, DATA_COMPRESSION
 
 from .plot import *
 from .export import *
@@ -25,6 +25,7 @@ __all__ = (plot.__all__ +
            ['LetsPlot'])
 
 from .frontend_context import _configuration as cfg
+from . import _render_cache
 
 
 class LetsPlot:
@@ -37,7 +38,9 @@ class LetsPlot:
                    isolated_frame: bool = None,
                    offline: bool = None,
                    no_js: bool = None,
-                   show_status: bool = False) -> None:
+                   show_status: bool = False,
+                   data_encoding: str = None,
+                   data_compression: str = None) -> None:
         """
         Configure Lets-Plot HTML output.
         Depending on the usage, LetsPlot generates different HTML to show plots.
@@ -62,6 +65,19 @@ class LetsPlot:
         show_status : bool, default=False
             Whether to show status of loading of the Lets-Plot JS library.
             Only applicable when the Lets-Plot JS library is preloaded.
+        data_encoding : {'json', 'float64', 'float32'}
+            How numeric data columns are embedded in HTML output.
+            'json' - as JSON arrays of numbers.
+            'float64', 'float32' - as base64-encoded binary buffers, decoded into typed arrays by Lets-Plot JS.
+            Binary encoding makes HTML of plots with large data several times smaller and faster to load.
+            Note that 'float32' is lossy: use it only when the single precision is enough for the data.
+            Datetime columns are always embedded as 'float64'.
+            Default (None): keep the current setting ('json' initially).
+        data_compression : {'deflate', 'none'}
+            'deflate' - compress binary data columns with deflate. Only applicable with the binary `data_encoding`.
+            Decompression requires a browser supporting `DecompressionStream`.
+            'none' - do not compress data columns.
+            Default (None): keep the current setting ('none' initially).
 
         Examples
         --------
@@ -93,6 +109,17 @@ class LetsPlot:
             raise ValueError("'no_js' argument is not boolean: {}".format(type(no_js)))
         if not isinstance(show_status, bool):
             raise ValueError("'show_status' argument is not boolean: {}".format(type(show_status)))
+        if data_encoding not in [None, 'json', 'float64', 'float32']:
+            raise ValueError("'data_encoding' argument must be 'json', 'float64' or 'float32' but was: {}"
+                             .format(data_encoding))
+        if data_compression not in [None, 'deflate', 'none']:
+            raise ValueError("'data_compression' argument must be 'deflate' or 'none' but was: {}"
+                             .format(data_compression))
+
+        if data_encoding is not None:
+            LetsPlot.set({DATA_ENCODING: data_encoding})
+        if data_compression is not None:
+            LetsPlot.set({DATA_COMPRESSION: data_compression})
 
         offline = offline if offline is not None else get_global_bool(OFFLINE)
         no_js = no_js if no_js is not None else get_global_bool(NO_JS)
@@ -120,6 +147,8 @@ class LetsPlot:
         - html_isolated_frame : preload Lets-Plot JS library or not (bool). Do not use this parameter explicitly. Instead you should call `LetsPlot.setup_html()`.
         - offline : to work with notebook without the Internet connection (bool). Do not use this parameter explicitly. Instead you should call `LetsPlot.setup_html()`.
         - no_js : do not generate HTML+JS as an output (bool). Do not use this parameter explicitly. Instead you should call `LetsPlot.setup_html()`. Also note that without JS interactive maps and tooltips doesn't work!
+        - data_encoding, data_compression : how numeric data columns are embedded in HTML output (str). Do not use these parameters explicitly. Instead you should call `LetsPlot.setup_html()`.
+        - prune_data : drop data columns not referenced by the plot (mappings, facets, tooltips, labels, `map_join`, `as_discrete()`) before rendering (bool, default True). Set to False if the plot refers to data columns in some other way.
 
         Interactive map settings could also be specified:
 
@@ -177,3 +206,59 @@ class LetsPlot:
         LetsPlot.set({
             PLOT_THEME: json.dumps(theme.as_dict())
         })
+
+    @classmethod
+    def setup_render_cache(cls, *,
+                           enabled: bool = True,
+                           max_bytes: int = 64 * 1024 * 1024,
+                           disk_path: str = None) -> None:
+        """
+        Configure the cache of rendered plots.
+
+        When enabled, SVG and HTML output of a plot is stored and reused the next time
+        the same plot is displayed or exported with the same options, skipping the rendering altogether.
+
+        Parameters
+        ----------
+        enabled : bool, default=True
+            Whether to cache rendered plots. Re-configuring the cache clears it.
+        max_bytes : int, default=64 MB
+            Maximal size of the in-memory cache.
+            Least recently used entries are evicted when the size is exceeded.
+        disk_path : str
+            Path to a directory to additionally store rendered plots in.
+            The on-disk cache is not limited in size and survives restarts of the Python process.
+
+        Examples
+        --------
+        .. code-block::
+            :linenos:
+            :emphasize-lines: 2
+
+            from lets_plot import *
+            LetsPlot.setup_render_cache(max_bytes=16 * 1024 * 1024)
+            p = ggplot() + geom_point(x=0, y=0)
+            ggsave(p, 'p1.svg')
+            ggsave(p, 'p2.svg')  # reuses the SVG rendered for 'p1.svg'
+            print(LetsPlot.render_cache_stats())
+
+        """
+        if not isinstance(enabled, bool):
+            raise ValueError("'enabled' argument is not boolean: {}".format(type(enabled)))
+        if not isinstance(max_bytes, int) or max_bytes < 0:
+            raise ValueError("'max_bytes' argument must be a non-negative int but was: {}".format(max_bytes))
+
+        _render_cache.setup_render_cache(enabled, max_bytes, disk_path)
+
+    @classmethod
+    def render_cache_stats(cls) -> Dict:
+        """
+        Return counters of the cache of rendered plots (see `LetsPlot.setup_render_cache()`).
+
+        Returns
+        -------
+        dict
+            Dictionary with keys: 'hits', 'misses', 'evictions', 'entries', 'size_bytes'.
+
+        """
+        return _render_cache.render_cache_stats()
@@ -0,0 +1,161 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import re
+from typing import Dict, Set, Any
+
+from ._type_utils import is_polars_dataframe, is_arrow_table
+from .plot.util import is_data_frame
+
+# Variables in tooltip/label lines and formats, see LineSpecConfigParseHelper.SOURCE_RE_PATTERN
+_LINE_VARIABLE_RE = re.compile(r'(?:\\\^|\\@)|(\^\w+)|@(([\w^@]+)|(\{(.*?)\})|\.{2}\w+\.{2})')
+
+
+def prune_unused_columns(plot_spec: Dict) -> Dict:
+    """
+    Drops data columns that are not referenced by the plot: by plot and layer mappings, facets,
+    tooltips and labels (lines, formats and variables), `map_join` and `as_discrete()` annotations.
+
+    The plot spec (a result of `as_dict()`) is not modified: dicts on the way to the pruned data are copied.
+    Plots transformed by the backend ('bistro' specs like `qq_plot()`) are returned as is.
+    """
+    kind = plot_spec.get('kind')
+    if kind == 'plot':
+        return _prune_plot(plot_spec)
+    if kind == 'subplots':
+        return _copy_with(plot_spec, figures=[
+            prune_unused_columns(figure) if isinstance(figure, dict) else figure
+            for figure in plot_spec.get('figures', [])
+        ])
+    if kind == 'ggbunch':
+        return _copy_with(plot_spec, items=[
+            _copy_with(item, feature_spec=prune_unused_columns(item['feature_spec']))
+            for item in plot_spec.get('items', [])
+        ])
+    return plot_spec
+
+
+def _prune_plot(plot_spec: Dict) -> Dict:
+    if 'bistro' in plot_spec:
+        return plot_spec
+
+    layers = plot_spec.get('layers', [])
+    plot_variables = _referenced_variables(plot_spec)
+    plot_variables.update(_facet_variables(plot_spec.get('facet')))
+    layer_variables = [_referenced_variables(layer) for layer in layers]
+
+    # Plot data is shared by all layers without own data.
+    result = _copy_with(plot_spec, layers=[
+        _prune_data(layer, plot_variables | variables) for layer, variables in zip(layers, layer_variables)
+    ])
+    return _prune_data(result, plot_variables.union(*layer_variables))
+
+
+def _prune_data(spec: Dict, variables: Set[str]) -> Dict:
+    data = spec.get('data')
+    if data is None:
+        return spec
+
+    columns = _column_names(data)
+    if columns is None:
+        return spec
+
+    # Non-string column names can't be referenced by name: keep them.
+    kept = [column for column in columns if column in variables or not isinstance(column, str)]
+    if len(kept) == len(columns):
+        return spec
+
+    result = _copy_with(spec, data=_select_columns(data, kept))
+
+    # Drop annotations of the dropped columns.
+    data_meta = spec.get('data_meta')
+    if isinstance(data_meta, dict) and 'series_annotations' in data_meta:
+        result['data_meta'] = _copy_with(data_meta, series_annotations=[
+            annotation for annotation in data_meta['series_annotations'] if annotation.get('column') in variables
+        ])
+    return result
+
+
+def _column_names(data):
+    if isinstance(data, dict):
+        return list(data.keys())
+    if is_data_frame(data):
+        return list(data.columns)
+    if is_polars_dataframe(data):
+        return data.columns
+    if is_arrow_table(data):
+        return data.schema.names
+    return None
+
+
+def _select_columns(data, columns):
+    if isinstance(data, dict):
+        return {column: data[column] for column in columns}
+    if is_data_frame(data):
+        # The dict of series is standardized the same way as the data frame, without copying the data.
+        return {column: data[column] for column in columns}
+    # polars.DataFrame and pyarrow.Table (no copying)
+    return data.select(columns)
+
+
+def _referenced_variables(spec: Any) -> Set[str]:
+    variables = set()
+    if not isinstance(spec, dict):
+        return variables
+
+    for value in (spec.get('mapping') or {}).values():
+        _add_names(variables, value)
+
+    for option in ['tooltips', 'labels']:
+        lines_spec = spec.get(option)
+        if not isinstance(lines_spec, dict):
+            continue
+        for line in (lines_spec.get('lines') or []) + [lines_spec.get('title')]:
+            _add_line_variables(variables, line)
+        for fmt in lines_spec.get('formats') or []:
+            _add_line_variables(variables, fmt.get('field'))
+        _add_names(variables, lines_spec.get('variables'))
+
+    map_join = spec.get('map_join')
+    if map_join:
+        _add_names(variables, map_join[0])
+
+    data_meta = spec.get('data_meta')
+    if isinstance(data_meta, dict):
+        for annotation in data_meta.get('mapping_annotations', []):
+            _add_names(variables, (annotation.get('parameters') or {}).get('order_by'))
+        _add_names(variables, data_meta.get('geodataframe', {}).get('geometry'))
+
+    return variables
+
+
+def _facet_variables(facet_spec: Any) -> Set[str]:
+    # facet_grid(x, y), facet_wrap(facets)
+    variables = set()
+    if isinstance(facet_spec, dict):
+        for option in ['x', 'y', 'facets']:
+            _add_names(variables, facet_spec.get(option))
+    return variables
+
+
+def _add_names(variables: Set[str], value):
+    if isinstance(value, str):
+        variables.add(value)
+    elif isinstance(value, (list, tuple)):
+        variables.update(v for v in value if isinstance(v, str))
+
+
+def _add_line_variables(variables: Set[str], line):
+    if not isinstance(line, str):
+        return
+    for match in _LINE_VARIABLE_RE.finditer(line):
+        if match.group(3) is not None:
+            variables.add(match.group(3))
+        elif match.group(5) is not None:
+            variables.add(match.group(5))
+
+
+def _copy_with(d: Dict, **changes) -> Dict:
+    result = dict(d)
+    result.update(changes)
+    return result
@@ -0,0 +1,623 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import math
+from numbers import Real
+from typing import Dict, List, Optional
+
+from ._data_pruning import _facet_variables, _copy_with
+from ._precompute import _layer_mapping, _has_scale_transform, _is_discrete, _supported_columns, _group_index, \
+    _column, _to_numpy, _as_float
+from ._type_utils import is_polars_dataframe, is_arrow_table
+from .plot.util import is_data_frame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+# See PlotConfig.PLOT_COMPUTATION_MESSAGES
+COMPUTATION_MESSAGES = 'computation_messages'
+
+# See DefaultSampling
+_SEED = 37
+_SAFETY = ('random', 200_000, _SEED)
+_POINT = ('random', 100_000, _SEED)
+_LINE = ('m4', 50_000, None)
+_RIBBON = ('systematic', 50_000, None)
+_SEGMENT = ('random', 10_000, _SEED)
+_RECT = ('random', 20_000, _SEED)
+_TEXT = ('random', 5_000, _SEED)
+_BAR = ('systematic', 5_000, None)
+
+# Geoms with stat='identity' by default (see GeomProto): geom -> (GeomKind name, default sampling).
+# Default samplings of other geoms are applied after the stat or are not point samplings.
+_DEFAULT_SAMPLING = {
+    'point': ('point', _POINT),
+    'jitter': ('jitter', _POINT),
+    'tile': ('tile', _POINT),
+    'line': ('line', _LINE),
+    'step': ('step', _LINE),
+    'ribbon': ('ribbon', _RIBBON),
+    'area': ('area', _LINE),
+    'segment': ('segment', _SEGMENT),
+    'abline': ('ab_line', _SEGMENT),
+    'hline': ('h_line', _SEGMENT),
+    'vline': ('v_line', _SEGMENT),
+    'rect': ('rect', _RECT),
+    'text': ('text', _TEXT),
+    'label': ('label', _TEXT),
+    'errorbar': ('error_bar', _BAR),
+    'crossbar': ('cross_bar', _BAR),
+    'linerange': ('line_range', _BAR),
+    'pointrange': ('point_range', _BAR),
+    'lollipop': ('lollipop', _BAR),
+}
+
+# Group-aware samplings keeping the shape of lines (see LineSamplingBase): name -> min group sample size.
+_LINE_SAMPLINGS = {'lttb': 3, 'm4': 4}
+
+# See Aes.isPositional()
+_POSITIONAL_AES = {'x', 'xintercept', 'xmin', 'xmax', 'xend',
+                   'y', 'ymin', 'ymax', 'yend', 'yintercept', 'intercept', 'lower', 'middle', 'upper', 'sample',
+                   'slope'}
+
+# See QuadtreeSampling
+_QUADTREE_DEF_DEPTH = 8
+_QUADTREE_MAX_DEPTH = 15
+_VIEWPORT_MARGIN = 0.1
+_PRIORITY_MULTIPLIER = 0x9E3779B1
+
+_MASK_32 = 0xFFFFFFFF
+
+
+def sample_data(plot_spec: Dict) -> Dict:
+    """
+    Applies the sampling of layers ('sampling' option or the default sampling of the geom) in Python,
+    so that only the sampled rows of the data are standardized and passed to the plotting engine.
+    The result is the same as of the sampling applied by the engine: the same rows are picked
+    (the seeded random sampling reproduces the engine's random number generator), the layer gets the sampled
+    data as its own data and `sampling='none'`, and the sampling message is added to the plot's computation messages.
+
+    Supported samplings: `sampling_random()`, `sampling_systematic()`, `sampling_lttb()`, `sampling_m4()`
+    and `sampling_quadtree()` (and their sums) of layers with stat='identity' in plots without facets.
+    Other layers (group-aware and vertex samplings, statistics, facets, geospatial data) are left to the engine.
+
+    The plot spec (a result of `as_dict()`) is not modified.
+    """
+    kind = plot_spec.get('kind')
+    if kind == 'plot':
+        return _sample_plot(plot_spec)
+    if kind == 'subplots':
+        return _copy_with(plot_spec, figures=[
+            sample_data(figure) if isinstance(figure, dict) else figure
+            for figure in plot_spec.get('figures', [])
+        ])
+    if kind == 'ggbunch':
+        return _copy_with(plot_spec, items=[
+            _copy_with(item, feature_spec=sample_data(item['feature_spec']))
+            for item in plot_spec.get('items', [])
+        ])
+    return plot_spec
+
+
+def _sample_plot(plot_spec: Dict) -> Dict:
+    layers = plot_spec.get('layers', [])
+    if numpy is None or 'bistro' in plot_spec or _facet_variables(plot_spec.get('facet')) \
+            or any(layer.get('geom') == 'livemap' for layer in layers):
+        return plot_spec
+
+    messages = []
+    sampled_layers = [_sample_layer(plot_spec, layer, messages) for layer in layers]
+    if not messages:
+        return plot_spec
+
+    result = _copy_with(plot_spec, layers=sampled_layers)
+    result[COMPUTATION_MESSAGES] = list(plot_spec.get(COMPUTATION_MESSAGES) or []) + messages
+
+    # Raw plot data is no longer needed if all layers have own data.
+    if 'data' in result and all('data' in layer for layer in result['layers']):
+        del result['data']
+    return result
+
+
+def _sample_layer(plot_spec: Dict, layer: Dict, messages: List[str]) -> Dict:
+    geom_kind, default_sampling = _DEFAULT_SAMPLING.get(layer.get('geom'), (None, None))
+    if geom_kind is None or layer.get('stat') not in (None, 'identity') \
+            or any(option in layer for option in ['map', 'map_join', 'map_data_meta']) \
+            or 'geodataframe' in (layer.get('data_meta') or {}) \
+            or 'geodataframe' in (plot_spec.get('data_meta') or {}):
+        return layer
+
+    # A layer without mappings gets no data in the engine.
+    if not (plot_spec.get('mapping') or layer.get('mapping')):
+        return layer
+
+    samplings = _samplings(layer.get('sampling'), default_sampling)
+    data = _combined_data(plot_spec, layer)
+    if samplings is None or data is None:
+        return layer
+
+    row_count = _row_count(data)
+    indices = None
+    applied = []
+    for sampling in samplings:
+        if sampling[0] in _LINE_SAMPLINGS:
+            if row_count <= sampling[1]:
+                continue
+            # After another sampling the engine computes the groups of the rows before it: leave it to the engine.
+            columns = _line_columns(plot_spec, layer, data) if indices is None else None
+            if columns is None:
+                return layer
+            picked = _sample_line(sampling, *columns)
+        elif sampling[0] == 'quadtree':
+            if row_count <= sampling[1]:
+                continue
+            columns = _xy_columns(plot_spec, layer, data)
+            if columns is None:
+                return layer
+            xs, ys = columns if indices is None else (values[indices] for values in columns)
+            picked = _sample_quadtree(sampling, xs, ys, _viewport(plot_spec))
+        else:
+            picked = _sample_indices(sampling, row_count)
+        if picked is None:
+            continue
+        indices = picked if indices is None else indices[picked]
+        row_count = len(picked)
+        applied.append(_expression_text(sampling))
+
+    if indices is None:
+        return layer
+
+    # See PlotSampling.apply(): the safety sampling unless there is a point sampling.
+    if row_count > _SAFETY[1] and all(sampling[0] in _LINE_SAMPLINGS for sampling in samplings):
+        indices = indices[_sample_indices(_SAFETY, row_count)]
+        row_count = len(indices)
+        applied.append(_expression_text(_SAFETY))
+
+    # See DataConfigUtil.layerMappingsAndCombinedData(): layer data of the same length is combined with the plot data.
+    plot_data = plot_spec.get('data')
+    if _column_names(plot_data) and _row_count(plot_data) == row_count:
+        return layer
+
+    messages.append("{} was applied to [{}/identity stat] layer".format('+'.join(applied), geom_kind))
+    return _copy_with(layer, data=_take_rows(data, indices), sampling='none')
+
+
+def _samplings(sampling_spec, default_sampling) -> Optional[List]:
+    # See SamplingConfig, SamplingProto
+    if sampling_spec is None:
+        return [default_sampling]
+
+    if isinstance(sampling_spec, dict) and 'feature-list' in sampling_spec:
+        specs = [feature.get('sampling') for feature in sampling_spec['feature-list']]
+    else:
+        specs = [sampling_spec]
+
+    samplings = []
+    for spec in specs:
+        name = spec if isinstance(spec, str) else spec.get('name') if isinstance(spec, dict) else None
+        if name == 'none':
+            continue
+        n = spec.get('n') if isinstance(spec, dict) else None
+        if name not in ('random', 'systematic', 'quadtree', *_LINE_SAMPLINGS) or n is None or n <= 0 \
+                or name == 'lttb' and n < _LINE_SAMPLINGS['lttb']:
+            # Invalid specs are reported by the engine.
+            return None
+        if name == 'quadtree':
+            # The depth instead of the seed.
+            depth = spec.get('depth', _QUADTREE_DEF_DEPTH)
+            if depth is None or not 0 <= depth <= _QUADTREE_MAX_DEPTH:
+                return None
+            samplings.append((name, int(n), int(depth)))
+            continue
+        seed = spec.get('seed') if name == 'random' else None
+        samplings.append((name, int(n), None if seed is None else int(seed)))
+    return samplings
+
+
+def _sample_indices(sampling, row_count: int):
+    """
+    Returns sorted indices of the picked rows or None if the sampling is not applicable.
+    """
+    name, n, seed = sampling
+    if row_count <= n:
+        return None
+
+    if name == 'systematic':
+        # See SystematicSampling
+        step = round(row_count / (n - 1)) if n > 1 else row_count
+        if step < 2:
+            return None
+        return numpy.arange(0, row_count, step)
+
+    # See RandomSampling
+    if seed is None:
+        return numpy.sort(numpy.random.default_rng().choice(row_count, n, replace=False))
+    return _sample_without_replacement(row_count, n, _KotlinRandom(seed))
+
+
+def _xy_columns(plot_spec: Dict, layer: Dict, data):
+    """
+    Returns the x and y values (as floats) of the rows or None if they can't be computed the same way as by the engine.
+    """
+    if _has_scale_transform(plot_spec, 'x') or _has_scale_transform(plot_spec, 'y'):
+        return None
+
+    mapping = _layer_mapping(plot_spec, layer)
+    xs, ys = (_positional_values(_column(data, mapping.get(aes))) for aes in ('x', 'y'))
+    if xs is None or ys is None:
+        return None
+    return xs, ys
+
+
+def _line_columns(plot_spec: Dict, layer: Dict, data):
+    """
+    Returns the x and y values (as floats) and the group index of the rows or None if they can't be computed
+    the same way as by the engine.
+    """
+    columns = _xy_columns(plot_spec, layer, data)
+    if columns is None:
+        return None
+    xs, ys = columns
+
+    mapping = _layer_mapping(plot_spec, layer)
+    # See DataProcessing.defaultGroupingVariables(), GroupingContext
+    keys = []
+    for aes, var in mapping.items():
+        if not isinstance(var, str) or var in keys or aes in _POSITIONAL_AES:
+            continue
+        column = _column(data, var)
+        if column is None:
+            return None
+        if aes == 'group' or _is_discrete(plot_spec, layer, aes, var, column):
+            keys.append(var)
+
+    key_columns = [_to_numpy(_column(data, var)) for var in keys]
+    if not _supported_columns(plot_spec, layer, keys, key_columns):
+        return None
+    groups, _ = _group_index([_column(data, var) for var in keys], key_columns, len(xs))
+    return xs, ys, groups
+
+
+def _positional_values(column):
+    array = _to_numpy(column)
+    if array is not None and array.ndim == 1 and array.dtype.kind == 'M':
+        # Epoch millis, see _standardize_value()
+        return array.astype('datetime64[us]').view(numpy.int64) / 1000.0
+    return _as_float(column)
+
+
+def _sample_line(sampling, xs, ys, groups):
+    """
+    Returns sorted indices of the picked rows or None if the sampling is not applicable, see LineSamplingBase.
+    """
+    name, n, _ = sampling
+    finite = numpy.isfinite(xs) & numpy.isfinite(ys)
+    rows = numpy.flatnonzero(finite)
+    if len(rows) <= n:
+        # Otherwise the sampling would only drop the break markers.
+        return None
+
+    # The first row of each run of non-finite rows of a group breaks the line.
+    order = numpy.argsort(groups, kind='stable')
+    run_starts = ~finite[order]
+    run_starts[1:] &= finite[order][:-1] | (groups[order][1:] != groups[order][:-1])
+    markers = order[run_starts]
+
+    groups = groups[rows]
+    sizes = numpy.bincount(groups)
+    # proportionate allocation
+    quotas = numpy.maximum(numpy.round(n * sizes / len(rows)).astype(numpy.int64), _LINE_SAMPLINGS[name])
+
+    sampled = (sizes > quotas)[groups]
+    kept = rows[~sampled]
+    rows, groups = rows[sampled], groups[sampled]
+    if len(rows) > 0:
+        sample = _m4 if name == 'm4' else _lttb
+        kept = numpy.concatenate([kept, rows[sample(xs[rows], ys[rows], groups, quotas)]])
+    kept = numpy.concatenate([kept, markers])
+    kept.sort()
+    return kept
+
+
+def _m4(xs, ys, groups, quotas):
+    """
+    Returns positions of the points picked by M4Sampling in each group.
+    """
+    bucket_counts = numpy.maximum(quotas // 4, 1)
+    group_count = len(quotas)
+    x_min = numpy.full(group_count, numpy.inf)
+    x_max = numpy.full(group_count, -numpy.inf)
+    numpy.minimum.at(x_min, groups, xs)
+    numpy.maximum.at(x_max, groups, xs)
+    spans = (x_max - x_min)[groups]
+    counts = bucket_counts[groups]
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        buckets = numpy.minimum(((xs - x_min[groups]) / spans * counts).astype(numpy.int64), counts - 1)
+    buckets[spans <= 0] = 0
+    # Buckets of all groups are numbered consecutively.
+    buckets += (numpy.cumsum(bucket_counts) - bucket_counts)[groups]
+
+    bucket_count = int(bucket_counts.sum())
+    positions = numpy.arange(len(xs))
+    picked = []
+    for values, extremum, initial in [(xs, numpy.minimum, numpy.inf), (xs, numpy.maximum, -numpy.inf),
+                                      (ys, numpy.minimum, numpy.inf), (ys, numpy.maximum, -numpy.inf)]:
+        extremes = numpy.full(bucket_count, initial)
+        extremum.at(extremes, buckets, values)
+        # The first point with the extreme value.
+        is_extreme = values == extremes[buckets]
+        first = numpy.full(bucket_count, len(xs))
+        numpy.minimum.at(first, buckets[is_extreme], positions[is_extreme])
+        picked.append(first[first < len(xs)])
+    return numpy.unique(numpy.concatenate(picked))
+
+
+def _lttb(xs, ys, groups, quotas):
+    """
+    Returns positions of the points picked by LttbSampling in each group.
+    """
+    # Stable: points with equal x keep their order.
+    order = numpy.lexsort((xs, groups))
+    group_ends = numpy.cumsum(numpy.bincount(groups, minlength=len(quotas)))
+    picked = []
+    group_start = 0
+    for group_end, quota in zip(group_ends.tolist(), quotas.tolist()):
+        if group_end > group_start:
+            group_order = order[group_start:group_end]
+            picked.append(group_order[_lttb_positions(xs[group_order], ys[group_order], quota)])
+        group_start = group_end
+    return numpy.concatenate(picked)
+
+
+def _lttb_positions(x, y, sample_size):
+    last = len(x) - 1
+    bucket_size = (len(x) - 2) / (sample_size - 2)
+    starts = numpy.minimum((numpy.arange(sample_size) * bucket_size).astype(numpy.int64) + 1, last + 1).tolist()
+
+    picked = numpy.empty(sample_size, dtype=numpy.int64)
+    picked[0] = a = 0
+    for bucket in range(sample_size - 2):
+        start, end, next_end = starts[bucket], starts[bucket + 1], starts[bucket + 2]
+        # Sequential sums as in the engine.
+        avg_x = numpy.add.accumulate(x[end:next_end])[-1] / (next_end - end)
+        avg_y = numpy.add.accumulate(y[end:next_end])[-1] / (next_end - end)
+        xa, ya = x[a], y[a]
+        areas = numpy.abs((xa - avg_x) * (y[start:end] - ya) - (xa - x[start:end]) * (avg_y - ya))
+        a = start + int(numpy.argmax(areas))
+        picked[bucket + 1] = a
+    picked[-1] = last
+    return picked
+
+
+def _viewport(plot_spec: Dict):
+    """
+    Returns x- and y-limits (or None) of not flipped cartesian coordinates, see CoordConfig.cartesianLimits().
+    """
+    coord = plot_spec.get('coord')
+    if not isinstance(coord, dict) or coord.get('name') not in ('cartesian', 'fixed') or coord.get('flip') is True:
+        return None, None
+
+    def limits(lim):
+        # See OptionsAccessor.getRangeOrNull()
+        if not isinstance(lim, (list, tuple)) or len(lim) != 2 \
+                or not all(isinstance(v, Real) and not isinstance(v, bool) for v in lim):
+            return None
+        return float(min(lim)), float(max(lim))
+
+    return limits(coord.get('xlim')), limits(coord.get('ylim'))
+
+
+def _sample_quadtree(sampling, xs, ys, viewport):
+    """
+    Returns sorted indices of the picked rows, see QuadtreeSampling.
+    """
+    _, n, depth = sampling
+    rows = numpy.flatnonzero(numpy.isfinite(xs) & numpy.isfinite(ys))
+    if len(rows) == 0:
+        return rows
+
+    x, y = xs[rows], ys[rows]
+    x_range, y_range = (float(x.min()), float(x.max())), (float(y.min()), float(y.max()))
+    x_lim, y_lim = viewport
+    level = _quadtree_level(_visible_share(x_range, x_lim) * _visible_share(y_range, y_lim))
+
+    if level <= depth:
+        cell_count = 1 << level
+        cells = _quadtree_cells(x, x_range, cell_count) * cell_count + _quadtree_cells(y, y_range, cell_count)
+        priorities = (rows.astype(numpy.uint64) * numpy.uint64(_PRIORITY_MULTIPLIER)) & numpy.uint64(_MASK_32)
+        # The rank of the priority of each row in its cell.
+        order = numpy.lexsort((priorities, cells))
+        sorted_cells = cells[order]
+        starts = numpy.flatnonzero(numpy.r_[True, sorted_cells[1:] != sorted_cells[:-1]])
+        ranks = numpy.arange(len(order)) - numpy.repeat(starts, numpy.diff(numpy.r_[starts, len(order)]))
+        kept = numpy.zeros(len(rows), dtype=bool)
+        kept[order[ranks < n]] = True
+        rows, x, y = rows[kept], x[kept], y[kept]
+
+    visible = numpy.ones(len(rows), dtype=bool)
+    for values, lim in [(x, x_lim), (y, y_lim)]:
+        if lim is not None:
+            margin = (lim[1] - lim[0]) * _VIEWPORT_MARGIN
+            visible &= (values >= lim[0] - margin) & (values <= lim[1] + margin)
+    return rows[visible]
+
+
+def _visible_share(data_range, lim) -> float:
+    if lim is None:
+        return 1.0
+    lower, upper = data_range
+    if upper == lower:
+        return 1.0 if lim[0] <= lower <= lim[1] else 0.0
+    overlap = min(upper, lim[1]) - max(lower, lim[0])
+    return max(overlap, 0.0) / (upper - lower)
+
+
+def _quadtree_level(visible_share: float) -> int:
+    if visible_share <= 0.0:
+        return _QUADTREE_MAX_DEPTH + 1
+    # The viewport covers 1/4^level of the data area.
+    return max(int(math.log(1 / visible_share) / math.log(4.0)), 0)
+
+
+def _quadtree_cells(values, data_range, cell_count: int):
+    lower, upper = data_range
+    if upper == lower:
+        return numpy.zeros(len(values), dtype=numpy.int64)
+    return numpy.minimum(((values - lower) / (upper - lower) * cell_count).astype(numpy.int64), cell_count - 1)
+
+
+def _sample_without_replacement(pop_size: int, sample_size: int, random):
+    # See SamplingUtil.sampleWithoutReplacement()
+    pick = sample_size <= pop_size // 2
+    index_count = sample_size if pick else pop_size - sample_size
+
+    index_set = set()
+    while len(index_set) < index_count:
+        index_set.add(random.next_int(pop_size))
+
+    indices = numpy.fromiter(index_set, dtype=numpy.int64, count=index_count)
+    if pick:
+        indices.sort()
+        return indices
+
+    kept = numpy.ones(pop_size, dtype=bool)
+    kept[indices] = False
+    return numpy.flatnonzero(kept)
+
+
+class _KotlinRandom:
+    """
+    The generator of `kotlin.random.Random(seed: Long)` (XorWow): produces the same numbers as the engine.
+    The state is kept as unsigned 32-bit integers.
+    """
+
+    def __init__(self, seed: int):
+        seed1 = seed & _MASK_32
+        seed2 = (seed >> 32) & _MASK_32
+        self._x, self._y, self._z, self._w = seed1, seed2, 0, 0
+        self._v = ~seed1 & _MASK_32
+        self._addend = ((seed1 << 10) ^ (seed2 >> 4)) & _MASK_32
+        for _ in range(64):
+            self._next()
+
+    def _next(self) -> int:
+        t = self._x
+        t ^= t >> 2
+        self._x, self._y, self._z = self._y, self._z, self._w
+        v0 = self._v
+        self._w = v0
+        t = (t ^ (t << 1) ^ v0 ^ (v0 << 4)) & _MASK_32
+        self._v = t
+        self._addend = (self._addend + 362437) & _MASK_32
+        return (t + self._addend) & _MASK_32
+
+    def next_int(self, until: int) -> int:
+        # Random.nextInt(until)
+        if until & -until == until:
+            bit_count = until.bit_length() - 1
+            bits = self._next()
+            return bits >> (32 - bit_count) if bit_count > 0 else 0
+        while True:
+            bits = self._next() >> 1
+            value = bits % until
+            if bits - value + (until - 1) <= 0x7FFFFFFF:  # no Int overflow
+                return value
+
+
+def _expression_text(sampling) -> str:
+    # See Sampling.expressionText
+    name, n, seed = sampling
+    if name == 'quadtree':
+        return "sampling_quadtree(n={}, depth={})".format(n, seed)
+    return "sampling_{}(n={}{})".format(name, n, '' if seed is None else ", seed={}".format(seed))
+
+
+def _combined_data(plot_spec: Dict, layer: Dict):
+    # See DataConfigUtil.layerMappingsAndCombinedData()
+    plot_data = plot_spec.get('data')
+    if 'data' not in layer:
+        return plot_data if _row_count(plot_data) is not None else None
+
+    layer_data = layer['data']
+    layer_rows = _row_count(layer_data)
+    if layer_rows is None:
+        return None
+    if not _column_names(layer_data):
+        return plot_data if _row_count(plot_data) is not None else None
+    if not _column_names(plot_data) or _row_count(plot_data) != layer_rows:
+        return layer_data
+
+    combined = _columns(plot_data)
+    combined.update(_columns(layer_data))
+    return combined
+
+
+def _column_names(data) -> List:
+    if isinstance(data, dict):
+        return list(data.keys())
+    if is_data_frame(data):
+        return list(data.columns)
+    if is_polars_dataframe(data):
+        return data.columns
+    if is_arrow_table(data):
+        return data.schema.names
+    return []
+
+
+def _columns(data) -> Dict:
+    if isinstance(data, dict):
+        return dict(data)
+    if is_arrow_table(data):
+        return {name: data.column(name) for name in data.schema.names}
+    return {name: data[name] for name in _column_names(data)}
+
+
+def _row_count(data) -> Optional[int]:
+    if is_data_frame(data):
+        return len(data)
+    if is_polars_dataframe(data):
+        return data.height
+    if is_arrow_table(data):
+        return data.num_rows
+    if not isinstance(data, dict):
+        return None
+
+    lengths = set()
+    for values in data.values():
+        if isinstance(values, (str, bytes, dict)) or not hasattr(values, '__len__'):
+            return None
+        lengths.add(len(values))
+    return lengths.pop() if len(lengths) == 1 else None if lengths else 0
+
+
+def _take_rows(data, indices):
+    if isinstance(data, dict):
+        return {name: _take(values, indices) for name, values in data.items()}
+    if is_data_frame(data):
+        return data.iloc[indices]
+    if is_polars_dataframe(data):
+        return data[indices]
+    # pyarrow.Table
+    return data.take(indices)
+
+
+def _take(values, indices):
+    if isinstance(values, numpy.ndarray):
+        return values[indices]
+    if pandas is not None and isinstance(values, pandas.Series):
+        return values.iloc[indices]
+    if hasattr(values, 'take') and not isinstance(values, (list, tuple)):
+        # pyarrow.Array, pyarrow.ChunkedArray
+        return values.take(indices)
+    if hasattr(values, 'gather'):
+        # polars.Series
+        return values.gather(indices)
+    return [values[i] for i in indices.tolist()]
@@ -0,0 +1,142 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import hashlib
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import polars
+except ImportError:
+    polars = None
+
+_PRIMITIVE_TYPES = (str, float, int, bool, type(None))
+
+
+def new_digest():
+    return hashlib.blake2b(digest_size=16)
+
+
+def digest(value) -> str:
+    h = new_digest()
+    update_digest(h, value)
+    return h.hexdigest()
+
+
+def update_digest(h, value) -> bool:
+    """
+    Feeds a stable representation of the value to the hash object.
+    Data columns (numpy, pandas, polars) are hashed from their buffers, without converting to Python objects.
+    Plot specs (`FeatureSpec`) contribute their fingerprint.
+
+    Returns True if the value only consists of plain Python values (str, numbers, lists, dicts etc.),
+    i.e. it holds no data frames, arrays or plot specs.
+    """
+    from lets_plot.plot.core import FeatureSpec
+
+    if isinstance(value, _PRIMITIVE_TYPES):
+        h.update(repr(value).encode())
+        h.update(b',')
+        return True
+    if isinstance(value, FeatureSpec):
+        h.update(b'spec:')
+        h.update(value.fingerprint().encode())
+        return False
+    if isinstance(value, dict):
+        h.update(b'{')
+        plain = True
+        for k, v in value.items():
+            plain &= update_digest(h, k)
+            plain &= update_digest(h, v)
+        h.update(b'}')
+        return plain
+    if isinstance(value, (list, tuple)):
+        if all(type(e) in _PRIMITIVE_TYPES for e in value):
+            h.update(repr(value).encode())
+            return True
+        h.update(b'[')
+        plain = True
+        for e in value:
+            plain &= update_digest(h, e)
+        h.update(b']')
+        return plain
+    if numpy and isinstance(value, numpy.ndarray):
+        _update_array_digest(h, value)
+        return False
+    if pandas and isinstance(value, pandas.DataFrame):
+        h.update(b'pandas.DataFrame')
+        for name, column in value.items():
+            update_digest(h, name)
+            update_digest(h, column)
+        return False
+    if pandas and isinstance(value, pandas.Series):
+        h.update('pandas.Series({},{})'.format(value.dtype, len(value)).encode())
+        if isinstance(value.dtype, numpy.dtype) and value.dtype.kind in 'biufM':
+            _update_array_digest(h, value.to_numpy())
+        else:
+            h.update(memoryview(pandas.util.hash_pandas_object(value, index=False).to_numpy()))
+        return False
+    if polars and isinstance(value, polars.DataFrame):
+        h.update(b'polars.DataFrame')
+        for column in value.get_columns():
+            update_digest(h, column.name)
+            update_digest(h, column)
+        return False
+    if polars and isinstance(value, polars.Series):
+        h.update('polars.Series({},{})'.format(value.dtype, len(value)).encode())
+        if value.dtype.is_numeric() and value.null_count() == 0:
+            _update_array_digest(h, value.to_numpy())
+        else:
+            h.update(memoryview(value.hash(seed=0).to_numpy()))
+        return False
+
+    pyarrow = sys.modules.get('pyarrow')
+    if pyarrow and isinstance(value, (pyarrow.Table, pyarrow.RecordBatch)):
+        h.update(b'pyarrow.Table')
+        for name, column in zip(value.schema.names, value.columns):
+            update_digest(h, name)
+            update_digest(h, column)
+        return False
+    if pyarrow and isinstance(value, pyarrow.ChunkedArray):
+        h.update('pyarrow.ChunkedArray({},{})'.format(value.type, len(value)).encode())
+        for chunk in value.chunks:
+            update_digest(h, chunk)
+        return False
+    if pyarrow and isinstance(value, pyarrow.Array):
+        _update_arrow_array_digest(h, value)
+        return False
+
+    # datetime, MappingMeta etc.
+    h.update(type(value).__name__.encode())
+    if hasattr(value, '__dict__'):
+        update_digest(h, vars(value))
+    else:
+        h.update(repr(value).encode())
+    h.update(b',')
+    return False
+
+
+def _update_arrow_array_digest(h, array):
+    h.update('pyarrow.Array({},{},{})'.format(array.type, array.offset, len(array)).encode())
+    for buffer in array.buffers():
+        # Sliced arrays share buffers with their parent: offset and length make the difference.
+        h.update(b'-' if buffer is None else memoryview(buffer))
+    if hasattr(array, 'dictionary'):  # DictionaryArray
+        _update_arrow_array_digest(h, array.dictionary)
+
+
+def _update_array_digest(h, array):
+    h.update('array({},{})'.format(array.dtype.str, array.shape).encode())
+    if array.dtype.hasobject:
+        update_digest(h, array.tolist())
+    else:
+        h.update(numpy.ascontiguousarray(array).reshape(-1).view(numpy.uint8))
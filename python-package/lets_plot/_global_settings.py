@@ -3,7 +3,7 @@
 # Use of this source code is governed by the MIT license that can be found in the LICENSE file.
 #
 import os
-from typing import Any
+from typing import Any, Optional, Tuple
 
 from ._version import __version__
 
@@ -46,6 +46,9 @@ JS_URL_MANUAL = 'js_url_manual'
 MAX_WIDTH = 'max_width'
 MAX_HEIGHT = 'max_height'
 PLOT_THEME = 'plot_theme'
+DATA_ENCODING = 'data_encoding'
+DATA_COMPRESSION = 'data_compression'
+PRUNE_DATA = 'prune_data'
 
 MAPTILES_KIND = 'maptiles_kind'
 MAPTILES_URL = 'maptiles_url'
@@ -95,6 +98,7 @@ _settings = {
     MAPTILES_THEME: _init_value(MAPTILES_THEME, _DATALORE_TILES_THEME),
     MAPTILES_MIN_ZOOM: _init_value(MAPTILES_MIN_ZOOM, _DATALORE_TILES_MIN_ZOOM),
     MAPTILES_MAX_ZOOM: _init_value(MAPTILES_MAX_ZOOM, _DATALORE_TILES_MAX_ZOOM),
+    PRUNE_DATA: _init_value(PRUNE_DATA, True),
 
     'dev_' + OFFLINE: _init_value('dev_' + OFFLINE, True),  # default: embed js into the notebook
     'dev_' + NO_JS: _init_value('dev_' + NO_JS, False),
@@ -111,6 +115,7 @@ _settings = {
     'dev_' + MAPTILES_THEME: _init_value('dev_' + MAPTILES_THEME, _DATALORE_TILES_THEME),
     'dev_' + MAPTILES_MIN_ZOOM: _init_value('dev_' + MAPTILES_MIN_ZOOM, _DATALORE_TILES_MIN_ZOOM),
     'dev_' + MAPTILES_MAX_ZOOM: _init_value('dev_' + MAPTILES_MAX_ZOOM, _DATALORE_TILES_MAX_ZOOM),
+    'dev_' + PRUNE_DATA: _init_value('dev_' + PRUNE_DATA, True),
 }
 
 
@@ -151,6 +156,16 @@ def get_js_cdn_url() -> str:
     return url
 
 
+def get_data_encoding() -> Tuple[Optional[str], Optional[str]]:
+    """
+    Returns encoding and compression of numeric data columns in HTML output.
+    Encoding: 'json', 'float64' or 'float32'; compression: None or 'deflate'.
+    """
+    encoding = get_global_str(DATA_ENCODING) if has_global_value(DATA_ENCODING) else 'json'
+    compression = get_global_str(DATA_COMPRESSION) if has_global_value(DATA_COMPRESSION) else 'none'
+    return encoding, (None if compression == 'none' else compression)
+
+
 def has_global_value(name: str) -> bool:
     val = _get_global_val_intern(_to_actual_name(name))
 
@@ -2,28 +2,63 @@
 #  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
 
 # noinspection PyUnresolvedReferences
-from typing import Dict
+from typing import Dict, List, Optional, Tuple, Callable
 
 import lets_plot_kotlin_bridge
 
+from ._data_pruning import prune_unused_columns
+from ._data_sampling import sample_data
+from ._precompute import precompute_stats
+from ._render_cache import cached_render
+from ._shared_data import share_data
 from ._type_utils import standardize_dict
-from ._global_settings import get_js_cdn_url
+from ._global_settings import get_js_cdn_url, get_data_encoding, get_global_bool, PRUNE_DATA
 
 
-def _generate_dynamic_display_html(plot_spec: Dict) -> str:
-    plot_spec = _standardize_plot_spec(plot_spec)
-    return lets_plot_kotlin_bridge.generate_html(plot_spec)
+def _generate_dynamic_display_html(plot_spec: Dict, fingerprint: str = None) -> str:
+    data_encoding, data_compression = get_data_encoding()
+    return _cached_render('dynamic_html', plot_spec, fingerprint, (data_encoding, data_compression),
+                          lambda std_spec: lets_plot_kotlin_bridge.generate_html(std_spec,
+                                                                                 data_encoding, data_compression))
 
 
-def _generate_svg(plot_spec: Dict, use_css_pixelated_image_rendering: bool = True) -> str:
-    plot_spec = _standardize_plot_spec(plot_spec)
-    return lets_plot_kotlin_bridge.export_svg(plot_spec, use_css_pixelated_image_rendering)
+def _generate_svg(plot_spec: Dict, use_css_pixelated_image_rendering: bool = True, fingerprint: str = None) -> str:
+    return _cached_render('svg', plot_spec, fingerprint, (use_css_pixelated_image_rendering,),
+                          lambda std_spec: lets_plot_kotlin_bridge.export_svg(std_spec,
+                                                                              use_css_pixelated_image_rendering))
 
 
-def _generate_static_html_page(plot_spec: Dict, iframe: bool) -> str:
-    plot_spec = _standardize_plot_spec(plot_spec)
+def _generate_static_html_page(plot_spec: Dict, iframe: bool, fingerprint: str = None) -> str:
     scriptUrl = get_js_cdn_url()
-    return lets_plot_kotlin_bridge.export_html(plot_spec, scriptUrl, iframe)
+    data_encoding, data_compression = get_data_encoding()
+    return _cached_render('static_html', plot_spec, fingerprint, (scriptUrl, iframe, data_encoding, data_compression),
+                          lambda std_spec: lets_plot_kotlin_bridge.export_html(std_spec, scriptUrl, iframe,
+                                                                               data_encoding, data_compression))
+
+
+def _generate_svg_batch(plot_specs: List[Dict], use_css_pixelated_image_rendering: bool = True) -> List[str]:
+    plot_specs = [_standardize_plot_spec(plot_spec) for plot_spec in plot_specs]
+    return lets_plot_kotlin_bridge.export_svg_batch(plot_specs, use_css_pixelated_image_rendering)
+
+
+def _generate_static_html_page_batch(plot_specs: List[Dict], iframe: bool) -> List[str]:
+    plot_specs = [_standardize_plot_spec(plot_spec) for plot_spec in plot_specs]
+    scriptUrl = get_js_cdn_url()
+    data_encoding, data_compression = get_data_encoding()
+    return lets_plot_kotlin_bridge.export_html_batch(plot_specs, scriptUrl, iframe, data_encoding, data_compression)
+
+
+def _cached_render(kind: str, plot_spec: Dict, fingerprint: Optional[str], options: Tuple,
+                   render: Callable[[Dict], str]) -> str:
+    """
+    :param fingerprint: fingerprint of the plot spec object if known.
+        Allows to skip the plot spec standardization on render cache hits.
+    """
+    if fingerprint is not None:
+        return cached_render(kind, fingerprint, options, lambda: render(_standardize_plot_spec(plot_spec)))
+
+    plot_spec = _standardize_plot_spec(plot_spec)
+    return cached_render(kind, plot_spec, options, lambda: render(plot_spec))
 
 
 def _standardize_plot_spec(plot_spec: Dict) -> Dict:
@@ -33,4 +68,17 @@ def _standardize_plot_spec(plot_spec: Dict) -> Dict:
     if not isinstance(plot_spec, dict):
         raise ValueError("dict expected but was {}".format(type(plot_spec)))
 
-    return standardize_dict(plot_spec)
+    # Layers with the 'precompute' option get their statistics computed here.
+    plot_spec = precompute_stats(plot_spec)
+
+    if get_global_bool(PRUNE_DATA):
+        plot_spec = prune_unused_columns(plot_spec)
+
+    # Only the sampled rows of the layer data are passed to the bridge.
+    plot_spec = sample_data(plot_spec)
+
+    # Data used by several layers or subplots is standardized and passed to the bridge once.
+    plot_spec = share_data(plot_spec)
+
+    # Numeric data columns are passed to the bridge as numpy arrays (via the buffer protocol).
+    return standardize_dict(plot_spec, numeric_buffers=True)
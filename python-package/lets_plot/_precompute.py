@@ -0,0 +1,1256 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import math
+import re
+import sys
+from collections.abc import Iterable
+from typing import Dict, List, Optional
+
+from ._data_pruning import _referenced_variables, _facet_variables, _copy_with
+from ._type_utils import is_polars_dataframe, is_arrow_table
+from .plot.util import is_data_frame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+PRECOMPUTE = 'precompute'
+RASTERIZE = 'rasterize'
+
+# See BinStatUtil
+_BIN_MAX_COUNT = 500
+_BIN_DEF_COUNT = 30
+_BIN_OPTIONS = ['bins', 'binwidth', 'center', 'boundary']
+_BIN_STAT_VARS = {'..x..', '..count..', '..density..'}
+
+# See Bin2dStat
+_BIN2D_OPTIONS = ['bins', 'binwidth', 'drop']
+_BIN2D_STAT_VARS = {'..x..', '..y..', '..count..', '..density..'}
+
+# See SummaryStat, StatProto.getAggFunction()
+_SUMMARY_OPTIONS = ['fun', 'fun_min', 'fun_max', 'quantiles']
+_SUMMARY_BIN_OPTIONS = _SUMMARY_OPTIONS + _BIN_OPTIONS
+_SUMMARY_STAT_VARS = {'..x..', '..y..', '..ymin..', '..ymax..'}
+_SUMMARY_DEF_FUNCTIONS = {'fun': 'mean', 'fun_min': 'min', 'fun_max': 'max'}
+_SUMMARY_DEF_QUANTILES = [0.25, 0.5, 0.75]
+_SUMMARY_EXACT_FUNCTIONS = {'count', 'sum', 'mean', 'min', 'max'}
+
+# Quantile sketch: the size of the biggest level and the minimal size of other levels.
+_SKETCH_SIZE = 2048
+_SKETCH_MIN_CAPACITY = 8
+
+# See SeriesUtil
+_TINY = 1e-50
+_MAX_DECIMAL_PLACES = 12
+
+# Rasterized points: reducers and the default plot size (see Defaults.DEF_PLOT_SIZE) defining the pixel grid.
+_RASTER_REDUCERS = ['count', 'any', 'mean']
+_RASTER_DEF_SIZE = (600, 400)
+_RASTER_LAYER_OPTIONS = ['show_legend', 'manual_key', 'alpha', 'color', 'fill']
+
+_DEFAULT_STAT = {'histogram': 'bin', 'freqpoly': 'bin', 'bin2d': 'bin2d', 'dotplot': 'dotplot', 'ydotplot': 'ydotplot',
+                 'density': 'density', 'density2d': 'density2d', 'density2df': 'density2df',
+                 'area_ridges': 'densityridges', 'violin': 'ydensity'}
+# Stats computed over the x- or y-range of all layers, see ConfiguredStatContext.
+_OVERALL_RANGE_STATS = {'bin', 'bin2d', 'dotplot', 'ydotplot', 'density', 'density2d', 'density2df',
+                        'densityridges', 'ydensity', 'summarybin'}
+_STAT_VAR_RE = re.compile(r'\.\.\w+\.\.')
+
+
+def precompute_stats(plot_spec: Dict) -> Dict:
+    """
+    Computes the statistics of layers with the `precompute` option in Python and replaces the layer data
+    with the result (the layer gets stat='identity').
+    Mappings, tooltips and `as_discrete()` ordering referring to the computed variables ('..count..' etc.)
+    are redirected to the columns of the computed data.
+
+    Supported stats: 'bin' (`geom_histogram()`, `geom_freqpoly()`), 'bin2d' (`geom_bin2d()`),
+    'summary' (`stat_summary()`) and 'summarybin' (`stat_summary_bin()`).
+    Points with the `rasterize` option (`geom_point()`) are aggregated into a pixel grid and replaced
+    with a raster layer.
+    Layers that can't be computed the same way as by the plotting engine (transformed or limited positional scale,
+    datetime or y-orientation) are left to the engine.
+    If a layer left to the engine has a stat computed over the range of all layers ('bin', 'density', 'dotplot' etc.),
+    all layers of the plot are left to the engine: the computed data would change that range.
+
+    The data of 'bin2d', 'summary', 'summarybin' and rasterized layers can be chunked: a collection (or any re-iterable object)
+    of data frames, or a pyarrow dataset. The chunks are read one at a time, up to twice (to compute the range
+    of the data and the bins).
+
+    The plot spec (a result of `as_dict()`) is not modified.
+    """
+    kind = plot_spec.get('kind')
+    if kind == 'plot':
+        return _precompute_plot(plot_spec)
+    if kind == 'subplots':
+        return _copy_with(plot_spec, figures=[
+            precompute_stats(figure) if isinstance(figure, dict) else figure
+            for figure in plot_spec.get('figures', [])
+        ])
+    if kind == 'ggbunch':
+        return _copy_with(plot_spec, items=[
+            _copy_with(item, feature_spec=precompute_stats(item['feature_spec']))
+            for item in plot_spec.get('items', [])
+        ])
+    return plot_spec
+
+
+def _precompute_plot(plot_spec: Dict) -> Dict:
+    layers = plot_spec.get('layers', [])
+    if not any(PRECOMPUTE in layer or RASTERIZE in layer for layer in layers):
+        return plot_spec
+
+    computed = [
+        _rasterize_layer(plot_spec, layer) if RASTERIZE in layer else
+        _precompute_layer(plot_spec, layer) if PRECOMPUTE in layer else None
+        for layer in layers
+    ]
+    if any(layer is not None for layer in computed) and any(
+            layer is None and _stat(original) in _OVERALL_RANGE_STATS for layer, original in zip(computed, layers)):
+        computed = [None] * len(layers)
+
+    result = _copy_with(plot_spec, layers=[
+        layer if layer is not None else _engine_layer(plot_spec, original)
+        for layer, original in zip(computed, layers)
+    ])
+
+    # Raw plot data is no longer needed if all layers have own data.
+    if 'data' in result and all('data' in layer for layer in result['layers']):
+        del result['data']
+    if _is_chunked(result.get('data')):
+        raise ValueError("Chunked plot data is only supported if all layers are computed with 'precompute'.")
+    return result
+
+
+def _stat(layer: Dict) -> Optional[str]:
+    return layer.get('stat') or _DEFAULT_STAT.get(layer.get('geom'))
+
+
+def _engine_layer(plot_spec: Dict, layer: Dict) -> Dict:
+    result = {name: value for name, value in layer.items() if name not in (PRECOMPUTE, RASTERIZE)}
+    if _is_chunked(_layer_data(plot_spec, result)):
+        if RASTERIZE in layer:
+            raise ValueError("Chunked data of a rasterized layer is only supported with numeric x and y.")
+        if PRECOMPUTE in layer:
+            raise ValueError("Chunked data is only supported by 'bin2d', 'summary' and 'summarybin' stats "
+                             "with 'precompute'.")
+    return result
+
+
+def _precompute_layer(plot_spec: Dict, layer: Dict) -> Optional[Dict]:
+    # None: the layer is left to the engine.
+    if numpy is None or not layer[PRECOMPUTE]:
+        return None
+
+    result = dict(layer)
+    del result[PRECOMPUTE]
+    stat = _stat(layer)
+    if stat == 'bin':
+        return _bin_layer(plot_spec, result)
+    if stat == 'bin2d':
+        return _bin2d_layer(plot_spec, result)
+    if stat in ('summary', 'summarybin'):
+        return _summary_layer(plot_spec, result, binned=stat == 'summarybin')
+    return None
+
+
+def _rasterize_layer(plot_spec: Dict, layer: Dict) -> Optional[Dict]:
+    # None: the layer is left to the engine.
+    result = dict(layer)
+    rasterize = result.pop(RASTERIZE)
+    if not rasterize:
+        return None
+
+    reducer = 'count' if rasterize is True else rasterize
+    if reducer not in _RASTER_REDUCERS:
+        raise ValueError("Unsupported 'rasterize' value: {!r}, expected True or one of: {}.".format(
+            rasterize, ', '.join(repr(r) for r in _RASTER_REDUCERS)
+        ))
+
+    return _raster_layer(plot_spec, result, reducer) if numpy is not None else None
+
+
+def _raster_layer(plot_spec: Dict, layer: Dict, reducer: str) -> Optional[Dict]:
+    """
+    Aggregates the points into a grid of pixels (a cell per pixel of the plot size) over the x- and y-range
+    of all layers of the plot, separately for each facet, and returns a raster layer filled by the `color`
+    (or `fill`) aesthetic: the number of points in the pixel ('count'), pixels having any points ('any')
+    or the mean of the continuous color variable ('mean').
+    With a discrete color each pixel gets the category having the most points.
+    The data is processed chunk by chunk.
+    """
+    mapping = _layer_mapping(plot_spec, layer)
+    if layer.get('stat') not in (None, 'identity') or layer.get('position') not in (None, 'identity') \
+            or _has_scale_transform(plot_spec, 'x') or _has_scale_transform(plot_spec, 'y') \
+            or 'alpha' in mapping or 'color' in mapping and 'fill' in mapping \
+            or any(option in layer for option in ['map', 'map_join']) \
+            or 'geodataframe' in (layer.get('data_meta') or {}):
+        return None
+
+    chunks = _chunks(_layer_data(plot_spec, layer))
+    sample = next(iter(chunks), None)
+    x_var, y_var = mapping.get('x'), mapping.get('y')
+    if not isinstance(x_var, str) or not isinstance(y_var, str) or sample is None \
+            or _is_datetime(plot_spec, layer, x_var) or _is_datetime(plot_spec, layer, y_var):
+        return None
+    x_range = _overall_range(plot_spec, 'x')
+    y_range = _overall_range(plot_spec, 'y')
+    if x_range is None or y_range is None:
+        return None
+
+    color_aes = 'fill' if 'fill' in mapping else 'color'
+    color_var = mapping.get(color_aes)
+    discrete = color_var is not None and _is_discrete(plot_spec, layer, color_aes, color_var,
+                                                      _column(sample, color_var))
+    if color_var is not None and not discrete and reducer != 'mean':
+        raise ValueError("rasterize={!r} doesn't support a continuous {}: use rasterize='mean'.".format(
+            reducer, color_aes))
+    if reducer == 'mean' and (color_var is None or discrete):
+        raise ValueError("rasterize='mean' requires a continuous color or fill.")
+
+    keys = [var for var in _facet_variables(plot_spec.get('facet')) if var not in (x_var, y_var)]
+    if discrete and color_var not in keys:
+        keys.append(color_var)
+
+    size = plot_spec.get('ggsize') or {}
+    raster = _Raster(
+        _pixel_count(size.get('width'), _RASTER_DEF_SIZE[0]), x_range,
+        _pixel_count(size.get('height'), _RASTER_DEF_SIZE[1]), y_range,
+        with_values=reducer == 'mean'
+    )
+    for chunk in chunks:
+        x = _as_float(_column(chunk, x_var))
+        y = _as_float(_column(chunk, y_var))
+        values = _as_float(_column(chunk, color_var)) if reducer == 'mean' else None
+        key_columns = [_to_numpy(_column(chunk, var)) for var in keys]
+        if x is None or y is None or reducer == 'mean' and values is None \
+                or not _supported_columns(plot_spec, layer, keys, key_columns):
+            return None
+        groups = raster.index([_column(chunk, var) for var in keys], key_columns, len(x))
+        raster.add(groups, x, y, values)
+
+    raster_mapping = {'x': x_var, 'y': y_var}
+    if discrete:
+        table = raster.categories_table(x_var, y_var, keys, color_var)
+        raster_mapping[color_aes] = color_var
+    else:
+        table = raster.table(x_var, y_var, keys, color_var if reducer == 'mean' else None)
+        if reducer != 'any':
+            raster_mapping[color_aes] = color_var if reducer == 'mean' else 'count'
+
+    result = {option: layer[option] for option in _RASTER_LAYER_OPTIONS if option in layer}
+    result.update(geom='raster', stat='identity', data=table, mapping=raster_mapping, fill_by=color_aes)
+    data_meta = _layer_data_meta(plot_spec, layer, table, {})
+    if data_meta:
+        result['data_meta'] = data_meta
+    return result
+
+
+def _pixel_count(size, default) -> int:
+    return max(int(size), 1) if isinstance(size, (int, float)) and size > 0 else default
+
+
+def _bin_layer(plot_spec: Dict, layer: Dict) -> Optional[Dict]:
+    """
+    Replicates BinStat: bins are computed over the x-range of all layers of the plot,
+    separately for each group (discrete aesthetics, `group` and facets).
+    """
+    if layer.get('orientation') == 'y' or _has_scale_transform(plot_spec, 'x'):
+        return None
+
+    data = _layer_data(plot_spec, layer)
+    mapping = _layer_mapping(plot_spec, layer)
+    x_var = mapping.get('x')
+    if not isinstance(x_var, str) or _is_datetime(plot_spec, layer, x_var):
+        return None
+    x = _as_float(_column(data, x_var))
+    x_range = _overall_range(plot_spec, 'x')
+    if x is None or x_range is None:
+        return None
+
+    renames = {'..x..': x_var, '..count..': 'count', '..density..': 'density'}
+    variables = _layer_variables(plot_spec, layer, mapping, data, [x_var], _BIN_STAT_VARS, renames,
+                                 unsupported_aes={'y'})
+    if variables is None:
+        return None
+    keys, weight_var, summarized, renamed_layer = variables
+
+    weights = None
+    if weight_var is not None:
+        weights = _as_float(_column(data, weight_var))
+        if weights is None:
+            return None
+
+    key_columns = [_to_numpy(_column(data, var)) for var in keys]
+    summarized_columns = [_to_numpy(_column(data, var)) for var in summarized]
+    if not _supported_columns(plot_spec, layer, keys + summarized, key_columns + summarized_columns):
+        return None
+
+    bin_count, bin_width, start_x = _binning_parameters(
+        x_range,
+        layer.get('bins'), layer.get('binwidth'),
+        layer.get('center'), layer.get('boundary')
+    )
+    groups, group_count = _group_index([_column(data, var) for var in keys], key_columns, len(x))
+    nonempty_groups, (bin_x, counts, densities) = _histogram(
+        x, weights, groups, group_count, x_range, bin_count, bin_width, start_x
+    )
+
+    table = {x_var: bin_x, 'count': counts, 'density': densities}
+    group_rows = numpy.repeat(_first_rows(groups, group_count)[nonempty_groups], bin_count)
+    for var, column in zip(keys, key_columns):
+        table[var] = column[group_rows]
+    for var, column in zip(summarized, summarized_columns):
+        table[var] = numpy.repeat(_summarize(column, groups, nonempty_groups), bin_count)
+
+    return _identity_layer(plot_spec, renamed_layer, table, renames, {'y': 'count'}, _BIN_OPTIONS)
+
+
+def _bin2d_layer(plot_spec: Dict, layer: Dict) -> Optional[Dict]:
+    """
+    Replicates Bin2dStat: bins are computed over the x- and y-range of all layers of the plot,
+    separately for each group (discrete aesthetics, `group` and facets).
+    The data is processed chunk by chunk.
+    """
+    if _has_scale_transform(plot_spec, 'x') or _has_scale_transform(plot_spec, 'y'):
+        return None
+
+    chunks = _chunks(_layer_data(plot_spec, layer))
+    sample = next(iter(chunks), None)
+    mapping = _layer_mapping(plot_spec, layer)
+    x_var, y_var = mapping.get('x'), mapping.get('y')
+    if not isinstance(x_var, str) or not isinstance(y_var, str) or sample is None \
+            or _is_datetime(plot_spec, layer, x_var) or _is_datetime(plot_spec, layer, y_var):
+        return None
+    x_range = _overall_range(plot_spec, 'x')
+    y_range = _overall_range(plot_spec, 'y')
+    if x_range is None or y_range is None:
+        return None
+
+    renames = {'..x..': x_var, '..y..': y_var, '..count..': 'count', '..density..': 'density'}
+    variables = _layer_variables(plot_spec, layer, mapping, sample, [x_var, y_var], _BIN2D_STAT_VARS, renames)
+    if variables is None:
+        return None
+    keys, weight_var, summarized, renamed_layer = variables
+
+    bins_x, bins_y = _pair(layer.get('bins'))
+    binwidth_x, binwidth_y = _pair(layer.get('binwidth'))
+    count_x, width_x, start_x, span_x = _bin2d_parameters(x_range, bins_x, binwidth_x)
+    count_y, width_y, start_y, span_y = _bin2d_parameters(y_range, bins_y, binwidth_y)
+
+    bins = _Bins2d(count_x, width_x, start_x, count_y, width_y, start_y, len(summarized))
+    for chunk in chunks:
+        x = _as_float(_column(chunk, x_var))
+        y = _as_float(_column(chunk, y_var))
+        weights = _as_float(_column(chunk, weight_var)) if weight_var is not None else None
+        key_columns = [_to_numpy(_column(chunk, var)) for var in keys]
+        summarized_columns = [_to_numpy(_column(chunk, var)) for var in summarized]
+        if x is None or y is None or weight_var is not None and weights is None \
+                or not _supported_columns(plot_spec, layer, keys + summarized, key_columns + summarized_columns):
+            return None
+        groups = bins.index([_column(chunk, var) for var in keys], key_columns, len(x))
+        bins.add(groups, x, y, weights, summarized_columns)
+
+    # Bin2dStat: density should integrate to 1.0
+    density_factor = count_x * count_y / (span_x * span_y)
+    drop = layer.get('drop')
+    table = bins.table(x_var, y_var, keys, summarized, density_factor, drop=drop is None or bool(drop))
+    return _identity_layer(plot_spec, renamed_layer, table, renames, {'fill': 'count'}, _BIN2D_OPTIONS)
+
+
+def _summary_layer(plot_spec: Dict, layer: Dict, binned: bool) -> Optional[Dict]:
+    """
+    Replicates SummaryStat (for each x-value) and SummaryBinStat (for each x-bin, `binned=True`):
+    y-values are aggregated separately for each group (discrete aesthetics, `group` and facets).
+    The data is processed chunk by chunk. Quantiles ('median', 'lq', 'mq', 'uq') are exact
+    for up to _SKETCH_SIZE values in a cell and estimated by a quantile sketch otherwise.
+    """
+    if layer.get('orientation') == 'y' \
+            or _has_scale_transform(plot_spec, 'x') or _has_scale_transform(plot_spec, 'y'):
+        return None
+    functions = _summary_functions(layer)
+    if functions is None:
+        return None
+
+    chunks = _chunks(_layer_data(plot_spec, layer))
+    sample = next(iter(chunks), None)
+    mapping = _layer_mapping(plot_spec, layer)
+    x_var, y_var = mapping.get('x'), mapping.get('y')
+    if not isinstance(x_var, str) or not isinstance(y_var, str) or sample is None \
+            or _is_datetime(plot_spec, layer, x_var) or _is_datetime(plot_spec, layer, y_var):
+        return None
+    # Each value of a discrete x is a group.
+    discrete_x = _is_discrete(plot_spec, layer, 'x', x_var, _column(sample, x_var))
+    if binned:
+        x_range = None if discrete_x else _overall_range(plot_spec, 'x')
+        if x_range is None:
+            return None
+        bin_count, bin_width, start_x = _binning_parameters(
+            x_range,
+            layer.get('bins'), layer.get('binwidth'),
+            layer.get('center'), layer.get('boundary')
+        )
+
+    renames = {'..x..': x_var, '..y..': y_var, '..ymin..': 'ymin', '..ymax..': 'ymax'}
+    variables = _layer_variables(plot_spec, layer, mapping, sample, [x_var, y_var], _SUMMARY_STAT_VARS, renames,
+                                 unsupported_aes={'weight'})
+    if variables is None:
+        return None
+    keys, _, summarized, renamed_layer = variables
+    if discrete_x:
+        keys = keys + [x_var]
+
+    summaries = _Summaries(len(summarized), with_quantiles=not set(functions.values()) <= _SUMMARY_EXACT_FUNCTIONS)
+    for chunk in chunks:
+        x = _to_numpy(_column(chunk, x_var)) if discrete_x else _as_float(_column(chunk, x_var))
+        y = _as_float(_column(chunk, y_var))
+        key_columns = [_to_numpy(_column(chunk, var)) for var in keys]
+        summarized_columns = [_to_numpy(_column(chunk, var)) for var in summarized]
+        if x is None or y is None \
+                or not _supported_columns(plot_spec, layer, keys + summarized, key_columns + summarized_columns):
+            return None
+        groups = summaries.index([_column(chunk, var) for var in keys], key_columns, len(y))
+        summaries.summarize(groups, summarized_columns)
+
+        # SeriesUtil.filterFinite()
+        if discrete_x:
+            finite = numpy.isfinite(y) & ~_is_null_array(x)
+            cells = numpy.zeros(len(y), dtype=numpy.int64)
+        else:
+            finite = numpy.isfinite(y) & numpy.isfinite(x)
+            if not binned:
+                cells = x
+            elif bin_width > 0:
+                cells = numpy.floor((x - start_x) / bin_width).astype(numpy.int64)
+            else:
+                # Constant x: NaN.toInt() is 0 in BinStatUtil.computeSummaryBins().
+                cells = numpy.zeros(len(x), dtype=numpy.int64)
+        summaries.add(groups[finite], cells[finite], y[finite])
+
+    if binned:
+        groups, cells = summaries.bins(bin_count)
+        table = {x_var: start_x + bin_width / 2 + numpy.resize(numpy.arange(bin_count), len(cells)) * bin_width}
+    else:
+        groups, cells, x = summaries.cells()
+        table = {} if discrete_x else {x_var: x}
+    for var, function in [(y_var, functions['fun']), ('ymin', functions['fun_min']), ('ymax', functions['fun_max'])]:
+        table[var] = summaries.aggregate(function, cells)
+    summaries.put_groups(table, groups, keys, summarized)
+
+    options = _SUMMARY_BIN_OPTIONS if binned else _SUMMARY_OPTIONS
+    return _identity_layer(plot_spec, renamed_layer, table, renames, {'ymin': 'ymin', 'ymax': 'ymax'}, options)
+
+
+def _summary_functions(layer: Dict) -> Optional[Dict]:
+    # Aggregate function names, quantiles are replaced by their probabilities (see StatProto.getAggFunction()).
+    quantiles = layer.get('quantiles')
+    if quantiles is not None and len(quantiles) != 3:
+        return None
+    lq, mq, uq = sorted(quantiles) if quantiles is not None else _SUMMARY_DEF_QUANTILES
+    probabilities = {'median': 0.5, 'lq': lq, 'mq': mq, 'uq': uq}
+
+    functions = {}
+    for option, default in _SUMMARY_DEF_FUNCTIONS.items():
+        name = layer.get(option)
+        name = default if name is None else str(name).lower()
+        if name not in _SUMMARY_EXACT_FUNCTIONS and name not in probabilities:
+            return None  # the engine reports the error
+        functions[option] = probabilities.get(name, name)
+    return functions
+
+
+def _layer_variables(plot_spec: Dict, layer: Dict, mapping: Dict, data, position_vars: List, stat_vars,
+                     renames: Dict, unsupported_aes=()):
+    """
+    Splits the variables of the layer into the variables defining groups (discrete aesthetics, `group` and facets),
+    the weight variable and the variables summarized in each group.
+    Returns None if the layer refers to a variable the engine computes but this implementation doesn't.
+    """
+    keys = [var for var in _facet_variables(plot_spec.get('facet')) if var not in position_vars]
+    weight_var = None
+    for aes, var in mapping.items():
+        if not isinstance(var, str) or var in position_vars or var in stat_vars:
+            continue
+        if _STAT_VAR_RE.fullmatch(var) or aes in unsupported_aes:
+            return None
+        if aes == 'weight':
+            weight_var = var
+        elif aes == 'group' or _is_discrete(plot_spec, layer, aes, var, _column(data, var)):
+            if var not in keys:
+                keys.append(var)
+
+    renamed_layer = _rename_variables(_copy_with(layer, mapping=mapping), renames)
+    if any(_STAT_VAR_RE.search(str(renamed_layer.get(option))) for option in ['mapping', 'tooltips', 'labels']):
+        return None
+    summarized = [var for var in _referenced_variables(renamed_layer)
+                  if var not in keys and var not in renames.values() and _column(data, var) is not None]
+    if set(renames.values()) & (set(keys) | set(summarized)) - set(position_vars):
+        return None
+    return keys, weight_var, summarized, renamed_layer
+
+
+def _supported_columns(plot_spec: Dict, layer: Dict, variables: List, columns: List) -> bool:
+    return not any(column is None or column.dtype.kind in 'Mm' or _is_datetime(plot_spec, layer, var)
+                   for var, column in zip(variables, columns))
+
+
+def _identity_layer(plot_spec: Dict, renamed_layer: Dict, table: Dict, renames: Dict, default_mapping: Dict,
+                    stat_options: List) -> Dict:
+    mapping = dict(renamed_layer['mapping'])
+    for aes, var in default_mapping.items():
+        mapping.setdefault(aes, var)
+    mapping.pop('weight', None)
+
+    result = {k: v for k, v in renamed_layer.items() if k not in stat_options}
+    result.update(stat='identity', data=table, mapping=mapping)
+    data_meta = _layer_data_meta(plot_spec, renamed_layer, table, renames)
+    if data_meta:
+        result['data_meta'] = data_meta
+    else:
+        result.pop('data_meta', None)
+    return result
+
+
+def _bin_count_and_width(span, bins, binwidth):
+    # BinStatUtil.binCountAndWidth()
+    if binwidth is not None and binwidth > 0:
+        return int(math.ceil(min(_BIN_MAX_COUNT, span / binwidth))), float(binwidth)
+    bin_count = min(_BIN_MAX_COUNT, max(1, _BIN_DEF_COUNT if bins is None else int(bins)))
+    return bin_count, span / bin_count
+
+
+def _binning_parameters(x_range, bins, binwidth, center, boundary):
+    # BinStatUtil.getBinningParameters()
+    lower, upper = x_range
+    start_x = lower
+    span_x = upper - start_x
+    _, width = _bin_count_and_width(span_x, bins, binwidth)
+    start_x -= width * 0.7
+    span_x += width * 1.4
+    count, width = _bin_count_and_width(span_x, bins, binwidth)
+
+    if boundary is None and center is None:
+        return count, width, start_x
+
+    x_pos = float(boundary if boundary is not None else center)
+    min_delta = x_pos - start_x if boundary is not None else sys.float_info.max
+    for i in range(count):
+        bin_left = start_x + i * width
+        if boundary is not None:
+            delta = x_pos - (bin_left + width)
+        else:
+            delta = x_pos - (bin_left + width / 2)
+        if abs(delta) < abs(min_delta):
+            min_delta = delta
+
+    return count, width, start_x + math.fmod(min_delta, width / 2)
+
+
+def _bin2d_parameters(data_range, bins, binwidth):
+    """
+    Returns the bin count, the bin width, the start and the span of the bins along one axis.
+    See Bin2dStat.apply()
+    """
+    lower, upper = data_range
+    if _is_beyond_precision(lower, upper):
+        _, width = _bin_count_and_width(1.0, bins, binwidth)
+        lower, upper = lower - 0.5, upper + 0.5
+    else:
+        _, width = _bin_count_and_width(upper - lower, bins, binwidth)
+        lower, upper = lower - width / 2, upper + width / 2
+    count, width = _bin_count_and_width(upper - lower, bins, binwidth)
+    return count, width, lower, upper - lower
+
+
+def _is_beyond_precision(lower, upper) -> bool:
+    # SeriesUtil.isBeyondPrecision()
+    delta = upper - lower
+    if delta < _TINY:
+        return True
+    return any(base > 0 and math.log10(base) - math.log10(delta) > _MAX_DECIMAL_PLACES for base in (lower, upper))
+
+
+class _Groups:
+    """
+    Groups of rows of chunked data and the summaries of the variables the stat doesn't compute.
+    Groups are numbered in the order of their first appearance in the data.
+    """
+
+    def __init__(self, summarized_count):
+        self._group_ids = {}  # key values -> group id
+        self._group_count = 0
+        # Sums and sizes of numeric summarized variables, first non-null values of other ones.
+        self._sums = [numpy.zeros(0) for _ in range(summarized_count)]
+        self._sizes = [numpy.zeros(0) for _ in range(summarized_count)]
+        self._firsts = [[] for _ in range(summarized_count)]
+        self._numeric = [True] * summarized_count
+
+    def index(self, columns, arrays, size):
+        groups, group_count = _group_index(columns, arrays, size)
+        group_ids = numpy.array([
+            self._group_ids.setdefault(tuple(_key_value(array[row]) for array in arrays), len(self._group_ids))
+            for row in _first_rows(groups, group_count)
+        ], dtype=numpy.int64)
+
+        grow = len(self._group_ids) - self._group_count
+        if grow > 0:
+            self._grow(grow)
+            self._group_count += grow
+        return group_ids[groups]
+
+    def _grow(self, grow):
+        self._sums = [numpy.concatenate([sums, numpy.zeros(grow)]) for sums in self._sums]
+        self._sizes = [numpy.concatenate([sizes, numpy.zeros(grow)]) for sizes in self._sizes]
+        for firsts in self._firsts:
+            firsts.extend([None] * grow)
+
+    def summarize(self, groups, summarized_columns):
+        for i, column in enumerate(summarized_columns):
+            self._summarize(i, column, groups)
+
+    def _summarize(self, i, column, groups):
+        # See _summarize(): the mean is used if the variable is numeric in all chunks.
+        values = _as_float(column)
+        if values is None:
+            self._numeric[i] = False
+            not_null = numpy.array([not _is_null(v) for v in column], dtype=bool)
+        else:
+            not_null = ~numpy.isnan(values)
+            self._sums[i] += numpy.bincount(groups[not_null], weights=values[not_null], minlength=self._group_count)
+            self._sizes[i] += numpy.bincount(groups[not_null], minlength=self._group_count)
+
+        rows = numpy.flatnonzero(not_null)
+        group_ids, first = numpy.unique(groups[rows], return_index=True)
+        firsts = self._firsts[i]
+        for group, row in zip(group_ids, rows[first]):
+            if firsts[group] is None:
+                firsts[group] = column[row]
+
+    def put_groups(self, table: Dict, groups, keys: List, summarized: List):
+        # Adds the key and summarized variables of the given groups to the table.
+        key_values = list(self._group_ids)
+        for i, var in enumerate(keys):
+            table[var] = [key_values[group][i] for group in groups]
+        for i, var in enumerate(summarized):
+            if not self._numeric[i]:
+                values = self._firsts[i]
+            else:
+                with numpy.errstate(invalid='ignore', divide='ignore'):
+                    means = self._sums[i] / self._sizes[i]
+                values = [None if math.isnan(v) else float(v) for v in means]
+            table[var] = [values[group] for group in groups]
+
+
+class _Bins2d(_Groups):
+    """
+    Weighted counts of 2d bins in each group, accumulated chunk by chunk.
+    """
+
+    def __init__(self, count_x, width_x, start_x, count_y, width_y, start_y, summarized_count):
+        super().__init__(summarized_count)
+        self._count_x, self._width_x, self._start_x = count_x, width_x, start_x
+        self._count_y, self._width_y, self._start_y = count_y, width_y, start_y
+        self._counts = numpy.zeros((0, count_x * count_y))
+        self._totals = numpy.zeros(0)
+
+    def _grow(self, grow):
+        super()._grow(grow)
+        self._counts = numpy.concatenate([self._counts, numpy.zeros((grow, self._counts.shape[1]))])
+        self._totals = numpy.concatenate([self._totals, numpy.zeros(grow)])
+
+    def add(self, groups, x, y, weights, summarized_columns):
+        # Bin2dStat.computeBins()
+        group_count = self._group_count
+        self.summarize(groups, summarized_columns)
+
+        finite = numpy.isfinite(x) & numpy.isfinite(y)
+        if not finite.all():
+            x, y, groups = x[finite], y[finite], groups[finite]
+            weights = None if weights is None else weights[finite]
+        if weights is not None:
+            weights = numpy.where(numpy.isfinite(weights), weights, 0.0)
+
+        self._totals += numpy.bincount(groups, weights=weights, minlength=group_count)
+        index_x = numpy.floor((x - self._start_x) / self._width_x)
+        index_y = numpy.floor((y - self._start_y) / self._width_y)
+        in_bins = (index_x >= 0) & (index_x < self._count_x) & (index_y >= 0) & (index_y < self._count_y)
+        flat_index = (groups * self._count_x + index_x.astype(numpy.int64)) * self._count_y
+        flat_index += index_y.astype(numpy.int64)
+        if not in_bins.all():
+            flat_index = flat_index[in_bins]
+            weights = None if weights is None else weights[in_bins]
+        bin_count = self._counts.shape[1]
+        self._counts += numpy.bincount(flat_index, weights=weights, minlength=group_count * bin_count) \
+            .reshape(group_count, bin_count)
+
+    def table(self, x_var, y_var, keys, summarized, density_factor, drop) -> Dict:
+        group_count, bin_count = self._counts.shape
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            densities = self._counts / self._totals[:, None] * density_factor
+        counts = self._counts.reshape(-1)
+        densities = densities.reshape(-1)
+        groups = numpy.repeat(numpy.arange(group_count), bin_count)
+        bin_index = numpy.tile(numpy.arange(bin_count), group_count)
+        if drop:
+            nonzero = counts != 0
+            counts, densities = counts[nonzero], densities[nonzero]
+            groups, bin_index = groups[nonzero], bin_index[nonzero]
+
+        index_x, index_y = numpy.divmod(bin_index, self._count_y)
+        table = {
+            x_var: self._start_x + self._width_x / 2 + index_x * self._width_x,
+            y_var: self._start_y + self._width_y / 2 + index_y * self._width_y,
+            'count': counts,
+            'density': densities,
+        }
+        self.put_groups(table, groups, keys, summarized)
+        return table
+
+
+class _Raster(_Groups):
+    """
+    Point counts (and sums of values) of the pixels in each group, accumulated chunk by chunk.
+    The pixels split the x- and y-range into equal parts, the upper ends of the ranges are in the last pixels.
+    Only non-empty pixels are stored: the number of groups times the number of pixels can be huge.
+    """
+
+    def __init__(self, count_x, x_range, count_y, y_range, with_values):
+        super().__init__(0)
+        self._count_x, self._count_y = count_x, count_y
+        self._start_x, self._width_x = self._start_and_width(x_range, count_x)
+        self._start_y, self._width_y = self._start_and_width(y_range, count_y)
+        # Sorted flat indices (group * pixel count + pixel) of the non-empty pixels of the groups.
+        self._pixels = numpy.zeros(0, dtype=numpy.int64)
+        self._counts = numpy.zeros(0)
+        self._value_sums = numpy.zeros(0) if with_values else None
+
+    @staticmethod
+    def _start_and_width(data_range, count):
+        lower, upper = data_range
+        if upper > lower:
+            return lower, (upper - lower) / count
+        # All values are in the first pixel.
+        return lower - 0.5, 1.0
+
+    def add(self, groups, x, y, values):
+        finite = numpy.isfinite(x) & numpy.isfinite(y)
+        if values is not None:
+            finite &= numpy.isfinite(values)
+        if not finite.all():
+            x, y, groups = x[finite], y[finite], groups[finite]
+            values = None if values is None else values[finite]
+
+        index_x = numpy.clip(numpy.floor((x - self._start_x) / self._width_x), 0, self._count_x - 1)
+        index_y = numpy.clip(numpy.floor((y - self._start_y) / self._width_y), 0, self._count_y - 1)
+        flat_index = (groups * self._count_x + index_x.astype(numpy.int64)) * self._count_y
+        flat_index += index_y.astype(numpy.int64)
+
+        # Merges the pixels of the chunk into the stored ones.
+        pixels, inverse = numpy.unique(numpy.concatenate([self._pixels, flat_index]), return_inverse=True)
+        stored, added = inverse[:len(self._pixels)], inverse[len(self._pixels):]
+        self._counts = numpy.bincount(stored, weights=self._counts, minlength=len(pixels)) \
+            + numpy.bincount(added, minlength=len(pixels))
+        if values is not None:
+            self._value_sums = numpy.bincount(stored, weights=self._value_sums, minlength=len(pixels)) \
+                + numpy.bincount(added, weights=values, minlength=len(pixels))
+        self._pixels = pixels
+
+    def table(self, x_var, y_var, keys, value_var) -> Dict:
+        # Non-empty pixels of each group.
+        groups, pixels = numpy.divmod(self._pixels, self._count_x * self._count_y)
+        table = self._pixel_table(x_var, y_var, pixels, self._counts)
+        if value_var is not None:
+            table[value_var] = self._value_sums / self._counts
+        self.put_groups(table, groups, keys, [])
+        return table
+
+    def categories_table(self, x_var, y_var, keys, category_var) -> Dict:
+        # Groups differing only by the category are merged:
+        # a pixel gets the category having the most points (the first one of equal counts).
+        i = keys.index(category_var)
+        merged_ids = {}
+        merged = numpy.array([merged_ids.setdefault(key[:i] + key[i + 1:], len(merged_ids))
+                              for key in self._group_ids], dtype=numpy.int64)
+        pixel_count = self._count_x * self._count_y
+        groups, pixels = numpy.divmod(self._pixels, pixel_count)
+        merged_pixels = merged[groups] * pixel_count + pixels
+
+        # By the merged pixel, then the most points first.
+        order = numpy.lexsort((groups, -self._counts, merged_pixels))
+        merged_pixels, groups, counts = merged_pixels[order], groups[order], self._counts[order]
+        starts = numpy.flatnonzero(numpy.diff(merged_pixels, prepend=-1))
+        totals = numpy.add.reduceat(counts, starts) if len(starts) > 0 else counts
+        table = self._pixel_table(x_var, y_var, merged_pixels[starts] % pixel_count, totals)
+        self.put_groups(table, groups[starts], keys, [])
+        return table
+
+    def _pixel_table(self, x_var, y_var, pixels, counts) -> Dict:
+        index_x, index_y = numpy.divmod(pixels, self._count_y)
+        return {
+            x_var: self._start_x + self._width_x / 2 + index_x * self._width_x,
+            y_var: self._start_y + self._width_y / 2 + index_y * self._width_y,
+            'count': counts,
+        }
+
+
+class _Summaries(_Groups):
+    """
+    Aggregates of y-values in cells (an x-value or an x-bin of a group), accumulated chunk by chunk.
+    Count, sum, min and max are exact. For quantiles the values are kept until a cell gets more than _SKETCH_SIZE
+    of them: then they are passed to a `_QuantileSketch` of the cell (in portions of more than _SKETCH_SIZE values).
+    """
+
+    def __init__(self, summarized_count, with_quantiles):
+        super().__init__(summarized_count)
+        self._cell_ids = {}  # (group id, x-value or bin index) -> cell id
+        self._cell_groups = numpy.zeros(0, dtype=numpy.int64)
+        self._counts = numpy.zeros(0)
+        self._sums_y = numpy.zeros(0)
+        self._min = numpy.zeros(0)
+        self._max = numpy.zeros(0)
+        self._with_quantiles = with_quantiles
+        self._value_cells = []  # chunks of the cells of the values not passed to a sketch yet
+        self._values = []  # chunks of the values not passed to a sketch yet
+        self._value_counts = numpy.zeros(0, dtype=numpy.int64)  # number of the values of each cell
+        self._sketches = {}  # cell -> _QuantileSketch
+        self._random = numpy.random.default_rng(0)  # shared by the sketches
+
+    def add(self, groups, cells, y):
+        """
+        `cells` are x-values or bin indices of the rows; rows with non-finite y or x are skipped by the caller.
+        """
+        local_cells, local_count = _group_index([groups, cells], [groups, cells], len(groups))
+        first_rows = _first_rows(local_cells, local_count)
+        cell_ids = numpy.array([
+            self._cell_ids.setdefault((int(groups[row]), _key_value(cells[row])), len(self._cell_ids))
+            for row in first_rows
+        ], dtype=numpy.int64)
+
+        grow = len(self._cell_ids) - len(self._counts)
+        if grow > 0:
+            new_cells = cell_ids >= len(self._counts)
+            cell_groups = numpy.empty(grow, dtype=numpy.int64)
+            cell_groups[cell_ids[new_cells] - len(self._counts)] = groups[first_rows[new_cells]]
+            self._cell_groups = numpy.concatenate([self._cell_groups, cell_groups])
+            self._counts = numpy.concatenate([self._counts, numpy.zeros(grow)])
+            self._sums_y = numpy.concatenate([self._sums_y, numpy.zeros(grow)])
+            self._min = numpy.concatenate([self._min, numpy.full(grow, numpy.inf)])
+            self._max = numpy.concatenate([self._max, numpy.full(grow, -numpy.inf)])
+            self._value_counts = numpy.concatenate([self._value_counts, numpy.zeros(grow, dtype=numpy.int64)])
+
+        cells = cell_ids[local_cells]
+        cell_count = len(self._counts)
+        self._counts += numpy.bincount(cells, minlength=cell_count)
+        self._sums_y += numpy.bincount(cells, weights=y, minlength=cell_count)
+        numpy.minimum.at(self._min, cells, y)
+        numpy.maximum.at(self._max, cells, y)
+        if self._with_quantiles:
+            self._value_cells.append(cells)
+            self._values.append(y)
+            self._value_counts += numpy.bincount(cells, minlength=cell_count)
+            self._update_sketches(self._value_counts > _SKETCH_SIZE)
+
+    def _update_sketches(self, cell_mask):
+        # Passes the kept values of the cells to their sketches.
+        if not cell_mask.any():
+            return
+        cells = numpy.concatenate(self._value_cells)
+        values = numpy.concatenate(self._values)
+        passed = cell_mask[cells]
+        self._value_cells, self._values = [cells[~passed]], [values[~passed]]
+        self._value_counts[cell_mask] = 0
+
+        cells, values = cells[passed], values[passed]
+        order = numpy.argsort(cells, kind='stable')
+        cells, values = cells[order], values[order]
+        starts = numpy.flatnonzero(numpy.diff(cells, prepend=-1))
+        for cell, cell_values in zip(cells[starts], numpy.split(values, starts[1:])):
+            sketch = self._sketches.get(cell)
+            if sketch is None:
+                sketch = self._sketches[cell] = _QuantileSketch(self._random)
+            sketch.update(cell_values)
+
+    def _quantiles(self, p):
+        # Exact quantiles of the cells without a sketch (see AggregateFunctions.quantile()), estimated otherwise.
+        sketched = numpy.zeros(len(self._counts), dtype=bool)
+        sketched[list(self._sketches.keys())] = True
+        self._update_sketches(sketched & (self._value_counts > 0))
+
+        cells = numpy.concatenate([numpy.zeros(0, dtype=numpy.int64)] + self._value_cells)
+        values = numpy.concatenate([numpy.zeros(0)] + self._values)
+        order = numpy.lexsort((values, cells))
+        values = values[order]
+        counts = numpy.bincount(cells, minlength=len(self._counts))
+        starts = numpy.cumsum(counts) - counts
+        exact = counts > 0
+        place = p * (counts[exact] - 1)
+        lower = starts[exact] + numpy.floor(place).astype(numpy.int64)
+        upper = starts[exact] + numpy.ceil(place).astype(numpy.int64)
+        result = numpy.full(len(self._counts), numpy.nan)
+        result[exact] = numpy.where(lower == upper, values[lower], (values[lower] + values[upper]) / 2.0)
+        for cell, sketch in self._sketches.items():
+            result[cell] = sketch.quantile(p)
+        return result
+
+    def cells(self):
+        # Cells grouped by group, in the order of their first appearance in each group (see SummaryStat).
+        # Returns the groups, the cells and the x-values of the cells.
+        cells = numpy.argsort(self._cell_groups, kind='stable')
+        x = numpy.array([key[1] for key in self._cell_ids], dtype=float)
+        return self._cell_groups[cells], cells, x[cells]
+
+    def bins(self, bin_count):
+        # All bins of each group, -1 for bins without values (see BinStatUtil.computeSummaryBins()).
+        cells = numpy.full((self._group_count, bin_count), -1, dtype=numpy.int64)
+        for (group, bin_index), cell in self._cell_ids.items():
+            cells[group, bin_index] = cell
+        return numpy.repeat(numpy.arange(self._group_count), bin_count), cells.reshape(-1)
+
+    def aggregate(self, function, cells):
+        """
+        Computes the aggregate function ('count', 'sum', ..., or a quantile probability) in the cells (-1: no values).
+        See AggregateFunctions
+        """
+        values = {
+            'count': self._counts,
+            'sum': self._sums_y,
+            'min': self._min,
+            'max': self._max,
+        }.get(function)
+        if values is None and function == 'mean':
+            with numpy.errstate(invalid='ignore', divide='ignore'):
+                values = self._sums_y / self._counts
+        elif values is None:
+            values = self._quantiles(function)
+        elif function != 'count':
+            values = numpy.where(self._counts > 0, values, numpy.nan)
+        # The last value is used for cells without values.
+        return numpy.append(values, 0.0 if function == 'count' else numpy.nan)[cells]
+
+
+class _QuantileSketch:
+    """
+    A KLL sketch: estimates quantiles of a stream of values in bounded memory (about 3 * _SKETCH_SIZE values).
+    Quantiles are exact while the sketch has received no more than _SKETCH_SIZE values.
+    """
+
+    def __init__(self, random):
+        self._levels = [numpy.zeros(0)]  # a value at level i stands for 2^i values
+        self._random = random
+
+    def update(self, values):
+        self._levels[0] = numpy.concatenate([self._levels[0], values])
+        level = 0
+        while level < len(self._levels):
+            values = self._levels[level]
+            if len(values) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(numpy.zeros(0))
+                # Keep every other value (of the sorted ones) with the double weight, from a random offset.
+                values = numpy.sort(values)
+                odd = len(values) % 2
+                self._levels[level + 1] = numpy.concatenate([
+                    self._levels[level + 1], values[odd + self._random.integers(2)::2]
+                ])
+                self._levels[level] = values[:odd]
+            level += 1
+
+    def _capacity(self, level):
+        return max(_SKETCH_MIN_CAPACITY, int(_SKETCH_SIZE * (2 / 3) ** (len(self._levels) - level - 1)))
+
+    def quantile(self, p):
+        # AggregateFunctions.quantile() over the values with their weights.
+        values = numpy.concatenate(self._levels)
+        if len(values) == 0:
+            return numpy.nan
+        weights = numpy.concatenate([numpy.full(len(v), 2 ** i, dtype=numpy.int64)
+                                     for i, v in enumerate(self._levels)])
+        order = numpy.argsort(values, kind='stable')
+        values, ranks = values[order], numpy.cumsum(weights[order])
+
+        def value_at(rank):
+            return values[numpy.searchsorted(ranks, rank, side='right')]
+
+        place = p * (ranks[-1] - 1)
+        if place == round(place):
+            return float(value_at(int(place)))
+        return float((value_at(math.ceil(place)) + value_at(math.floor(place))) / 2.0)
+
+
+def _histogram(x, weights, groups, group_count, x_range, bin_count, bin_width, start_x):
+    # BinStatUtil.computeHistogramBins()
+    finite = numpy.isfinite(x)
+    if not finite.all():
+        x, groups = x[finite], groups[finite]
+        weights = None if weights is None else weights[finite]
+    if weights is not None:
+        weights = numpy.where(numpy.isfinite(weights), weights, 0.0)
+
+    if bin_width > 0:
+        bin_index = numpy.floor((x - start_x) / bin_width)
+    else:
+        bin_index = numpy.zeros(len(x))
+
+    total = numpy.bincount(groups, weights=weights, minlength=group_count)
+    in_bins = (bin_index >= 0) & (bin_index < bin_count)
+    flat_index = bin_index.astype(numpy.int64)
+    flat_index += groups * bin_count
+    if not in_bins.all():
+        flat_index = flat_index[in_bins]
+        weights = None if weights is None else weights[in_bins]
+    counts = numpy.bincount(flat_index, weights=weights, minlength=group_count * bin_count).astype(float)
+
+    # Groups without finite x produce no bins.
+    nonempty_groups = numpy.flatnonzero(numpy.bincount(groups, minlength=group_count))
+    counts = counts.reshape(group_count, bin_count)[nonempty_groups]
+
+    normal_bin_width = (x_range[1] - x_range[0]) / bin_count
+    density_factor = 1.0 / normal_bin_width if normal_bin_width > 0 else 1.0
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        densities = counts / total[nonempty_groups, None] * density_factor
+
+    x0 = start_x + bin_width / 2
+    bin_x = x0 + numpy.arange(bin_count) * bin_width
+    return nonempty_groups, (numpy.tile(bin_x, len(nonempty_groups)), counts.reshape(-1), densities.reshape(-1))
+
+
+def _summarize(column, groups, group_ids) -> List:
+    # Variables without a stat are replaced by the mean (numeric) or the first non-null value in each group.
+    # See DataProcessing.applyStat()
+    values = _as_float(column)
+    result = []
+    for group_id in group_ids:
+        if values is not None:
+            group_values = values[groups == group_id]
+            group_values = group_values[~numpy.isnan(group_values)]
+            result.append(float(numpy.mean(group_values)) if len(group_values) > 0 else None)
+        else:
+            result.append(next((v for v in column[groups == group_id] if not _is_null(v)), None))
+    return result
+
+
+def _first_rows(groups, group_count):
+    # The index of the first row of each group.
+    first_rows = numpy.empty(group_count, dtype=numpy.int64)
+    first_rows[groups[::-1]] = numpy.arange(len(groups) - 1, -1, -1)
+    return first_rows
+
+
+def _group_index(columns, arrays, size):
+    """
+    Returns the group index of every row and the number of groups.
+    Groups are numbered in the order of their first appearance in the data.
+    """
+    if not columns:
+        return numpy.zeros(size, dtype=numpy.int64), 1
+
+    groups = None
+    for column, array in zip(columns, arrays):
+        # pandas factorizes categorical series by their codes: much faster than their values.
+        codes, count = _factorize(column if pandas is not None and isinstance(column, pandas.Series) else array)
+        groups = codes if groups is None else groups * count + codes
+    return (groups, count) if len(columns) == 1 else _factorize(groups)
+
+
+def _factorize(values):
+    if pandas is not None:
+        codes, uniques = pandas.factorize(values, use_na_sentinel=False)
+        return codes.astype(numpy.int64, copy=False), len(uniques)
+
+    index = {}
+    codes = numpy.fromiter((index.setdefault(v, len(index)) for v in values.tolist()), dtype=numpy.int64,
+                           count=len(values))
+    return codes, len(index)
+
+
+def _overall_range(plot_spec: Dict, aes: str):
+    # The range of values of the positional aesthetic in all layers, see ConfiguredStatContext.
+    lower, upper = math.inf, -math.inf
+    for layer in plot_spec.get('layers', []):
+        var = _layer_mapping(plot_spec, layer).get(aes)
+        if not isinstance(var, str):
+            continue
+        for chunk in _chunks(_layer_data(plot_spec, layer)):
+            values = _as_float(_column(chunk, var))
+            if values is None:
+                return None
+            values = values[numpy.isfinite(values)]
+            if len(values) > 0:
+                lower, upper = min(lower, values.min()), max(upper, values.max())
+
+    return (float(lower), float(upper)) if lower <= upper else None
+
+
+def _has_scale_transform(plot_spec: Dict, aes: str) -> bool:
+    return any(
+        scale.get('aesthetic') == aes and any(scale.get(option) is not None for option in ['trans', 'limits'])
+        or scale.get('aesthetic') == aes and scale.get('discrete')
+        for scale in plot_spec.get('scales', [])
+    )
+
+
+def _layer_data(plot_spec: Dict, layer: Dict):
+    return layer['data'] if 'data' in layer else plot_spec.get('data')
+
+
+def _is_chunked(data) -> bool:
+    # An iterable of data frames or a pyarrow dataset (see _chunks()).
+    if _is_arrow_dataset(data):
+        return True
+    return data is not None and isinstance(data, Iterable) and not isinstance(data, (dict, str)) \
+        and not is_data_frame(data) and not is_polars_dataframe(data) and not is_arrow_table(data)
+
+
+def _is_arrow_dataset(data) -> bool:
+    # A dataset can only exist if pyarrow.dataset is already imported: don't import it otherwise.
+    dataset = sys.modules.get('pyarrow.dataset')
+    return dataset is not None and isinstance(data, dataset.Dataset)
+
+
+class _DatasetBatches:
+    # Record batches of a pyarrow dataset, read anew on each iteration.
+    def __init__(self, dataset):
+        self._dataset = dataset
+
+    def __iter__(self):
+        return iter(self._dataset.to_batches())
+
+
+def _chunks(data) -> Iterable:
+    if _is_arrow_dataset(data):
+        return _DatasetBatches(data)
+    if not _is_chunked(data):
+        return [data]
+    if iter(data) is data:
+        raise ValueError("Chunked data is read more than once: "
+                         "a collection or a re-iterable object is expected but was {}.".format(type(data).__name__))
+    return data
+
+
+def _layer_mapping(plot_spec: Dict, layer: Dict) -> Dict:
+    mapping = dict(plot_spec.get('mapping') or {})
+    mapping.update(layer.get('mapping') or {})
+    return mapping
+
+
+def _layer_data_meta(plot_spec: Dict, layer: Dict, table: Dict, renames: Dict) -> Dict:
+    data_meta = dict(layer.get('data_meta') or {})
+    if 'series_annotations' in data_meta:
+        data_meta['series_annotations'] = [
+            annotation for annotation in data_meta['series_annotations'] if annotation.get('column') in table
+        ]
+
+    # Annotations of the plot mapping may refer to the computed variables as well.
+    layer_aes = {annotation.get('aes') for annotation in data_meta.get('mapping_annotations', [])}
+    inherited = [
+        annotation for annotation in (plot_spec.get('data_meta') or {}).get('mapping_annotations', [])
+        if annotation.get('aes') not in layer_aes and annotation.get('aes') not in (layer.get('mapping') or {})
+    ]
+    if any(_STAT_VAR_RE.search(str(annotation.get('parameters'))) for annotation in inherited):
+        data_meta['mapping_annotations'] = data_meta.get('mapping_annotations', []) + _rename_variables(
+            inherited, renames
+        )
+    return {k: v for k, v in data_meta.items() if v}
+
+
+def _rename_variables(spec, renames: Dict):
+    # Replaces references to the computed variables in mappings, tooltips, labels and `as_discrete()` parameters.
+    if isinstance(spec, str):
+        for old, new in renames.items():
+            if old in spec:
+                spec = spec.replace(old, new) if spec != old else new
+        return spec
+    if isinstance(spec, dict):
+        return {k: v if k == 'data' else _rename_variables(v, renames) for k, v in spec.items()}
+    if isinstance(spec, list):
+        return [_rename_variables(v, renames) for v in spec]
+    return spec
+
+
+def _is_discrete(plot_spec: Dict, layer: Dict, aes: str, var: str, column) -> bool:
+    annotations = list((layer.get('data_meta') or {}).get('mapping_annotations', []))
+    if aes not in (layer.get('mapping') or {}):
+        annotations += (plot_spec.get('data_meta') or {}).get('mapping_annotations', [])
+    if any(a.get('aes') == aes and a.get('annotation') == 'as_discrete' for a in annotations):
+        return True
+    return column is not None and _as_float(column) is None
+
+
+def _is_datetime(plot_spec: Dict, layer: Dict, var: str) -> bool:
+    annotations = list((layer.get('data_meta') or {}).get('series_annotations', []))
+    if 'data' not in layer:
+        annotations += (plot_spec.get('data_meta') or {}).get('series_annotations', [])
+    return any(a.get('column') == var and a.get('type') == 'datetime' for a in annotations)
+
+
+def _column(data, name):
+    if isinstance(data, dict):
+        return data.get(name)
+    if is_data_frame(data) or is_polars_dataframe(data):
+        return data[name] if name in data.columns else None
+    if is_arrow_table(data):
+        return data.column(name) if name in data.schema.names else None
+    return None
+
+
+def _to_numpy(values):
+    if values is None:
+        return None
+    if pandas is not None and isinstance(values, pandas.Series):
+        if pandas.api.types.is_numeric_dtype(values.dtype) and not pandas.api.types.is_bool_dtype(values.dtype):
+            return values.to_numpy(dtype=float, na_value=numpy.nan)
+        return values.to_numpy()
+    if hasattr(values, 'to_numpy'):
+        # polars.Series, pyarrow.Array
+        try:
+            return values.to_numpy(zero_copy_only=False)
+        except TypeError:
+            return values.to_numpy()
+    return numpy.asarray(values)
+
+
+def _as_float(values):
+    """
+    Returns the values as a float array if they are numeric, None otherwise.
+    """
+    array = _to_numpy(values)
+    if array is None or array.ndim != 1:
+        return None
+    if array.dtype.kind in 'iuf':
+        return array.astype(float, copy=False)
+    if array.dtype.kind == 'O' and all(
+            v is None or isinstance(v, (int, float, numpy.number)) and not isinstance(v, (bool, numpy.bool_))
+            for v in array):
+        return numpy.array([numpy.nan if v is None else v for v in array], dtype=float)
+    return None
+
+
+def _pair(value):
+    # A number or a pair of numbers, see OptionsAccessor.getNumPairDef()
+    if isinstance(value, (list, tuple)):
+        return (value[0] if len(value) > 0 else None), (value[1] if len(value) > 1 else None)
+    return value, value
+
+
+def _key_value(value):
+    # Key values of different chunks must be equal and hashable: numpy scalars become Python values.
+    if isinstance(value, numpy.generic):
+        value = value.item()
+    return None if _is_null(value) else value
+
+
+def _is_null_array(values):
+    if pandas is not None:
+        return numpy.asarray(pandas.isna(values), dtype=bool)
+    return numpy.array([_is_null(v) for v in values], dtype=bool)
+
+
+def _is_null(value) -> bool:
+    return value is None or isinstance(value, float) and math.isnan(value)
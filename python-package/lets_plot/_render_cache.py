@@ -0,0 +1,191 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import io
+import os
+import random
+import re
+import string
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from ._fingerprint import new_digest, update_digest
+from ._version import __version__
+
+# Output id of the dynamic display HTML, see PlotHtmlHelper.getDynamicDisplayHtml()
+_OUTPUT_ID_RE = re.compile(r'<div id="([A-Za-z0-9]+)"></div>')
+
+# Output of a failed rendering (plain or in an SVG), see PlotReprGenerator
+_RENDER_ERROR_RE = re.compile(r'^(?:<svg [^>]*>\s*<text [^>]*>)?(\w+\(\) - Exception: [^<]*)')
+
+
+class RenderCache:
+    """
+    LRU cache of rendered plots (SVG, HTML) with byte-size eviction and an optional on-disk tier.
+    Keys are digests of the plot spec (or its fingerprint) combined with the output kind and options.
+    Output of failed renderings is not cached. The cache can be used from several threads.
+    """
+
+    def __init__(self, max_bytes: int, disk_path: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.disk_path = disk_path
+        self._lock = threading.Lock()  # guards the entries, the size and the counters
+        self._entries = OrderedDict()  # key -> text
+        self._size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if disk_path is not None and not os.path.exists(disk_path):
+            os.makedirs(disk_path)
+
+    def get_or_render(self, key: str, render: Callable[[], str]) -> str:
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return text
+
+        # Rendering (and disk access) is done outside of the lock.
+        text = self._read_disk(key)
+        if text is not None:
+            with self._lock:
+                self.hits += 1
+                self._put(key, text)
+            return text
+
+        text = render()
+        with self._lock:
+            self.misses += 1
+            if render_error(text) is not None:
+                return text
+            self._put(key, text)
+        self._write_disk(key, text)
+        return text
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'size_bytes': self._size_bytes,
+            }
+
+    def _put(self, key: str, text: str):
+        # Must be called with the lock held.
+        size = sys.getsizeof(text)
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            # Rendered by another thread meanwhile.
+            self._size_bytes -= sys.getsizeof(self._entries.pop(key))
+        self._entries[key] = text
+        self._size_bytes += size
+        while self._size_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size_bytes -= sys.getsizeof(evicted)
+            self.evictions += 1
+
+    def _disk_file(self, key: str) -> str:
+        return os.path.join(self.disk_path, key)
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        if self.disk_path is None or not os.path.exists(self._disk_file(key)):
+            return None
+
+        with io.open(self._disk_file(key), mode="r", encoding="utf-8") as f:
+            return f.read()
+
+    def _write_disk(self, key: str, text: str):
+        if self.disk_path is None:
+            return
+
+        # Write to a temp file first so that concurrent readers never see a partially written entry.
+        # Each writer has its own temp file: the same entry can be written by several threads or processes.
+        fd, tmp_file = tempfile.mkstemp(dir=self.disk_path, suffix='.tmp')
+        try:
+            with io.open(fd, mode="w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_file, self._disk_file(key))
+        except BaseException:
+            os.remove(tmp_file)
+            raise
+
+
+_cache: Optional[RenderCache] = None
+
+
+def setup_render_cache(enabled: bool, max_bytes: int, disk_path: Optional[str]):
+    global _cache
+    _cache = RenderCache(max_bytes, disk_path) if enabled else None
+
+
+def render_cache_stats() -> Dict:
+    if _cache is None:
+        return {'hits': 0, 'misses': 0, 'evictions': 0, 'entries': 0, 'size_bytes': 0}
+    return _cache.stats()
+
+
+def is_enabled() -> bool:
+    return _cache is not None
+
+
+def spec_fingerprint(spec) -> Optional[str]:
+    """
+    Returns the fingerprint of a `PlotSpec`, `SupPlotsSpec` or `GGBunch` to be used as a cache key,
+    or None if the render cache is disabled (to not waste time on hashing).
+    """
+    if _cache is None:
+        return None
+    return spec.fingerprint()
+
+
+def cached_render(kind: str, plot_spec_key, options: Tuple, render: Callable[[], str]) -> str:
+    """
+    Returns the cached result of `render()` if the render cache is enabled
+    and the same plot spec was already rendered to the same kind of output with the same options.
+
+    `plot_spec_key` is either the standardized plot spec dict or the fingerprint of the plot spec object.
+    """
+    if _cache is None:
+        return render()
+
+    key = _cache_key(kind, plot_spec_key, options)
+    text = _cache.get_or_render(key, render)
+    if kind == 'dynamic_html':
+        # Each displayed plot must have its own output element.
+        text = _renew_output_id(text)
+
+    return text
+
+
+def render_error(text: str) -> Optional[str]:
+    """
+    Returns the exception message if `text` is the output of a failed rendering rather than a plot, otherwise None.
+    """
+    match = _RENDER_ERROR_RE.match(text)
+    return None if match is None else match.group(1)
+
+
+def _cache_key(kind: str, plot_spec_key, options: Tuple) -> str:
+    h = new_digest()
+    # Entries of the disk tier rendered by another version are not used.
+    update_digest(h, (__version__, kind, options))
+    update_digest(h, plot_spec_key)
+    return h.hexdigest()
+
+
+def _renew_output_id(html: str) -> str:
+    match = _OUTPUT_ID_RE.search(html)
+    if match is None:
+        return html
+
+    new_id = ''.join(random.choice(string.ascii_letters + string.digits) for _ in range(6))
+    return html.replace('"{}"'.format(match.group(1)), '"{}"'.format(new_id))
@@ -0,0 +1,114 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+from typing import Dict, List
+
+from ._fingerprint import digest
+from ._type_utils import is_polars_dataframe, is_arrow_table
+from .plot.util import is_data_frame
+
+# See Option.Meta.SharedData
+SHARED_DATA = 'shared_data'
+DATA_REF = 'data_ref'
+
+
+def share_data(plot_spec: Dict) -> Dict:
+    """
+    Moves data used in several places of the figure (plot and layers, subplots, GGBunch items)
+    to the 'shared_data' table at the top level of the spec. The data is replaced by 'data_ref' ids.
+
+    Data objects are considered the same if they are the same object or have equal fingerprints.
+    Fingerprints are only computed for data with the same type, column names and length.
+
+    The plot spec (a result of `as_dict()`) is not modified: dicts on the way to the shared data are copied.
+    """
+    if SHARED_DATA in plot_spec:
+        return plot_spec
+
+    data_list = []
+    _collect_data(plot_spec, data_list)
+
+    usages = {}  # id(data) -> number of usages
+    by_signature = {}
+    for data in data_list:
+        if id(data) in usages:
+            usages[id(data)] += 1
+            continue
+        signature = _signature(data)
+        if signature is None:
+            continue
+        usages[id(data)] = 1
+        by_signature.setdefault(signature, []).append(data)
+
+    ids = {}  # id(data) -> shared data id
+    table = {}
+
+    for signature, same_signature in by_signature.items():
+        if len(same_signature) > 1:
+            by_digest = {}
+            for data in same_signature:
+                by_digest.setdefault(digest(data), []).append(data)
+            groups = list(by_digest.values())
+        else:
+            groups = [same_signature]
+
+        for group in groups:
+            if sum(usages[id(data)] for data in group) < 2:
+                continue
+            data_id = str(len(table))
+            table[data_id] = group[0]
+            for data in group:
+                ids[id(data)] = data_id
+
+    if not table:
+        return plot_spec
+
+    result = _replace_data(plot_spec, ids)
+    result[SHARED_DATA] = table
+    return result
+
+
+def _collect_data(spec, result: List):
+    if isinstance(spec, dict):
+        for key, value in spec.items():
+            if key == 'data':
+                result.append(value)
+            else:
+                _collect_data(value, result)
+    elif isinstance(spec, list):
+        for value in spec:
+            _collect_data(value, result)
+
+
+def _signature(data):
+    if isinstance(data, dict):
+        if not data:
+            return None
+        lengths = tuple(len(v) if hasattr(v, '__len__') and not isinstance(v, str) else -1 for v in data.values())
+        return dict, tuple(data.keys()), lengths
+    if is_data_frame(data):
+        return type(data), tuple(data.columns), len(data)
+    if is_polars_dataframe(data):
+        return type(data), tuple(data.columns), data.height
+    if is_arrow_table(data):
+        return type(data), tuple(data.schema.names), data.num_rows
+    return None
+
+
+def _replace_data(spec, ids: Dict):
+    if isinstance(spec, dict):
+        result = {}
+        for key, value in spec.items():
+            if key == 'data':
+                if id(value) in ids:
+                    result[DATA_REF] = ids[id(value)]
+                else:
+                    result[key] = value
+            elif isinstance(value, (dict, list)):
+                result[key] = _replace_data(value, ids)
+            else:
+                result[key] = value
+        return result
+    if isinstance(spec, list):
+        return [_replace_data(value, ids) for value in spec]
+    return spec
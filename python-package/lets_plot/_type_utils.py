@@ -4,9 +4,10 @@
 #
 import json
 import math
-from datetime import datetime
+import sys
+from datetime import datetime, date, timezone
 
-from typing import Dict
+from typing import Dict, Optional
 
 try:
     import numpy
@@ -31,10 +32,12 @@ except ImportError:
 
 
 # Parameter 'value' can also be pandas.DataFrame
-def standardize_dict(value: Dict) -> Dict:
+# With numeric_buffers=True numeric data columns are kept as contiguous numpy arrays
+# which the native Kotlin bridge reads through the Python buffer protocol.
+def standardize_dict(value: Dict, numeric_buffers: bool = False) -> Dict:
     result = {}
     for k, v in value.items():
-        result[_standardize_value(k)] = _standardize_value(v)
+        result[_standardize_value(k)] = _standardize_value(v, numeric_buffers)
 
     return result
 
@@ -43,6 +46,17 @@ def is_polars_dataframe(v):
     return polars and isinstance(v, polars.DataFrame)
 
 
+def is_arrow_table(v):
+    # An Arrow table can only exist if pyarrow is already imported: don't import it (slow) otherwise.
+    pyarrow = sys.modules.get('pyarrow')
+    return pyarrow is not None and isinstance(v, (pyarrow.Table, pyarrow.RecordBatch))
+
+
+def _is_arrow_array(v):
+    pyarrow = sys.modules.get('pyarrow')
+    return pyarrow is not None and isinstance(v, (pyarrow.Array, pyarrow.ChunkedArray))
+
+
 def is_dict_or_dataframe(v):
     return isinstance(v, dict) or (pandas and isinstance(v, pandas.DataFrame))
 
@@ -59,7 +73,7 @@ def is_number(v):
     return is_int(v) or is_float(v)
 
 
-def _standardize_value(v):
+def _standardize_value(v, numeric_buffers: bool = False):
     if v is None:
         return v
     if isinstance(v, bool):
@@ -75,23 +89,169 @@ def _standardize_value(v):
     if is_int(v):
         return float(v)
     if is_dict_or_dataframe(v):
-        return standardize_dict(v)
+        return standardize_dict(v, numeric_buffers)
     if is_polars_dataframe(v):
-        return standardize_dict(v.to_dict(as_series=False))
+        return {_standardize_value(s.name): _standardize_polars_series(s, numeric_buffers) for s in v.get_columns()}
+    if polars and isinstance(v, polars.Series):
+        return _standardize_polars_series(v, numeric_buffers)
+    if is_arrow_table(v):
+        return {_standardize_value(name): _standardize_arrow_array(column, numeric_buffers)
+                for name, column in zip(v.schema.names, v.columns)}
+    if _is_arrow_array(v):
+        return _standardize_arrow_array(v, numeric_buffers)
     if isinstance(v, list):
-        return [_standardize_value(elem) for elem in v]
+        return [_standardize_value(elem, numeric_buffers) for elem in v]
     if isinstance(v, tuple):
-        return tuple(_standardize_value(elem) for elem in v)
+        return tuple(_standardize_value(elem, numeric_buffers) for elem in v)
     if (numpy and isinstance(v, numpy.ndarray)) or (pandas and isinstance(v, pandas.Series)):
+        std_column = _standardize_column(v, numeric_buffers)
+        if std_column is not None:
+            return std_column
         return _standardize_value(v.tolist())
     if isinstance(v, datetime):
         if pandas and v is pandas.NaT:
             return None
         else:
             return v.timestamp() * 1000  # convert from second to millisecond
+    if isinstance(v, date):
+        # Dates (e.g. values of polars `Date` columns) are treated as UTC midnight.
+        return datetime(v.year, v.month, v.day, tzinfo=timezone.utc).timestamp() * 1000
     if shapely and isinstance(v, shapely.geometry.base.BaseGeometry):
         return json.dumps(shapely.geometry.mapping(v))
     try:
         return repr(v)
     except Exception:
         raise Exception('Unsupported type: {0}({1})'.format(v, type(v)))
+
+
+def _standardize_column(v, numeric_buffers: bool = False):
+    """
+    Columnar fast path for numpy arrays and pandas series.
+    Numeric, boolean, datetime and categorical columns are converted with bulk numpy operations.
+    Returns None if the column requires per-element standardization.
+
+    With numeric_buffers=True numeric, boolean and datetime columns are returned as
+    contiguous float64, int64 or bool numpy arrays (non-finite values mean "missing") instead of lists.
+    """
+    if pandas and isinstance(v, pandas.Series):
+        dtype = v.dtype
+        if isinstance(dtype, pandas.CategoricalDtype):
+            categories = _standardize_value(v.cat.categories.to_numpy())
+            return _standardize_categorical(categories, v.cat.codes.to_numpy())
+        if isinstance(dtype, pandas.DatetimeTZDtype):
+            v = v.dt.tz_convert('UTC').dt.tz_localize(None)
+        elif not isinstance(dtype, numpy.dtype):
+            return None  # pandas extension types (nullable integers etc.)
+
+        v = v.to_numpy()
+
+    if v.ndim != 1:
+        return None
+
+    kind = v.dtype.kind
+    if kind == 'b':
+        return numpy.ascontiguousarray(v) if numeric_buffers else v.tolist()
+    if kind in 'iu':
+        if numeric_buffers:
+            if v.dtype == numpy.int64:
+                return numpy.ascontiguousarray(v)
+            return numpy.ascontiguousarray(v, dtype=numpy.float64)
+        return v.astype(numpy.float64).tolist()
+    if kind == 'f':
+        values = v.astype(numpy.float64, copy=False)
+        if numeric_buffers:
+            return numpy.ascontiguousarray(values)
+        return _masked_to_list(values, ~numpy.isfinite(values))
+    if kind == 'M':
+        # Naive datetimes are treated as UTC, the same way pandas.Timestamp.timestamp() does.
+        millis = v.astype('datetime64[us]').view(numpy.int64) / 1000.0
+        if numeric_buffers:
+            millis[numpy.isnat(v)] = numpy.nan
+            return millis
+        return _masked_to_list(millis, numpy.isnat(v))
+
+    return None
+
+
+def _standardize_categorical(categories: list, codes) -> list:
+    # Standardize the (usually short) list of categories only, then expand it by codes.
+    # The code -1 (missing value) picks the trailing None.
+    lookup = numpy.empty(len(categories) + 1, dtype=object)
+    lookup[:-1] = categories
+    lookup[-1] = None
+    return lookup[codes].tolist()
+
+
+def _standardize_polars_series(s, numeric_buffers: bool = False):
+    if s.dtype == polars.Object:
+        return _standardize_value(s.to_list(), numeric_buffers)
+
+    # Zero-copy for most of the types.
+    return _standardize_arrow_array(s.to_arrow(), numeric_buffers)
+
+
+# Milliseconds per unit of Arrow timestamps.
+_ARROW_TIME_UNIT_MILLIS = {'s': 1000.0, 'ms': 1.0, 'us': 1e-3, 'ns': 1e-6}
+
+
+def _standardize_arrow_array(array, numeric_buffers: bool = False):
+    """
+    Converts pyarrow `Array` or `ChunkedArray` (also from polars) reading its buffers directly.
+    Nulls (validity bitmap) become None or NaN, dictionary-encoded columns are expanded from
+    the standardized dictionary, timestamps and dates are converted to UTC epoch milliseconds.
+    """
+    pyarrow = sys.modules['pyarrow']
+    types = pyarrow.types
+
+    if isinstance(array, pyarrow.ChunkedArray):
+        chunks = [_standardize_arrow_array(chunk, numeric_buffers) for chunk in array.chunks]
+        if len(chunks) == 1:
+            return chunks[0]
+        if chunks and all(isinstance(chunk, numpy.ndarray) for chunk in chunks):
+            return numpy.concatenate(chunks)
+        return [e for chunk in chunks for e in (chunk.tolist() if isinstance(chunk, numpy.ndarray) else chunk)]
+
+    arrow_type = array.type
+    if types.is_dictionary(arrow_type):
+        categories = _standardize_arrow_array(array.dictionary)
+        indices = array.indices
+        codes = indices.fill_null(0).to_numpy().astype(numpy.int64)
+        if indices.null_count > 0:
+            codes[indices.is_null().to_numpy(zero_copy_only=False)] = -1
+        return _standardize_categorical(categories, codes)
+    if types.is_string(arrow_type) or types.is_large_string(arrow_type):
+        return array.to_pylist()
+
+    if types.is_timestamp(arrow_type) or types.is_date(arrow_type):
+        if types.is_timestamp(arrow_type):
+            factor = _ARROW_TIME_UNIT_MILLIS[arrow_type.unit]
+            array = array.view(pyarrow.int64())
+        elif types.is_date32(arrow_type):
+            factor = 24 * 60 * 60 * 1000.0  # days
+            array = array.view(pyarrow.int32())
+        else:
+            factor = 1.0
+            array = array.view(pyarrow.int64())
+
+        # Integers with nulls are converted to floats with NaN.
+        millis = array.to_numpy(zero_copy_only=False).astype(numpy.float64) * factor
+        return millis if numeric_buffers else _masked_to_list(millis, numpy.isnan(millis))
+
+    if types.is_integer(arrow_type) or types.is_floating(arrow_type) or types.is_boolean(arrow_type):
+        values = array.to_numpy(zero_copy_only=False)
+        std_column = _standardize_column(values, numeric_buffers)
+        if std_column is not None:
+            return std_column
+
+    # Booleans with nulls, nested and other types.
+    return _standardize_value(array.to_pylist(), numeric_buffers)
+
+
+def _masked_to_list(values, mask) -> list:
+    if not mask.any():
+        return values.tolist()
+
+    # None for special values like 'nan' etc. (see _standardize_value())
+    result = values.astype(object)
+    result[mask] = None
+    return result.tolist()
@@ -2,5 +2,6 @@
 #  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
 
 from .ggsave_ import *
+from .simple import export_many
 
 __all__ = ggsave_.__all__
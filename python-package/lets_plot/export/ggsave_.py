@@ -3,14 +3,14 @@
 
 import os
 from os.path import join
-from typing import Union
+from typing import Union, Iterable, List
 
-from .simple import export_svg, export_html, export_png
+from .simple import export_svg, export_html, export_png, export_many
 from ..plot.core import PlotSpec
 from ..plot.plot import GGBunch
 from ..plot.subplots import SupPlotsSpec
 
-__all__ = ['ggsave']
+__all__ = ['ggsave', 'ggsave_many']
 
 _DEF_EXPORT_DIR = "lets-plot-images"
 
@@ -62,6 +62,86 @@ def ggsave(plot: Union[PlotSpec, SupPlotsSpec, GGBunch], filename: str, *, path:
     if not (isinstance(plot, PlotSpec) or isinstance(plot, SupPlotsSpec) or isinstance(plot, GGBunch)):
         raise ValueError("PlotSpec, SupPlotsSpec or GGBunch expected but was: {}".format(type(plot)))
 
+    filename = _check_filename(filename)
+    path = _export_dir(path)
+    pathname = join(path, filename)
+
+    ext = os.path.splitext(filename)[1][1:].lower()
+    if ext == 'svg':
+        return export_svg(plot, pathname)
+    elif ext in ['html', 'htm']:
+        return export_html(plot, pathname, iframe=iframe)
+    elif ext == 'png':
+        return export_png(plot, pathname, scale)
+    else:
+        raise ValueError(
+            "Unsupported file extension: '{}'\nPlease use one of: 'png', 'svg', 'html', 'htm'".format(ext)
+        )
+
+
+def ggsave_many(plots: Iterable[Union[PlotSpec, SupPlotsSpec, GGBunch]], filenames: Iterable[str], *,
+                path: str = None, iframe: bool = True, scale: float = 2.0,
+                batch_size: int = 64, processes: int = None) -> List[str]:
+    """
+    Export many plots or `bunches` to files.
+    Supported formats: PNG, SVG, HTML.
+
+    Unlike calling `ggsave()` in a loop, plots are rendered in batches (optionally in several processes)
+    which considerably reduces the per-plot overhead when exporting thousands of plots.
+    If a plot fails to render, `RuntimeError` is raised.
+
+    The exported files are created in directory ${user.dir}/lets-plot-images
+    if not specified otherwise (see the `path` parameter).
+
+    Parameters
+    ----------
+    plots : iterable of `PlotSpec`, `SupPlotsSpec` or `GGBunch`
+        Plot specifications to export.
+    filenames : iterable of str
+        The names of files, one per plot. Each must end with a file extension corresponding
+        to one of the supported formats: SVG, HTML (or HTM), PNG (requires CairoSVG library).
+    path : str
+        Path to a directory to save image files in.
+        By default it is ${user.dir}/lets-plot-images.
+    iframe : bool, default=True
+        Whether to wrap HTML page into a iFrame.
+        Only applicable when exporting to HTML.
+    scale : float, default=2.0
+        Scaling factor for raster output.
+        Only applicable when exporting to PNG.
+    batch_size : int, default=64
+        Number of plots rendered in one native call.
+    processes : int
+        Number of worker processes to render batches in.
+        By default batches are rendered in the current process.
+
+    Returns
+    -------
+    list of str
+        Absolute pathnames of created files.
+
+    Examples
+    --------
+    .. code-block::
+        :linenos:
+        :emphasize-lines: 6
+
+        from lets_plot import *
+        LetsPlot.setup_html()
+        plots = [ggplot() + geom_point(x=0, y=i) for i in range(100)]
+        filenames = ['plot_{}.svg'.format(i) for i in range(100)]
+        ggsave_many(plots, filenames, path='.')
+
+    """
+    path = _export_dir(path)
+    pathnames = (join(path, _check_filename(filename)) for filename in filenames)
+    if hasattr(filenames, '__len__'):
+        # Allows to check the number of filenames before exporting.
+        pathnames = list(pathnames)
+    return export_many(plots, pathnames, iframe=iframe, scale=scale, batch_size=batch_size, processes=processes)
+
+
+def _check_filename(filename: str) -> str:
     filename = filename.strip()
     name, ext = os.path.splitext(filename)
 
@@ -70,22 +150,14 @@ def ggsave(plot: Union[PlotSpec, SupPlotsSpec, GGBunch], filename: str, *, path:
     if not ext:
         raise ValueError("Missing file extension: '{}'.".format(filename))
 
+    return filename
+
+
+def _export_dir(path: str) -> str:
     if not path:
         path = join(os.getcwd(), _DEF_EXPORT_DIR)
 
     if not os.path.exists(path):
         os.makedirs(path)
 
-    pathname = join(path, filename)
-
-    ext = ext[1:].lower()
-    if ext == 'svg':
-        return export_svg(plot, pathname)
-    elif ext in ['html', 'htm']:
-        return export_html(plot, pathname, iframe=iframe)
-    elif ext == 'png':
-        return export_png(plot, pathname, scale)
-    else:
-        raise ValueError(
-            "Unsupported file extension: '{}'\nPlease use one of: 'png', 'svg', 'html', 'htm'".format(ext)
-        )
+    return path
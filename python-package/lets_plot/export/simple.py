@@ -2,8 +2,11 @@
 #  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
 
 import io
+import os
+from collections import deque
+from itertools import islice
 from os.path import abspath
-from typing import Union
+from typing import Union, Iterable, List
 
 from ..plot.core import PlotSpec
 from ..plot.plot import GGBunch
@@ -31,8 +34,9 @@ def export_svg(plot: Union[PlotSpec, SupPlotsSpec, GGBunch], filename: str) -> s
         raise ValueError("PlotSpec, SupPlotsSpec or GGBunch expected but was: {}".format(type(plot)))
 
     from .. import _kbridge as kbr
+    from .._render_cache import spec_fingerprint
 
-    svg = kbr._generate_svg(plot.as_dict())
+    svg = kbr._generate_svg(plot.as_dict(), fingerprint=spec_fingerprint(plot))
     with io.open(filename, mode="w", encoding="utf-8") as f:
         f.write(svg)
 
@@ -62,8 +66,9 @@ def export_html(plot: Union[PlotSpec, SupPlotsSpec, GGBunch], filename: str, ifr
         raise ValueError("PlotSpec, SupPlotsSpec or GGBunch expected but was: {}".format(type(plot)))
 
     from .. import _kbridge as kbr
+    from .._render_cache import spec_fingerprint
 
-    html_page = kbr._generate_static_html_page(plot.as_dict(), iframe)
+    html_page = kbr._generate_static_html_page(plot.as_dict(), iframe, fingerprint=spec_fingerprint(plot))
     with io.open(filename, mode="w", encoding="utf-8") as f:
         f.write(html_page)
 
@@ -112,9 +117,165 @@ def export_png(plot: Union[PlotSpec, SupPlotsSpec, GGBunch], filename: str, scal
         return None
 
     from .. import _kbridge
+    from .._render_cache import spec_fingerprint
     # Use SVG image-rendering style as Cairo doesn't support CSS image-rendering style,
-    svg = _kbridge._generate_svg(plot.as_dict(), use_css_pixelated_image_rendering=False)
+    svg = _kbridge._generate_svg(plot.as_dict(), use_css_pixelated_image_rendering=False,
+                                 fingerprint=spec_fingerprint(plot))
 
     cairosvg.svg2png(bytestring=svg, write_to=filename, scale=scale)
 
     return abspath(filename)
+
+
+def export_many(plots: Iterable[Union[PlotSpec, SupPlotsSpec, GGBunch]], filenames: Iterable[str], *,
+                iframe: bool = True, scale: float = 2.0, batch_size: int = 64, processes: int = None) -> List[str]:
+    """
+    Export many plots to files.
+    The format of each file (SVG, HTML or PNG) is defined by its extension.
+
+    Plots are rendered in batches: each batch crosses the Python - native code boundary once,
+    and files are written as soon as their batch is rendered.
+    If a plot fails to render, `RuntimeError` is raised and no file of its batch is written.
+
+    Parameters
+    ----------
+    plots : iterable of `PlotSpec`, `SupPlotsSpec` or `GGBunch` objects
+        Plot specifications to export.
+    filenames : iterable of str
+        Filenames to save plots under, one per plot.
+    iframe : bool, default=True
+        Whether to wrap HTML page into a iFrame.
+        Only applicable when exporting to HTML.
+    scale : float, default=2.0
+        Scaling factor for raster output.
+        Only applicable when exporting to PNG.
+    batch_size : int, default=64
+        Number of plots rendered in one native call.
+    processes : int
+        Number of worker processes to render batches in.
+        By default batches are rendered in the current process.
+
+    Returns
+    -------
+    list of str
+        Absolute pathnames of created files.
+
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive but was: {}".format(batch_size))
+    if hasattr(plots, '__len__') and hasattr(filenames, '__len__') and len(plots) != len(filenames):
+        raise ValueError("Number of filenames ({}) doesn't match number of plots ({}).".format(
+            len(filenames), len(plots)
+        ))
+
+    batches = _batches(_export_jobs(plots, filenames), batch_size)
+    if not processes:
+        return [pathname for batch in batches for pathname in _export_batch(batch, iframe, scale)]
+
+    from concurrent.futures import ProcessPoolExecutor
+    from .._global_settings import _settings
+
+    result = []
+    # Workers get the settings of this process (JS CDN URL, data encoding, etc.).
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(dict(_settings),)) as executor:
+        # Keep only a few batches in flight to not hold all the plots in memory at once.
+        pending = deque()
+        for batch in batches:
+            if len(pending) >= 2 * processes:
+                result.extend(pending.popleft().result())
+            pending.append(executor.submit(_export_batch, batch, iframe, scale))
+
+        while pending:
+            result.extend(pending.popleft().result())
+
+    return result
+
+
+def _export_jobs(plots, filenames):
+    filenames = iter(filenames)
+    for plot in plots:
+        if not (isinstance(plot, PlotSpec) or isinstance(plot, SupPlotsSpec) or isinstance(plot, GGBunch)):
+            raise ValueError("PlotSpec, SupPlotsSpec or GGBunch expected but was: {}".format(type(plot)))
+
+        filename = next(filenames, None)
+        if filename is None:
+            raise ValueError("Number of filenames is less than number of plots.")
+
+        ext = os.path.splitext(filename)[1][1:].lower()
+        if ext not in ['svg', 'html', 'htm', 'png']:
+            raise ValueError(
+                "Unsupported file extension: '{}'\nPlease use one of: 'png', 'svg', 'html', 'htm'".format(ext)
+            )
+
+        yield plot.as_dict(), filename, ext
+
+    if next(filenames, None) is not None:
+        raise ValueError("Number of filenames is greater than number of plots.")
+
+
+def _init_worker(settings):
+    from .._global_settings import _settings
+    _settings.update(settings)
+
+
+def _batches(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _export_batch(batch, iframe: bool, scale: float) -> List[str]:
+    from .. import _kbridge
+
+    svg_jobs = [job for job in batch if job[2] == 'svg']
+    png_jobs = [job for job in batch if job[2] == 'png']
+    html_jobs = [job for job in batch if job[2] in ['html', 'htm']]
+
+    content = {}
+    if svg_jobs:
+        svg_list = _kbridge._generate_svg_batch([spec for spec, _, _ in svg_jobs])
+        content.update(_checked(svg_jobs, svg_list))
+
+    if html_jobs:
+        html_list = _kbridge._generate_static_html_page_batch([spec for spec, _, _ in html_jobs], iframe)
+        content.update(_checked(html_jobs, html_list))
+
+    png_content = {}
+    if png_jobs:
+        import cairosvg
+
+        # Use SVG image-rendering style as Cairo doesn't support CSS image-rendering style,
+        svg_list = _kbridge._generate_svg_batch([spec for spec, _, _ in png_jobs],
+                                                use_css_pixelated_image_rendering=False)
+        png_content.update(_checked(png_jobs, svg_list))
+
+    for filename, text in content.items():
+        with io.open(filename, mode="w", encoding="utf-8") as f:
+            f.write(text)
+
+    for filename, svg in png_content.items():
+        cairosvg.svg2png(bytestring=svg, write_to=filename, scale=scale)
+
+    return [abspath(filename) for _, filename, _ in batch]
+
+
+def _checked(jobs, texts: List[str]):
+    """
+    Returns (filename, text) pairs of the rendered jobs.
+    Raises `RuntimeError` if rendering of a plot (or of the whole batch) failed.
+    """
+    from .._render_cache import render_error
+
+    if len(texts) != len(jobs):
+        # The whole batch failed: the bridge returns the error only.
+        error = render_error(texts[0]) if len(texts) == 1 else None
+        raise RuntimeError("Failed to export '{}': {}".format(jobs[0][1], error or "unexpected output of the batch"))
+
+    for (_, filename, _), text in zip(jobs, texts):
+        error = render_error(text)
+        if error is not None:
+            raise RuntimeError("Failed to export '{}': {}".format(filename, error))
+    return [(filename, text) for (_, filename, _), text in zip(jobs, texts)]
@@ -9,6 +9,7 @@ from ._html_contexts import _create_html_frontend_context, _use_isolated_frame
 from ._json_contexts import _create_json_frontend_context, _is_Intellij_Python_Lets_Plot_Plugin
 from ._mime_types import TEXT_HTML, LETS_PLOT_JSON
 from ._static_svg_ctx import StaticSvgImageContext
+from .._render_cache import spec_fingerprint
 from .._version import __version__
 from ..plot.core import PlotSpec
 from ..plot.plot import GGBunch
@@ -77,7 +78,7 @@ def _display_plot(spec: Any):
         raise ValueError("PlotSpec, SupPlotsSpec or GGBunch expected but was: {}".format(type(spec)))
 
     if _default_mimetype == TEXT_HTML:
-        plot_html = _as_html(spec.as_dict())
+        plot_html = _as_html(spec.as_dict(), fingerprint=spec_fingerprint(spec))
         try:
             from IPython.display import display_html
             display_html(plot_html, raw=True)
@@ -97,11 +98,12 @@ def _display_plot(spec: Any):
     print(spec.as_dict())
 
 
-def _as_html(plot_spec: Dict) -> str:
+def _as_html(plot_spec: Dict, fingerprint: str = None) -> str:
     """
     Creates plot HTML using 'html' frontend context.
 
     :param plot_spec: dict
+    :param fingerprint: fingerprint of the plot spec object (used as a key in the render cache)
     """
     if TEXT_HTML not in _frontend_contexts:
         if _use_isolated_frame():
@@ -118,4 +120,4 @@ def _as_html(plot_spec: Dict) -> str:
                 </div>    
                 """
 
-    return _frontend_contexts[TEXT_HTML].as_str(plot_spec)
+    return _frontend_contexts[TEXT_HTML].as_str(plot_spec, fingerprint=fingerprint)
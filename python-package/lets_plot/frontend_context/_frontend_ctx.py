@@ -9,7 +9,7 @@ class FrontendContext:
     def configure(self, verbose: bool):
         pass
 
-    def as_str(self, plot_spec: Dict) -> str:
+    def as_str(self, plot_spec: Dict, fingerprint: str = None) -> str:
         pass
 
     def show(self, plot_spec: Dict) -> str:
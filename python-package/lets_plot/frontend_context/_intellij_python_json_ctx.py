@@ -7,6 +7,10 @@ from typing import Dict, Tuple
 
 from ._frontend_ctx import FrontendContext
 from ._mime_types import LETS_PLOT_JSON
+from .._data_pruning import prune_unused_columns
+from .._data_sampling import sample_data
+from .._global_settings import get_global_bool, PRUNE_DATA
+from .._precompute import precompute_stats
 from .._type_utils import standardize_dict
 
 
@@ -16,6 +20,10 @@ class IntellijPythonJsonContext(FrontendContext):
         pass
 
     def show(self, plot_spec: Dict) -> str:
+        plot_spec = precompute_stats(plot_spec)
+        if get_global_bool(PRUNE_DATA):
+            plot_spec = prune_unused_columns(plot_spec)
+        plot_spec = sample_data(plot_spec)
         plot_spec_std = standardize_dict(plot_spec)
         data_object = DisplayDataObject(plot_spec_std)
 
@@ -39,8 +39,8 @@ class JupyterNotebookContext(FrontendContext):
             # noinspection PyTypeChecker
             display_html(self._configure_embedded_script(verbose), raw=True)
 
-    def as_str(self, plot_spec: Dict) -> str:
-        return kbr._generate_dynamic_display_html(plot_spec)
+    def as_str(self, plot_spec: Dict, fingerprint: str = None) -> str:
+        return kbr._generate_dynamic_display_html(plot_spec, fingerprint=fingerprint)
 
     @staticmethod
     def _configure_connected_script(verbose: bool) -> str:
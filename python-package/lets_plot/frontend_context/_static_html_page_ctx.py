@@ -23,5 +23,5 @@ class StaticHtmlPageContext(FrontendContext):
         if not self.connected:
             print("WARN: Embedding Lets-Plot JS library for offline usage is not supported.")
 
-    def as_str(self, plot_spec: Dict) -> str:
-        return kbr._generate_static_html_page(plot_spec, iframe=False)
+    def as_str(self, plot_spec: Dict, fingerprint: str = None) -> str:
+        return kbr._generate_static_html_page(plot_spec, iframe=False, fingerprint=fingerprint)
@@ -22,5 +22,5 @@ class StaticSvgImageContext(FrontendContext):
                 pass
                 print(message)
 
-    def as_str(self, plot_spec: Dict) -> str:
-        return kbr._generate_svg(plot_spec)
+    def as_str(self, plot_spec: Dict, fingerprint: str = None) -> str:
+        return kbr._generate_svg(plot_spec, fingerprint=fingerprint)
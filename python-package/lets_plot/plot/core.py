@@ -3,9 +3,11 @@
 # Use of this source code is governed by the MIT license that can be found in the LICENSE file.
 #
 import json
+from itertools import islice
 
 __all__ = ['aes', 'layer']
 
+from lets_plot._fingerprint import new_digest, update_digest
 from lets_plot._global_settings import get_global_bool, has_global_value, FRAGMENTS_ENABLED
 
 
@@ -139,19 +141,45 @@ def _filter_none(original: dict) -> dict:
 #  Specs
 #
 
-def _specs_to_dict(opts_raw):
+def _specs_to_dict(opts_raw, children: list = None):
     opts = {}
     for k, v in opts_raw.items():
         if isinstance(v, FeatureSpec):
-            opts[k] = v.as_dict()
+            opts[k] = _spec_to_dict(v, children)
         elif isinstance(v, dict):
-            opts[k] = _specs_to_dict(v)
+            opts[k] = _specs_to_dict(v, children)
         else:
             opts[k] = v
 
     return _filter_none(opts)
 
 
+def _copy_dict_tree(value):
+    """
+    Copies the nested dicts and lists of a (memoized) spec dict.
+    Data columns are not copied: only the data dicts themselves.
+    """
+    if isinstance(value, dict):
+        return {
+            k: dict(v) if k in ('data', 'map') and isinstance(v, dict) else _copy_dict_tree(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_copy_dict_tree(v) for v in value]
+    return value
+
+
+def _spec_to_dict(spec, children: list = None):
+    """
+    Returns the (possibly memoized) dict of the nested spec and,
+    if `children` list is provided, records the spec and its dict there.
+    """
+    d = spec._dict()
+    if children is not None:
+        children.append((spec, d))
+    return d
+
+
 class FeatureSpec():
     """
     A base class of the plot objects.
@@ -162,13 +190,19 @@ class FeatureSpec():
     `position_dodge()`, `scale_x_continuous()` etc.
     """
 
+    # Tens of thousands of specs can be alive in a dashboard: avoid per-instance `__dict__`.
+    __slots__ = ('kind', '__props', '__fingerprint', '__dict_cache')
+
     def __init__(self, kind, name, **kwargs):
         """Initialize self."""
         self.kind = kind
         self.__props = {}
         if name is not None:
             self.__props['name'] = name
-        self.__props.update(**kwargs)
+        # Only store properties with non-default (i.e. not None) values.
+        self.__props.update((k, v) for k, v in kwargs.items() if v is not None)
+        self.__fingerprint = None
+        self.__dict_cache = None
 
     def props(self):
         """
@@ -191,8 +225,55 @@ class FeatureSpec():
             p.props()
 
         """
+        # The caller can modify properties.
+        self.__fingerprint = None
+        self.__dict_cache = None
         return self.__props
 
+    def fingerprint(self) -> str:
+        """
+        Return a stable hash of the object specification.
+
+        Objects with equal specifications (including their data) have equal fingerprints.
+        Data columns (`numpy` arrays, `pandas` and `polars` data frames) are hashed directly from their buffers.
+
+        Returns
+        -------
+        str
+            Hexadecimal digest.
+
+        Examples
+        --------
+        .. jupyter-execute::
+            :linenos:
+            :emphasize-lines: 5
+
+            from lets_plot import *
+            LetsPlot.setup_html()
+            p1 = ggplot({'x': [0], 'y': [0]}) + geom_point(aes('x', 'y'))
+            p2 = ggplot({'x': [0], 'y': [0]}) + geom_point(aes('x', 'y'))
+            p1.fingerprint() == p2.fingerprint()
+
+        """
+        if self.__fingerprint is not None:
+            return self.__fingerprint
+
+        h = new_digest()
+        plain = update_digest(h, self._fingerprint_items())
+        fingerprint = h.hexdigest()
+        if plain and self._is_dict_cacheable() and not hasattr(self, '__dict__'):
+            # Memoize only when there are no data and nested specs (which can be changed independently)
+            # and no state outside of `props()`. Data given as a dict of lists can be changed in place.
+            self.__fingerprint = fingerprint
+        return fingerprint
+
+    def _fingerprint_items(self) -> list:
+        items = [self.__class__.__name__, self.kind, self.__props]
+        if hasattr(self, '__dict__'):
+            # State of subclasses without `__slots__`, e.g. `layer_tooltips`.
+            items.append(vars(self))
+        return items
+
     def as_dict(self):
         """
         Return the dictionary of all properties of the object with `as_dict()`
@@ -214,7 +295,46 @@ class FeatureSpec():
             p = ggplot({'x': [0], 'y': [0]}) + geom_point(aes('x', 'y'))
             p.as_dict()
         """
-        return _specs_to_dict(self.props())
+        if hasattr(self, '__dict__'):
+            # Subclasses with state outside of `props()` (e.g. `layer_tooltips`) extend `as_dict()` themselves.
+            return self._build_dict([])
+        # The memoized dict is shared: the caller gets its own copy which can be modified.
+        return _copy_dict_tree(self._dict())
+
+    def _dict(self) -> dict:
+        """
+        Memoized version of `as_dict()`.
+        The returned dict is shared with the dicts of the parent specs and must not be modified.
+
+        The memoized dict is dropped when `props()` are accessed,
+        and it is rebuilt when the dict of any nested spec was rebuilt.
+        This way serialization of a plot derived with `+` reuses the dicts of its unchanged layers, scales etc.
+        """
+        if hasattr(self, '__dict__'):
+            return self.as_dict()
+
+        cache = self.__dict_cache
+        if cache is not None:
+            d, children = cache
+            if all(child._dict() is child_dict for child, child_dict in children):
+                return d
+
+        children = []
+        d = self._build_dict(children)
+        if self._is_dict_cacheable():
+            self.__dict_cache = (d, children)
+        return d
+
+    def _build_dict(self, children: list) -> dict:
+        """
+        Builds the dict of properties.
+        Nested specs must be converted with `_spec_to_dict(spec, children)`.
+        """
+        return _specs_to_dict(self.__props, children)
+
+    def _is_dict_cacheable(self) -> bool:
+        # Data given as a dict is copied by `_specs_to_dict()`: in-place changes of it must not be missed.
+        return not any(isinstance(self.__props.get(k), dict) for k in ['data', 'map'])
 
     def __str__(self):
         return json.dumps(self.as_dict(), indent=2)
@@ -249,6 +369,8 @@ class PlotSpec(FeatureSpec):
     `corr_plot(...).points().build()` etc.
     """
 
+    __slots__ = ('__scales', '__layers', '__metainfo_list', '__is_livemap', '__crs_initialized', '__crs')
+
     @classmethod
     def duplicate(cls, other):
         dup = PlotSpec(data=None, mapping=None,
@@ -266,9 +388,9 @@ class PlotSpec(FeatureSpec):
                  crs=None, **kwargs):
         """Initialize self."""
         super().__init__('plot', name=None, data=data, mapping=mapping, **kwargs)
-        self.__scales = list(scales)
-        self.__layers = list(layers)
-        self.__metainfo_list = list(metainfo_list)
+        self.__scales = _SharedList.of(scales)
+        self.__layers = _SharedList.of(layers)
+        self.__metainfo_list = _SharedList.of(metainfo_list)
         self.__is_livemap = is_livemap
         self.__crs_initialized = crs_initialized
         self.__crs = crs
@@ -296,7 +418,7 @@ class PlotSpec(FeatureSpec):
 
         """
         # used to evaluate 'completion'
-        return self.props()['data']
+        return self.props().get('data')
 
     def has_layers(self) -> bool:
         """
@@ -362,7 +484,7 @@ class PlotSpec(FeatureSpec):
         elif isinstance(other, FeatureSpec):
             plot = PlotSpec.duplicate(self)
             if other.kind == 'layer':
-                if other.props()['geom'] == 'livemap':
+                if other.props().get('geom') == 'livemap':
                     plot.__is_livemap = True
 
                 from lets_plot.plot.util import is_geo_data_frame  # local import to break circular reference
@@ -380,11 +502,11 @@ class PlotSpec(FeatureSpec):
                     raise ValueError("livemap doesn't support `use_crs`")
 
                 other.before_append(plot.__is_livemap)
-                plot.__layers.append(other)
+                plot.__layers = plot.__layers.append(other)
                 return plot
 
             if other.kind == 'scale':
-                plot.__scales.append(other)
+                plot.__scales = plot.__scales.append(other)
                 return plot
 
             if other.kind == 'theme':
@@ -404,7 +526,7 @@ class PlotSpec(FeatureSpec):
                 return plot
 
             if other.kind == 'metainfo':
-                plot.__metainfo_list.append(other)
+                plot.__metainfo_list = plot.__metainfo_list.append(other)
                 return plot
 
             if isinstance(other, FeatureSpecArray):
@@ -418,12 +540,15 @@ class PlotSpec(FeatureSpec):
 
         return super().__add__(other)
 
-    def as_dict(self):
-        d = super().as_dict()
+    def _fingerprint_items(self) -> list:
+        return super()._fingerprint_items() + [list(self.__scales), list(self.__layers), list(self.__metainfo_list)]
+
+    def _build_dict(self, children: list) -> dict:
+        d = super()._build_dict(children)
         d['kind'] = self.kind
-        d['scales'] = [scale.as_dict() for scale in self.__scales]
-        d['layers'] = [layer.as_dict() for layer in self.__layers]
-        d['metainfo_list'] = [metainfo.as_dict() for metainfo in self.__metainfo_list]
+        d['scales'] = [_spec_to_dict(scale, children) for scale in self.__scales]
+        d['layers'] = [_spec_to_dict(layer, children) for layer in self.__layers]
+        d['metainfo_list'] = [_spec_to_dict(metainfo, children) for metainfo in self.__metainfo_list]
         return d
 
     def __str__(self):
@@ -452,7 +577,8 @@ class PlotSpec(FeatureSpec):
     def _repr_html_(self):
         # Special method discovered and invoked by IPython.display.display.
         from ..frontend_context._configuration import _as_html
-        return _as_html(self.as_dict())
+        from .._render_cache import spec_fingerprint
+        return _as_html(self.as_dict(), fingerprint=spec_fingerprint(self))
 
     def show(self):
         """
@@ -484,6 +610,8 @@ class LayerSpec(FeatureSpec):
     `geom_contour()`, `geom_boxplot()`, `geom_text()` etc.
     """
 
+    __slots__ = ()
+
     __own_features = ['geom', 'stat', 'mapping', 'position']
 
     @classmethod
@@ -499,7 +627,7 @@ class LayerSpec(FeatureSpec):
             get_geo_data_frame_meta
         from lets_plot.geo_data_internals.utils import is_geocoder
 
-        name = self.props()['geom']
+        name = self.props().get('geom')
         map_join = self.props().get('map_join')
         map = self.props().get('map')
         map_data_meta = None
@@ -544,7 +672,7 @@ class LayerSpec(FeatureSpec):
 
     def get_plot_layer_data(self):
         # used to evaluate 'completion'
-        return self.props()['data']
+        return self.props().get('data')
 
     def __add__(self, other):
         if isinstance(other, DummySpec):
@@ -565,6 +693,8 @@ class LayerSpec(FeatureSpec):
 
 
 class FeatureSpecArray(FeatureSpec):
+    __slots__ = ('__elements',)
+
     def __init__(self, *features):
         super().__init__('feature-list', name=None)
         self.__elements = list(features)
@@ -572,8 +702,11 @@ class FeatureSpecArray(FeatureSpec):
     def elements(self):
         return self.__elements
 
-    def as_dict(self):
-        elements = [{e.kind: e.as_dict()} for e in self.__elements]
+    def _fingerprint_items(self) -> list:
+        return super()._fingerprint_items() + [self.__elements]
+
+    def _build_dict(self, children: list) -> dict:
+        elements = [{e.kind: _spec_to_dict(e, children)} for e in self.__elements]
         return {'feature-list': elements}
 
     def __add__(self, other):
@@ -597,10 +730,12 @@ class FeatureSpecArray(FeatureSpec):
 
 
 class DummySpec(FeatureSpec):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__('dummy', name=None)
 
-    def as_dict(self):
+    def _build_dict(self, children: list) -> dict:
         return {'dummy-feature': True}
 
     def __add__(self, other):
@@ -613,6 +748,43 @@ def _generate_data(size):
     return PlotSpec(data='x' * size, mapping=None, scales=[], layers=[])
 
 
+class _SharedList:
+    """
+    Immutable list which shares its storage with the list it was derived from.
+
+    `append()` returns a new list in O(1) (amortized) time: the item is appended to the shared storage in-place
+    unless the storage was already extended by another list derived from the same origin,
+    in which case the storage is copied.
+    """
+
+    __slots__ = ('_items', '_size')
+
+    def __init__(self, items: list, size: int):
+        self._items = items
+        self._size = size
+
+    @classmethod
+    def of(cls, items) -> '_SharedList':
+        if isinstance(items, _SharedList):
+            return items
+        items = list(items)
+        return _SharedList(items, len(items))
+
+    def append(self, item) -> '_SharedList':
+        if len(self._items) == self._size:
+            items = self._items
+        else:
+            items = self._items[:self._size]
+        items.append(item)
+        return _SharedList(items, self._size + 1)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return islice(self._items, self._size)
+
+
 def _theme_dicts_merge(x, y):
     """
     Simple values in `y` override values in `x`.
@@ -30,6 +30,7 @@ __all__ = ['geom_point', 'geom_path', 'geom_line',
 
 def geom_point(mapping=None, *, data=None, stat=None, position=None, show_legend=None, sampling=None, tooltips=None,
                map=None, map_join=None, use_crs=None,
+               rasterize=None,
                color_by=None, fill_by=None,
                **other_args):
     """
@@ -74,6 +75,14 @@ def geom_point(mapping=None, *, data=None, stat=None, position=None, show_legend
         If an EPSG code is given, then all the coordinates in `GeoDataFrame` (see the `map` parameter)
         will be projected to this CRS.
         Specify "provided" to disable any further re-projection and to keep the `GeoDataFrame’s` original CRS.
+    rasterize : bool or {'count', 'any', 'mean'}, default=False
+        Aggregate the points in Python (NumPy) into a grid with a cell per pixel of the plot size
+        and draw the grid as a raster instead of the points. Use it with millions of points.
+        The cells are colored through the `color` (or `fill`) scale:
+        'count' (or True) - by the number of points,
+        'any' - the cells having points,
+        'mean' - by the mean of the continuous variable mapped to `color`.
+        With a discrete `color` each cell gets the category having the most points.
     color_by : {'fill', 'color', 'paint_a', 'paint_b', 'paint_c'}, default='color'
         Define the color aesthetic for the geometry.
     fill_by : {'fill', 'color', 'paint_a', 'paint_b', 'paint_c'}, default='fill'
@@ -169,6 +178,22 @@ def geom_point(mapping=None, *, data=None, stat=None, position=None, show_legend
 
     |
 
+    .. jupyter-execute::
+        :linenos:
+        :emphasize-lines: 9
+
+        import numpy as np
+        from lets_plot import *
+        LetsPlot.setup_html()
+        np.random.seed(42)
+        n = 1_000_000
+        x = np.random.normal(size=n)
+        y = x + np.random.normal(size=n)
+        ggplot({'x': x, 'y': y}, aes(x='x', y='y')) + \\
+            geom_point(rasterize=True)
+
+    |
+
     .. jupyter-execute::
         :linenos:
         :emphasize-lines: 8-11
@@ -195,6 +220,7 @@ def geom_point(mapping=None, *, data=None, stat=None, position=None, show_legend
                  sampling=sampling,
                  tooltips=tooltips,
                  map=map, map_join=map_join, use_crs=use_crs,
+                 rasterize=rasterize,
                  color_by=color_by, fill_by=fill_by,
                  **other_args)
 
@@ -808,6 +834,7 @@ def geom_histogram(mapping=None, *, data=None, stat=None, position=None, show_le
                    binwidth=None,
                    center=None,
                    boundary=None,
+                   precompute=None,
                    color_by=None, fill_by=None,
                    **other_args):
     """
@@ -854,6 +881,11 @@ def geom_histogram(mapping=None, *, data=None, stat=None, position=None, show_le
         Specify x-value to align bin centers to.
     boundary : float
         Specify x-value to align bin boundary (i.e. point between bins) to.
+    precompute : bool, default=False
+        Compute the bins in Python (NumPy) and send only the bins to the plotting engine
+        instead of the raw data. Use it with very large data.
+        The result is the same as computed by the engine, including computed variables
+        available in the mapping and tooltips.
     color_by : {'fill', 'color', 'paint_a', 'paint_b', 'paint_c'}, default='color'
         Define the color aesthetic for the geometry.
     fill_by : {'fill', 'color', 'paint_a', 'paint_b', 'paint_c'}, default='fill'
@@ -947,6 +979,7 @@ def geom_histogram(mapping=None, *, data=None, stat=None, position=None, show_le
                  binwidth=binwidth,
                  center=center,
                  boundary=boundary,
+                 precompute=precompute,
                  color_by=color_by, fill_by=fill_by,
                  **other_args)
 
@@ -1112,6 +1145,7 @@ def geom_bin2d(mapping=None, *, data=None, stat=None, position=None, show_legend
                bins=None,
                binwidth=None,
                drop=None,
+               precompute=None,
                color_by=None, fill_by=None,
                **other_args):
     """
@@ -1146,6 +1180,13 @@ def geom_bin2d(mapping=None, *, data=None, stat=None, position=None, show_legend
         Override `bins`. The default is to use bin widths that cover the entire range of the data.
     drop : bool, default=True
         Specify whether to remove all bins with 0 counts.
+    precompute : bool, default=False
+        Compute the bins in Python (NumPy) and send only the bins to the plotting engine
+        instead of the raw data. Use it with very large data.
+        The result is the same as computed by the engine, including computed variables
+        available in the mapping and tooltips.
+        With `precompute` the data can also be a list (or any re-iterable collection) of data frames
+        which are processed one at a time.
     color_by : {'fill', 'color', 'paint_a', 'paint_b', 'paint_c'}, default='color'
         Define the color aesthetic for the geometry.
     fill_by : {'fill', 'color', 'paint_a', 'paint_b', 'paint_c'}, default='fill'
@@ -1265,6 +1306,7 @@ def geom_bin2d(mapping=None, *, data=None, stat=None, position=None, show_legend
                  bins=bins,
                  binwidth=binwidth,
                  drop=drop,
+                 precompute=precompute,
                  color_by=color_by, fill_by=fill_by,
                  **other_args)
 
@@ -2949,6 +2991,8 @@ def geom_boxplot(mapping=None, *, data=None, stat=None, position=None, show_lege
                  outlier_shape=None, outlier_size=None, outlier_stroke=None,
                  varwidth=None,
                  whisker_width=None,
+                 quantile_method=None,
+                 max_outliers=None,
                  color_by=None, fill_by=None,
                  **other_args):
     """
@@ -2998,6 +3042,15 @@ def geom_boxplot(mapping=None, *, data=None, stat=None, position=None, show_lege
         of the number of observations in the groups.
     whisker_width : float, default=0.5
         A multiplicative factor applied to the box width to draw horizontal segments on whiskers.
+    quantile_method : {'exact', 'approx'}, default='exact'
+        Method of computing the quartiles.
+        'approx' computes the quartiles of groups bigger than 100000 observations over a random sample
+        of 100000 of them: much faster for very large groups, the whiskers and outliers stay exact
+        with respect to the approximate hinges.
+    max_outliers : int
+        Maximum number of outliers shown in each box.
+        If there are more, a random sample is shown which always includes the smallest and the largest outliers.
+        By default, all outliers are shown.
     color_by : {'fill', 'color', 'paint_a', 'paint_b', 'paint_c'}, default='color'
         Define the color aesthetic for the geometry.
     fill_by : {'fill', 'color', 'paint_a', 'paint_b', 'paint_c'}, default='fill'
@@ -3128,6 +3181,7 @@ def geom_boxplot(mapping=None, *, data=None, stat=None, position=None, show_lege
                           fatten=fatten,
                           varwidth=varwidth,
                           whisker_width=whisker_width,
+                          quantile_method=quantile_method,
                           color_by=color_by, fill_by=fill_by,
                           **other_args)
     if stat is None or stat == 'boxplot':
@@ -3150,6 +3204,8 @@ def geom_boxplot(mapping=None, *, data=None, stat=None, position=None, show_lege
                                shape=outlier_param('shape', outlier_shape),
                                size=size,
                                stroke=outlier_param('stroke', outlier_stroke),
+                               quantile_method=quantile_method,
+                               max_outliers=max_outliers,
                                color_by=color_by, fill_by=fill_by)
     return boxplot_layer
 
@@ -3158,7 +3214,8 @@ def geom_violin(mapping=None, *, data=None, stat=None, position=None, show_legen
                 orientation=None,
                 show_half=None,
                 quantiles=None, quantile_lines=None,
-                scale=None, trim=None, tails_cutoff=None, kernel=None, bw=None, adjust=None, n=None, fs_max=None,
+                scale=None, trim=None, tails_cutoff=None, kernel=None, bw=None, adjust=None, n=None,
+                method=None, fs_max=None,
                 color_by=None, fill_by=None,
                 **other_args):
     """
@@ -3216,6 +3273,11 @@ def geom_violin(mapping=None, *, data=None, stat=None, position=None, show_legen
         Adjust the value of bandwidth by multiplying it. Change how smooth the frequency curve is.
     n : int, default=512
         The number of sampled points for plotting the function.
+    method : {'auto', 'fft'}, default='auto'
+        The method of density computation.
+        'auto' - 'full scan' or, for data bigger than `fs_max`, less accurate but more efficient computation.
+        'fft' - the data is binned onto a fine grid, which is then convolved with the kernel.
+        Much faster on large data (millions of values).
     fs_max : int, default=500
         Maximum size of data to use density computation with 'full scan'.
         For bigger data, less accurate but more efficient density computation is applied.
@@ -3362,7 +3424,8 @@ def geom_violin(mapping=None, *, data=None, stat=None, position=None, show_legen
                  show_half=show_half,
                  quantiles=quantiles,
                  quantile_lines=quantile_lines,
-                 scale=scale, trim=trim, tails_cutoff=tails_cutoff, kernel=kernel, bw=bw, adjust=adjust, n=n, fs_max=fs_max,
+                 scale=scale, trim=trim, tails_cutoff=tails_cutoff, kernel=kernel, bw=bw, adjust=adjust, n=n,
+                 method=method, fs_max=fs_max,
                  color_by=color_by, fill_by=fill_by,
                  **other_args)
 
@@ -3540,7 +3603,8 @@ def geom_ydotplot(mapping=None, *, data=None, show_legend=None, sampling=None, t
 
 
 def geom_area_ridges(mapping=None, *, data=None, stat=None, position=None, show_legend=None, sampling=None, tooltips=None,
-                     trim=None, tails_cutoff=None, kernel=None, adjust=None, bw=None, n=None, fs_max=None,
+                     trim=None, tails_cutoff=None, kernel=None, adjust=None, bw=None, n=None, method=None,
+                     fs_max=None,
                      min_height=None, scale=None, quantiles=None, quantile_lines=None,
                      color_by=None, fill_by=None,
                      **other_args):
@@ -3587,6 +3651,11 @@ def geom_area_ridges(mapping=None, *, data=None, stat=None, position=None, show_
         Adjust the value of bandwidth by multiplying it. Change how smooth the frequency curve is.
     n : int, default=512
         The number of sampled points for plotting the function.
+    method : {'auto', 'fft'}, default='auto'
+        The method of density computation.
+        'auto' - 'full scan' or, for data bigger than `fs_max`, less accurate but more efficient computation.
+        'fft' - the data is binned onto a fine grid, which is then convolved with the kernel.
+        Much faster on large data (millions of values).
     fs_max : int, default=500
         Maximum size of data to use density computation with 'full scan'.
         For bigger data, less accurate but more efficient density computation is applied.
@@ -3706,6 +3775,7 @@ def geom_area_ridges(mapping=None, *, data=None, stat=None, position=None, show_
                  adjust=adjust,
                  bw=bw,
                  n=n,
+                 method=method,
                  fs_max=fs_max,
                  min_height=min_height,
                  scale=scale,
@@ -3949,6 +4019,7 @@ def geom_density(mapping=None, *, data=None, stat=None, position=None, show_lege
                  adjust=None,
                  bw=None,
                  n=None,
+                 method=None,
                  fs_max=None,
                  quantiles=None,
                  quantile_lines=None,
@@ -4001,6 +4072,11 @@ def geom_density(mapping=None, *, data=None, stat=None, position=None, show_lege
         Adjust the value of bandwidth by multiplying it. Changes how smooth the frequency curve is.
     n : int, default=512
         The number of sampled points for plotting the function.
+    method : {'auto', 'fft'}, default='auto'
+        The method of density computation.
+        'auto' - 'full scan' or, for data bigger than `fs_max`, less accurate but more efficient computation.
+        'fft' - the data is binned onto a fine grid, which is then convolved with the kernel.
+        Much faster on large data (millions of values).
     fs_max : int, default=500
         Maximum size of data to use density computation with 'full scan'.
         For bigger data, less accurate but more efficient density computation is applied.
@@ -4144,7 +4220,7 @@ def geom_density(mapping=None, *, data=None, stat=None, position=None, show_lege
                  sampling=sampling,
                  tooltips=tooltips,
                  orientation=orientation,
-                 trim=trim, kernel=kernel, adjust=adjust, bw=bw, n=n, fs_max=fs_max,
+                 trim=trim, kernel=kernel, adjust=adjust, bw=bw, n=n, method=method, fs_max=fs_max,
                  quantiles=quantiles, quantile_lines=quantile_lines,
                  color_by=color_by, fill_by=fill_by,
                  **other_args)
@@ -4155,6 +4231,7 @@ def geom_density2d(mapping=None, *, data=None, stat=None, position=None, show_le
                    adjust=None,
                    bw=None,
                    n=None,
+                   method=None,
                    bins=None,
                    binwidth=None,
                    color_by=None,
@@ -4196,6 +4273,11 @@ def geom_density2d(mapping=None, *, data=None, stat=None, position=None, show_le
     n : list of int
         The number of sampled points for plotting the function
         (on x and y direction correspondingly).
+    method : {'auto', 'fft'}, default='auto'
+        The method of density computation.
+        'auto' - the kernel sum is computed for every point of the grid.
+        'fft' - the data is binned onto a fine grid, which is then convolved with the kernel.
+        Much faster on large data (hundreds of thousands of points).
     bins : int
         Number of levels.
     binwidth : float
@@ -4356,7 +4438,7 @@ def geom_density2d(mapping=None, *, data=None, stat=None, position=None, show_le
                  show_legend=show_legend,
                  sampling=sampling,
                  tooltips=tooltips,
-                 kernel=kernel, adjust=adjust, bw=bw, n=n, bins=bins, binwidth=binwidth,
+                 kernel=kernel, adjust=adjust, bw=bw, n=n, method=method, bins=bins, binwidth=binwidth,
                  color_by=color_by,
                  **other_args)
 
@@ -4367,6 +4449,7 @@ def geom_density2df(mapping=None, *, data=None, stat=None, position=None, show_l
                     adjust=None,
                     bw=None,
                     n=None,
+                    method=None,
                     bins=None,
                     binwidth=None,
                     color_by=None, fill_by=None,
@@ -4408,6 +4491,11 @@ def geom_density2df(mapping=None, *, data=None, stat=None, position=None, show_l
     n : list of int
         The number of sampled points for plotting the function
         (on x and y direction correspondingly).
+    method : {'auto', 'fft'}, default='auto'
+        The method of density computation.
+        'auto' - the kernel sum is computed for every point of the grid.
+        'fft' - the data is binned onto a fine grid, which is then convolved with the kernel.
+        Much faster on large data (hundreds of thousands of points).
     bins : int
         Number of levels.
     binwidth : float
@@ -4573,6 +4661,7 @@ def geom_density2df(mapping=None, *, data=None, stat=None, position=None, show_l
                  kernel=kernel,
                  adjust=adjust,
                  bw=bw, n=n,
+                 method=method,
                  bins=bins,
                  binwidth=binwidth,
                  color_by=color_by, fill_by=fill_by,
@@ -5150,6 +5239,7 @@ def geom_qq2_line(mapping=None, *, data=None, stat=None, position=None, show_leg
 
 def geom_freqpoly(mapping=None, *, data=None, stat=None, position=None, show_legend=None, sampling=None, tooltips=None,
                   orientation=None,
+                  precompute=None,
                   color_by=None,
                   **other_args):
     """
@@ -5186,6 +5276,9 @@ def geom_freqpoly(mapping=None, *, data=None, stat=None, position=None, show_leg
     orientation : str, default='x'
         Specify the axis that the layer's stat and geom should run along.
         Possible values: 'x', 'y'.
+    precompute : bool, default=False
+        Compute the bins in Python (NumPy) and send only the bins to the plotting engine
+        instead of the raw data. Use it with very large data.
     color_by : {'fill', 'color', 'paint_a', 'paint_b', 'paint_c'}, default='color'
         Define the color aesthetic for the geometry.
     other_args
@@ -5258,6 +5351,7 @@ def geom_freqpoly(mapping=None, *, data=None, stat=None, position=None, show_leg
                  sampling=sampling,
                  tooltips=tooltips,
                  orientation=orientation,
+                 precompute=precompute,
                  color_by=color_by,
                  **other_args)
 
@@ -3,7 +3,8 @@
 # Use of this source code is governed by the MIT license that can be found in the LICENSE file.
 #
 import base64
-import io
+import struct
+import zlib
 
 from .core import aes
 from .geom import _geom
@@ -12,11 +13,6 @@ from .scale import scale_grey
 from .util import as_boolean
 from .util import is_ndarray
 
-try:
-    import png
-except ImportError:
-    png = None
-
 try:
     import numpy
 except ImportError:
@@ -30,26 +26,42 @@ except ImportError:
 __all__ = ['geom_imshow', 'geom_image']
 
 
-def _hex2rgb(hex_c, alpha):
-    hex_s = hex_c.lstrip('#')
-    list_rgb = [int(hex_s[i:i + 2], 16) for i in (0, 2, 4)]
-    if alpha is not None:
-        list_rgb.append(int(alpha + 0.5))
-    return list_rgb
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# PNG color types
+_PNG_GREYSCALE = 0
+_PNG_RGB = 2
+_PNG_PALETTE = 3
+_PNG_GREYSCALE_ALPHA = 4
+_PNG_RGBA = 6
 
 
-def _hex2rgb_arr_uint8(hex_c, alpha=None):
+def _palette(hex_colors, alpha=None):
     """
-    Create 'palette' for PyPNG PNG writer
+    Create PNG palette: array of RGB (or RGBA if alpha is given) uint8 entries.
     """
-    return numpy.array(_hex2rgb(hex_c, alpha), dtype=numpy.uint8)
+    rgb = numpy.frombuffer(bytes.fromhex(''.join(c.lstrip('#') for c in hex_colors)), dtype=numpy.uint8)
+    rgb = rgb.reshape(-1, 3)
+    if alpha is None:
+        return rgb
+    palette = numpy.empty((len(rgb), 4), dtype=numpy.uint8)
+    palette[:, :3] = rgb
+    palette[:, 3] = int(alpha + 0.5)
+    return palette
 
 
-def _normalize_2D(image_data, norm, vmin, vmax, min_lum):
+def _normalize_2D(image_data, norm, vmin, vmax, min_lum, copy=True):
     """
     Take numpy 2D array of float or int-s and
     return 2D array of ints with the target range [0..255].
     Values outside the target range will be later clipped.
+
+    8- and 16-bit integer images are normalized via a lookup table
+    (each value of the type is normalized once): the result is uint8 array.
+    If not `copy`, the image can be modified in place (unless it is read-only).
+
+    Return the normalized image, vmin, vmax and the type of normalized values before rounding
+    (float32 for images normalized via the lookup table).
     """
     min_lum = max(0, min_lum)
     max_lum = 255 - min_lum
@@ -64,15 +76,24 @@ def _normalize_2D(image_data, norm, vmin, vmax, min_lum):
     # Make a copy via `numpy.copy()` or via `arr.astype()`
     #   - prevent modification of the original image
     #   - work around read-only flag in the original image
+    copy = copy or not image_data.flags.writeable
 
     if normalize:
         if vmin == vmax:
-            image_data = numpy.copy(image_data)
-            image_data[True] = 127
+            image_data = numpy.full_like(image_data, 127)
+        elif image_data.dtype.kind in 'iu' and image_data.itemsize <= 2 \
+                and image_data.size > 256 ** image_data.itemsize:
+            lut, _, _, value_dtype = _normalize_2D(_all_values(image_data.dtype), norm, vmin, vmax, min_lum)
+            lut_uint8 = numpy.empty(len(lut), dtype=numpy.uint8)
+            _to_uint8(lut, lut_uint8, in_place=True)
+            # Index by the (unsigned) bit patterns of values.
+            image_data = lut_uint8[image_data.view(numpy.dtype('u{}'.format(image_data.itemsize)))]
+            return (image_data, vmin, vmax, value_dtype)
         else:
             # float array for scaling
             if image_data.dtype.kind == 'f':
-                image_data = numpy.copy(image_data)
+                if copy:
+                    image_data = numpy.copy(image_data)
             else:
                 image_data = image_data.astype(numpy.float32)
 
@@ -84,12 +105,77 @@ def _normalize_2D(image_data, norm, vmin, vmax, min_lum):
             image_data += min_lum
     else:
         # no normalization
-        image_data = numpy.copy(image_data)
+        if copy:
+            image_data = numpy.copy(image_data)
         image_data.clip(min_lum, max_lum, out=image_data)
         vmin = float(numpy.nanmin(image_data))
         vmax = float(numpy.nanmax(image_data))
 
-    return (image_data, vmin, vmax)
+    return (image_data, vmin, vmax, image_data.dtype)
+
+
+def _all_values(dtype):
+    """
+    All values of 8- or 16-bit integer type ordered by their (unsigned) bit patterns.
+    """
+    unsigned = numpy.dtype('u{}'.format(dtype.itemsize))
+    return numpy.arange(256 ** dtype.itemsize, dtype=unsigned).view(dtype)
+
+
+def _to_uint8(values, out, in_place=False):
+    """
+    Write values clipped to range [0..255] (floats are rounded) to uint8 array `out`.
+    If `in_place`, `values` can be modified.
+    """
+    if values.dtype != numpy.uint8:
+        values = values.clip(0, 255, out=values if in_place else None)
+        if values.dtype.kind == 'f':
+            values += 0.5
+    numpy.copyto(out, values, casting='unsafe')
+
+
+def _uint8_value(value, dtype):
+    """
+    The uint8 value of a (float) number as if it were in an array of type `dtype`.
+    """
+    out = numpy.empty(1, dtype=numpy.uint8)
+    _to_uint8(numpy.full(1, value, dtype=dtype), out, in_place=True)
+    return out[0]
+
+
+def _png_scanlines(height, width, nchannels):
+    """
+    Create contiguous PNG image data: rows of pixels, each prefixed with the filter type byte (0: None).
+    Return the data and its pixels: a (height, width, nchannels) view to be filled by the caller.
+    """
+    scanlines = numpy.empty((height, 1 + width * nchannels), dtype=numpy.uint8)
+    scanlines[:, 0] = 0
+    return scanlines, scanlines[:, 1:].reshape(height, width, nchannels)
+
+
+def _png_chunk(tag, data):
+    """
+    Return the parts of PNG chunk (the data is not copied).
+    """
+    checksum = zlib.crc32(data, zlib.crc32(tag)) & 0xFFFFFFFF
+    return [struct.pack("!I", len(data)) + tag, data, struct.pack("!I", checksum)]
+
+
+def _encode_png(scanlines, width, color_type, palette=None, compression=None):
+    """
+    Encode PNG image (bit depth 8) in one `zlib` call over the image data made by `_png_scanlines()`.
+    """
+    height = scanlines.shape[0]
+    parts = [_PNG_SIGNATURE]
+    parts += _png_chunk(b'IHDR', struct.pack("!2I5B", width, height, 8, color_type, 0, 0, 0))
+    if palette is not None:
+        parts += _png_chunk(b'PLTE', palette[:, :3].tobytes())
+        if palette.shape[1] == 4:
+            parts += _png_chunk(b'tRNS', palette[:, 3].tobytes())
+    level = -1 if compression is None else compression
+    parts += _png_chunk(b'IDAT', zlib.compress(scanlines, level))
+    parts += _png_chunk(b'IEND', b'')
+    return b''.join(parts)
 
 
 def geom_image(image_data, cmap=None, norm=None, *, vmin=None, vmax=None, extent=None):
@@ -115,6 +201,7 @@ def geom_imshow(image_data, cmap=None, *,
                 vmin=None, vmax=None,
                 extent=None,
                 compression=None,
+                copy=True,
                 show_legend=True,
                 color_by="paint_c",
                 ):
@@ -165,6 +252,8 @@ def geom_imshow(image_data, cmap=None, *,
         Values from 0 (no compression) to 9 (highest).
         Value `None` means that the `zlib` module uses
         the default level of compression (which is generally acceptable).
+    copy : bool, default=True
+        False - allow modifying `image_data` in place to avoid copying a big image.
     show_legend : bool, default=True
         Greyscale images only.
         False - do not show legend for this layer.
@@ -223,9 +312,6 @@ def geom_imshow(image_data, cmap=None, *,
 
     """
 
-    if png is None:
-        raise ValueError("pypng is not installed")
-
     if not is_ndarray(image_data):
         raise ValueError("Invalid image_data: ndarray is expected but was {}".format(type(image_data)))
 
@@ -243,61 +329,7 @@ def geom_imshow(image_data, cmap=None, *,
             raise ValueError(
                 "Invalid compression: expected integer in range [0..9] but was {}".format(compression))
 
-    greyscale = (image_data.ndim == 2)
-    if greyscale:
-        # Greyscale image
-
-        has_nan = numpy.isnan(image_data.max())
-        min_lum = 0 if not (has_nan and cmap) else 1  # index 0 reserved for NaN-s
-
-        (image_data, greyscale_data_min, greyscale_data_max) = _normalize_2D(image_data, norm, vmin, vmax, min_lum)
-        height, width = image_data.shape
-        nchannels = 1
-
-        has_nan = numpy.isnan(image_data.max())
-        if has_nan and not cmap:
-            # add alpha-channel (LA)
-            alpha_ch_scaler = 1 if alpha is None else alpha
-            is_nan = numpy.isnan(image_data)
-            im_shape = numpy.shape(image_data)
-            alpha_ch = numpy.zeros(im_shape, dtype=image_data.dtype)
-            alpha_ch[is_nan == False] = 255 * alpha_ch_scaler
-            image_data[is_nan] = 0
-            image_data = numpy.dstack((image_data, alpha_ch))
-            nchannels = 2
-        elif has_nan and cmap:
-            # replace all NaN-s with 0 (index 0 for transparent color)
-            numpy.nan_to_num(image_data, copy=False, nan=0)
-        elif not cmap and alpha is not None:
-            # add alpha-channel (LA)
-            im_shape = numpy.shape(image_data)
-            alpha_ch = numpy.full(im_shape, 255 * alpha, dtype=image_data.dtype)
-            image_data = numpy.dstack((image_data, alpha_ch))
-            nchannels = 2
-
-    else:
-        # Color RGB/RGBA image
-        # Make a copy:
-        #   - prevent modification of the original image
-        #   - drop read-only flag
-        image_data = numpy.copy(image_data)
-        if image_data.dtype.kind == 'f':
-            image_data *= 255
-
-        height, width, nchannels = image_data.shape
-
-        if alpha is not None:
-            if nchannels == 3:
-                # RGB image: add alpha channel (RGBA)
-                alpha_ch = numpy.full((height, width, 1), 255 * alpha, dtype=image_data.dtype)
-                image_data = numpy.dstack((image_data, alpha_ch))
-                nchannels = 4
-            elif nchannels == 4:
-                # RGBA image: apply alpha scaling
-                image_data[:, :, 3] *= alpha
-
-    # Make sure all values are ints in range 0-255.
-    image_data.clip(0, 255, out=image_data)
+    height, width = image_data.shape[:2]
 
     # Image extent with possible axis flipping.
     # The default image bounds include 1/2 unit size expand in all directions.
@@ -310,63 +342,107 @@ def geom_imshow(image_data, cmap=None, *,
                 "Invalid `extent`: list of 4 numbers expected: {}".format(e)
             )
 
-    if ext_x0 > ext_x1:
-        # copy after flip to work around this numpy issue: https://github.com/drj11/pypng/issues/91
-        image_data = numpy.flip(image_data, axis=1).copy()
+    flip_x = ext_x0 > ext_x1
+    if flip_x:
         ext_x0, ext_x1 = ext_x1, ext_x0
 
-    if ext_y0 > ext_y1:
-        image_data = numpy.flip(image_data, axis=0)
+    flip_y = ext_y0 > ext_y1
+    if flip_y:
         ext_y0, ext_y1 = ext_y1, ext_y0
 
-    # Make sure each value is 1 byte and the type is numpy.int8.
-    # Otherwise, pypng will produce broken colors.
-    if image_data.dtype.kind == 'f':
-        # Can't cast directly from float to np.int8.
-        image_data += 0.5
-        image_data = image_data.astype(numpy.int16)
+    def png_scanlines(nchannels):
+        # The pixels are written to the PNG image data flipped according to the extent.
+        scanlines, pixels = _png_scanlines(height, width, nchannels)
+        if flip_x:
+            pixels = pixels[:, ::-1]
+        if flip_y:
+            pixels = pixels[::-1]
+        return scanlines, pixels
+
+    copy = as_boolean(copy, default=True)
+    greyscale = (image_data.ndim == 2)
+    palette = None
+    if greyscale:
+        # Greyscale image
+
+        has_nan = numpy.isnan(image_data.max())
+        min_lum = 0 if not (has_nan and cmap) else 1  # index 0 reserved for NaN-s
 
-    if image_data.dtype != numpy.int8:
-        image_data = image_data.astype(numpy.int8)
+        (image_data, greyscale_data_min, greyscale_data_max, value_dtype) = _normalize_2D(
+            image_data, norm, vmin, vmax, min_lum, copy
+        )
 
-    # Reshape to 2d-array:
-    # from [[[R, G, B], [R, G, B]], ...] to [[R, G, B, R, G, B],..] for RGB(A)
-    # or from [[[L, A], [L, A]], ...] to [[L, A, L, A],..] for greyscale–alpha (LA)
-    # or pypng will fail
-    image_2d = image_data.reshape(-1, width * nchannels)
+        has_nan = numpy.isnan(image_data.max())
+        is_nan = numpy.isnan(image_data) if has_nan else None
+        if has_nan:
+            # index 0 for transparent color if cmap
+            image_data[is_nan] = 0
 
-    # PNG writer
-    palette = None
-    if cmap and greyscale:
-        # colormap via palettable
-        if not palettable:
-            raise ValueError(
-                "Can't process `cmap`: please install 'Palettable' (https://pypi.org/project/palettable/) to your "
-                "Python environment. "
-            )
-        if not has_nan:
-            alpha_ch_val = None if alpha is None else 255 * alpha
-            cmap_256 = palettable.get_map(cmap + "_256")
-            palette = [_hex2rgb_arr_uint8(c, alpha_ch_val) for c in cmap_256.hex_colors]
+        if cmap:
+            # colormap via palettable
+            if not palettable:
+                raise ValueError(
+                    "Can't process `cmap`: please install 'Palettable' (https://pypi.org/project/palettable/) to your "
+                    "Python environment. "
+                )
+            if not has_nan:
+                alpha_ch_val = None if alpha is None else 255 * alpha
+                palette = _palette(palettable.get_map(cmap + "_256").hex_colors, alpha_ch_val)
+            else:
+                alpha_ch_val = 255 if alpha is None else 255 * alpha
+                # transparent color at index 0
+                palette = numpy.concatenate([
+                    numpy.zeros((1, 4), dtype=numpy.uint8),
+                    _palette(palettable.get_map(cmap + "_255").hex_colors, alpha_ch_val)
+                ])
+            color_type = _PNG_PALETTE
+            scanlines, pixels = png_scanlines(1)
+        elif has_nan or alpha is not None:
+            # add alpha-channel (LA)
+            color_type = _PNG_GREYSCALE_ALPHA
+            scanlines, pixels = png_scanlines(2)
+            alpha_ch_scaler = 1 if alpha is None else alpha
+            pixels[:, :, 1] = _uint8_value(255 * alpha_ch_scaler, value_dtype)
+            if has_nan:
+                pixels[:, :, 1][is_nan] = 0
+        else:
+            color_type = _PNG_GREYSCALE
+            scanlines, pixels = png_scanlines(1)
+
+        _to_uint8(image_data, pixels[:, :, 0], in_place=True)
+
+    else:
+        # Color RGB/RGBA image
+        nchannels = image_data.shape[2]
+        # Don't modify the original image unless allowed.
+        in_place = not copy and image_data.flags.writeable
+        if image_data.dtype.kind == 'f':
+            image_data = numpy.multiply(image_data, 255, out=image_data if in_place else None)
+            in_place = True
+
+        if alpha is not None and nchannels == 4:
+            # RGBA image: apply alpha scaling
+            if not in_place or image_data.dtype.kind != 'f':
+                image_data = image_data.astype(numpy.float64)
+            image_data[:, :, 3] *= alpha
+            in_place = True
+
+        if alpha is not None and nchannels == 3:
+            # RGB image: add alpha channel (RGBA)
+            color_type = _PNG_RGBA
+            scanlines, pixels = png_scanlines(4)
+            pixels[:, :, 3] = _uint8_value(255 * alpha, image_data.dtype)
         else:
-            alpha_ch_val = 255 if alpha is None else 255 * alpha
-            cmap_255 = palettable.get_map(cmap + "_255")
-            # transparent color at index 0
-            palette = [numpy.array([0, 0, 0, 0], dtype=numpy.uint8)] + [_hex2rgb_arr_uint8(c, alpha_ch_val) for c in
-                                                                        cmap_255.hex_colors]
-
-    png_bytes = io.BytesIO()
-    png.Writer(
-        width=width,
-        height=height,
-        greyscale=greyscale and not cmap,
-        alpha=(nchannels == 4 or nchannels == 2),  # RGBA or LA
-        bitdepth=8,
-        palette=palette,
-        compression=compression
-    ).write(png_bytes, image_2d)
-
-    href = 'data:image/png;base64,' + str(base64.standard_b64encode(png_bytes.getvalue()), 'utf-8')
+            color_type = _PNG_RGBA if nchannels == 4 else _PNG_RGB
+            scanlines, pixels = png_scanlines(nchannels)
+
+        _to_uint8(image_data, pixels[:, :, :nchannels], in_place=in_place)
+
+    # Free the normalized copy of the image before encoding.
+    del image_data
+
+    png_bytes = _encode_png(scanlines, width, color_type, palette, compression)
+    href = 'data:image/png;base64,' + str(base64.standard_b64encode(png_bytes), 'utf-8')
 
     # The Legend (colorbar)
     show_legend = as_boolean(show_legend, default=True)
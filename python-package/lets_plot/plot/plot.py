@@ -9,6 +9,7 @@ from lets_plot._global_settings import has_global_value, get_global_val, MAX_WID
 from lets_plot.geo_data_internals.utils import is_geocoder
 from lets_plot.plot.core import FeatureSpec
 from lets_plot.plot.core import PlotSpec
+from lets_plot.plot.core import _spec_to_dict
 from lets_plot.plot.util import as_annotated_data
 
 __all__ = ['ggplot', 'ggsize', 'GGBunch']
@@ -170,6 +171,8 @@ class GGBunch(FeatureSpec):
 
     """
 
+    __slots__ = ('items',)
+
     def __init__(self):
         """
         Initialize self.
@@ -209,13 +212,20 @@ class GGBunch(FeatureSpec):
 
         self.items.append(dict(feature_spec=plot_spec, x=x, y=y, width=width, height=height))
 
-    def as_dict(self):
-        d = super().as_dict()
+    def _fingerprint_items(self) -> list:
+        return super()._fingerprint_items() + [self.items]
+
+    def _is_dict_cacheable(self) -> bool:
+        # `add_plot()` changes items without invalidating the memoized dict.
+        return False
+
+    def _build_dict(self, children: list) -> dict:
+        d = super()._build_dict(children)
         d['kind'] = self.kind
 
         def item_as_dict(item):
             result = dict((k, v) for k, v in item.items() if k != 'feature_spec')
-            result['feature_spec'] = item['feature_spec'].as_dict()
+            result['feature_spec'] = _spec_to_dict(item['feature_spec'], children)
             return result
 
         d['items'] = [item_as_dict(item) for item in self.items]
@@ -226,7 +236,8 @@ class GGBunch(FeatureSpec):
         Special method discovered and invoked by IPython.display.display.
         """
         from ..frontend_context._configuration import _as_html
-        return _as_html(self.as_dict())
+        from .._render_cache import spec_fingerprint
+        return _as_html(self.as_dict(), fingerprint=spec_fingerprint(self))
 
     def show(self):
         """
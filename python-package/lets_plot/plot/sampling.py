@@ -11,7 +11,10 @@ __all__ = ['sampling_random',
            'sampling_group_random',
            'sampling_group_systematic',
            'sampling_vertex_vw',
-           'sampling_vertex_dp']
+           'sampling_vertex_dp',
+           'sampling_lttb',
+           'sampling_m4',
+           'sampling_quadtree']
 
 
 def sampling_random(n, seed=None):
@@ -324,5 +327,138 @@ def sampling_vertex_dp(n):
     return _sampling('vertex_dp', n=n)
 
 
+def sampling_lttb(n):
+    """
+    Downsample lines using the Largest-Triangle-Three-Buckets algorithm.
+
+    Parameters
+    ----------
+    n : int
+        Number of items to return.
+
+    Returns
+    -------
+    `FeatureSpec`
+        Line sample specification.
+
+    Notes
+    -----
+    Each line (group) is sampled separately, the number of items is distributed between lines
+    proportionally to their size.
+    The points of a line are sorted by x and split into buckets,
+    one point is picked in each bucket so that the visual shape of the line is kept.
+    The first and the last points are always kept.
+
+    Examples
+    --------
+    .. jupyter-execute::
+        :linenos:
+        :emphasize-lines: 9
+
+        import numpy as np
+        from lets_plot import *
+        LetsPlot.setup_html()
+        n = 100000
+        x = np.arange(n)
+        np.random.seed(12)
+        y = np.random.normal(0, 1, n).cumsum()
+        ggplot({'x': x, 'y': y}, aes(x='x', y='y')) + \\
+            geom_line(sampling=sampling_lttb(500))
+
+    """
+    return _sampling('lttb', n=n)
+
+
+def sampling_m4(n):
+    """
+    Downsample lines using the M4 algorithm.
+
+    Parameters
+    ----------
+    n : int
+        Number of items to return.
+
+    Returns
+    -------
+    `FeatureSpec`
+        Line sample specification.
+
+    Notes
+    -----
+    Each line (group) is sampled separately, the number of items is distributed between lines
+    proportionally to their size.
+    The x-range of a line is split into n / 4 buckets of the same width,
+    in each bucket the points with the minimal and maximal x and y are picked.
+    M4 is the default sampling of `geom_line()`, `geom_step()` and `geom_area()`.
+
+    Examples
+    --------
+    .. jupyter-execute::
+        :linenos:
+        :emphasize-lines: 9
+
+        import numpy as np
+        from lets_plot import *
+        LetsPlot.setup_html()
+        n = 100000
+        x = np.arange(n)
+        np.random.seed(12)
+        y = np.random.normal(0, 1, n).cumsum()
+        ggplot({'x': x, 'y': y}, aes(x='x', y='y')) + \\
+            geom_line(sampling=sampling_m4(500))
+
+    """
+    return _sampling('m4', n=n)
+
+
+def sampling_quadtree(n, depth=None):
+    """
+    Pick points for the visible area: about n points are shown whatever the zoom.
+
+    Parameters
+    ----------
+    n : int
+        Number of points to return from each quadtree cell.
+    depth : int, default=8
+        Depth of the quadtree (from 0 to 15).
+        When zoomed in deeper than this level, all the visible points are shown.
+
+    Returns
+    -------
+    `FeatureSpec`
+        Point sample specification.
+
+    Notes
+    -----
+    The x/y-range of the data is split into a quadtree (pyramid) of `depth` levels:
+    the level d consists of 2^d x 2^d cells, each cell keeps n points,
+    and the points of a level are a subset of the points of the next level.
+
+    The visible area is set by the limits of `coord_cartesian()` or `coord_fixed()`:
+    when it covers 1/4^d of the data area, the points of the level d inside the visible area are shown.
+    Without the limits the level 0 (n points of the whole data) is shown.
+    Thus zooming into a dense region with `coord_cartesian()` shows its detail instead of an empty-looking area.
+
+    Examples
+    --------
+    .. jupyter-execute::
+        :linenos:
+        :emphasize-lines: 9-10
+
+        import numpy as np
+        from lets_plot import *
+        LetsPlot.setup_html()
+        n = 1000000
+        np.random.seed(12)
+        x = np.random.normal(0, 1, n)
+        y = np.random.normal(0, 1, n)
+        ggplot({'x': x, 'y': y}, aes(x='x', y='y')) + \\
+            geom_point(sampling=sampling_quadtree(1000)) + \\
+            coord_cartesian(xlim=[0, 0.5], ylim=[0, 0.5])
+
+    """
+    return _sampling('quadtree', n=n, depth=depth)
+
+
 def _sampling(name, **kwargs):
     return FeatureSpec('sampling', name, **kwargs)
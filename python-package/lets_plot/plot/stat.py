@@ -13,6 +13,7 @@ def stat_summary(mapping=None, *, data=None, geom=None,
                  orientation=None,
                  fun=None, fun_min=None, fun_max=None,
                  quantiles=None,
+                 precompute=None,
                  color_by=None, fill_by=None,
                  **other_args):
     """
@@ -55,6 +56,14 @@ def stat_summary(mapping=None, *, data=None, geom=None,
     quantiles : list of float, default=[0.25, 0.5, 0.75]
         A list of probabilities defining the quantile functions 'lq', 'mq' and 'uq'.
         Must contain exactly 3 values between 0 and 1.
+    precompute : bool, default=False
+        Compute the summaries in Python (NumPy) and send only the result to the plotting engine
+        instead of the raw data. Use it with very large data.
+        With `precompute` the data can also be a list (or any re-iterable collection) of data frames
+        or a pyarrow dataset: the chunks are processed one at a time.
+        'count', 'sum', 'mean', 'min' and 'max' are computed exactly,
+        quantiles ('median', 'lq', 'mq', 'uq') are estimated with a small relative rank error
+        when a group (or a bin) has more than 2048 values.
     color_by : {'fill', 'color', 'paint_a', 'paint_b', 'paint_c'}, default='color'
         Define the color aesthetic for the geometry.
     fill_by : {'fill', 'color', 'paint_a', 'paint_b', 'paint_c'}, default='fill'
@@ -141,6 +150,7 @@ def stat_summary(mapping=None, *, data=None, geom=None,
                  orientation=orientation,
                  fun=fun, fun_min=fun_min, fun_max=fun_max,
                  quantiles=quantiles,
+                 precompute=precompute,
                  color_by=color_by, fill_by=fill_by,
                  **other_args)
 
@@ -152,6 +162,7 @@ def stat_summary_bin(mapping=None, *, data=None, geom=None,
                      quantiles=None,
                      bins=None, binwidth=None,
                      center=None, boundary=None,
+                     precompute=None,
                      color_by=None, fill_by=None,
                      **other_args):
     """
@@ -205,6 +216,14 @@ def stat_summary_bin(mapping=None, *, data=None, geom=None,
         Specify x-value to align bin centers to.
     boundary : float
         Specify x-value to align bin boundary (i.e. point between bins) to.
+    precompute : bool, default=False
+        Compute the summaries in Python (NumPy) and send only the result to the plotting engine
+        instead of the raw data. Use it with very large data.
+        With `precompute` the data can also be a list (or any re-iterable collection) of data frames
+        or a pyarrow dataset: the chunks are processed one at a time.
+        'count', 'sum', 'mean', 'min' and 'max' are computed exactly,
+        quantiles ('median', 'lq', 'mq', 'uq') are estimated with a small relative rank error
+        when a group (or a bin) has more than 2048 values.
     color_by : {'fill', 'color', 'paint_a', 'paint_b', 'paint_c'}, default='color'
         Define the color aesthetic for the geometry.
     fill_by : {'fill', 'color', 'paint_a', 'paint_b', 'paint_c'}, default='fill'
@@ -294,6 +313,7 @@ def stat_summary_bin(mapping=None, *, data=None, geom=None,
                  quantiles=quantiles,
                  bins=bins, binwidth=binwidth,
                  center=center, boundary=boundary,
+                 precompute=precompute,
                  color_by=color_by, fill_by=fill_by,
                  **other_args)
 
@@ -9,7 +9,7 @@ from typing import Dict
 from lets_plot.plot.core import DummySpec
 from lets_plot.plot.core import FeatureSpec
 from lets_plot.plot.core import FeatureSpecArray
-from lets_plot.plot.core import _specs_to_dict
+from lets_plot.plot.core import _specs_to_dict, _spec_to_dict
 
 __all__ = ['SupPlotsSpec']
 
@@ -36,6 +36,8 @@ class SupPlotsSpec(FeatureSpec):
     See: `gggrid()`
     """
 
+    __slots__ = ('__figures', '__layout')
+
     @classmethod
     def duplicate(cls, other):
         dup = SupPlotsSpec(
@@ -73,11 +75,14 @@ class SupPlotsSpec(FeatureSpec):
 
         return super().__add__(other)
 
-    def as_dict(self):
-        d = super().as_dict()
+    def _fingerprint_items(self) -> list:
+        return super()._fingerprint_items() + [self.__figures, self.__layout.as_dict()]
+
+    def _build_dict(self, children: list) -> dict:
+        d = super()._build_dict(children)
         d['kind'] = self.kind
         d['layout'] = self.__layout.as_dict()
-        d['figures'] = [figure.as_dict() if figure is not None else None for figure in self.__figures]
+        d['figures'] = [_spec_to_dict(figure, children) if figure is not None else None for figure in self.__figures]
 
         return d
 
@@ -86,7 +91,8 @@ class SupPlotsSpec(FeatureSpec):
         Special method discovered and invoked by IPython.display.display.
         """
         from ..frontend_context._configuration import _as_html
-        return _as_html(self.as_dict())
+        from .._render_cache import spec_fingerprint
+        return _as_html(self.as_dict(), fingerprint=spec_fingerprint(self))
 
     def show(self):
         """
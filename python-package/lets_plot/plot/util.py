@@ -2,11 +2,12 @@
 # Copyright (c) 2019. JetBrains s.r.o.
 # Use of this source code is governed by the MIT license that can be found in the LICENSE file.
 #
+import sys
 from collections.abc import Iterable
 from datetime import datetime
-from typing import Any, Tuple, Sequence, Optional
+from typing import Any, Tuple, Sequence, Optional, List
 
-from lets_plot._type_utils import is_dict_or_dataframe
+from lets_plot._type_utils import is_dict_or_dataframe, is_polars_dataframe, is_arrow_table
 from lets_plot.geo_data_internals.utils import find_geo_names
 from lets_plot.mapping import MappingMeta
 from lets_plot.plot.core import aes
@@ -57,15 +58,12 @@ def as_annotated_data(raw_data: Any, raw_mapping: Any) -> Tuple:
     # series annotations
     series_meta = []
 
-    if is_dict_or_dataframe(data):
-        for column_name, values in data.items():
-            if isinstance(values, Iterable):
-                not_empty_series = any(True for _ in values)
-                if not_empty_series and all(isinstance(val, datetime) for val in values):
-                    series_meta.append({
-                        'column': column_name,
-                        'type': 'datetime'
-                    })
+    if is_dict_or_dataframe(data) or is_polars_dataframe(data) or is_arrow_table(data):
+        for column_name in _datetime_columns(data):
+            series_meta.append({
+                'column': column_name,
+                'type': 'datetime'
+            })
 
     if len(series_meta) > 0:
         data_meta.update({'series_annotations': series_meta})
@@ -73,6 +71,44 @@ def as_annotated_data(raw_data: Any, raw_mapping: Any) -> Tuple:
     return data, aes(**mapping), {'data_meta': data_meta}
 
 
+def _datetime_columns(data) -> List:
+    if is_polars_dataframe(data):
+        return [series.name for series in data.get_columns() if _is_datetime_series(series)]
+    if is_arrow_table(data):
+        types = sys.modules['pyarrow'].types
+        return [field.name for field in data.schema
+                if data.num_rows > 0 and (types.is_timestamp(field.type) or types.is_date(field.type))]
+    return [name for name, values in data.items() if _is_datetime_series(values)]
+
+
+def _is_datetime_series(values) -> bool:
+    if not isinstance(values, Iterable):
+        return False
+
+    # Columns of numpy, pandas and polars are detected by their dtype,
+    # object columns and lists are checked element by element.
+    dtype = getattr(values, 'dtype', None)
+    if dtype is not None:
+        if type(dtype).__module__.startswith('polars'):
+            import polars
+            if dtype == polars.Object:
+                return _is_datetime_list(values)
+            return len(values) > 0 and (dtype == polars.Datetime or dtype == polars.Date)
+
+        kind = getattr(dtype, 'kind', None)
+        if kind == 'M':  # numpy datetime64 or pandas.DatetimeTZDtype
+            return len(values) > 0
+        if kind in ('b', 'i', 'u', 'f', 'c', 'm', 'S', 'U') or getattr(dtype, 'type', None) is str:
+            return False
+
+    return _is_datetime_list(values)
+
+
+def _is_datetime_list(values) -> bool:
+    not_empty_series = any(True for _ in values)
+    return not_empty_series and all(isinstance(val, datetime) for val in values)
+
+
 def is_data_pub_stream(data: Any) -> bool:
     # try:
     #     from lets_plot.display import DataPubStream
@@ -149,11 +185,10 @@ def auto_join_geo_names(map_join: Any, gdf):
 
 
 def is_geo_data_frame(data: Any) -> bool:
-    try:
-        from geopandas import GeoDataFrame
-        return isinstance(data, GeoDataFrame)
-    except ImportError:
-        return False
+    # A GeoDataFrame can only exist if geopandas is already imported.
+    # This avoids a costly failing import attempt on every call when geopandas is not installed.
+    geopandas = sys.modules.get('geopandas')
+    return geopandas is not None and isinstance(data, geopandas.GeoDataFrame)
 
 
 def get_geo_data_frame_meta(geo_data_frame) -> dict:
@@ -107,3 +107,63 @@ def test_feature_array_with_dummy():
     expect = array.as_dict()
     assert (array + DummySpec()).as_dict() == expect
     assert (DummySpec() + array).as_dict() == expect
+
+
+def test_plot_add_keeps_value_semantics():
+    geom1 = _geom('geom1')
+    geom2 = _geom('geom2')
+    geom3 = _geom('geom3')
+
+    base = gg.ggplot() + geom1
+    plot_a = base + geom2
+    plot_b = base + geom3  # 'base' layers storage is already extended by 'plot_a'
+
+    assert [l['geom'] for l in base.as_dict()['layers']] == ['geom1']
+    assert [l['geom'] for l in plot_a.as_dict()['layers']] == ['geom1', 'geom2']
+    assert [l['geom'] for l in plot_b.as_dict()['layers']] == ['geom1', 'geom3']
+    assert [l['geom'] for l in (plot_a + geom3).as_dict()['layers']] == ['geom1', 'geom2', 'geom3']
+
+
+def test_specs_store_only_non_default_props():
+    layer = gg.geom_point(gg.aes('x'), size=3)
+    assert not hasattr(layer, '__dict__')
+    assert layer.props()['mapping'].props() == {'x': 'x'}
+    assert 'data' not in layer.props()
+    assert layer.props()['size'] == 3
+
+
+def test_as_dict_reuses_dicts_of_unchanged_specs():
+    layer = gg.geom_point(gg.aes('x', 'y'), size=3)
+    plot = gg.ggplot() + layer
+    layer_dict = plot._dict()['layers'][0]
+
+    plot_2 = plot + gg.ggtitle('title')
+    assert plot_2._dict()['layers'][0] is layer_dict
+    assert plot_2.as_dict()['ggtitle'] == {'text': 'title'}
+
+    # Access to props() drops the memoized dict.
+    layer.props()['size'] = 5
+    assert plot_2.as_dict()['layers'][0]['size'] == 5
+    assert plot.as_dict()['layers'][0]['size'] == 5
+
+
+def test_as_dict_is_not_memoized_for_dict_data():
+    data = {'x': [0]}
+    plot = gg.ggplot(data) + gg.geom_point()
+    assert plot.as_dict()['data'] == {'x': [0]}
+
+    data['x'].append(1)
+    assert plot.as_dict()['data'] == {'x': [0, 1]}
+
+
+def test_as_dict_result_can_be_modified():
+    plot = gg.ggplot({'x': [0]}) + gg.geom_point(gg.aes('x', 'x')) + gg.scale_x_log10()
+    d = plot.as_dict()
+    d['layers'][0]['geom'] = 'line'
+    d['scales'][0]['name'] = 'MUT'
+    d['data']['y'] = [1]
+
+    d = plot.as_dict()
+    assert d['layers'][0]['geom'] == 'point'
+    assert 'name' not in d['scales'][0]
+    assert d['data'] == {'x': [0]}
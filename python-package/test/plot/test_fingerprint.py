@@ -0,0 +1,82 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lets_plot.plot import ggplot, aes, geom_point, geom_line, scale_x_log10, theme_bw, ggsize, gggrid, GGBunch
+
+
+def _df():
+    return pd.DataFrame({
+        'x': np.arange(10, dtype=float),
+        'y': np.arange(10),
+        'c': list('ababababab'),
+        'd': pd.date_range('2020-01-01', periods=10),
+    })
+
+
+def _plot(df):
+    return ggplot(df, aes('x', 'y')) + geom_point(aes(color='c')) + scale_x_log10() + theme_bw()
+
+
+def test_equal_specs_have_equal_fingerprints():
+    assert _plot(_df()).fingerprint() == _plot(_df()).fingerprint()
+
+
+def test_fingerprint_depends_on_data():
+    df = _df()
+    p = _plot(df)
+    fingerprint = p.fingerprint()
+
+    df.loc[0, 'x'] = 100
+    assert p.fingerprint() != fingerprint
+
+    df = _df()
+    df.loc[0, 'c'] = 'z'
+    assert _plot(df).fingerprint() != fingerprint
+
+
+def test_fingerprint_depends_on_features():
+    fingerprint = _plot(_df()).fingerprint()
+    assert (_plot(_df()) + ggsize(100, 100)).fingerprint() != fingerprint
+    assert (_plot(_df()) + geom_line()).fingerprint() != fingerprint
+
+
+def test_memoized_fingerprint_is_invalidated_by_props():
+    scale = scale_x_log10()
+    fingerprint = scale.fingerprint()
+    scale.props()['name'] = 'X'
+    assert scale.fingerprint() != fingerprint
+
+
+def test_subplots_and_bunch():
+    p = _plot(_df())
+    assert gggrid([p, p]).fingerprint() == gggrid([p, p]).fingerprint()
+    assert gggrid([p, p]).fingerprint() != gggrid([p, p], ncol=1).fingerprint()
+
+    bunch = GGBunch()
+    bunch.add_plot(p, 0, 0)
+    fingerprint = bunch.fingerprint()
+    bunch.add_plot(p, 100, 0)
+    assert bunch.fingerprint() != fingerprint
+
+
+def test_arrow_table_fingerprint():
+    pa = pytest.importorskip('pyarrow')
+    table = pa.table({'x': [1.0, 2.0, 3.0], 'c': pa.array(['a', 'b', 'a']).dictionary_encode()})
+    assert (ggplot(table) + geom_point()).fingerprint() == \
+           (ggplot(pa.table({'x': [1.0, 2.0, 3.0], 'c': pa.array(['a', 'b', 'a']).dictionary_encode()}))
+            + geom_point()).fingerprint()
+    assert ggplot(table).fingerprint() != ggplot(table.slice(1)).fingerprint()
+    assert ggplot(table).fingerprint() != \
+           ggplot(table.set_column(1, 'c', pa.array(['a', 'b', 'b']).dictionary_encode())).fingerprint()
+
+
+def test_fingerprint_of_dict_data_is_not_memoized():
+    data = {'x': [0.0, 1.0]}
+    layer = geom_point(data=data)
+    fingerprint = layer.fingerprint()
+    data['x'][0] = 9.0
+    assert layer.fingerprint() != fingerprint
@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2023. JetBrains s.r.o.
+# Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+#
+
+import base64
+import struct
+import zlib
+
+import numpy as np
+
+from lets_plot.plot.geom_imshow_ import geom_imshow
+
+
+def _png_chunks(spec):
+    href = spec.as_dict()['feature-list'][0]['layer']['href']
+    png_bytes = base64.standard_b64decode(href[len('data:image/png;base64,'):])
+    assert png_bytes[:8] == b'\x89PNG\r\n\x1a\n'
+
+    chunks = {}
+    pos = 8
+    while pos < len(png_bytes):
+        length, tag = struct.unpack("!I4s", png_bytes[pos:pos + 8])
+        data = png_bytes[pos + 8:pos + 8 + length]
+        checksum, = struct.unpack("!I", png_bytes[pos + 8 + length:pos + 12 + length])
+        assert checksum == zlib.crc32(tag + data)
+        chunks[tag] = data
+        pos += length + 12
+    return chunks
+
+
+def test_png_image_data():
+    image = np.array([
+        [0, 1, 2],
+        [3, 4, np.nan]
+    ])
+    chunks = _png_chunks(geom_imshow(image, norm=False, extent=[2.5, -0.5, -0.5, 1.5]))
+
+    assert list(chunks.keys()) == [b'IHDR', b'IDAT', b'IEND']
+    # width, height, bit depth, color type (greyscale with alpha), compression, filter, interlace
+    assert struct.unpack("!2I5B", chunks[b'IHDR']) == (3, 2, 8, 4, 0, 0, 0)
+    # Rows with the filter type byte, the columns are flipped by the extent.
+    assert zlib.decompress(chunks[b'IDAT']) == bytes([
+        0, 2, 255, 1, 255, 0, 255,
+        0, 0, 0, 4, 255, 3, 255,
+    ])
+
+
+def test_palette():
+    image = np.array([[0., 1.]])
+    chunks = _png_chunks(geom_imshow(image, cmap='viridis', alpha=0.5))
+
+    palette = np.frombuffer(chunks[b'PLTE'], dtype=np.uint8).reshape(-1, 3)
+    assert len(palette) == 256
+    assert palette[0].tolist() == [0x44, 0x01, 0x54]
+    assert chunks[b'tRNS'] == bytes([128] * 256)
+    assert zlib.decompress(chunks[b'IDAT']) == bytes([0, 0, 255])
+
+
+def test_integer_image_normalized_via_lookup_table():
+    rng = np.random.default_rng(42)
+    for dtype in [np.uint8, np.int8, np.uint16, np.int16]:
+        info = np.iinfo(dtype)
+        image = rng.integers(info.min, info.max, size=(300, 300), endpoint=True).astype(dtype)
+        for kwargs in [dict(), dict(cmap='magma'), dict(vmin=-100, vmax=100, alpha=0.3)]:
+            assert geom_imshow(image, **kwargs).as_dict() == \
+                   geom_imshow(image.astype(np.float32), **kwargs).as_dict()
+
+
+def test_copy():
+    image = np.array([[0., 10.], [20., 30.]])
+    original = image.copy()
+    spec = geom_imshow(image)
+    assert np.array_equal(image, original)
+
+    # The image is normalized in place.
+    assert geom_imshow(image, copy=False).as_dict() == spec.as_dict()
+    assert not np.array_equal(image, original)
+
+    # Read-only image is not modified.
+    original.flags.writeable = False
+    assert geom_imshow(original, copy=False).as_dict() == spec.as_dict()
@@ -2,7 +2,12 @@
 #  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
 
 from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
 from pandas import DataFrame
+
 from lets_plot.plot.util import as_annotated_data
 
 dt_value = datetime(2020, 1, 1)
@@ -47,6 +52,45 @@ def test_df_with_empty_series():
     assert {} == get_data_meta(data)
 
 
+def test_datetime_dtypes():
+    data = {
+        'numpy': np.array(['2020-01-01', 'NaT'], dtype='datetime64[ns]'),
+        'pandas': pd.Series(pd.to_datetime(['2020-01-01', None])),
+        'pandas_tz': pd.Series(pd.to_datetime(['2020-01-01']).tz_localize('Europe/Berlin')),
+        'objects': pd.Series([dt_value], dtype=object),
+        'floats': np.array([1.0]),
+        'strings': pd.Series(['foo']),
+    }
+    assert_series_annotations(data, [
+        {'column': 'numpy', 'type': 'datetime'},
+        {'column': 'pandas', 'type': 'datetime'},
+        {'column': 'pandas_tz', 'type': 'datetime'},
+        {'column': 'objects', 'type': 'datetime'},
+    ])
+
+
+def test_polars_datetime_dtypes():
+    polars = pytest.importorskip('polars')
+    df = polars.DataFrame({
+        'datetime': [dt_value],
+        'date': [dt_value.date()],
+        'float': [0.0],
+    })
+    assert_series_annotations(df, [
+        {'column': 'datetime', 'type': 'datetime'},
+        {'column': 'date', 'type': 'datetime'},
+    ])
+
+
+def test_changed_object_column_is_checked_again():
+    df = DataFrame({'v': [dt_value, dt_value]}, dtype=object)
+    assert_series_annotations(df, [{'column': 'v', 'type': 'datetime'}])
+
+    # Neither the columns nor the dtypes are changed.
+    df.loc[1, 'v'] = 'foo'
+    assert 'series_annotations' not in get_data_meta(df)
+
+
 def get_data_meta(data):
     _, _, data_meta = as_annotated_data(data, None)
     return data_meta['data_meta']
@@ -55,3 +99,16 @@ def get_data_meta(data):
 def assert_series_annotations(data, expected):
     data_meta = get_data_meta(data)
     assert expected == data_meta['series_annotations']
+
+
+def test_arrow_table_datetime_types():
+    pa = pytest.importorskip('pyarrow')
+    table = pa.table({
+        'timestamp': pa.array([0], type=pa.timestamp('ms')),
+        'date': pa.array([0], type=pa.date32()),
+        'float': pa.array([0.0]),
+    })
+    assert_series_annotations(table, [
+        {'column': 'timestamp', 'type': 'datetime'},
+        {'column': 'date', 'type': 'datetime'},
+    ])
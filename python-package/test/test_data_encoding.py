@@ -0,0 +1,109 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import base64
+import importlib.machinery
+import re
+import zlib
+
+import numpy as np
+import pytest
+
+import lets_plot_kotlin_bridge
+from lets_plot import LetsPlot
+from lets_plot._global_settings import _settings, get_data_encoding, DATA_ENCODING, DATA_COMPRESSION
+from lets_plot._type_utils import standardize_dict
+from lets_plot.plot import ggplot, aes, geom_point
+
+
+@pytest.fixture(autouse=True)
+def restore_settings():
+    saved = dict(_settings)
+    yield
+    _settings.clear()
+    _settings.update(saved)
+
+
+def test_default_data_encoding():
+    assert get_data_encoding() == ('json', None)
+
+
+def test_set_data_encoding():
+    LetsPlot.set({DATA_ENCODING: 'float32', DATA_COMPRESSION: 'deflate'})
+    assert get_data_encoding() == ('float32', 'deflate')
+
+
+@pytest.mark.parametrize('args', [
+    {'data_encoding': 'float16'},
+    {'data_encoding': 'float64', 'data_compression': 'gzip'},
+    {'data_compression': False},
+])
+def test_setup_html_rejects_unsupported_data_encoding(args):
+    with pytest.raises(ValueError):
+        LetsPlot.setup_html(**args)
+    assert get_data_encoding() == ('json', None)
+
+
+def test_setup_html_data_compression():
+    LetsPlot.setup_html(data_encoding='float64', data_compression='deflate')
+    assert get_data_encoding() == ('float64', 'deflate')
+
+    LetsPlot.setup_html(data_encoding='float32')
+    assert get_data_encoding() == ('float32', 'deflate')
+
+    LetsPlot.setup_html(data_compression='none')
+    assert get_data_encoding() == ('float32', None)
+
+
+# The encoded column, see TypedArrayEncoding.kt
+_ENCODED_COLUMN_RE = re.compile(r'\{\s*"typed_array":"(\w+)",\s*(?:"compression":"(\w+)",\s*)?'
+                                r'"length":(\d+),\s*"data":"([^"]*)"\s*}')
+
+
+def _decode_columns(html):
+    columns = []
+    for typed_array, compression, length, data in _ENCODED_COLUMN_RE.findall(html):
+        buffer = base64.standard_b64decode(data.replace('\\/', '/'))
+        if compression == 'deflate':
+            buffer = zlib.decompress(buffer)
+        values = np.frombuffer(buffer, dtype='<f8' if typed_array == 'float64' else '<f4')
+        assert len(values) == int(length)
+        columns.append(values)
+    return columns
+
+
+_requires_extension = pytest.mark.skipif(
+    not getattr(lets_plot_kotlin_bridge, '__file__', '').endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES)),
+    reason='lets_plot_kotlin_bridge extension is not built'
+)
+
+
+@_requires_extension
+@pytest.mark.parametrize('data_encoding,data_compression', [
+    ('float64', None),
+    ('float64', 'deflate'),
+    ('float32', None),
+    ('float32', 'deflate'),
+])
+def test_encoded_columns_round_trip(data_encoding, data_compression):
+    x = np.linspace(-1, 1, 500)
+    x[7] = np.nan
+    spec = (ggplot({'x': x, 'y': np.arange(500)}, aes('x', 'y')) + geom_point(sampling='none')).as_dict()
+
+    html = lets_plot_kotlin_bridge.export_html(standardize_dict(spec), 'lets-plot.js', False,
+                                               data_encoding, data_compression)
+    columns = _decode_columns(html)
+    assert len(columns) > 0
+    dtype = np.float64 if data_encoding == 'float64' else np.float32
+    assert any(np.array_equal(column, x.astype(dtype), equal_nan=True) for column in columns)
+
+
+@_requires_extension
+def test_datetime_column_round_trip():
+    t = np.datetime64('2023-06-01T12:00:00') + np.arange(500) * np.timedelta64(1001, 'ms')
+    spec = (ggplot({'t': t, 'y': np.arange(500.0)}, aes('t', 'y')) + geom_point(sampling='none')).as_dict()
+
+    # Float32 would round epoch milliseconds to about 2 minutes.
+    html = lets_plot_kotlin_bridge.export_html(standardize_dict(spec), 'lets-plot.js', False, 'float32', None)
+    millis = t.astype('datetime64[ms]').astype(np.int64).astype(np.float64)
+    assert any(column.dtype == np.float64 and np.array_equal(column, millis) for column in _decode_columns(html))
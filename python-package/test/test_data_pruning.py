@@ -0,0 +1,92 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from lets_plot import LetsPlot
+from lets_plot._data_pruning import prune_unused_columns
+from lets_plot._global_settings import _settings
+from lets_plot import _kbridge
+from lets_plot.bistro.qq import qq_plot
+from lets_plot.mapping import as_discrete
+from lets_plot.plot import ggplot, aes, geom_point, geom_text, facet_grid, gggrid, layer_tooltips
+
+data = {name: [0] for name in ['x', 'y', 'c', 'f', 'tip', 'tip space', 'fmt', 'var', 'order', 'label', 'unused']}
+
+
+def _data_columns(spec):
+    return set(spec['data'].keys())
+
+
+def test_unused_plot_columns_are_dropped():
+    p = ggplot(data, aes('x')) + geom_point(aes(y='y', color=as_discrete('c', order_by='order')),
+                                            tooltips=layer_tooltips(['tip'])
+                                            .line('@{tip space}')
+                                            .format('@fmt', '.1f')
+                                            .line('@|@fmt')) + \
+        geom_text(label='label', tooltips='none') + \
+        facet_grid(x='f')
+    spec = prune_unused_columns(p.as_dict())
+    assert _data_columns(spec) == {'x', 'y', 'c', 'f', 'tip', 'tip space', 'fmt', 'order'}
+
+
+def test_layer_data_keeps_plot_level_references():
+    p = ggplot(mapping=aes('x')) + geom_point(aes(y='y'), data=data) + facet_grid(y='f')
+    spec = prune_unused_columns(p.as_dict())
+    assert _data_columns(spec['layers'][0]) == {'x', 'y', 'f'}
+
+
+def test_plot_spec_is_not_modified():
+    p = ggplot(data, aes('x', 'y')) + geom_point()
+    spec = p.as_dict()
+    prune_unused_columns(spec)
+    assert _data_columns(spec) == set(data.keys())
+
+
+def test_data_frames():
+    df = pd.DataFrame(data)
+    df['t'] = [datetime(2020, 1, 1)]
+    spec = prune_unused_columns((ggplot(df, aes('x', 't')) + geom_point()).as_dict())
+    assert _data_columns(spec) == {'x', 't'}
+    assert [a['column'] for a in spec['data_meta']['series_annotations']] == ['t']
+
+    df['t2'] = [datetime(2020, 1, 1)]
+    spec = prune_unused_columns((ggplot(df, aes('x', 'y')) + geom_point()).as_dict())
+    assert spec['data_meta']['series_annotations'] == []
+
+
+def test_polars_data_frame():
+    pl = pytest.importorskip('polars')
+    spec = prune_unused_columns((ggplot(pl.DataFrame(data), aes('x', 'y')) + geom_point()).as_dict())
+    assert spec['data'].columns == ['x', 'y']
+
+
+def test_subplots():
+    p = ggplot(data, aes('x', 'y')) + geom_point()
+    spec = prune_unused_columns(gggrid([p, None]).as_dict())
+    assert _data_columns(spec['figures'][0]) == {'x', 'y'}
+    assert spec['figures'][1] is None
+
+
+def test_bistro_is_not_pruned():
+    spec = qq_plot(data, 'x').as_dict()
+    assert prune_unused_columns(spec) is spec
+
+
+@pytest.fixture
+def restore_settings():
+    saved = dict(_settings)
+    yield
+    _settings.clear()
+    _settings.update(saved)
+
+
+def test_pruning_can_be_disabled(restore_settings):
+    p = ggplot(data, aes('x', 'y')) + geom_point()
+    assert set(_kbridge._standardize_plot_spec(p.as_dict())['data'].keys()) == {'x', 'y'}
+
+    LetsPlot.set({'prune_data': False})
+    assert set(_kbridge._standardize_plot_spec(p.as_dict())['data'].keys()) == set(data.keys())
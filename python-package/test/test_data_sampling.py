@@ -0,0 +1,172 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import numpy as np
+import pandas as pd
+
+from lets_plot._data_sampling import sample_data, _KotlinRandom
+from lets_plot.plot import ggplot, aes, geom_point, geom_line, geom_histogram, facet_wrap, coord_cartesian
+from lets_plot.plot import sampling_random, sampling_systematic, sampling_group_random, sampling_lttb, sampling_m4, \
+    sampling_quadtree
+
+N = 200_000
+data = {'x': np.arange(N, dtype=float), 'y': np.arange(N) % 7}
+
+
+def test_kotlin_random_numbers():
+    # kotlin.random.Random(37).nextInt(1000003)
+    random = _KotlinRandom(37)
+    assert [random.next_int(1000003) for _ in range(5)] == [165175, 411395, 984294, 254930, 808503]
+
+
+def test_default_point_sampling():
+    spec = sample_data((ggplot(data, aes('x', 'y')) + geom_point()).as_dict())
+    layer = spec['layers'][0]
+
+    assert 'data' not in spec
+    assert layer['sampling'] == 'none'
+    x = layer['data']['x']
+    assert len(x) == 100_000 and np.all(np.diff(x) > 0)
+    assert np.array_equal(layer['data']['y'], x.astype(int) % 7)
+    assert spec['computation_messages'] == [
+        'sampling_random(n=100000, seed=37) was applied to [point/identity stat] layer'
+    ]
+
+
+def test_systematic_sampling():
+    p = ggplot() + geom_line(aes('x', 'y'), data=pd.DataFrame(data), sampling=sampling_systematic(1000))
+    layer = sample_data(p.as_dict())['layers'][0]
+
+    # step = round(200000 / 999) = 200
+    assert layer['data']['x'].tolist() == list(range(0, N, 200))
+
+
+def test_sum_of_samplings():
+    p = ggplot(data, aes('x', 'y')) + geom_point(sampling=sampling_random(150_000, seed=1) + sampling_systematic(10))
+    spec = sample_data(p.as_dict())
+
+    # step = round(150000 / 9) = 16667
+    assert len(spec['layers'][0]['data']['x']) == 9
+    assert spec['computation_messages'] == [
+        'sampling_random(n=150000, seed=1)+sampling_systematic(n=10) was applied to [point/identity stat] layer'
+    ]
+
+
+def test_default_line_sampling():
+    y = np.zeros(N)
+    y[1234] = 1
+    spec = sample_data((ggplot({'x': np.arange(N), 'y': y}, aes('x', 'y')) + geom_line()).as_dict())
+    x = spec['layers'][0]['data']['x']
+
+    assert len(x) <= 50_000 and np.all(np.diff(x) > 0)
+    # The spike and the ends of the line are kept.
+    assert {0, 1234, N - 1} <= set(x.tolist())
+    assert spec['computation_messages'] == ['sampling_m4(n=50000) was applied to [line/identity stat] layer']
+
+
+def test_line_sampling_keeps_gaps():
+    y = np.sin(np.arange(80_000) / 100)
+    y[20_000:30_000] = np.nan
+    spec = sample_data((ggplot({'x': np.arange(80_000), 'y': y}, aes('x', 'y')) + geom_line()).as_dict())
+    layer = spec['layers'][0]
+
+    # The first row of the gap is kept as the break of the line.
+    assert np.isnan(layer['data']['y']).sum() == 1
+    assert layer['data']['x'][np.isnan(layer['data']['y'])].tolist() == [20_000]
+    assert np.isfinite(layer['data']['y']).sum() <= 50_000
+
+    # Not applicable: the sampling would only drop the gap rows.
+    y = np.arange(55_000, dtype=float)
+    y[::10] = np.nan
+    spec = sample_data((ggplot({'x': np.arange(55_000), 'y': y}, aes('x', 'y')) + geom_line()).as_dict())
+    assert 'sampling' not in spec['layers'][0]
+    assert 'computation_messages' not in spec
+
+
+def test_line_samplings_of_groups():
+    # Two lines: the 'c' values are the groups.
+    line_data = {'x': np.arange(N) // 2, 'y': np.sin(np.arange(N)), 'c': ['a', 'b'] * (N // 2)}
+    for sampling, expected_size in [(sampling_lttb(100), 100), (sampling_m4(100), None)]:
+        p = ggplot(line_data, aes('x', 'y', color='c')) + geom_line(sampling=sampling)
+        layer = sample_data(p.as_dict())['layers'][0]
+        c = np.array(layer['data']['c'])
+        x = layer['data']['x']
+
+        assert expected_size is None or len(x) == expected_size
+        for group in ['a', 'b']:
+            assert x[c == group][0] == 0 and x[c == group][-1] == N // 2 - 1
+            assert 45 <= np.sum(c == group) <= 50
+
+
+def test_line_sampling_with_safety_sampling():
+    p = ggplot({'x': np.arange(300_000), 'y': np.arange(300_000)}, aes('x', 'y')) + \
+        geom_line(sampling=sampling_lttb(250_000))
+    spec = sample_data(p.as_dict())
+    assert len(spec['layers'][0]['data']['x']) == 200_000
+    assert spec['computation_messages'] == [
+        'sampling_lttb(n=250000)+sampling_random(n=200000, seed=37) was applied to [line/identity stat] layer'
+    ]
+
+
+def test_quadtree_sampling_of_viewport():
+    # Grid of 300 x 300 points.
+    side = 300
+    grid = {'x': np.arange(side * side) % side, 'y': np.arange(side * side) // side}
+    p = ggplot(grid, aes('x', 'y')) + geom_point(sampling=sampling_quadtree(100))
+
+    spec = sample_data(p.as_dict())
+    assert len(spec['layers'][0]['data']['x']) == 100
+    assert spec['computation_messages'] == [
+        'sampling_quadtree(n=100, depth=8) was applied to [point/identity stat] layer'
+    ]
+
+    # Zoomed to the quadtree cell of the level 2 (1/16 of the data area) or deeper: about 100 points are visible.
+    for lim, depth, visible_count in [((side - 1) / 4, 8, 100), ((side - 1) / 32, 8, 100), (9, 2, 100)]:
+        p_zoomed = ggplot(grid, aes('x', 'y')) + geom_point(sampling=sampling_quadtree(100, depth=depth)) + \
+                   coord_cartesian(xlim=[0, lim], ylim=[0, lim])
+        layer = sample_data(p_zoomed.as_dict())['layers'][0]
+        x, y = layer['data']['x'], layer['data']['y']
+        assert np.sum((x <= lim) & (y <= lim)) == visible_count
+        # Points near the viewport are kept.
+        assert x.max() <= lim * 1.1 and y.max() <= lim * 1.1
+
+
+def test_random_sampling_is_reproducible():
+    p = ggplot(data, aes('x', 'y')) + geom_point(sampling=sampling_random(1000, seed=5))
+    x = sample_data(p.as_dict())['layers'][0]['data']['x']
+    assert len(np.unique(x)) == 1000
+    assert np.array_equal(x, sample_data(p.as_dict())['layers'][0]['data']['x'])
+
+
+def test_layer_data_is_combined_with_plot_data():
+    layer_data = {'y': -data['y'], 'c': list(range(N))}
+    p = ggplot(data, aes('x', 'y')) + geom_point(aes(color='c'), data=layer_data) + geom_histogram()
+    plot_spec = p.as_dict()
+    spec = sample_data(plot_spec)
+    layer = spec['layers'][0]
+
+    assert set(layer['data'].keys()) == {'x', 'y', 'c'}
+    assert np.array_equal(layer['data']['y'], -(layer['data']['x'].astype(int) % 7))
+    assert layer['data']['c'] == layer['data']['x'].astype(int).tolist()
+    # The plot data is used by the histogram.
+    assert spec['data'] is plot_spec['data']
+
+
+def test_not_sampled():
+    small = {'x': [0, 1], 'y': [0, 1]}
+    for p in [
+        ggplot(small, aes('x', 'y')) + geom_point(),
+        ggplot(data, aes('x', 'y')) + geom_point(sampling='none'),
+        ggplot(data, aes('x', 'y')) + geom_point(sampling=sampling_group_random(3)),
+        ggplot(data, aes('x', 'y')) + geom_point(stat='count'),
+        ggplot(data, aes('x', 'y')) + geom_point() + facet_wrap('y'),
+    ]:
+        spec = p.as_dict()
+        assert sample_data(spec) is spec
+
+
+def test_plot_spec_is_not_modified():
+    spec = (ggplot(data, aes('x', 'y')) + geom_point()).as_dict()
+    plot_data = spec['data']
+    sample_data(spec)
+    assert spec['data'] is plot_data and 'data' not in spec['layers'][0] and 'computation_messages' not in spec
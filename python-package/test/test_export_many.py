@@ -0,0 +1,114 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import io
+
+import pytest
+
+from lets_plot import _kbridge, _global_settings
+from lets_plot.export import export_many
+from lets_plot.export.ggsave_ import ggsave, ggsave_many
+from lets_plot.plot import ggplot, geom_point, ggtitle
+
+
+class _Bridge:
+    """
+    Renders the title of a plot instead of the plot, or an error for the 'error' title.
+    """
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def export_svg_batch(self, plot_specs, use_css_pixelated_image_rendering):
+        self.batch_sizes.append(len(plot_specs))
+        return [self._render('<svg>{}</svg>', spec, 'generateSvgBatch') for spec in plot_specs]
+
+    def export_html_batch(self, plot_specs, script_url, iframe, data_encoding, data_compression):
+        self.batch_sizes.append(len(plot_specs))
+        template = '<html>{} ' + '{} {} {}</html>'.format(script_url, iframe, data_encoding)
+        return [self._render(template, spec, 'generateStaticHtmlPageBatch') for spec in plot_specs]
+
+    def export_svg(self, plot_spec, use_css_pixelated_image_rendering):
+        return self._render('<svg>{}</svg>', plot_spec, 'generateSvg')
+
+    def export_html(self, plot_spec, script_url, iframe, data_encoding, data_compression):
+        template = '<html>{} ' + '{} {} {}</html>'.format(script_url, iframe, data_encoding)
+        return self._render(template, plot_spec, 'generateStaticHtmlPage')
+
+    @staticmethod
+    def _render(template, spec, fun_name):
+        title = spec['ggtitle']['text']
+        if title == 'error':
+            return '{}() - Exception: Unknown geom'.format(fun_name)
+        return template.format(title)
+
+
+@pytest.fixture
+def bridge(monkeypatch):
+    bridge = _Bridge()
+    monkeypatch.setattr(_kbridge, 'lets_plot_kotlin_bridge', bridge)
+    return bridge
+
+
+def _plot(title):
+    return ggplot() + geom_point(x=0, y=0) + ggtitle(title)
+
+
+def _read(pathname):
+    with io.open(pathname, encoding='utf-8') as f:
+        return f.read()
+
+
+def test_batches(bridge, tmp_path):
+    filenames = [str(tmp_path / 'plot_{}.{}'.format(i, 'svg' if i % 2 == 0 else 'html')) for i in range(10)]
+    pathnames = export_many([_plot(str(i)) for i in range(10)], filenames, batch_size=4)
+
+    assert pathnames == filenames
+    assert bridge.batch_sizes == [2, 2, 2, 2, 1, 1]
+    assert _read(filenames[0]) == '<svg>0</svg>'
+    assert _read(filenames[1]).startswith('<html>1 ')
+
+
+def test_ggsave(bridge, tmp_path):
+    assert _read(ggsave(_plot('a'), 'a.svg', path=str(tmp_path))) == '<svg>a</svg>'
+    assert _read(ggsave(_plot('b'), ' b.HTML ', path=str(tmp_path))).startswith('<html>b ')
+    with pytest.raises(ValueError):
+        ggsave(_plot('c'), 'c.pdf', path=str(tmp_path))
+
+
+def test_iframe_default(bridge, tmp_path):
+    export_many([_plot('a')], [str(tmp_path / 'a.html')])
+    ggsave_many([_plot('b')], ['b.html'], path=str(tmp_path))
+    assert _read(str(tmp_path / 'a.html')).split()[-2] == 'True'
+    assert _read(str(tmp_path / 'b.html')).split()[-2] == 'True'
+
+
+@pytest.mark.parametrize('plot_count,filename_count', [(3, 2), (2, 3)])
+def test_number_of_filenames_mismatch(bridge, tmp_path, plot_count, filename_count):
+    plots = [_plot(str(i)) for i in range(plot_count)]
+    filenames = [str(tmp_path / '{}.svg'.format(i)) for i in range(filename_count)]
+    with pytest.raises(ValueError):
+        export_many(plots, filenames)
+    with pytest.raises(ValueError):
+        export_many(iter(plots), iter(filenames))
+    with pytest.raises(ValueError):
+        ggsave_many(plots, ['{}.svg'.format(i) for i in range(filename_count)], path=str(tmp_path))
+
+
+def test_render_error_is_raised(bridge, tmp_path):
+    filenames = [str(tmp_path / '{}.svg'.format(i)) for i in range(3)]
+    with pytest.raises(RuntimeError, match='Unknown geom'):
+        export_many([_plot('0'), _plot('error'), _plot('2')], filenames)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_processes(bridge, tmp_path, monkeypatch):
+    # Settings of the main process, see LetsPlot.set()
+    for name, value in [(_global_settings.JS_URL_MANUAL, 'https://example.com/lets-plot.js'),
+                        (_global_settings.DATA_ENCODING, 'float32')]:
+        monkeypatch.setitem(_global_settings._settings, _global_settings._to_actual_name(name), value)
+
+    filenames = [str(tmp_path / 'plot_{}.html'.format(i)) for i in range(10)]
+    assert export_many([_plot(str(i)) for i in range(10)], filenames, batch_size=3, processes=2) == filenames
+    for i, filename in enumerate(filenames):
+        assert _read(filename) == '<html>{} https://example.com/lets-plot.js True float32</html>'.format(i)
@@ -0,0 +1,40 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import importlib.machinery
+import re
+
+import numpy as np
+import pytest
+
+import lets_plot_kotlin_bridge
+from lets_plot import _kbridge
+from lets_plot._type_utils import standardize_dict
+from lets_plot.plot import ggplot, aes, geom_point
+
+# These tests need the compiled native bridge.
+pytestmark = pytest.mark.skipif(
+    not getattr(lets_plot_kotlin_bridge, '__file__', '').endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES)),
+    reason='lets_plot_kotlin_bridge extension is not built'
+)
+
+
+def _normalized_ids(svg):
+    # Generated element ids differ from call to call.
+    ids = {}
+    return re.sub(r'(?<=id=")[\w-]+|(?<=#)[\w-]+', lambda m: ids.setdefault(m.group(0), str(len(ids))), svg)
+
+
+def test_numeric_buffers_equal_lists():
+    data = {
+        'x': np.array([1.5, np.nan, 2.5, np.inf, 3.5]),
+        'y': np.array([1, 2, 3, 4, 5], dtype=np.int64),
+        'b': np.array([True, False, True, False, True]),
+    }
+    spec = (ggplot(data, aes('x', 'y', color='b')) + geom_point()).as_dict()
+
+    svg_from_buffers = lets_plot_kotlin_bridge.export_svg(standardize_dict(spec, numeric_buffers=True), True)
+    svg_from_lists = lets_plot_kotlin_bridge.export_svg(standardize_dict(spec), True)
+    assert 'Exception' not in svg_from_buffers
+    assert _normalized_ids(svg_from_buffers) == _normalized_ids(svg_from_lists)
+    assert _normalized_ids(_kbridge._generate_svg(spec)) == _normalized_ids(svg_from_lists)
@@ -0,0 +1,461 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lets_plot._precompute import precompute_stats
+from lets_plot.mapping import as_discrete
+from lets_plot.plot import ggplot, aes, geom_histogram, geom_freqpoly, geom_bin2d, geom_point, facet_wrap, ggsize
+from lets_plot.plot import geom_density, geom_density2d
+from lets_plot.plot import layer_tooltips, scale_x_log10, scale_y_log10, stat_summary, stat_summary_bin
+
+
+def _layer(p):
+    return precompute_stats(p.as_dict())['layers'][0]
+
+
+def test_bins_match_engine_binning():
+    # range [1, 3], 2 bins: the range is extended by 0.7 bin width at both ends.
+    layer = _layer(ggplot({'x': [1, 2, 3]}, aes('x')) + geom_histogram(bins=2, precompute=True))
+
+    assert layer['stat'] == 'identity'
+    assert 'precompute' not in layer and 'bins' not in layer
+    assert layer['mapping'] == {'x': 'x', 'y': 'count'}
+    assert layer['data']['x'] == pytest.approx([1.15, 2.85])
+    assert layer['data']['count'].tolist() == [1, 2]
+    assert layer['data']['density'] == pytest.approx([1 / 3, 2 / 3])
+
+
+def test_bin_boundary_and_weights():
+    data = {'x': [0.2, 0.7, 1.2, np.nan], 'w': [1, 2, np.nan, 5]}
+    layer = _layer(ggplot(data, aes('x', weight='w')) + geom_histogram(binwidth=0.5, boundary=0, precompute=True))
+
+    x = layer['data']['x']
+    assert np.allclose((x - 0.25) / 0.5, np.round((x - 0.25) / 0.5))
+    counts = dict(zip(np.round(x, 2), layer['data']['count']))
+    assert counts[0.25] == 1 and counts[0.75] == 2 and counts[1.25] == 0
+    assert 'weight' not in layer['mapping']
+
+
+def test_groups_and_facets():
+    df = pd.DataFrame({
+        'x': np.arange(100.0),
+        'g': ['a', 'b'] * 50,
+        'f': [1] * 50 + [2] * 50,
+        'v': np.arange(100.0),
+    })
+    p = ggplot(df, aes('x')) + \
+        geom_histogram(aes(fill='g'), bins=10, precompute=True,
+                       tooltips=layer_tooltips().line('@..density..').line('@v')) + \
+        facet_wrap('f')
+    spec = precompute_stats(p.as_dict())
+    layer = spec['layers'][0]
+    table = layer['data']
+
+    assert 'data' not in spec
+    assert len(table['x']) == 4 * 10
+    assert list(dict.fromkeys(zip(table['f'], table['g']))) == [(1, 'a'), (1, 'b'), (2, 'a'), (2, 'b')]
+    assert sum(table['count']) == 100
+    assert layer['tooltips']['lines'] == ['@density', '@v']
+    # Not a grouping variable: the mean in each group.
+    assert table['v'][0] == pytest.approx(np.arange(0.0, 50, 2).mean())
+
+
+def test_density_mapping_and_discrete_ordering():
+    df = pd.DataFrame({'x': [1.0, 2.0, 3.0], 'g': [1, 2, 1]})
+    p = ggplot(df) + geom_freqpoly(aes('x', y='..density..', color=as_discrete('g', order_by='..count..')),
+                                   precompute=True)
+    layer = _layer(p)
+
+    assert layer['mapping'] == {'x': 'x', 'y': 'density', 'color': 'g'}
+    assert layer['data_meta']['mapping_annotations'][0]['parameters']['order_by'] == 'count'
+    assert set(layer['data']['g']) == {1, 2}
+
+
+def test_x_range_of_all_layers():
+    p = ggplot() + geom_histogram(aes('x'), data={'x': [1, 2, 3]}, bins=2, precompute=True) + \
+        geom_point(aes('x', 'x'), data={'x': [0, 10]})
+    layer = _layer(p)
+    # range [0, 10]
+    assert layer['data']['x'] == pytest.approx([0.75, 9.25])
+    assert layer['data']['count'].tolist() == [3, 0]
+
+
+def test_other_layers_binned_over_x_range():
+    data = {'x': [1, 2, 3]}
+    layers = precompute_stats((ggplot(data, aes('x')) + geom_histogram(bins=2, precompute=True) +
+                               geom_freqpoly(bins=2, precompute=True)).as_dict())['layers']
+    assert [layer['stat'] for layer in layers] == ['identity', 'identity']
+    assert layers[0]['data']['x'] == pytest.approx(layers[1]['data']['x'])
+
+    # The computed bins would change the x-range of the layers binned by the engine.
+    for p in [ggplot(data, aes('x')) + geom_histogram(precompute=True) + geom_density(),
+              ggplot(data, aes('x')) + geom_histogram(precompute=True) + geom_freqpoly(),
+              ggplot(data, aes('x')) + geom_histogram(precompute=True) +
+              geom_histogram(precompute=True) + scale_x_log10()]:
+        layers = precompute_stats(p.as_dict())['layers']
+        assert all('stat' not in layer and 'precompute' not in layer for layer in layers)
+
+    chunks = [pd.DataFrame({'x': [1, 2], 'y': [1, 2]})] * 2
+    with pytest.raises(ValueError):
+        precompute_stats((ggplot(chunks, aes('x', 'y')) + geom_bin2d(precompute=True) + geom_density2d()).as_dict())
+
+
+@pytest.mark.parametrize('p', [
+    ggplot({'x': [1, 2, 3]}, aes('x')) + geom_histogram(precompute=True) + scale_x_log10(),
+    ggplot({'x': [1, 2, 3]}, aes(y='x')) + geom_histogram(orientation='y', precompute=True),
+    ggplot({'x': pd.to_datetime(['2020-01-01', '2021-01-01'])}, aes('x')) + geom_histogram(precompute=True),
+])
+def test_left_to_engine(p):
+    layer = _layer(p)
+    assert 'precompute' not in layer
+    assert 'stat' not in layer
+
+
+def test_plot_spec_is_not_modified():
+    p = ggplot({'x': [1, 2, 3]}, aes('x')) + geom_histogram(precompute=True)
+    spec = p.as_dict()
+    precompute_stats(spec)
+    assert spec['layers'][0]['precompute'] is True
+
+
+def _engine_histogram(xs, weights, start_x, bin_count, bin_width, density_factor):
+    # BinStatUtil.computeHistogramBins(), as is
+    total = 0.0
+    counts = {}
+    for x, w in zip(xs, weights):
+        if not np.isfinite(x):
+            continue
+        w = w if np.isfinite(w) else 0.0
+        total += w
+        i = int(np.floor((x - start_x) / bin_width))
+        counts[i] = counts.get(i, 0.0) + w
+    x0 = start_x + bin_width / 2
+    return ([x0 + i * bin_width for i in range(bin_count)],
+            [counts.get(i, 0.0) for i in range(bin_count)],
+            [counts.get(i, 0.0) / total * density_factor for i in range(bin_count)])
+
+
+def test_vectorized_bins_equal_engine_loop():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'x': rng.normal(size=5000),
+        'w': rng.uniform(size=5000),
+        'g': rng.choice(['a', 'b', 'c'], size=5000),
+    })
+    df.loc[::97, 'x'] = np.nan
+    p = ggplot(df, aes('x', weight='w', fill='g')) + geom_histogram(bins=17, center=0.1, precompute=True)
+    table = _layer(p)['data']
+
+    from lets_plot._precompute import _binning_parameters
+    x_range = (df['x'].min(), df['x'].max())
+    bin_count, bin_width, start_x = _binning_parameters(x_range, 17, None, 0.1, None)
+    density_factor = bin_count / (x_range[1] - x_range[0])
+    for i, group in enumerate(dict.fromkeys(df['g'])):
+        group_df = df[df['g'] == group]
+        expected = _engine_histogram(group_df['x'], group_df['w'], start_x, bin_count, bin_width, density_factor)
+        rows = slice(i * bin_count, (i + 1) * bin_count)
+        assert set(table['g'][rows]) == {group}
+        assert table['x'][rows].tolist() == expected[0]
+        assert table['count'][rows].tolist() == expected[1]
+        assert table['density'][rows].tolist() == expected[2]
+
+
+def _engine_bin2d(xs, ys, weights, start, count, width, density_factor, drop):
+    # Bin2dStat.computeBins(), as is
+    total = 0.0
+    counts = {}
+    for x, y, w in zip(xs, ys, weights):
+        if not np.isfinite(x) or not np.isfinite(y):
+            continue
+        w = w if np.isfinite(w) else 0.0
+        total += w
+        key = (int(np.floor((x - start[0]) / width[0])), int(np.floor((y - start[1]) / width[1])))
+        counts[key] = counts.get(key, 0.0) + w
+    result = []
+    for i in range(count[0]):
+        for j in range(count[1]):
+            c = counts.get((i, j), 0.0)
+            if drop and c == 0.0:
+                continue
+            result.append((start[0] + width[0] / 2 + i * width[0], start[1] + width[1] / 2 + j * width[1],
+                           c, c / total * density_factor))
+    return result
+
+
+@pytest.mark.parametrize('drop', [True, False])
+def test_vectorized_bins2d_equal_engine_loop(drop):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'x': rng.normal(size=5000),
+        'y': rng.uniform(size=5000),
+        'w': rng.uniform(size=5000),
+        'g': rng.choice(['a', 'b'], size=5000),
+    })
+    df.loc[::97, 'x'] = np.nan
+    p = ggplot(df, aes('x', 'y', weight='w')) + \
+        geom_bin2d(aes(alpha='g'), bins=[12, 7], drop=drop, precompute=True)
+    layer = _layer(p)
+    table = layer['data']
+    assert layer['mapping'] == {'x': 'x', 'y': 'y', 'alpha': 'g', 'fill': 'count'}
+
+    from lets_plot._precompute import _bin2d_parameters
+    count_x, width_x, start_x, span_x = _bin2d_parameters((df['x'].min(), df['x'].max()), 12, None)
+    count_y, width_y, start_y, span_y = _bin2d_parameters((df['y'].min(), df['y'].max()), 7, None)
+    assert (count_x, count_y) == (12, 7)
+    density_factor = 1 / (span_x * span_y / (count_x * count_y))
+    expected = []
+    for group in dict.fromkeys(df['g']):
+        group_df = df[df['g'] == group]
+        expected += [row + (group,) for row in _engine_bin2d(
+            group_df['x'], group_df['y'], group_df['w'],
+            (start_x, start_y), (count_x, count_y), (width_x, width_y), density_factor, drop
+        )]
+    actual = list(zip(table['x'], table['y'], table['count'], table['density'], table['g']))
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        assert a[4] == e[4]
+        assert a[:4] == pytest.approx(e[:4])
+
+
+def test_bins2d_of_zero_span_data():
+    layer = _layer(ggplot({'x': [1, 1], 'y': [5, 5]}, aes('x', 'y')) + geom_bin2d(binwidth=0.4, precompute=True))
+    # The range is expanded by 0.5 at both ends: [0.5, 1.5] -> 3 bins of width 0.4.
+    assert layer['data']['x'] == pytest.approx([1.1])
+    assert layer['data']['y'] == pytest.approx([5.1])
+    assert layer['data']['count'].tolist() == [2]
+
+
+def test_chunked_data():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        'x': rng.normal(size=3000),
+        'y': rng.normal(size=3000),
+        'g': rng.choice(['a', 'b', 'c'], size=3000),
+        'v': rng.uniform(size=3000),
+    })
+    chunks = [df.iloc[i:i + 700] for i in range(0, len(df), 700)]
+
+    def bin2d_layer(data):
+        return _layer(ggplot(data, aes('x', 'y')) +
+                      geom_bin2d(aes(fill='g'), precompute=True, tooltips=layer_tooltips().line('@v')))
+
+    expected = bin2d_layer(df)['data']
+    actual = bin2d_layer(chunks)['data']
+    assert list(actual) == list(expected)
+    for var in ['x', 'y', 'count', 'density', 'v']:
+        assert np.allclose(np.asarray(actual[var], dtype=float), np.asarray(expected[var], dtype=float))
+    assert list(actual['g']) == list(expected['g'])
+
+
+def test_chunked_data_must_be_reiterable():
+    chunks = (pd.DataFrame({'x': [i], 'y': [i]}) for i in range(3))
+    with pytest.raises(ValueError):
+        precompute_stats((ggplot(chunks, aes('x', 'y')) + geom_bin2d(precompute=True)).as_dict())
+
+
+def test_chunked_data_left_to_engine():
+    chunks = [pd.DataFrame({'x': [1, 2], 'y': [1, 2]})] * 2
+    with pytest.raises(ValueError):
+        precompute_stats((ggplot(chunks, aes('x', 'y')) + geom_bin2d(precompute=True) + scale_y_log10()).as_dict())
+
+
+def _engine_quantile(sorted_values, p):
+    # AggregateFunctions.quantile(), as is
+    if len(sorted_values) == 0:
+        return np.nan
+    place = p * (len(sorted_values) - 1)
+    if round(place) == place:
+        return sorted_values[int(place)]
+    return (sorted_values[int(np.ceil(place))] + sorted_values[int(np.floor(place))]) / 2.0
+
+
+def test_summary_equals_engine_aggregation():
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame({
+        'x': rng.choice(['a', 'b', 'c', 'd'], size=3000),
+        'y': rng.normal(size=3000),
+        'g': rng.choice(['u', 'v'], size=3000),
+    })
+    df.loc[::31, 'y'] = np.nan
+    p = ggplot(df, aes('x', 'y', color='g')) + \
+        stat_summary(fun='lq', fun_min='count', fun_max='median', quantiles=[0.75, 0.1, 0.5], precompute=True)
+    layer = _layer(p)
+    table = layer['data']
+
+    assert layer['mapping'] == {'x': 'x', 'y': 'y', 'color': 'g', 'ymin': 'ymin', 'ymax': 'ymax'}
+    expected = []
+    for (g, x), group_df in df.groupby(['g', 'x'], sort=False):
+        values = sorted(group_df['y'].dropna())
+        expected.append((x, g, _engine_quantile(values, 0.1), len(values), _engine_quantile(values, 0.5)))
+    actual = list(zip(table['x'], table['g'], table['y'], table['ymin'], table['ymax']))
+    assert sorted(actual) == pytest.approx(sorted(expected))
+
+
+def test_summary_of_continuous_x_is_grouped_by_value():
+    df = {
+        'x': [1.0, 2.0, 1.0, 2.0, 3.0, np.nan],
+        'y': [1.0, 2.0, 3.0, 4.0, np.inf, 6.0],
+        'g': ['a', 'a', 'b', 'b', 'a', 'a'],
+    }
+    table = _layer(ggplot(df, aes('x', 'y', fill='g')) + stat_summary(fun='sum', precompute=True))['data']
+    assert list(zip(table['g'], table['x'], table['y'])) == [('a', 1.0, 1.0), ('a', 2.0, 2.0),
+                                                           ('b', 1.0, 3.0), ('b', 2.0, 4.0)]
+
+
+def test_summary_bin_equals_engine_aggregation():
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({'x': rng.normal(size=2000), 'y': rng.exponential(size=2000)})
+    p = ggplot(df, aes('x', 'y')) + stat_summary_bin(fun='mean', fun_min='mq', bins=40, precompute=True)
+    table = _layer(p)['data']
+
+    from lets_plot._precompute import _binning_parameters
+    bin_count, bin_width, start_x = _binning_parameters((df['x'].min(), df['x'].max()), 40, None, None, None)
+    bin_index = np.floor((df['x'] - start_x) / bin_width).astype(int)
+    assert len(table['x']) == bin_count
+    for i in range(bin_count):
+        values = sorted(df['y'][bin_index == i])
+        assert table['x'][i] == pytest.approx(start_x + bin_width / 2 + i * bin_width)
+        if values:
+            assert table['y'][i] == pytest.approx(np.mean(values))
+            assert table['ymin'][i] == pytest.approx(_engine_quantile(values, 0.5))
+            assert table['ymax'][i] == max(values)
+        else:
+            assert np.isnan(table['y'][i]) and np.isnan(table['ymin'][i]) and np.isnan(table['ymax'][i])
+
+
+def test_summary_bin_of_constant_x():
+    p = ggplot({'x': [3.0] * 10, 'y': list(range(10))}) + stat_summary_bin(aes('x', 'y'), precompute=True)
+    table = _layer(p)['data']
+    # 30 bins of zero width, all values are in the first one (see BinStatUtil.computeSummaryBins()).
+    assert table['x'].tolist() == [3.0] * 30
+    assert (table['y'][0], table['ymin'][0], table['ymax'][0]) == (4.5, 0, 9)
+    assert np.isnan(table['y'][1:]).all()
+
+
+def test_quantile_sketch():
+    from lets_plot._precompute import _QuantileSketch, _SKETCH_SIZE
+    rng = np.random.default_rng(4)
+    values = rng.normal(size=200_000)
+
+    exact = _QuantileSketch(rng)
+    exact.update(values[:_SKETCH_SIZE])
+    sorted_values = sorted(values[:_SKETCH_SIZE])
+    for p in [0, 0.1, 0.25, 0.5, 0.9, 1]:
+        assert exact.quantile(p) == _engine_quantile(sorted_values, p)
+
+    sketch = _QuantileSketch(rng)
+    for chunk in np.array_split(values, 50):
+        sketch.update(chunk)
+    assert sum(len(level) for level in sketch._levels) < 3 * _SKETCH_SIZE
+    for p in [0.01, 0.25, 0.5, 0.75, 0.99]:
+        rank = np.searchsorted(np.sort(values), sketch.quantile(p)) / len(values)
+        assert abs(rank - p) < 0.01
+
+
+def test_summary_sketches_of_big_cells_only():
+    from lets_plot._precompute import _Summaries, _SKETCH_SIZE
+    rng = np.random.default_rng(6)
+    # Cell 0 gets many values, cells 1.. get a few values each (like a continuous x).
+    cells = np.concatenate([np.zeros(3 * _SKETCH_SIZE, dtype=int), np.arange(1, 1001).repeat(3)])
+    rng.shuffle(cells)
+    y = rng.normal(size=len(cells))
+
+    summaries = _Summaries(0, with_quantiles=True)
+    for chunk in np.array_split(np.arange(len(cells)), 7):
+        summaries.add(np.zeros(len(chunk), dtype=np.int64), cells[chunk], y[chunk])
+    _, cell_index, x = summaries.cells()
+    medians = summaries.aggregate(0.5, cell_index)
+
+    assert len(summaries._sketches) == 1
+    for cell, median in zip(x, medians):
+        values = sorted(y[cells == cell])
+        if cell == 0:
+            assert abs(np.searchsorted(values, median) / len(values) - 0.5) < 0.02
+        else:
+            assert median == _engine_quantile(values, 0.5)
+
+
+def test_summary_of_chunked_data():
+    rng = np.random.default_rng(5)
+    df = pd.DataFrame({'x': rng.choice([1, 2, 3], size=5000), 'y': rng.normal(size=5000)})
+    chunks = [df.iloc[i:i + 999] for i in range(0, len(df), 999)]
+
+    def summary_table(data):
+        return _layer(ggplot(data, aes(as_discrete('x'), 'y')) + stat_summary(fun='median', precompute=True))['data']
+
+    expected = summary_table(df)
+    actual = summary_table(chunks)
+    assert list(actual['x']) == list(expected['x'])
+    for var in ['y', 'ymin', 'ymax']:
+        assert actual[var] == pytest.approx(expected[var])
+
+
+def test_rasterized_points():
+    data = {'x': [0, 0.1, 1, 2, 2], 'y': [0, 0, 1, 2, 2], 'c': ['a', 'b', 'b', 'a', 'a'], 'v': [1, 2, 3, 4, 6]}
+
+    # 2 x 2 pixels: the upper ends of the ranges are in the last pixels.
+    layer = _layer(ggplot(data, aes('x', 'y')) + geom_point(rasterize=True, size=3) + ggsize(2, 2))
+    assert layer['geom'] == 'raster' and layer['stat'] == 'identity' and 'rasterize' not in layer
+    assert layer['mapping'] == {'x': 'x', 'y': 'y', 'color': 'count'} and layer['fill_by'] == 'color'
+    assert layer['data']['x'].tolist() == [0.5, 1.5]
+    assert layer['data']['y'].tolist() == [0.5, 1.5]
+    assert layer['data']['count'].tolist() == [2, 3]
+
+    # A pixel gets the category having the most points.
+    layer = _layer(ggplot(data, aes('x', 'y', color='c')) + geom_point(rasterize='any') + ggsize(2, 2))
+    assert layer['mapping'] == {'x': 'x', 'y': 'y', 'color': 'c'}
+    assert list(layer['data']['c']) == ['a', 'a'] and layer['data']['count'].tolist() == [2, 3]
+
+    layer = _layer(ggplot(data, aes('x', 'y', color='v')) + geom_point(rasterize='mean') + ggsize(2, 2))
+    assert layer['data']['v'].tolist() == [1.5, 13 / 3]
+
+
+def test_rasterized_facets_and_chunks():
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({'x': rng.normal(size=5000), 'y': rng.normal(size=5000), 'g': rng.choice(['u', 'v'], 5000)})
+    chunks = [df.iloc[i:i + 999] for i in range(0, len(df), 999)]
+
+    def raster_table(data):
+        return _layer(ggplot(data, aes('x', 'y')) + geom_point(rasterize=True) + facet_wrap('g'))['data']
+
+    expected = raster_table(df)
+    actual = raster_table(chunks)
+    assert sum(expected['count']) == 5000
+    assert {g: sum(c for c, gg in zip(expected['count'], expected['g']) if gg == g) for g in ['u', 'v']} == \
+           dict(df['g'].value_counts())
+    for var in ['x', 'y', 'count', 'g']:
+        assert list(actual[var]) == list(expected[var])
+
+
+def test_rasterized_many_groups():
+    from lets_plot._precompute import _Raster
+    # 10^4 groups of 10^6 pixels: only the non-empty pixels are stored.
+    raster = _Raster(1000, (0.0, 1.0), 1000, (0.0, 1.0), with_values=False)
+    groups = raster.index([np.arange(20_000) % 10_000], [np.arange(20_000) % 10_000], 20_000)
+    raster.add(groups, np.zeros(20_000), np.ones(20_000), None)
+    raster.add(groups, np.ones(20_000), np.ones(20_000), None)
+
+    table = raster.table('x', 'y', ['g'], None)
+    assert len(raster._counts) == 20_000
+    assert table['count'].tolist() == [2, 2] * 10_000
+    assert table['g'][:4] == [0, 0, 1, 1]
+
+
+def test_rasterize_errors_and_fallback():
+    data = {'x': [1, 2], 'y': [1, 2], 'v': [1, 2]}
+    with pytest.raises(ValueError):
+        _layer(ggplot(data, aes('x', 'y')) + geom_point(rasterize='sum'))
+    with pytest.raises(ValueError):
+        _layer(ggplot(data, aes('x', 'y')) + geom_point(rasterize='mean'))
+    with pytest.raises(ValueError):
+        _layer(ggplot(data, aes('x', 'y', color='v')) + geom_point(rasterize=True))
+
+    # Left as points.
+    for p in [ggplot(data, aes('x', 'y')) + geom_point(rasterize=True) + scale_x_log10(),
+              ggplot(data, aes('x', 'y', alpha='v')) + geom_point(rasterize=True),
+              ggplot(data, aes('x', 'y')) + geom_point(rasterize=False)]:
+        layer = _layer(p)
+        assert layer['geom'] == 'point' and 'rasterize' not in layer
@@ -0,0 +1,128 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from lets_plot import _render_cache
+from lets_plot._render_cache import RenderCache, cached_render
+
+
+@pytest.fixture
+def render_cache():
+    _render_cache.setup_render_cache(True, 1024 * 1024, None)
+    yield
+    _render_cache.setup_render_cache(False, 0, None)
+
+
+class _Renderer:
+    def __init__(self, text='<svg/>'):
+        self.calls = 0
+        self.text = text
+
+    def __call__(self):
+        self.calls += 1
+        return self.text
+
+
+def test_disabled_by_default():
+    render = _Renderer()
+    cached_render('svg', {'kind': 'plot'}, (), render)
+    cached_render('svg', {'kind': 'plot'}, (), render)
+    assert render.calls == 2
+
+
+def test_hit_skips_rendering(render_cache):
+    render = _Renderer()
+    spec = {'kind': 'plot', 'data': {'x': np.array([1.0, 2.0]), 'c': ['a', 'b']}}
+    assert cached_render('svg', spec, (True,), render) == '<svg/>'
+    assert cached_render('svg', {'kind': 'plot', 'data': {'x': np.array([1.0, 2.0]), 'c': ['a', 'b']}}, (True,),
+                         render) == '<svg/>'
+    assert render.calls == 1
+    assert _render_cache.render_cache_stats()['hits'] == 1
+    assert _render_cache.render_cache_stats()['misses'] == 1
+
+
+@pytest.mark.parametrize('other_kind,other_spec,other_options', [
+    ('html', {'x': np.array([1.0, 2.0])}, (True,)),
+    ('svg', {'x': np.array([1.0, 3.0])}, (True,)),
+    ('svg', {'x': [1.0, 2.0]}, (True,)),
+    ('svg', {'x': np.array([1.0, 2.0])}, (False,)),
+])
+def test_key_includes_spec_kind_and_options(render_cache, other_kind, other_spec, other_options):
+    render = _Renderer()
+    cached_render('svg', {'x': np.array([1.0, 2.0])}, (True,), render)
+    cached_render(other_kind, other_spec, other_options, render)
+    assert render.calls == 2
+
+
+def test_dynamic_html_output_id_is_renewed(render_cache):
+    html = '<div id="abcdef"></div><script>document.getElementById("abcdef");</script>'
+    render = _Renderer(html)
+    cached_render('dynamic_html', {}, (), render)
+    cached = cached_render('dynamic_html', {}, (), render)
+    assert render.calls == 1
+    assert '"abcdef"' not in cached
+    assert cached.count(cached[9:15]) == 2
+
+
+def test_lru_eviction():
+    cache = RenderCache(max_bytes=3 * len('x' * 1000) + 300, disk_path=None)
+    for key in ['a', 'b', 'c', 'a', 'd']:
+        cache.get_or_render(key, lambda: 'x' * 1000)
+
+    assert cache.stats()['evictions'] == 1
+    assert cache.get_or_render('a', lambda: 'y') == 'x' * 1000  # 'b' was evicted, not 'a'
+    assert cache.get_or_render('b', lambda: 'y') == 'y'
+
+
+def test_disk_tier(tmp_path):
+    RenderCache(max_bytes=1024, disk_path=str(tmp_path)).get_or_render('key', lambda: '<svg/>')
+
+    cache = RenderCache(max_bytes=1024, disk_path=str(tmp_path))
+    assert cache.get_or_render('key', lambda: 'other') == '<svg/>'
+    assert cache.stats()['hits'] == 1
+
+
+@pytest.mark.parametrize('error', [
+    'generateStaticHtmlPage() - Exception: Unknown geom: foo',
+    '<svg style="width:100%;height:100%;" xmlns="http://www.w3.org/2000/svg">\n'
+    '    <text x="0" y="20">generateSvg() - Exception: Unknown geom: foo</text>\n</svg>',
+])
+def test_render_error_is_not_cached(tmp_path, error):
+    cache = RenderCache(max_bytes=1024, disk_path=str(tmp_path))
+    render = _Renderer(error)
+    assert cache.get_or_render('key', render) == error
+    assert cache.get_or_render('key', render) == error
+    assert render.calls == 2
+    assert cache.stats()['entries'] == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_key_includes_version(render_cache, monkeypatch):
+    render = _Renderer()
+    cached_render('svg', {}, (), render)
+    monkeypatch.setattr(_render_cache, '__version__', 'other')
+    cached_render('svg', {}, (), render)
+    assert render.calls == 2
+
+
+def test_concurrent_use(tmp_path):
+    cache = RenderCache(max_bytes=20 * sys.getsizeof('x' * 100), disk_path=str(tmp_path))
+
+    def use(i):
+        for j in range(200):
+            key = str((i * j) % 50)
+            assert cache.get_or_render(key, lambda: key * 100) == key * 100
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(use, range(8)))
+
+    stats = cache.stats()
+    assert stats['hits'] + stats['misses'] == 8 * 200
+    assert stats['size_bytes'] == sum(sys.getsizeof(text) for text in cache._entries.values())
+    # No temp files are left.
+    assert not any(path.name.endswith('.tmp') for path in tmp_path.iterdir())
@@ -0,0 +1,50 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import numpy as np
+import pandas as pd
+
+from lets_plot import _kbridge
+from lets_plot._shared_data import share_data, SHARED_DATA, DATA_REF
+from lets_plot.plot import ggplot, aes, geom_point, geom_line, gggrid
+
+df = pd.DataFrame({'x': np.arange(10.0), 'y': np.arange(10.0) ** 2})
+
+
+def test_grid_over_one_data_frame_shares_it_once():
+    plots = [ggplot(df, aes('x', 'y')) + geom_point() for _ in range(16)]
+    spec = share_data(gggrid(plots, ncol=4).as_dict())
+
+    assert list(spec[SHARED_DATA].keys()) == ['0']
+    assert spec[SHARED_DATA]['0'] is df
+    for figure in spec['figures']:
+        assert DATA_REF in figure and 'data' not in figure
+        assert figure[DATA_REF] == '0'
+
+
+def test_equal_data_is_shared_by_fingerprint():
+    p = ggplot(df.copy(), aes('x', 'y')) + geom_point() + geom_line(data=df.copy())
+    spec = share_data(p.as_dict())
+
+    assert len(spec[SHARED_DATA]) == 1
+    assert spec[DATA_REF] == spec['layers'][1][DATA_REF] == '0'
+
+
+def test_data_used_once_is_not_shared():
+    p = ggplot(df, aes('x', 'y')) + geom_point() + geom_line(data=df[['x']])
+    spec = p.as_dict()
+    assert share_data(spec) is spec
+
+
+def test_plot_spec_is_not_modified():
+    spec = gggrid([ggplot(df) + geom_point(), ggplot(df) + geom_point()]).as_dict()
+    share_data(spec)
+    assert all(figure['data'] is df for figure in spec['figures'])
+
+
+def test_shared_data_is_standardized_once():
+    spec = _kbridge._standardize_plot_spec(gggrid([ggplot(df, aes('x', 'y')) + geom_point()] * 4).as_dict())
+
+    assert list(spec[SHARED_DATA].keys()) == ['0']
+    assert spec[SHARED_DATA]['0']['x'].tolist() == df['x'].tolist()
+    assert [figure[DATA_REF] for figure in spec['figures']] == ['0'] * 4
@@ -0,0 +1,140 @@
+#  Copyright (c) 2023. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lets_plot._type_utils import standardize_dict, _standardize_value
+
+dt_values = pd.to_datetime(['2020-01-01 00:00:00.123456', None])
+
+
+@pytest.mark.parametrize('column', [
+    np.array([1.5, np.nan, np.inf, -np.inf]),
+    np.array([1.5, 2.5], dtype=np.float32),
+    np.array([1, 2, 3], dtype=np.int8),
+    np.array([1, 2, 3], dtype=np.uint64),
+    np.array([True, False]),
+    np.array(['a', 'b']),
+    np.array([[1, 2], [3, 4]]),
+    pd.Series([1.5, None]),
+    pd.Series([1, 2]),
+    pd.Series([True, False]),
+    pd.Series(['a', None]),
+    pd.Series([1, None], dtype='Int64'),
+    pd.Series(dt_values),
+    pd.Series(dt_values).dt.tz_localize('Europe/Berlin'),
+    pd.Series(pd.Categorical(['a', 'b', None, 'a'])),
+    pd.Series(pd.Categorical([1.5, None, 2.5])),
+    pd.Series(pd.Categorical(dt_values)),
+])
+def test_columnar_standardization_equals_per_element(column):
+    assert standardize_dict({'c': column})['c'] == _standardize_value(column.tolist())
+
+
+def test_datetime64_array_as_epoch_millis():
+    column = np.array(['1970-01-01T00:00:01.5', 'NaT'], dtype='datetime64[ns]')
+    assert _standardize_value(column) == [1500.0, None]
+
+
+def test_dataframe():
+    df = pd.DataFrame({
+        'x': [1, 2],
+        'y': [0.5, np.nan],
+        'c': pd.Categorical(['a', None]),
+    })
+    assert standardize_dict(df) == {
+        'x': [1.0, 2.0],
+        'y': [0.5, None],
+        'c': ['a', None],
+    }
+
+
+def test_numeric_buffers():
+    df = pd.DataFrame({
+        'f': [1.5, np.nan],
+        'i': np.array([1, 2], dtype=np.int64),
+        'i32': np.array([1, 2], dtype=np.int32),
+        'b': [True, False],
+        'dt': pd.to_datetime(['1970-01-01 00:00:01', None]),
+        's': ['a', None],
+    })
+    std = standardize_dict({'data': df}, numeric_buffers=True)['data']
+
+    assert std['f'].dtype == np.float64 and std['f'].flags.c_contiguous
+    np.testing.assert_array_equal(std['f'], [1.5, np.nan])
+    assert std['i'].dtype == np.int64
+    assert std['i32'].dtype == np.float64
+    assert std['b'].dtype == np.bool_
+    np.testing.assert_array_equal(std['dt'], [1000.0, np.nan])
+    assert std['s'] == ['a', None]
+
+
+def test_date():
+    assert _standardize_value(date(2020, 1, 1)) == 1577836800000.0
+
+
+def _arrow_test_table():
+    pa = pytest.importorskip('pyarrow')
+    return pa.table({
+        'f': pa.array([1.5, None, float('nan')]),
+        'i': pa.array([1, None, 3], type=pa.int32()),
+        'j': pa.array([1, 2, 3]),
+        'b': pa.array([True, None, False]),
+        's': pa.array(['a', None, 'c']),
+        'c': pa.array(['x', 'y', None]).dictionary_encode(),
+        't': pa.array([0, None, 1500], type=pa.timestamp('us', tz='UTC')),
+        'd': pa.array([0, None, 1], type=pa.date32()),
+    })
+
+
+arrow_test_expected = {
+    'f': [1.5, None, None],
+    'i': [1.0, None, 3.0],
+    'j': [1.0, 2.0, 3.0],
+    'b': [True, None, False],
+    's': ['a', None, 'c'],
+    'c': ['x', 'y', None],
+    't': [0.0, None, 1.5],
+    'd': [0.0, None, 86400000.0],
+}
+
+
+def test_arrow_table():
+    assert standardize_dict({'data': _arrow_test_table()})['data'] == arrow_test_expected
+
+
+def test_arrow_chunked_columns():
+    pa = pytest.importorskip('pyarrow')
+    table = pa.concat_tables([_arrow_test_table(), _arrow_test_table()])
+    assert standardize_dict({'data': table})['data'] == {k: v + v for k, v in arrow_test_expected.items()}
+
+
+def test_arrow_numeric_buffers():
+    std = standardize_dict({'data': _arrow_test_table()}, numeric_buffers=True)['data']
+    np.testing.assert_array_equal(std['f'], [1.5, np.nan, np.nan])
+    np.testing.assert_array_equal(std['i'], [1.0, np.nan, 3.0])
+    assert std['j'].dtype == np.int64
+    np.testing.assert_array_equal(std['t'], [0.0, np.nan, 1.5])
+
+
+def test_polars_dataframe():
+    pl = pytest.importorskip('polars')
+    pytest.importorskip('pyarrow')
+    df = pl.DataFrame({
+        'f': [1.5, None],
+        'i': [1, None],
+        'c': pl.Series(['x', None], dtype=pl.Categorical),
+        'd': [date(2020, 1, 1), None],
+        'l': [[1], None],
+    })
+    assert standardize_dict({'data': df})['data'] == {
+        'f': [1.5, None],
+        'i': [1.0, None],
+        'c': ['x', None],
+        'd': [1577836800000.0, None],
+        'l': [[1.0], None],
+    }